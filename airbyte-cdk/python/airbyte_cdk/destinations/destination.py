@@ -7,20 +7,25 @@ import io
 import logging
 import sys
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, List, Mapping
+from collections import defaultdict
+from typing import IO, Any, Callable, Dict, Iterable, List, Mapping
 
 from airbyte_cdk.connector import Connector
 from airbyte_cdk.exception_handler import init_uncaught_exception_handler
-from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog, Type
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, ConfiguredAirbyteCatalog, Type
 from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_or_exit
+from airbyte_cdk.utils.message_serializer import airbyte_message_from_string
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
-from pydantic import ValidationError
 
 logger = logging.getLogger("airbyte")
 
 
 class Destination(Connector, ABC):
     VALID_CMDS = {"spec", "check", "write"}
+    # Size of the reads from stdin
+    INPUT_BUFFER_SIZE = 1024 * 1024
+    # Number of records of a stream handed at once to the batch writer by write_in_batches
+    batch_size: int = 1000
 
     @abstractmethod
     def write(
@@ -32,17 +37,48 @@ class Destination(Connector, ABC):
         check_result = self.check(logger, config)
         return AirbyteMessage(type=Type.CONNECTION_STATUS, connectionStatus=check_result)
 
-    def _parse_input_stream(self, input_stream: io.TextIOWrapper) -> Iterable[AirbyteMessage]:
+    def write_in_batches(
+        self, input_messages: Iterable[AirbyteMessage], write_batch: Callable[[str, List[AirbyteRecordMessage]], None]
+    ) -> Iterable[AirbyteMessage]:
+        """
+        Groups the incoming records per stream and hands them to write_batch once batch_size records of a stream are buffered.
+        Every buffered batch is written before a STATE message is emitted so that state is only checkpointed for persisted records.
+        Destinations writing records in bulk can implement write as `yield from self.write_in_batches(input_messages, self._write_batch)`.
+        :param input_messages: messages to write
+        :param write_batch: writes up to batch_size records of a stream, given its name and the records in the order they were
+          received. The records must be persisted once it returns.
+        """
+        buffers: Dict[str, List[AirbyteRecordMessage]] = defaultdict(list)
+
+        def flush() -> None:
+            for stream, records in buffers.items():
+                if records:
+                    write_batch(stream, records)
+            buffers.clear()
+
+        for message in input_messages:
+            if message.type == Type.RECORD:
+                buffer = buffers[message.record.stream]
+                buffer.append(message.record)
+                if len(buffer) >= self.batch_size:
+                    write_batch(message.record.stream, buffer)
+                    buffers[message.record.stream] = []
+            elif message.type == Type.STATE:
+                flush()
+                yield message
+        flush()
+
+    def _parse_input_stream(self, input_stream: IO) -> Iterable[AirbyteMessage]:
         """Reads from stdin, converting to Airbyte messages"""
         for line in input_stream:
             try:
-                yield AirbyteMessage.parse_raw(line)
-            except ValidationError:
+                yield airbyte_message_from_string(line)
+            except ValueError:
+                if isinstance(line, bytes):
+                    line = line.decode("utf-8", errors="replace")
                 logger.info(f"ignoring input which can't be deserialized as Airbyte Message: {line}")
 
-    def _run_write(
-        self, config: Mapping[str, Any], configured_catalog_path: str, input_stream: io.TextIOWrapper
-    ) -> Iterable[AirbyteMessage]:
+    def _run_write(self, config: Mapping[str, Any], configured_catalog_path: str, input_stream: IO) -> Iterable[AirbyteMessage]:
         catalog = ConfiguredAirbyteCatalog.parse_file(configured_catalog_path)
         input_messages = self._parse_input_stream(input_stream)
         logger.info("Begin writing to the destination...")
@@ -108,9 +144,9 @@ class Destination(Connector, ABC):
         if cmd == "check":
             yield self._run_check(config=config)
         elif cmd == "write":
-            # Wrap in UTF-8 to override any other input encodings
-            wrapped_stdin = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
-            yield from self._run_write(config=config, configured_catalog_path=parsed_args.catalog, input_stream=wrapped_stdin)
+            # Read stdin as bytes in large chunks, messages are decoded as UTF-8 JSON regardless of any other input encodings
+            buffered_stdin = io.BufferedReader(sys.stdin.buffer, buffer_size=self.INPUT_BUFFER_SIZE)
+            yield from self._run_write(config=config, configured_catalog_path=parsed_args.catalog, input_stream=buffered_stdin)
 
     def run(self, args: List[str]):
         init_uncaught_exception_handler(logger)
@@ -5,23 +5,29 @@
 
 import argparse
 import importlib
+import json
 import logging
 import os.path
 import sys
 import tempfile
+import time
 from typing import Iterable, List
 
 from airbyte_cdk.exception_handler import init_uncaught_exception_handler
 from airbyte_cdk.logger import init_logger
-from airbyte_cdk.models import AirbyteMessage, Status, Type
+from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level, Status, Type
 from airbyte_cdk.models.airbyte_protocol import ConnectorSpecification
 from airbyte_cdk.sources import Source
 from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_or_exit, split_config
 from airbyte_cdk.utils.airbyte_secrets_utils import get_secrets, update_secrets
+from airbyte_cdk.utils.message_serializer import BufferedMessageWriter, airbyte_message_to_string
+from airbyte_cdk.utils.stream_metrics import metrics_registry
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
 logger = init_logger("airbyte")
 
+METRICS_LOG_PREFIX = "Stream metrics: "
+
 
 class AirbyteEntrypoint(object):
     def __init__(self, source: Source):
@@ -119,17 +125,39 @@ class AirbyteEntrypoint(object):
                     config_catalog = self.source.read_catalog(parsed_args.catalog)
                     state = self.source.read_state(parsed_args.state)
                     generator = self.source.read(self.logger, config, config_catalog, state)
-                    for message in generator:
-                        yield message.json(exclude_unset=True)
+                    try:
+                        for message in generator:
+                            if message.type == Type.RECORD and metrics_registry.enabled:
+                                started_at = time.perf_counter()
+                                serialized_message = airbyte_message_to_string(message)
+                                # Serialized messages are ASCII unless orjson is installed, their length is a close estimate of their size
+                                metrics_registry.stream(message.record.stream).record_emitted(
+                                    len(serialized_message), time.perf_counter() - started_at
+                                )
+                                yield serialized_message
+                            else:
+                                yield airbyte_message_to_string(message)
+                            if metrics_registry.report_due():
+                                yield self._metrics_message()
+                        if metrics_registry.report_interval:
+                            yield self._metrics_message()
+                    finally:
+                        metrics_registry.dump()
                 else:
                     raise Exception("Unexpected command " + cmd)
 
+    @staticmethod
+    def _metrics_message() -> str:
+        message = f"{METRICS_LOG_PREFIX}{json.dumps(metrics_registry.report(), default=str)}"
+        return AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message=message)).json(exclude_unset=True)
+
 
 def launch(source: Source, args: List[str]):
     source_entrypoint = AirbyteEntrypoint(source)
     parsed_args = source_entrypoint.parse_args(args)
-    for message in source_entrypoint.run(parsed_args):
-        print(message)
+    with BufferedMessageWriter(sys.stdout.buffer) as writer:
+        for message in source_entrypoint.run(parsed_args):
+            writer.write(message)
 
 
 def main():
@@ -5,7 +5,7 @@
 import json
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 from airbyte_cdk.models import (
     AirbyteCatalog,
@@ -25,9 +25,13 @@ from airbyte_cdk.sources.source import Source
 from airbyte_cdk.sources.streams import Stream
 from airbyte_cdk.sources.streams.core import StreamData
 from airbyte_cdk.sources.streams.http.http import HttpStream
+from airbyte_cdk.sources.streams.http.rate_limiter import RateLimit, RateLimiter
+from airbyte_cdk.sources.streams.http.transport import HttpTransport
+from airbyte_cdk.sources.utils.concurrency import read_concurrently, read_in_order
 from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
 from airbyte_cdk.sources.utils.schema_helpers import InternalConfig, split_config
-from airbyte_cdk.utils.event_timing import create_timer
+from airbyte_cdk.utils.event_timing import EventTimer, create_timer
+from airbyte_cdk.utils.stream_metrics import metrics_registry
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
 
@@ -101,41 +105,26 @@ class AbstractSource(Source, ABC):
         # TODO assert all streams exist in the connector
         # get the streams once in case the connector needs to make any queries to generate them
         stream_instances = {s.name: s for s in self.streams(config)}
+        if self.rate_limits:
+            rate_limiter = RateLimiter(self.rate_limits)
+            for stream_instance in stream_instances.values():
+                self._apply_rate_limiter(stream_instance, rate_limiter)
+        transport = self.http_transport
+        if transport:
+            for stream_instance in stream_instances.values():
+                self._apply_transport(stream_instance, transport)
         state_manager = ConnectorStateManager(stream_instance_map=stream_instances, state=state)
         self._stream_to_instance_map = stream_instances
         with create_timer(self.name) as timer:
-            for configured_stream in catalog.streams:
-                stream_instance = stream_instances.get(configured_stream.stream.name)
-                if not stream_instance:
-                    raise KeyError(
-                        f"The requested stream {configured_stream.stream.name} was not found in the source."
-                        f" Available streams: {stream_instances.keys()}"
-                    )
-                stream_is_available, error = stream_instance.check_availability(logger, self)
-                if not stream_is_available:
-                    logger.warning(f"Skipped syncing stream '{stream_instance.name}' because it was unavailable. Error: {error}")
-                    continue
-                try:
-                    timer.start_event(f"Syncing stream {configured_stream.stream.name}")
-                    yield from self._read_stream(
-                        logger=logger,
-                        stream_instance=stream_instance,
-                        configured_stream=configured_stream,
-                        state_manager=state_manager,
-                        internal_config=internal_config,
-                    )
-                except AirbyteTracedException as e:
-                    raise e
-                except Exception as e:
-                    logger.exception(f"Encountered an exception while reading stream {configured_stream.stream.name}")
-                    display_message = stream_instance.get_error_display_message(e)
-                    if display_message:
-                        raise AirbyteTracedException.from_exception(e, message=display_message) from e
-                    raise e
-                finally:
-                    timer.finish_event()
-                    logger.info(f"Finished syncing {configured_stream.stream.name}")
-                    logger.info(timer.report())
+            stream_reads = [
+                self._read_configured_stream(logger, configured_stream, stream_instances, state_manager, internal_config, timer)
+                for configured_stream in catalog.streams
+            ]
+            if self.max_concurrent_streams > 1:
+                yield from read_concurrently(stream_reads, max_workers=self.max_concurrent_streams)
+            else:
+                for stream_read in stream_reads:
+                    yield from stream_read
 
         logger.info(f"Finished syncing {self.name}")
 
@@ -143,6 +132,124 @@ class AbstractSource(Source, ABC):
     def per_stream_state_enabled(self) -> bool:
         return True
 
+    @property
+    def max_concurrent_streams(self) -> int:
+        """
+        Override to read several configured streams at the same time. With a value greater than 1, each stream is read on a worker
+        thread and its messages are merged into the output in the order that stream produced them, so a stream's STATE messages are
+        always emitted after the records they cover. Streams are still isolated from each other: each instance is only ever read by
+        a single thread.
+        :return: The maximum number of streams read concurrently. Streams are read one after the other by default.
+        """
+        return 1
+
+    @property
+    def rate_limits(self) -> List[RateLimit]:
+        """
+        Override to declare the rate limits of the API. The requests of all the HTTP streams of the source, including the retrievers of
+        declarative streams and the parents of substreams, are then scheduled by a single rate limiter so that the limits are never
+        exceeded, whichever streams are read. Streams that define their own rate_limiter keep it.
+        :return: The rate limits to enforce, none by default
+        """
+        return []
+
+    @classmethod
+    def _apply_rate_limiter(cls, stream_instance: Stream, rate_limiter: RateLimiter) -> None:
+        for http_stream in cls._http_streams(stream_instance):
+            if http_stream.rate_limiter is None:
+                http_stream.rate_limiter = rate_limiter
+
+    @classmethod
+    def _http_streams(cls, stream_instance: Stream) -> Iterator[HttpStream]:
+        """
+        :return: the HTTP streams sending the requests of stream_instance: the stream itself or the retriever of a declarative stream,
+          and the same for the parents of substreams, whether they are the parent of an HttpSubStream or of a SubstreamPartitionRouter
+        """
+        streams = [stream_instance]
+        visited = set()
+        while streams:
+            stream = streams.pop()
+            if id(stream) in visited:
+                continue
+            visited.add(id(stream))
+            if isinstance(stream, HttpStream):
+                yield stream
+            for related_stream in (getattr(stream, "retriever", None), getattr(stream, "parent", None)):
+                if isinstance(related_stream, Stream):
+                    streams.append(related_stream)
+            streams.extend(cls._partition_parent_streams(getattr(stream, "stream_slicer", None)))
+
+    @classmethod
+    def _partition_parent_streams(cls, stream_slicer: Any) -> Iterator[Stream]:
+        parent_stream_configs = getattr(stream_slicer, "parent_stream_configs", None)
+        if isinstance(parent_stream_configs, list):
+            for parent_stream_config in parent_stream_configs:
+                if isinstance(getattr(parent_stream_config, "stream", None), Stream):
+                    yield parent_stream_config.stream
+        # stream slicers combining the slices of several others, e.g. a partition router with an incremental sync
+        stream_slicers = getattr(stream_slicer, "stream_slicers", None)
+        if isinstance(stream_slicers, list):
+            for nested_stream_slicer in stream_slicers:
+                yield from cls._partition_parent_streams(nested_stream_slicer)
+
+    @property
+    def http_transport(self) -> Optional[HttpTransport]:
+        """
+        Override to size the connection pools of the source, e.g. when streams or slices are read concurrently. The requests of all
+        the HTTP streams of the source, including the retrievers of declarative streams and the parents of substreams, and the token
+        refresh requests of their OAuth authenticators are then sent through the transport.
+        :return: The transport to send requests through. By default, HTTP streams share the connection pools of the process
+        """
+        return None
+
+    @classmethod
+    def _apply_transport(cls, stream_instance: Stream, transport: HttpTransport) -> None:
+        for http_stream in cls._http_streams(stream_instance):
+            http_stream.use_transport(transport)
+
+    def _read_configured_stream(
+        self,
+        logger: logging.Logger,
+        configured_stream: ConfiguredAirbyteStream,
+        stream_instances: Mapping[str, Stream],
+        state_manager: ConnectorStateManager,
+        internal_config: InternalConfig,
+        timer: EventTimer,
+    ) -> Iterator[AirbyteMessage]:
+        stream_instance = stream_instances.get(configured_stream.stream.name)
+        if not stream_instance:
+            raise KeyError(
+                f"The requested stream {configured_stream.stream.name} was not found in the source."
+                f" Available streams: {stream_instances.keys()}"
+            )
+        stream_is_available, error = stream_instance.check_availability(logger, self)
+        if not stream_is_available:
+            self._discard_prefetched_responses(stream_instance)
+            logger.warning(f"Skipped syncing stream '{stream_instance.name}' because it was unavailable. Error: {error}")
+            return
+        event_name = f"Syncing stream {configured_stream.stream.name}"
+        try:
+            timer.start_event(event_name)
+            yield from self._read_stream(
+                logger=logger,
+                stream_instance=stream_instance,
+                configured_stream=configured_stream,
+                state_manager=state_manager,
+                internal_config=internal_config,
+            )
+        except AirbyteTracedException as e:
+            raise e
+        except Exception as e:
+            logger.exception(f"Encountered an exception while reading stream {configured_stream.stream.name}")
+            display_message = stream_instance.get_error_display_message(e)
+            if display_message:
+                raise AirbyteTracedException.from_exception(e, message=display_message) from e
+            raise e
+        finally:
+            timer.finish_event(event_name)
+            logger.info(f"Finished syncing {configured_stream.stream.name}")
+            logger.info(timer.report())
+
     def _read_stream(
         self,
         logger: logging.Logger,
@@ -186,13 +293,22 @@ class AbstractSource(Source, ABC):
         record_counter = 0
         stream_name = configured_stream.stream.name
         logger.info(f"Syncing stream: {stream_name} ")
-        for record in record_iterator:
-            if record.type == MessageType.RECORD:
-                record_counter += 1
-            yield record
+        try:
+            for record in record_iterator:
+                if record.type == MessageType.RECORD:
+                    record_counter += 1
+                yield record
+        finally:
+            # responses of the availability check that the read did not replay would otherwise be kept for the rest of the sync
+            self._discard_prefetched_responses(stream_instance)
 
         logger.info(f"Read {record_counter} records from {stream_name} stream")
 
+    @staticmethod
+    def _discard_prefetched_responses(stream_instance: Stream) -> None:
+        if isinstance(stream_instance, HttpStream):
+            stream_instance.discard_prefetched_responses()
+
     @staticmethod
     def _limit_reached(internal_config: InternalConfig, records_counter: int) -> bool:
         """
@@ -239,19 +355,21 @@ class AbstractSource(Source, ABC):
 
         total_records_counter = 0
         has_slices = False
-        for _slice in slices:
+        slices_and_records = self._read_slices(
+            stream_instance,
+            slices,
+            # the state as updated by the records of the previous slices
+            get_stream_state=lambda: stream_state,
+            sync_mode=SyncMode.incremental,
+            cursor_field=configured_stream.cursor_field or None,
+        )
+        for _slice, records in slices_and_records:
             has_slices = True
             if logger.isEnabledFor(logging.DEBUG):
                 yield AirbyteMessage(
                     type=MessageType.LOG,
                     log=AirbyteLogMessage(level=Level.INFO, message=f"{self.SLICE_LOG_PREFIX}{json.dumps(_slice, default=str)}"),
                 )
-            records = stream_instance.read_records(
-                sync_mode=SyncMode.incremental,
-                stream_slice=_slice,
-                stream_state=stream_state,
-                cursor_field=configured_stream.cursor_field or None,
-            )
             record_counter = 0
             for message_counter, record_data_or_message in enumerate(records, start=1):
                 message = self._get_message(record_data_or_message, stream_instance)
@@ -272,6 +390,8 @@ class AbstractSource(Source, ABC):
                         # Break from slice loop to save state and exit from _read_incremental function.
                         break
 
+            # slices are handed back in order, so the state only ever covers the slices whose records were all emitted
+            stream_instance.close_slice(_slice)
             yield self._checkpoint_state(stream_instance, stream_state, state_manager)
             if self._limit_reached(internal_config, total_records_counter):
                 return
@@ -293,17 +413,18 @@ class AbstractSource(Source, ABC):
             f"Processing stream slices for {configured_stream.stream.name} (sync_mode: full_refresh)", extra={"stream_slices": slices}
         )
         total_records_counter = 0
-        for _slice in slices:
+        slices_and_records = self._read_slices(
+            stream_instance,
+            slices,
+            sync_mode=SyncMode.full_refresh,
+            cursor_field=configured_stream.cursor_field,
+        )
+        for _slice, record_data_or_messages in slices_and_records:
             if logger.isEnabledFor(logging.DEBUG):
                 yield AirbyteMessage(
                     type=MessageType.LOG,
                     log=AirbyteLogMessage(level=Level.INFO, message=f"{self.SLICE_LOG_PREFIX}{json.dumps(_slice, default=str)}"),
                 )
-            record_data_or_messages = stream_instance.read_records(
-                stream_slice=_slice,
-                sync_mode=SyncMode.full_refresh,
-                cursor_field=configured_stream.cursor_field,
-            )
             for record_data_or_message in record_data_or_messages:
                 message = self._get_message(record_data_or_message, stream_instance)
                 yield message
@@ -312,6 +433,32 @@ class AbstractSource(Source, ABC):
                     if self._limit_reached(internal_config, total_records_counter):
                         return
 
+    @staticmethod
+    def _read_slices(
+        stream_instance: Stream,
+        slices: Iterable[Optional[Mapping[str, Any]]],
+        get_stream_state: Optional[Callable[[], MutableMapping[str, Any]]] = None,
+        **read_records_kwargs: Any,
+    ) -> Iterator[Tuple[Optional[Mapping[str, Any]], Iterable[Union[StreamData, AirbyteMessage]]]]:
+        """
+        Pairs each slice with the records read for it. When the stream reads several slices at the same time, the records of the next
+        slices are prefetched on worker threads while the slices are still handed back in order.
+        For incremental reads, the records of a slice are read with the state returned by get_stream_state when the slice is read,
+        so prefetched slices are read with the state as it was when they were prefetched. Streams implementing the state property
+        only fold the progress of a prefetched slice into their state once it is closed, see Stream.close_slice.
+        """
+        metrics = metrics_registry.stream(stream_instance.name)
+
+        def read_records(_slice: Optional[Mapping[str, Any]]) -> Iterable[Union[StreamData, AirbyteMessage]]:
+            kwargs = dict(read_records_kwargs, stream_state=get_stream_state()) if get_stream_state else read_records_kwargs
+            return metrics.track_slice(_slice, stream_instance.read_records(stream_slice=_slice, **kwargs))
+
+        if stream_instance.max_concurrent_slices > 1:
+            yield from read_in_order(slices, read_records, max_workers=stream_instance.max_concurrent_slices)
+        else:
+            for _slice in slices:
+                yield _slice, read_records(_slice)
+
     def _checkpoint_state(self, stream: Stream, stream_state, state_manager: ConnectorStateManager):
         # First attempt to retrieve the current state using the stream's state property. We receive an AttributeError if the state
         # property is not implemented by the stream instance and as a fallback, use the stream_state retrieved from the stream
@@ -3,6 +3,7 @@
 #
 
 import copy
+import threading
 from typing import Any, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 from airbyte_cdk.models import AirbyteMessage, AirbyteStateBlob, AirbyteStateMessage, AirbyteStateType, AirbyteStreamState, StreamDescriptor
@@ -25,7 +26,8 @@ class HashableStreamDescriptor(StreamDescriptor):
 class ConnectorStateManager:
     """
     ConnectorStateManager consolidates the various forms of a stream's incoming state message (STREAM / GLOBAL / LEGACY) under a common
-    interface. It also provides methods to extract and update state
+    interface. It also provides methods to extract and update state. Updates are serialized so that streams read concurrently can
+    checkpoint through the same manager.
     """
 
     def __init__(self, stream_instance_map: Mapping[str, Stream], state: Union[List[AirbyteStateMessage], MutableMapping[str, Any]] = None):
@@ -42,6 +44,7 @@ class ConnectorStateManager:
                 "state messages with shared_state will not be processed correctly. "
             )
         self.per_stream_states = per_stream_states
+        self._lock = threading.RLock()
 
     def get_stream_state(self, stream_name: str, namespace: Optional[str]) -> Mapping[str, Any]:
         """
@@ -63,7 +66,8 @@ class ConnectorStateManager:
         :param value: A stream state mapping that is being updated for a stream
         """
         stream_descriptor = HashableStreamDescriptor(name=stream_name, namespace=namespace)
-        self.per_stream_states[stream_descriptor] = AirbyteStateBlob.parse_obj(value)
+        with self._lock:
+            self.per_stream_states[stream_descriptor] = AirbyteStateBlob.parse_obj(value)
 
     def create_state_message(self, stream_name: str, namespace: Optional[str], send_per_stream_state: bool) -> AirbyteMessage:
         """
@@ -73,6 +77,10 @@ class ConnectorStateManager:
         :param send_per_stream_state: Decides which state format the message should be generated as
         :return: The Airbyte state message to be emitted by the connector during a sync
         """
+        with self._lock:
+            return self._create_state_message(stream_name, namespace, send_per_stream_state)
+
+    def _create_state_message(self, stream_name: str, namespace: Optional[str], send_per_stream_state: bool) -> AirbyteMessage:
         if send_per_stream_state:
             hashable_descriptor = HashableStreamDescriptor(name=stream_name, namespace=namespace)
             stream_state = self.per_stream_states.get(hashable_descriptor) or AirbyteStateBlob()
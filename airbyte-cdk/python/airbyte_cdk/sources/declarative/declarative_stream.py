@@ -81,6 +81,13 @@ class DeclarativeStream(Stream):
     def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]):
         return self.state
 
+    @property
+    def max_concurrent_slices(self) -> int:
+        return self.retriever.max_concurrent_slices
+
+    def close_slice(self, stream_slice: Optional[Mapping[str, Any]]) -> None:
+        self.retriever.close_slice(stream_slice)
+
     @property
     def cursor_field(self) -> Union[str, List[str]]:
         """
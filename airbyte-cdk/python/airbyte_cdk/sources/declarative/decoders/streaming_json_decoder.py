@@ -0,0 +1,297 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import codecs
+import json
+import re
+from dataclasses import InitVar, dataclass
+from fnmatch import fnmatchcase
+from typing import Any, Iterable, Iterator, List, Mapping
+
+import requests
+from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+
+_NON_WHITESPACE = re.compile(r"\S")
+# Characters changing the nesting of a value outside of its strings, and ending or escaping within its strings
+_STRUCTURAL = re.compile(r'[\[\]{}"]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+
+class _ValueScan:
+    """
+    Position within a string or container value scanned over several chunks
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+
+    def end_of_value(self, text: str, position: int) -> int:
+        """
+        Scans text from position, each character only once over all the chunks of the value
+        :return: the position following the end of the value, or -1 if the value continues in the next chunk
+        """
+        if self.escaped:
+            position += 1
+            self.escaped = False
+        while True:
+            if self.in_string:
+                match = _STRING_SPECIAL.search(text, position)
+                if not match:
+                    return -1
+                position = match.end()
+                if match.group() == "\\":
+                    if position == len(text):
+                        self.escaped = True
+                        return -1
+                    position += 1
+                    continue
+                self.in_string = False
+                if self.depth == 0:
+                    return position
+            else:
+                match = _STRUCTURAL.search(text, position)
+                if not match:
+                    return -1
+                position = match.end()
+                character = match.group()
+                if character == '"':
+                    self.in_string = True
+                elif character in "[{":
+                    self.depth += 1
+                else:
+                    self.depth -= 1
+                    if self.depth <= 0:
+                        return position
+
+
+class _JsonStream:
+    """
+    Pull parser over a JSON document received in chunks. Only the part of the document that was not consumed yet is kept in memory,
+    values are decoded one at a time with the standard library decoder as soon as they are complete.
+    """
+
+    def __init__(self, chunks: Iterable[str], max_buffer_size: int):
+        self._chunks = iter(chunks)
+        self._max_buffer_size = max_buffer_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._exhausted = False
+
+    def peek(self) -> str:
+        """
+        :return: the next non-whitespace character without consuming it, or an empty string at the end of the document
+        """
+        while True:
+            match = _NON_WHITESPACE.search(self._buffer, self._position)
+            if match:
+                self._position = match.start()
+                return match.group()
+            self._position = len(self._buffer)
+            if not self._fill():
+                return ""
+
+    def expect(self, characters: str) -> str:
+        """
+        Consumes the next non-whitespace character, which must be one of characters
+        """
+        character = self.peek()
+        if not character or character not in characters:
+            raise json.JSONDecodeError(f"Expecting one of {characters!r}", self._buffer, self._position)
+        self._position += 1
+        return character
+
+    def read_value(self) -> Any:
+        """
+        Consumes and decodes the next value of the document
+        """
+        if self.peek() in ('"', "[", "{"):
+            return self._read_delimited_value()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+                # A number ending with the buffer could continue in the next chunk
+                if end < len(self._buffer) or self._exhausted:
+                    self._position = end
+                    return value
+            except json.JSONDecodeError:
+                if self._exhausted:
+                    raise
+            self._fill()
+
+    def _read_delimited_value(self) -> Any:
+        """
+        Consumes a string, an object or an array. Its end is found by scanning the chunks as they are received, and it is decoded
+        once complete, so that the chunks of a large value are neither decoded nor copied again every time one is received.
+        """
+        scan = _ValueScan()
+        text, start = self._buffer, self._position
+        end = scan.end_of_value(text, start)
+        parts: List[str] = []
+        size = 0
+        while end < 0:
+            parts.append(text[start:])
+            size += len(parts[-1])
+            text, start = self._next_chunk(), 0
+            if not text:
+                raise json.JSONDecodeError("Unterminated value", "".join(parts), size)
+            if size + len(text) > self._max_buffer_size:
+                self._raise_buffer_exceeded()
+            end = scan.end_of_value(text, start)
+        parts.append(text[start:end])
+        self._buffer, self._position = text, end
+        return self._decoder.decode("".join(parts))
+
+    def _next_chunk(self) -> str:
+        """
+        :return: the next non-empty chunk, or an empty string at the end of the document
+        """
+        for chunk in self._chunks:
+            if chunk:
+                return chunk
+        self._exhausted = True
+        return ""
+
+    def _fill(self) -> bool:
+        chunk = self._next_chunk()
+        if not chunk:
+            return False
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+        if len(self._buffer) > self._max_buffer_size:
+            self._raise_buffer_exceeded()
+        return True
+
+    def _raise_buffer_exceeded(self) -> None:
+        raise ValueError(
+            f"A single JSON value is larger than the streaming buffer of {self._max_buffer_size} characters. "
+            f"Increase max_buffer_size or extract records from a deeper field_path"
+        )
+
+    def iter_object_keys(self) -> Iterator[str]:
+        """
+        Consumes an object, yielding its keys. The value of each key must be consumed before resuming the iteration
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self._position += 1
+            return
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise json.JSONDecodeError("Expecting property name enclosed in double quotes", self._buffer, self._position)
+            self.expect(":")
+            yield key
+            if self.expect(",}") == "}":
+                return
+
+    def iter_array_indexes(self) -> Iterator[int]:
+        """
+        Consumes an array, yielding the index of each element. Each element must be consumed before resuming the iteration
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self._position += 1
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            if self.expect(",]") == "]":
+                return
+
+    def skip_value(self) -> None:
+        """
+        Consumes the next value without holding a containers' content in memory
+        """
+        character = self.peek()
+        if character == "{":
+            for _ in self.iter_object_keys():
+                self.skip_value()
+        elif character == "[":
+            for _ in self.iter_array_indexes():
+                self.skip_value()
+        else:
+            self.read_value()
+
+
+@dataclass
+class StreamingJsonDecoder(JsonDecoder):
+    """
+    Decoder strategy that parses the json-encoded content of a response incrementally while it is downloaded, so that records can be
+    extracted from arbitrarily large responses without holding the whole body in memory. Only a single record, up to max_buffer_size
+    characters, is held in memory at a time.
+
+    When used with a DpathExtractor, the response is requested as a stream, whose body can only be read once: a retriever whose
+    paginator decodes the response body, like a cursor pagination, refuses to stream its responses.
+
+    Attributes:
+        chunk_size (int): Number of bytes read from the response at a time
+        max_buffer_size (int): Maximum number of characters held in memory to decode a single value
+    """
+
+    parameters: InitVar[Mapping[str, Any]]
+    chunk_size: int = 64 * 1024
+    max_buffer_size: int = 16 * 1024 * 1024
+
+    def iter_records(self, response: requests.Response, path: List[str]) -> Iterable[Any]:
+        """
+        Yields the records found at path as they are parsed, following the same rules as the DpathExtractor does on a decoded response:
+        if path contains a "*" wildcard, every value matching path is a record. Otherwise, the elements of the array found at path are
+        the records, or the object found at path if it is not empty.
+        :param response: the response to decode
+        :param path: path to the records, as evaluated field_path of a DpathExtractor
+        :return: iterable of the records
+        """
+        stream = _JsonStream(self._iter_text(response), self.max_buffer_size)
+        wildcard = "*" in path
+        has_records = False
+        try:
+            if not stream.peek():
+                return
+            for record in self._iter_matches(stream, path, wildcard):
+                has_records = True
+                yield record
+        except json.JSONDecodeError:
+            # Consistently with JsonDecoder, a response that cannot be decoded has no records. A response that becomes invalid after some
+            # records were read cannot be silently truncated
+            if has_records:
+                raise
+
+    def _iter_text(self, response: requests.Response) -> Iterator[str]:
+        decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+        for chunk in response.iter_content(chunk_size=self.chunk_size):
+            yield decoder.decode(chunk)
+        yield decoder.decode(b"", final=True)
+
+    def _iter_matches(self, stream: _JsonStream, path: List[str], wildcard: bool) -> Iterator[Any]:
+        if not path:
+            if wildcard:
+                yield stream.read_value()
+            elif stream.peek() == "[":
+                for _ in stream.iter_array_indexes():
+                    yield stream.read_value()
+            else:
+                value = stream.read_value()
+                if value:
+                    yield value
+            return
+
+        # Interpolated path segments can be evaluated as numbers, e.g. indexes of an array
+        segment, remaining_path = str(path[0]), path[1:]
+        opening = stream.peek()
+        if opening == "{":
+            keys = stream.iter_object_keys()
+        elif opening == "[":
+            keys = (str(index) for index in stream.iter_array_indexes())
+        else:
+            stream.read_value()
+            return
+        for key in keys:
+            if (wildcard and fnmatchcase(key, segment)) or key == segment:
+                yield from self._iter_matches(stream, remaining_path, wildcard)
+            else:
+                stream.skip_value()
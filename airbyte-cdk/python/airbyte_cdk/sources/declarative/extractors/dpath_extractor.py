@@ -3,12 +3,13 @@
 #
 
 from dataclasses import InitVar, dataclass
-from typing import Any, List, Mapping, Union
+from typing import Any, Iterable, List, Mapping, Union
 
 import dpath.util
 import requests
 from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordExtractor
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 from airbyte_cdk.sources.declarative.types import Config, Record
@@ -24,6 +25,9 @@ class DpathExtractor(RecordExtractor):
     If the field path points to an empty object, an empty array is returned.
     If the field path points to a non-existing path, an empty array is returned.
 
+    When the decoder is a StreamingJsonDecoder, records are lazily extracted while the response is downloaded instead of being
+    returned as a list.
+
     Examples of instantiating this transform:
     ```
       extractor:
@@ -63,12 +67,15 @@ class DpathExtractor(RecordExtractor):
             if isinstance(self.field_path[path_index], str):
                 self.field_path[path_index] = InterpolatedString.create(self.field_path[path_index], parameters=parameters)
 
-    def extract_records(self, response: requests.Response) -> List[Record]:
+    def extract_records(self, response: requests.Response) -> Union[List[Record], Iterable[Record]]:
+        path = [path.eval(self.config) for path in self.field_path]
+        if isinstance(self.decoder, StreamingJsonDecoder):
+            return self.decoder.iter_records(response, path)
+
         response_body = self.decoder.decode(response)
-        if len(self.field_path) == 0:
+        if len(path) == 0:
             extracted = response_body
         else:
-            path = [path.eval(self.config) for path in self.field_path]
             if "*" in path:
                 extracted = dpath.util.values(response_body, path)
             else:
@@ -3,7 +3,7 @@
 #
 
 from dataclasses import InitVar, dataclass
-from typing import Any, List, Mapping, Optional
+from typing import Any, Iterable, List, Mapping, Optional, Union
 
 from airbyte_cdk.sources.declarative.interpolation.interpolated_boolean import InterpolatedBoolean
 from airbyte_cdk.sources.declarative.types import Config, Record, StreamSlice, StreamState
@@ -27,10 +27,12 @@ class RecordFilter:
 
     def filter_records(
         self,
-        records: List[Record],
+        records: Union[List[Record], Iterable[Record]],
         stream_state: StreamState,
         stream_slice: Optional[StreamSlice] = None,
         next_page_token: Optional[Mapping[str, Any]] = None,
-    ) -> List[Record]:
+    ) -> Union[List[Record], Iterable[Record]]:
         kwargs = {"stream_state": stream_state, "stream_slice": stream_slice, "next_page_token": next_page_token}
-        return [record for record in records if self._filter_interpolator.eval(self.config, record=record, **kwargs)]
+        filtered = (record for record in records if self._filter_interpolator.eval(self.config, record=record, **kwargs))
+        # Records that are streamed are filtered lazily
+        return list(filtered) if isinstance(records, list) else filtered
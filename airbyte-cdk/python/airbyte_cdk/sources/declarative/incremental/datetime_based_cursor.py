@@ -3,8 +3,10 @@
 #
 
 import datetime
+import json
+import threading
 from dataclasses import InitVar, dataclass, field
-from typing import Any, Iterable, Mapping, Optional, Union
+from typing import Any, Dict, Iterable, Mapping, Optional, Union
 
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.declarative.datetime.datetime_parser import DatetimeParser
@@ -78,6 +80,9 @@ class DatetimeBasedCursor(StreamSlicer):
         self.partition_field_start = InterpolatedString.create(self.partition_field_start or "start_time", parameters=parameters)
         self.partition_field_end = InterpolatedString.create(self.partition_field_end or "end_time", parameters=parameters)
         self._parser = DatetimeParser()
+        # cursor value of the last record of each slice read at the same time as others, until the slice is closed
+        self._slice_cursors: Dict[str, Any] = {}
+        self._slice_cursors_lock = threading.Lock()
 
         # If datetime format is not specified then start/end datetime should inherit it from the stream slicer
         if not self.start_datetime.datetime_format:
@@ -114,6 +119,26 @@ class DatetimeBasedCursor(StreamSlicer):
         if self.partition_field_end:
             self._cursor_end = stream_slice_value_end
 
+    def observe(self, stream_slice: StreamSlice, record: Record) -> None:
+        record_value = record.get(self.cursor_field.eval(self.config))
+        if not record_value:
+            return
+        slice_key = self._slice_key(stream_slice)
+        with self._slice_cursors_lock:
+            slice_cursor = self._slice_cursors.get(slice_key)
+            self._slice_cursors[slice_key] = max(slice_cursor, record_value) if slice_cursor else record_value
+
+    def close_slice(self, stream_slice: StreamSlice) -> None:
+        with self._slice_cursors_lock:
+            slice_cursor = self._slice_cursors.pop(self._slice_key(stream_slice), None)
+        # Same as updating the cursor with every record of the slice as it is read, a slice without records leaves the cursor as is
+        if slice_cursor:
+            self.update_cursor(stream_slice, last_record={self.cursor_field.eval(self.config): slice_cursor})
+
+    @staticmethod
+    def _slice_key(stream_slice: StreamSlice) -> str:
+        return json.dumps(stream_slice, sort_keys=True, default=str)
+
     def stream_slices(self, sync_mode: SyncMode, stream_state: Mapping[str, Any]) -> Iterable[Mapping[str, Any]]:
         """
         Partition the daterange into slices of size = step.
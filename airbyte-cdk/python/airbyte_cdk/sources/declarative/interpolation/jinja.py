@@ -3,7 +3,9 @@
 #
 
 import ast
-from typing import Optional
+import copy
+from functools import lru_cache
+from typing import Any, Optional
 
 from airbyte_cdk.sources.declarative.interpolation.filters import filters
 from airbyte_cdk.sources.declarative.interpolation.interpolation import Interpolation
@@ -29,12 +31,22 @@ class JinjaInterpolation(Interpolation):
     "{{ max(2, 3) }}" will return 3
 
     Additional information on jinja templating can be found at https://jinja.palletsprojects.com/en/3.1.x/templates/#
+
+    Templates are compiled once per input string and kept in a bounded LRU cache, and so are the results of parsing rendered strings
+    as python literals. Strings without any jinja delimiter are returned as is without going through jinja.
     """
 
+    # Maximum number of distinct templates kept compiled, and of distinct rendered strings kept parsed
+    CACHE_SIZE = 1024
+    # Delimiters of jinja statements, expressions and comments. Strings without any of them render to themselves
+    _JINJA_DELIMITERS = ("{{", "{%", "{#")
+
     def __init__(self):
         self._environment = Environment()
         self._environment.filters.update(**filters)
         self._environment.globals.update(**macros)
+        self._compile = lru_cache(maxsize=self.CACHE_SIZE)(self._environment.from_string)
+        self._cached_literal_eval = lru_cache(maxsize=self.CACHE_SIZE)(self._parse_literal)
 
     def eval(self, input_str: str, config: Config, default: Optional[str] = None, **additional_parameters):
         context = {"config": config, **additional_parameters}
@@ -52,14 +64,29 @@ class JinjaInterpolation(Interpolation):
         return self._literal_eval(self._eval(default, context))
 
     def _literal_eval(self, result):
+        try:
+            evaluated = self._cached_literal_eval(result)
+        except TypeError:
+            # Unhashable results cannot be cached
+            evaluated = self._parse_literal(result)
+        if isinstance(evaluated, (list, dict, set)):
+            # The cached value is shared across evaluations, callers may mutate it
+            return copy.deepcopy(evaluated)
+        return evaluated
+
+    @staticmethod
+    def _parse_literal(result: Any) -> Any:
         try:
             return ast.literal_eval(result)
         except (ValueError, SyntaxError):
             return result
 
     def _eval(self, s: str, context):
+        if isinstance(s, str) and not s.endswith("\n") and not any(delimiter in s for delimiter in self._JINJA_DELIMITERS):
+            # Jinja renders text without delimiters unchanged, except for a trailing newline which it strips
+            return s
         try:
-            return self._environment.from_string(s).render(context)
+            return self._compile(s).render(context)
         except TypeError:
             # The string is a static value, not a jinja template
             # It can be returned as is
@@ -2,10 +2,15 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import hashlib
 import json
 import logging
+import os
 import pkgutil
-from typing import Any, Iterator, List, Mapping, MutableMapping, Union
+import tempfile
+from contextlib import contextmanager
+from importlib import metadata
+from typing import Any, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Set, Union
 
 import yaml
 from airbyte_cdk.models import (
@@ -19,12 +24,14 @@ from airbyte_cdk.sources.declarative.checks.connection_checker import Connection
 from airbyte_cdk.sources.declarative.declarative_source import DeclarativeSource
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import CheckStream as CheckStreamModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import DeclarativeStream as DeclarativeStreamModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import RateLimit as RateLimitModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import Spec as SpecModel
 from airbyte_cdk.sources.declarative.parsers.manifest_component_transformer import ManifestComponentTransformer
 from airbyte_cdk.sources.declarative.parsers.manifest_reference_resolver import ManifestReferenceResolver
 from airbyte_cdk.sources.declarative.parsers.model_to_component_factory import ModelToComponentFactory
 from airbyte_cdk.sources.declarative.types import ConnectionDefinition
 from airbyte_cdk.sources.streams.core import Stream
+from airbyte_cdk.sources.streams.http.rate_limiter import RateLimit
 from jsonschema.exceptions import ValidationError
 from jsonschema.validators import validate
 
@@ -32,13 +39,24 @@ from jsonschema.validators import validate
 class ManifestDeclarativeSource(DeclarativeSource):
     """Declarative source defined by a manifest of low-code components that define source connector behavior"""
 
-    VALID_TOP_LEVEL_FIELDS = {"check", "definitions", "schemas", "spec", "streams", "type", "version"}
+    VALID_TOP_LEVEL_FIELDS = {"check", "definitions", "rate_limits", "schemas", "spec", "streams", "type", "version"}
+    # Environment variable pointing to the directory where resolved manifests are cached
+    ENV_MANIFEST_CACHE_DIR = "AIRBYTE_MANIFEST_CACHE_DIR"
 
-    def __init__(self, source_config: ConnectionDefinition, debug: bool = False, component_factory: ModelToComponentFactory = None):
+    def __init__(
+        self,
+        source_config: ConnectionDefinition,
+        debug: bool = False,
+        component_factory: ModelToComponentFactory = None,
+        manifest_cache_dir: Optional[str] = None,
+    ):
         """
         :param source_config(Mapping[str, Any]): The manifest of low-code components that describe the source connector
         :param debug(bool): True if debug mode is enabled
         :param component_factory(ModelToComponentFactory): optional factory if ModelToComponentFactory's default behaviour needs to be tweaked
+        :param manifest_cache_dir(Optional[str]): directory where the resolved and validated manifest is cached so that later instances
+        created from the same manifest skip resolving and validating it. Defaults to the AIRBYTE_MANIFEST_CACHE_DIR environment
+        variable, the manifest is not cached when neither is set
         """
         self.logger = logging.getLogger(f"airbyte.{self.name}")
 
@@ -47,18 +65,37 @@ class ManifestDeclarativeSource(DeclarativeSource):
         if "type" not in manifest:
             manifest["type"] = "DeclarativeSource"
 
+        self._debug = debug
+        self._constructor = component_factory if component_factory else ModelToComponentFactory()
+        self._selected_stream_names: Optional[Set[str]] = None
+
+        raw_component_schema = self._read_component_schema()
+        cache_path = self._manifest_cache_path(
+            manifest_cache_dir or os.environ.get(self.ENV_MANIFEST_CACHE_DIR), manifest, raw_component_schema
+        )
+        cached_source_config = self._read_cached_manifest(cache_path)
+        if cached_source_config is not None:
+            self._source_config = cached_source_config
+            return
+
         resolved_source_config = ManifestReferenceResolver().preprocess_manifest(manifest)
         propagated_source_config = ManifestComponentTransformer().propagate_types_and_parameters("", resolved_source_config, {})
         self._source_config = propagated_source_config
-        self._debug = debug
-        self._constructor = component_factory if component_factory else ModelToComponentFactory()
 
-        self._validate_source()
+        self._validate_source(raw_component_schema)
+        self._write_cached_manifest(cache_path)
 
     @property
     def resolved_manifest(self) -> Mapping[str, Any]:
         return self._source_config
 
+    @property
+    def rate_limits(self) -> List[RateLimit]:
+        return [
+            self._constructor.create_component(RateLimitModel, rate_limit, dict())
+            for rate_limit in self._source_config.get("rate_limits", [])
+        ]
+
     @property
     def connection_checker(self) -> ConnectionChecker:
         check = self._source_config["check"]
@@ -71,11 +108,15 @@ class ManifestDeclarativeSource(DeclarativeSource):
             raise ValueError(f"Expected to generate a ConnectionChecker component, but received {check_stream.__class__}")
 
     def streams(self, config: Mapping[str, Any]) -> List[Stream]:
+        """
+        Creates the streams of the manifest. While reading or checking the connection, only the streams that are needed are created.
+        """
         self._emit_manifest_debug_message(extra_args={"source_name": self.name, "parsed_config": json.dumps(self._source_config)})
 
         source_streams = [
             self._constructor.create_component(DeclarativeStreamModel, stream_config, config)
             for stream_config in self._stream_configs(self._source_config)
+            if self._selected_stream_names is None or stream_config.get("name") in self._selected_stream_names
         ]
 
         for stream in source_streams:
@@ -104,7 +145,8 @@ class ManifestDeclarativeSource(DeclarativeSource):
 
     def check(self, logger: logging.Logger, config: Mapping[str, Any]) -> AirbyteConnectionStatus:
         self._configure_logger_level(logger)
-        return super().check(logger, config)
+        with self._only_create_streams(getattr(self.connection_checker, "stream_names", None)):
+            return super().check(logger, config)
 
     def read(
         self,
@@ -114,7 +156,25 @@ class ManifestDeclarativeSource(DeclarativeSource):
         state: Union[List[AirbyteStateMessage], MutableMapping[str, Any]] = None,
     ) -> Iterator[AirbyteMessage]:
         self._configure_logger_level(logger)
-        yield from super().read(logger, config, catalog, state)
+        with self._only_create_streams([configured_stream.stream.name for configured_stream in catalog.streams]):
+            yield from super().read(logger, config, catalog, state)
+
+    @contextmanager
+    def _only_create_streams(self, stream_names: Optional[Iterable[str]]) -> Iterator[None]:
+        """
+        Restricts the streams created by streams() to stream_names while in the context. Creating the components of a stream is expensive,
+        so streams that are not used by the operation are not created. All the streams are created if any of the names is not a stream
+        of the manifest, so that the error reported about the unknown stream lists all the streams.
+        """
+        manifest_stream_names = {stream_config.get("name") for stream_config in self._stream_configs(self._source_config)}
+        if stream_names is None or not set(stream_names) <= manifest_stream_names:
+            yield
+            return
+        self._selected_stream_names = set(stream_names)
+        try:
+            yield
+        finally:
+            self._selected_stream_names = None
 
     def _configure_logger_level(self, logger: logging.Logger):
         """
@@ -123,16 +183,68 @@ class ManifestDeclarativeSource(DeclarativeSource):
         if self._debug:
             logger.setLevel(logging.DEBUG)
 
-    def _validate_source(self):
-        """
-        Validates the connector manifest against the declarative component schema
-        """
+    @staticmethod
+    def _read_component_schema() -> bytes:
         try:
-            raw_component_schema = pkgutil.get_data("airbyte_cdk", "sources/declarative/declarative_component_schema.yaml")
-            declarative_component_schema = yaml.load(raw_component_schema, Loader=yaml.SafeLoader)
+            return pkgutil.get_data("airbyte_cdk", "sources/declarative/declarative_component_schema.yaml")
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Failed to read manifest component json schema required for validation: {e}")
 
+    @staticmethod
+    def _manifest_cache_path(cache_dir: Optional[str], manifest: Mapping[str, Any], raw_component_schema: bytes) -> Optional[str]:
+        """
+        The cache is keyed by the content of the manifest, of the schema it is validated against and by the CDK version which defines
+        how the manifest is resolved.
+        """
+        if not cache_dir:
+            return None
+        try:
+            serialized_manifest = json.dumps(manifest, sort_keys=True)
+        except (TypeError, ValueError):
+            # Manifests with values that are not JSON serializable, like YAML dates, cannot be restored from the cache
+            return None
+        try:
+            cdk_version = metadata.version("airbyte-cdk")
+        except metadata.PackageNotFoundError:
+            cdk_version = ""
+        digest = hashlib.sha256()
+        for part in (cdk_version.encode("utf-8"), raw_component_schema, serialized_manifest.encode("utf-8")):
+            digest.update(hashlib.sha256(part).digest())
+        return os.path.join(cache_dir, f"manifest_{digest.hexdigest()}.json")
+
+    def _read_cached_manifest(self, cache_path: Optional[str]) -> Optional[MutableMapping[str, Any]]:
+        if not cache_path or not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path) as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring the resolved manifest cached in {cache_path}: {e}")
+            return None
+
+    def _write_cached_manifest(self, cache_path: Optional[str]) -> None:
+        if not cache_path:
+            return
+        try:
+            serialized_source_config = json.dumps(self._source_config)
+        except (TypeError, ValueError):
+            return
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            # Written to a temporary file first so that concurrent processes never read a partially written manifest
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".tmp")
+            with os.fdopen(file_descriptor, "w") as temporary_file:
+                temporary_file.write(serialized_source_config)
+            os.replace(temporary_path, cache_path)
+        except OSError as e:
+            self.logger.warning(f"Failed to cache the resolved manifest in {cache_path}: {e}")
+
+    def _validate_source(self, raw_component_schema: bytes):
+        """
+        Validates the connector manifest against the declarative component schema
+        """
+        declarative_component_schema = yaml.load(raw_component_schema, Loader=yaml.SafeLoader)
+
         streams = self._source_config.get("streams")
         if not streams:
             raise ValidationError(f"A valid manifest should have at least one stream defined. Got {streams}")
@@ -283,6 +283,19 @@ class InjectInto(Enum):
     body_json = "body_json"
 
 
+class RateLimit(BaseModel):
+    type: Literal["RateLimit"]
+    requests: int = Field(..., description="Maximum number of requests sent per period")
+    period_seconds: Optional[float] = Field(
+        1, description="Length of the period in seconds, e.g. 1 for requests per second or 60 for requests per minute"
+    )
+    max_concurrent_requests: Optional[int] = Field(None, description="Maximum number of requests in flight at the same time")
+    url_pattern: Optional[str] = Field(
+        None,
+        description="Regular expression searched in the URL of the requests the limit applies to, all the requests of the source when not set",
+    )
+
+
 class RequestOption(BaseModel):
     type: Literal["RequestOption"]
     field_name: str
@@ -315,6 +328,12 @@ class Spec(BaseModel):
     documentation_url: Optional[str] = None
 
 
+class StreamingJsonDecoder(BaseModel):
+    type: Literal["StreamingJsonDecoder"]
+    chunk_size: Optional[int] = None
+    max_buffer_size: Optional[int] = None
+
+
 class WaitTimeFromHeader(BaseModel):
     type: Literal["WaitTimeFromHeader"]
     header: str
@@ -400,7 +419,7 @@ class DefaultPaginator(BaseModel):
 class DpathExtractor(BaseModel):
     type: Literal["DpathExtractor"]
     field_path: List[str]
-    decoder: Optional[JsonDecoder] = None
+    decoder: Optional[Union[JsonDecoder, StreamingJsonDecoder]] = None
     parameters: Optional[Dict[str, Any]] = Field(None, alias="$parameters")
 
 
@@ -480,6 +499,10 @@ class DeclarativeSource(BaseModel):
     schemas: Optional[Schemas] = None
     definitions: Optional[Dict[str, Any]] = None
     spec: Optional[Spec] = None
+    rate_limits: Optional[List[RateLimit]] = Field(
+        None,
+        description="Rate limits of the API, enforced on the requests of all the streams of the source including the parents of substreams",
+    )
 
 
 class DeclarativeStream(BaseModel):
@@ -530,6 +553,14 @@ class SimpleRetriever(BaseModel):
         [],
         description="StreamSlicer component that describes how to partition the stream, enabling incremental syncs and checkpointing.",
     )
+    max_pages_in_flight: Optional[int] = Field(
+        1,
+        description="Maximum number of page requests in flight at the same time. The next pages are requested while the current one is parsed when they can be predicted, which is the case with the OffsetIncrement and PageIncrement pagination strategies.",
+    )
+    max_concurrent_slices: Optional[int] = Field(
+        1,
+        description="Maximum number of slices read at the same time. The records of the next slices are fetched while the current one is emitted, records are still emitted in slice order and state is only checkpointed up to the last slice whose records were all emitted.",
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias="$parameters")
 
 
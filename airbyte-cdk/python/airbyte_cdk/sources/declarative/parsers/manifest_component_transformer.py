@@ -26,6 +26,7 @@ DEFAULT_MODEL_TYPES: Mapping[str, str] = {
     "CustomIncrementalSync.start_time_option": "RequestOption",
     # DeclarativeSource
     "DeclarativeSource.check": "CheckStream",
+    "DeclarativeSource.rate_limits": "RateLimit",
     "DeclarativeSource.spec": "Spec",
     "DeclarativeSource.streams": "DeclarativeStream",
     # DeclarativeStream
@@ -20,7 +20,7 @@ from airbyte_cdk.sources.declarative.auth.token import (
 from airbyte_cdk.sources.declarative.checks import CheckStream
 from airbyte_cdk.sources.declarative.datetime import MinMaxDatetime
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
-from airbyte_cdk.sources.declarative.decoders import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders import JsonDecoder, StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordFilter, RecordSelector
 from airbyte_cdk.sources.declarative.incremental import DatetimeBasedCursor
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
@@ -64,6 +64,7 @@ from airbyte_cdk.sources.declarative.models.declarative_component_schema import
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import OffsetIncrement as OffsetIncrementModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import PageIncrement as PageIncrementModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import ParentStreamConfig as ParentStreamConfigModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import RateLimit as RateLimitModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import RecordFilter as RecordFilterModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import RecordSelector as RecordSelectorModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import RemoveFields as RemoveFieldsModel
@@ -72,6 +73,7 @@ from airbyte_cdk.sources.declarative.models.declarative_component_schema import
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import SessionTokenAuthenticator as SessionTokenAuthenticatorModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import SimpleRetriever as SimpleRetrieverModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import Spec as SpecModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import StreamingJsonDecoder as StreamingJsonDecoderModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import SubstreamPartitionRouter as SubstreamPartitionRouterModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import WaitTimeFromHeader as WaitTimeFromHeaderModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import WaitUntilTimeFromHeader as WaitUntilTimeFromHeaderModel
@@ -98,6 +100,7 @@ from airbyte_cdk.sources.declarative.stream_slicers import CartesianProductStrea
 from airbyte_cdk.sources.declarative.transformations import AddFields, RemoveFields
 from airbyte_cdk.sources.declarative.transformations.add_fields import AddedFieldDefinition
 from airbyte_cdk.sources.declarative.types import Config
+from airbyte_cdk.sources.streams.http.rate_limiter import RateLimit
 from pydantic import BaseModel
 
 ComponentDefinition: Union[Literal, Mapping, List]
@@ -152,6 +155,7 @@ class ModelToComponentFactory:
             OffsetIncrementModel: self.create_offset_increment,
             PageIncrementModel: self.create_page_increment,
             ParentStreamConfigModel: self.create_parent_stream_config,
+            RateLimitModel: self.create_rate_limit,
             RecordFilterModel: self.create_record_filter,
             RecordSelectorModel: self.create_record_selector,
             RemoveFieldsModel: self.create_remove_fields,
@@ -160,6 +164,7 @@ class ModelToComponentFactory:
             SessionTokenAuthenticatorModel: self.create_session_token_authenticator,
             SimpleRetrieverModel: self.create_simple_retriever,
             SpecModel: self.create_spec,
+            StreamingJsonDecoderModel: self.create_streaming_json_decoder,
             SubstreamPartitionRouterModel: self.create_substream_partition_router,
             WaitTimeFromHeaderModel: self.create_wait_time_from_header,
             WaitUntilTimeFromHeaderModel: self.create_wait_until_time_from_header,
@@ -678,6 +683,15 @@ class ModelToComponentFactory:
             parameters=model.parameters,
         )
 
+    @staticmethod
+    def create_rate_limit(model: RateLimitModel, config: Config, **kwargs) -> RateLimit:
+        return RateLimit(
+            requests=model.requests,
+            period_seconds=model.period_seconds,
+            max_concurrent_requests=model.max_concurrent_requests,
+            url_pattern=model.url_pattern,
+        )
+
     @staticmethod
     def create_record_filter(model: RecordFilterModel, config: Config, **kwargs) -> RecordFilter:
         return RecordFilter(condition=model.condition, config=config, parameters=model.parameters)
@@ -743,6 +757,7 @@ class ModelToComponentFactory:
                 record_selector=record_selector,
                 stream_slicer=stream_slicer or SinglePartitionRouter(parameters={}),
                 config=config,
+                max_pages_in_flight=model.max_pages_in_flight or 1,
                 maximum_number_of_slices=self._limit_slices_fetched,
                 parameters=model.parameters,
             )
@@ -754,6 +769,8 @@ class ModelToComponentFactory:
             record_selector=record_selector,
             stream_slicer=stream_slicer or SinglePartitionRouter(parameters={}),
             config=config,
+            max_pages_in_flight=model.max_pages_in_flight or 1,
+            max_concurrent_slices=model.max_concurrent_slices or 1,
             parameters=model.parameters,
         )
 
@@ -761,6 +778,14 @@ class ModelToComponentFactory:
     def create_spec(model: SpecModel, config: Config, **kwargs) -> Spec:
         return Spec(connection_specification=model.connection_specification, documentation_url=model.documentation_url, parameters={})
 
+    @staticmethod
+    def create_streaming_json_decoder(model: StreamingJsonDecoderModel, config: Config, **kwargs) -> StreamingJsonDecoder:
+        return StreamingJsonDecoder(
+            parameters={},
+            chunk_size=model.chunk_size or StreamingJsonDecoder.chunk_size,
+            max_buffer_size=model.max_buffer_size or StreamingJsonDecoder.max_buffer_size,
+        )
+
     def create_substream_partition_router(self, model: SubstreamPartitionRouterModel, config: Config, **kwargs) -> SubstreamPartitionRouter:
         parent_stream_configs = []
         if model.parent_stream_configs:
@@ -108,6 +108,16 @@ class DefaultPaginator(Paginator):
         else:
             return None
 
+    def predict_next_page_token(self, next_page_token: Optional[Mapping[str, Any]]) -> Optional[Mapping[str, Any]]:
+        if not isinstance(self.page_token_option, RequestOption):
+            # Pages are only predicted when their token is injected in the request options
+            return None
+        token = self.pagination_strategy.predict_next_page_token(next_page_token.get("next_page_token") if next_page_token else None)
+        return {"next_page_token": token} if token else None
+
+    def reads_response_body(self) -> bool:
+        return self.pagination_strategy.reads_response_body()
+
     def path(self):
         if self._token and self.page_token_option and isinstance(self.page_token_option, RequestPath):
             # Replace url base to only return the path
@@ -122,7 +132,7 @@ class DefaultPaginator(Paginator):
         stream_slice: Optional[StreamSlice] = None,
         next_page_token: Optional[Mapping[str, Any]] = None,
     ) -> Mapping[str, Any]:
-        return self._get_request_options(RequestOptionType.request_parameter)
+        return self._get_request_options(RequestOptionType.request_parameter, next_page_token)
 
     def get_request_headers(
         self,
@@ -131,7 +141,7 @@ class DefaultPaginator(Paginator):
         stream_slice: Optional[StreamSlice] = None,
         next_page_token: Optional[Mapping[str, Any]] = None,
     ) -> Mapping[str, str]:
-        return self._get_request_options(RequestOptionType.header)
+        return self._get_request_options(RequestOptionType.header, next_page_token)
 
     def get_request_body_data(
         self,
@@ -140,7 +150,7 @@ class DefaultPaginator(Paginator):
         stream_slice: Optional[StreamSlice] = None,
         next_page_token: Optional[Mapping[str, Any]] = None,
     ) -> Mapping[str, Any]:
-        return self._get_request_options(RequestOptionType.body_data)
+        return self._get_request_options(RequestOptionType.body_data, next_page_token)
 
     def get_request_body_json(
         self,
@@ -149,21 +159,18 @@ class DefaultPaginator(Paginator):
         stream_slice: Optional[StreamSlice] = None,
         next_page_token: Optional[Mapping[str, Any]] = None,
     ) -> Mapping[str, Any]:
-        return self._get_request_options(RequestOptionType.body_json)
+        return self._get_request_options(RequestOptionType.body_json, next_page_token)
 
     def reset(self):
         self.pagination_strategy.reset()
 
-    def _get_request_options(self, option_type: RequestOptionType) -> Mapping[str, Any]:
+    def _get_request_options(self, option_type: RequestOptionType, next_page_token: Optional[Mapping[str, Any]]) -> Mapping[str, Any]:
         options = {}
 
-        if (
-            self.page_token_option
-            and self._token
-            and isinstance(self.page_token_option, RequestOption)
-            and self.page_token_option.inject_into == option_type
-        ):
-            options[self.page_token_option.field_name] = self._token
+        # Pages requested ahead of time are not the page the paginator is on
+        token = next_page_token.get("next_page_token") if next_page_token else self._token
+        if token and isinstance(self.page_token_option, RequestOption) and self.page_token_option.inject_into == option_type:
+            options[self.page_token_option.field_name] = token
         if self.page_size_option and self.pagination_strategy.get_page_size() and self.page_size_option.inject_into == option_type:
             options[self.page_size_option.field_name] = self.pagination_strategy.get_page_size()
         return options
@@ -191,6 +198,9 @@ class PaginatorTestReadDecorator(Paginator):
         self._page_count += 1
         return self._decorated.next_page_token(response, last_records)
 
+    def reads_response_body(self) -> bool:
+        return self._decorated.reads_response_body()
+
     def path(self):
         return self._decorated.path()
 
@@ -36,6 +36,22 @@ class Paginator(ABC, RequestOptionsProvider):
         """
         pass
 
+    def predict_next_page_token(self, next_page_token: Optional[Mapping[str, Any]]) -> Optional[Mapping[str, Any]]:
+        """
+        Predicts the next_page_token of the page following the page requested with next_page_token, so that it can be requested ahead
+        of time. The request options of the predicted page are read by passing the predicted token to the get_request_* methods.
+
+        :param next_page_token: the token of a page, None for the first page
+        :return: A mapping {"next_page_token": <token>} if the next page does not depend on the content of the page and it is full, None otherwise
+        """
+        return None
+
+    def reads_response_body(self) -> bool:
+        """
+        :return: True if next_page_token decodes the body of the response, which can then not be streamed while its records are read
+        """
+        return False
+
     @abstractmethod
     def path(self) -> Optional[str]:
         """
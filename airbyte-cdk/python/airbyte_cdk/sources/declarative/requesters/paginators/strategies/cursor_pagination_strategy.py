@@ -55,6 +55,9 @@ class CursorPaginationStrategy(PaginationStrategy):
         token = self.cursor_value.eval(config=self.config, last_records=last_records, response=decoded_response, headers=headers)
         return token if token else None
 
+    def reads_response_body(self) -> bool:
+        return True
+
     def reset(self):
         # No state to reset
         pass
@@ -51,6 +51,9 @@ class OffsetIncrement(PaginationStrategy):
             self._offset += len(last_records)
             return self._offset
 
+    def predict_next_page_token(self, token: Optional[Any]) -> Optional[Any]:
+        return (token or 0) + self.get_page_size()
+
     def reset(self):
         self._offset = 0
 
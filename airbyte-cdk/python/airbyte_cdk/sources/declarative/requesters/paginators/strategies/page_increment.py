@@ -33,6 +33,9 @@ class PageIncrement(PaginationStrategy):
             self._page += 1
             return self._page
 
+    def predict_next_page_token(self, token: Optional[Any]) -> Optional[Any]:
+        return (self.start_from_page if token is None else token) + 1
+
     def reset(self):
         self._page = self.start_from_page
 
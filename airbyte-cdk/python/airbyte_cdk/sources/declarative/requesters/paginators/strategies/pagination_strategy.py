@@ -24,6 +24,19 @@ class PaginationStrategy:
         """
         pass
 
+    def predict_next_page_token(self, token: Optional[Any]) -> Optional[Any]:
+        """
+        :param token: token of a page, None for the first page
+        :return: the token next_page_token returns after that page if it is full, or None if it depends on the content of the page
+        """
+        return None
+
+    def reads_response_body(self) -> bool:
+        """
+        :return: True if next_page_token decodes the body of the response
+        """
+        return False
+
     @abstractmethod
     def reset(self):
         """
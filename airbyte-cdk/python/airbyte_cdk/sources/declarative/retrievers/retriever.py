@@ -39,6 +39,18 @@ class Retriever:
     def stream_slices(self, *, sync_mode: SyncMode, stream_state: Optional[StreamState] = None) -> Iterable[Optional[StreamSlice]]:
         """Returns the stream slices"""
 
+    @property
+    def max_concurrent_slices(self) -> int:
+        """Returns the maximum number of slices read at the same time"""
+        return 1
+
+    def close_slice(self, stream_slice: Optional[StreamSlice]) -> None:
+        """
+        Called in slice order once the records of stream_slice and of every slice before it have been emitted
+
+        :param stream_slice: The slice whose records were all emitted
+        """
+
     @property
     @abstractmethod
     def state(self) -> StreamState:
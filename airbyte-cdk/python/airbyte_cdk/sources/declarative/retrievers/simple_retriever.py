@@ -2,8 +2,10 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import copy
 import json
 import logging
+import threading
 from dataclasses import InitVar, dataclass, field
 from itertools import islice
 from json import JSONDecodeError
@@ -12,6 +14,7 @@ from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
 import requests
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level, SyncMode
 from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources.declarative.decoders import StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.exceptions import ReadException
 from airbyte_cdk.sources.declarative.extractors.http_selector import HttpSelector
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
@@ -48,6 +51,9 @@ class SimpleRetriever(Retriever, HttpStream):
         record_selector (HttpSelector): The record selector
         paginator (Optional[Paginator]): The paginator
         stream_slicer (Optional[StreamSlicer]): The stream slicer
+        max_pages_in_flight (int): The maximum number of page requests sent ahead of time when the paginator can predict the next page
+        max_concurrent_slices (int): The maximum number of slices read at the same time. Each slice is then paginated on its own and the
+          cursor only moves past a slice once it is closed
         parameters (Mapping[str, Any]): Additional runtime parameters to be used for string interpolation
     """
 
@@ -61,15 +67,48 @@ class SimpleRetriever(Retriever, HttpStream):
     _primary_key: str = field(init=False, repr=False, default="")
     paginator: Optional[Paginator] = None
     stream_slicer: Optional[StreamSlicer] = SinglePartitionRouter(parameters={})
+    max_pages_in_flight: int = 1
+    max_concurrent_slices: int = 1
 
     def __post_init__(self, parameters: Mapping[str, Any]):
         self.paginator = self.paginator or NoPagination(parameters=parameters)
+        if self._streams_responses and self.paginator.reads_response_body():
+            # The body of a streamed response is consumed while its records are read, so it can't be decoded again to paginate
+            raise ValueError(
+                f"Stream {self._name} cannot extract records with a StreamingJsonDecoder since its paginator decodes the response body, "
+                f"use a JsonDecoder instead"
+            )
         HttpStream.__init__(self, self.requester.get_authenticator())
+        # pagination state of the slice read on each thread
+        self._slice_pagination = threading.local()
         self._last_response = None
         self._last_records = None
         self._parameters = parameters
         self.name = InterpolatedString(self._name, parameters=parameters)
 
+    @property
+    def _paginator(self) -> Paginator:
+        """
+        Paginator of the slice read on the current thread: slices read at the same time as others are each paginated by their own copy
+        """
+        return getattr(self._slice_pagination, "paginator", self.paginator)
+
+    @property
+    def _last_response(self) -> Optional[requests.Response]:
+        return getattr(self._slice_pagination, "last_response", None)
+
+    @_last_response.setter
+    def _last_response(self, value: Optional[requests.Response]) -> None:
+        self._slice_pagination.last_response = value
+
+    @property
+    def _last_records(self) -> Optional[Iterable[Record]]:
+        return getattr(self._slice_pagination, "last_records", None)
+
+    @_last_records.setter
+    def _last_records(self, value: Optional[Iterable[Record]]) -> None:
+        self._slice_pagination.last_records = value
+
     @property
     def name(self) -> str:
         """
@@ -178,7 +217,7 @@ class SimpleRetriever(Retriever, HttpStream):
             stream_slice,
             next_page_token,
             self.requester.get_request_headers,
-            self.paginator.get_request_headers,
+            self._paginator.get_request_headers,
             self.stream_slicer.get_request_headers,
         )
         return {str(k): str(v) for k, v in headers.items()}
@@ -198,7 +237,7 @@ class SimpleRetriever(Retriever, HttpStream):
             stream_slice,
             next_page_token,
             self.requester.get_request_params,
-            self.paginator.get_request_params,
+            self._paginator.get_request_params,
             self.stream_slicer.get_request_params,
         )
 
@@ -222,7 +261,7 @@ class SimpleRetriever(Retriever, HttpStream):
             stream_state=self.state, stream_slice=stream_slice, next_page_token=next_page_token
         )
         if isinstance(base_body_data, str):
-            paginator_body_data = self.paginator.get_request_body_data()
+            paginator_body_data = self._paginator.get_request_body_data()
             if paginator_body_data:
                 raise ValueError(
                     f"Cannot combine requester's body data= {base_body_data} with paginator's body_data: {paginator_body_data}"
@@ -233,7 +272,7 @@ class SimpleRetriever(Retriever, HttpStream):
             stream_slice,
             next_page_token,
             self.requester.get_request_body_data,
-            self.paginator.get_request_body_data,
+            self._paginator.get_request_body_data,
             self.stream_slicer.get_request_body_data,
         )
 
@@ -253,7 +292,7 @@ class SimpleRetriever(Retriever, HttpStream):
             stream_slice,
             next_page_token,
             self.requester.get_request_body_json,
-            self.paginator.get_request_body_json,
+            self._paginator.get_request_body_json,
             self.stream_slicer.get_request_body_json,
         )
 
@@ -269,7 +308,16 @@ class SimpleRetriever(Retriever, HttpStream):
         this method. Note that these options do not conflict with request-level options such as headers, request params, etc..
         """
         # Warning: use self.state instead of the stream_state passed as argument!
-        return self.requester.request_kwargs(stream_state=self.state, stream_slice=stream_slice, next_page_token=next_page_token)
+        request_kwargs = self.requester.request_kwargs(stream_state=self.state, stream_slice=stream_slice, next_page_token=next_page_token)
+        if self._streams_responses:
+            # Records are decoded while the response is downloaded instead of once it is fully held in memory
+            return {"stream": True, **request_kwargs}
+        return request_kwargs
+
+    @property
+    def _streams_responses(self) -> bool:
+        extractor = getattr(self.record_selector, "extractor", None)
+        return isinstance(getattr(extractor, "decoder", None), StreamingJsonDecoder)
 
     def path(
         self,
@@ -287,7 +335,7 @@ class SimpleRetriever(Retriever, HttpStream):
         :return:
         """
         # Warning: use self.state instead of the stream_state passed as argument!
-        paginator_path = self.paginator.path()
+        paginator_path = self._paginator.path()
         if paginator_path:
             return paginator_path
         else:
@@ -334,8 +382,12 @@ class SimpleRetriever(Retriever, HttpStream):
         records = self.record_selector.select_records(
             response=response, stream_state=self.state, stream_slice=stream_slice, next_page_token=next_page_token
         )
-        self._last_records = records
-        return records
+        if isinstance(records, list):
+            self._last_records = records
+            return records
+        # Streamed records are not held in memory, only what the paginator and the cursor need is kept while they are read
+        self._last_records = _StreamedRecords()
+        return self._last_records.track(records)
 
     @property
     def primary_key(self) -> Optional[Union[str, List[str], List[List[str]]]]:
@@ -355,7 +407,10 @@ class SimpleRetriever(Retriever, HttpStream):
 
         :return: The token for the next page from the input response object. Returning None means there are no more pages to read in this response.
         """
-        return self.paginator.next_page_token(response, self._last_records)
+        return self._paginator.next_page_token(response, self._last_records)
+
+    def predict_next_page_token(self, next_page_token: Optional[Mapping[str, Any]]) -> Optional[Mapping[str, Any]]:
+        return self._paginator.predict_next_page_token(next_page_token)
 
     def read_records(
         self,
@@ -366,7 +421,9 @@ class SimpleRetriever(Retriever, HttpStream):
     ) -> Iterable[StreamData]:
         # Warning: use self.state instead of the stream_state passed as argument!
         stream_slice = stream_slice or {}  # None-check
-        self.paginator.reset()
+        if self.max_concurrent_slices > 1:
+            self._slice_pagination.paginator = copy.deepcopy(self.paginator)
+        self._paginator.reset()
         records_generator = self._read_pages(
             self._parse_records_and_emit_request_and_responses,
             stream_slice,
@@ -375,14 +432,25 @@ class SimpleRetriever(Retriever, HttpStream):
         for record in records_generator:
             # Only record messages should be parsed to update the cursor which is indicated by the Mapping type
             if isinstance(record, Mapping):
-                self.stream_slicer.update_cursor(stream_slice, last_record=record)
+                self._update_cursor(stream_slice, record)
             yield record
         else:
             last_record = self._last_records[-1] if self._last_records else None
             if last_record and isinstance(last_record, Mapping):
-                self.stream_slicer.update_cursor(stream_slice, last_record=last_record)
+                self._update_cursor(stream_slice, last_record)
             yield from []
 
+    def _update_cursor(self, stream_slice: StreamSlice, record: Record) -> None:
+        if self.max_concurrent_slices > 1:
+            # the records of the slices before this one may not have been emitted yet, the cursor moves past the slice once it is closed
+            self.stream_slicer.observe(stream_slice, record)
+        else:
+            self.stream_slicer.update_cursor(stream_slice, last_record=record)
+
+    def close_slice(self, stream_slice: Optional[StreamSlice]) -> None:
+        if self.max_concurrent_slices > 1:
+            self.stream_slicer.close_slice(stream_slice or {})
+
     def stream_slices(
         self, *, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Optional[StreamState] = None
     ) -> Iterable[Optional[Mapping[str, Any]]]:
@@ -416,6 +484,30 @@ class SimpleRetriever(Retriever, HttpStream):
         yield from self.parse_response(response, stream_slice=stream_slice, stream_state=stream_state)
 
 
+class _StreamedRecords:
+    """
+    Stands in for the records of a page that were streamed: only their count and the last of them are kept.
+    """
+
+    def __init__(self):
+        self._count = 0
+        self._last_record = None
+
+    def track(self, records: Iterable[Record]) -> Iterable[Record]:
+        for record in records:
+            self._count += 1
+            self._last_record = record
+            yield record
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Record:
+        if self._count and index in (-1, self._count - 1):
+            return self._last_record
+        raise IndexError(f"Only the last of the {self._count} streamed records is kept")
+
+
 @dataclass
 class SimpleRetrieverTestReadDecorator(SimpleRetriever):
     """
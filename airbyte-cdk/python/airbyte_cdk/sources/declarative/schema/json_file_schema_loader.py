@@ -6,7 +6,7 @@ import json
 import pkgutil
 import sys
 from dataclasses import InitVar, dataclass, field
-from typing import Any, Mapping, Union
+from typing import Any, Dict, Mapping, Union
 
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 from airbyte_cdk.sources.declarative.schema.schema_loader import SchemaLoader
@@ -49,11 +49,18 @@ class JsonFileSchemaLoader(ResourceSchemaLoader, SchemaLoader):
         if not self.file_path:
             self.file_path = _default_file_path()
         self.file_path = InterpolatedString.create(self.file_path, parameters=parameters)
+        # Schemas by file path, the schema of a stream is requested for every record it reads
+        self._schemas: Dict[str, Mapping[str, Any]] = {}
 
     def get_json_schema(self) -> Mapping[str, Any]:
         # todo: It is worth revisiting if we can replace file_path with just file_name if every schema is in the /schemas directory
         # this would require that we find a creative solution to store or retrieve source_name in here since the files are mounted there
         json_schema_path = self._get_json_filepath()
+        if json_schema_path not in self._schemas:
+            self._schemas[json_schema_path] = self._load_json_schema(json_schema_path)
+        return self._schemas[json_schema_path]
+
+    def _load_json_schema(self, json_schema_path: str) -> Mapping[str, Any]:
         resource, schema_path = self.extract_resource_and_schema_path(json_schema_path)
         raw_json_file = pkgutil.get_data(resource, schema_path)
 
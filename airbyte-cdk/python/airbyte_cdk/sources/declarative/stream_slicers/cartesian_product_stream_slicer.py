@@ -40,6 +40,14 @@ class CartesianProductStreamSlicer(StreamSlicer):
         for slicer in self.stream_slicers:
             slicer.update_cursor(stream_slice, last_record)
 
+    def observe(self, stream_slice: Mapping[str, Any], record: Mapping[str, Any]) -> None:
+        for slicer in self.stream_slicers:
+            slicer.observe(stream_slice, record)
+
+    def close_slice(self, stream_slice: Mapping[str, Any]) -> None:
+        for slicer in self.stream_slicers:
+            slicer.close_slice(stream_slice)
+
     def get_request_params(
         self,
         *,
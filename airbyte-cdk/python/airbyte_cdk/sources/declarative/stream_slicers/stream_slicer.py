@@ -44,3 +44,22 @@ class StreamSlicer(RequestOptionsProvider):
     @abstractmethod
     def get_stream_state(self) -> StreamState:
         """Returns the current stream state"""
+
+    def observe(self, stream_slice: StreamSlice, record: Record) -> None:
+        """
+        Called instead of update_cursor for each record read when several slices are read at the same time. The progress of a slice
+        must not be reflected in the stream state before the slice is closed, since the records of the slices before it may not have
+        been emitted yet.
+
+        :param stream_slice: The slice the record was read for
+        :param record: Record read from the source
+        """
+
+    def close_slice(self, stream_slice: StreamSlice) -> None:
+        """
+        Called in slice order when several slices are read at the same time, once the records of stream_slice and of every slice before it
+        have been emitted. Folds the progress of the slice into the stream state.
+
+        :param stream_slice: The slice whose records were all emitted
+        """
+        self.update_cursor(stream_slice)
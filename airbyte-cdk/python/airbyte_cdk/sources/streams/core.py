@@ -232,6 +232,27 @@ class Stream(ABC):
         """
         return None
 
+    @property
+    def max_concurrent_slices(self) -> int:
+        """
+        Decides how many stream slices are read at the same time. E.g: if this returns a value of 4, then while the records of a slice are
+        emitted, the next 3 slices are already being fetched on worker threads. Records are still emitted in slice order and state is
+        checkpointed after each slice once every previous slice has been fully emitted, so an interrupted sync never skips data.
+
+        Only enable this if read_records can safely be called for different slices at the same time. Streams implementing the state
+        property (see IncrementalMixin) must also keep the progress of the slices being read apart from their state, and only fold it
+        into their state once the slice is closed (see close_slice): otherwise the state checkpointed after a slice could cover records
+        of later slices that were not emitted yet.
+        """
+        return 1
+
+    def close_slice(self, stream_slice: Optional[Mapping[str, Any]]) -> None:
+        """
+        Called in slice order during incremental syncs, once the records of stream_slice and of every slice before it have been emitted
+        and right before the state is checkpointed. Override to fold the progress of the slice into the state of the stream when its
+        slices are read at the same time (see max_concurrent_slices).
+        """
+
     @deprecated(version="0.1.49", reason="You should use explicit state property instead, see IncrementalMixin docs.")
     def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]):
         """Override to extract state from the latest record. Needed to implement incremental sync.
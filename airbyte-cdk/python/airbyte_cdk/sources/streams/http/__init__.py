@@ -5,5 +5,7 @@
 # Initialize Streams Package
 from .exceptions import UserDefinedBackoffException
 from .http import HttpStream, HttpSubStream
+from .rate_limiter import RateLimit, RateLimiter
+from .transport import HttpTransport
 
-__all__ = ["HttpStream", "HttpSubStream", "UserDefinedBackoffException"]
+__all__ = ["HttpStream", "HttpSubStream", "HttpTransport", "RateLimit", "RateLimiter", "UserDefinedBackoffException"]
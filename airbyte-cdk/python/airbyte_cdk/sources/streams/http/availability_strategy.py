@@ -3,8 +3,10 @@
 #
 
 import logging
+import threading
 import typing
-from typing import Dict, Optional, Tuple
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
 
 import requests
 from airbyte_cdk.sources.streams import Stream
@@ -15,12 +17,36 @@ from requests import HTTPError
 if typing.TYPE_CHECKING:
     from airbyte_cdk.sources import Source
 
+_prefetch = threading.local()
+
+
+@contextmanager
+def prefetching_responses(stream: Stream) -> Iterator[None]:
+    """
+    While in this context, the stream keeps the responses it receives on the current thread so that the same requests are not sent
+    again when it is read right after its availability was checked. Other streams, e.g. the parent of a substream, keep nothing, since
+    they may only be read much later, if at all.
+    """
+    previous = getattr(_prefetch, "stream", None)
+    _prefetch.stream = stream
+    try:
+        yield
+    finally:
+        _prefetch.stream = previous
+
+
+def is_prefetching_responses(stream: Stream) -> bool:
+    return getattr(_prefetch, "stream", None) is stream
+
 
 class HttpAvailabilityStrategy(AvailabilityStrategy):
     def check_availability(self, stream: Stream, logger: logging.Logger, source: Optional["Source"]) -> Tuple[bool, Optional[str]]:
         """
         Check stream availability by attempting to read the first record of the
-        stream.
+        stream. The responses the stream receives while doing so are kept and
+        replayed when the same requests are sent again to read the stream, so checking
+        availability doesn't cost any extra request. They are discarded once the read
+        of the stream ended, or when the stream is unavailable.
 
         :param stream: stream
         :param logger: source logger
@@ -30,25 +56,26 @@ class HttpAvailabilityStrategy(AvailabilityStrategy):
           for some reason and the str should describe what went wrong and how to
           resolve the unavailability, if possible.
         """
-        try:
-            # Some streams need a stream slice to read records (e.g. if they have a SubstreamPartitionRouter)
-            # Streams that don't need a stream slice will return `None` as their first stream slice.
-            stream_slice = get_first_stream_slice(stream)
-        except StopIteration:
-            # If stream_slices has no `next()` item (Note - this is different from stream_slices returning [None]!)
-            # This can happen when a substream's `stream_slices` method does a `for record in parent_records: yield <something>`
-            # without accounting for the case in which the parent stream is empty.
-            reason = f"Cannot attempt to connect to stream {stream.name} - no stream slices were found, likely because the parent stream is empty."
-            return False, reason
-
-        try:
-            get_first_record_for_slice(stream, stream_slice)
-            return True, None
-        except StopIteration:
-            logger.info(f"Successfully connected to stream {stream.name}, but got 0 records.")
-            return True, None
-        except HTTPError as error:
-            return self.handle_http_error(stream, logger, source, error)
+        with prefetching_responses(stream):
+            try:
+                # Some streams need a stream slice to read records (e.g. if they have a SubstreamPartitionRouter)
+                # Streams that don't need a stream slice will return `None` as their first stream slice.
+                stream_slice = get_first_stream_slice(stream)
+            except StopIteration:
+                # If stream_slices has no `next()` item (Note - this is different from stream_slices returning [None]!)
+                # This can happen when a substream's `stream_slices` method does a `for record in parent_records: yield <something>`
+                # without accounting for the case in which the parent stream is empty.
+                reason = f"Cannot attempt to connect to stream {stream.name} - no stream slices were found, likely because the parent stream is empty."
+                return False, reason
+
+            try:
+                get_first_record_for_slice(stream, stream_slice)
+                return True, None
+            except StopIteration:
+                logger.info(f"Successfully connected to stream {stream.name}, but got 0 records.")
+                return True, None
+            except HTTPError as error:
+                return self.handle_http_error(stream, logger, source, error)
 
     def handle_http_error(
         self, stream: Stream, logger: logging.Logger, source: Optional["Source"], error: HTTPError
@@ -5,9 +5,12 @@
 
 import logging
 import os
+import time
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import suppress
-from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
+from typing import Any, Callable, Deque, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 from urllib.parse import urljoin
 
 import requests
@@ -15,13 +18,17 @@ import requests_cache
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.streams.availability_strategy import AvailabilityStrategy
 from airbyte_cdk.sources.streams.core import Stream, StreamData
-from airbyte_cdk.sources.streams.http.availability_strategy import HttpAvailabilityStrategy
+from airbyte_cdk.sources.streams.http.availability_strategy import HttpAvailabilityStrategy, is_prefetching_responses
+from airbyte_cdk.utils.stream_metrics import metrics_registry, timed
 from requests.auth import AuthBase
 from requests_cache.session import CachedSession
 
 from .auth.core import HttpAuthenticator, NoAuth
 from .exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
+from .rate_limiter import RateLimiter
 from .rate_limiting import default_backoff_handler, user_defined_backoff_handler
+from .requests_native_auth.abstract_oauth import AbstractOauth2Authenticator
+from .transport import HttpTransport, default_transport
 
 # list of all possible HTTP methods which can be used for sending of request bodies
 BODY_REQUEST_METHODS = ("GET", "POST", "PUT", "PATCH")
@@ -34,6 +41,8 @@ class HttpStream(Stream, ABC):
 
     source_defined_cursor = True  # Most HTTP streams use a source defined cursor (i.e: the user can't configure it like on a SQL table)
     page_size: Optional[int] = None  # Use this variable to define page size for API http requests with pagination support
+    rate_limiter: Optional[RateLimiter] = None  # Schedules requests according to the rate limits of the source, shared by its streams
+    transport: HttpTransport = default_transport  # Connection pools the requests are sent through, shared by the streams of the source
 
     # TODO: remove legacy HttpAuthenticator authenticator references
     def __init__(self, authenticator: Union[AuthBase, HttpAuthenticator] = None):
@@ -41,6 +50,7 @@ class HttpStream(Stream, ABC):
             self._session = self.request_cache()
         else:
             self._session = requests.Session()
+        self.transport.mount(self._session)
 
         self._authenticator: HttpAuthenticator = NoAuth()
         if isinstance(authenticator, AuthBase):
@@ -48,6 +58,16 @@ class HttpStream(Stream, ABC):
         elif authenticator:
             self._authenticator = authenticator
 
+    def use_transport(self, transport: HttpTransport) -> None:
+        """
+        Sends the requests of the stream, and the token refresh requests of its OAuth authenticator, through the connection pools
+        of transport
+        """
+        self.transport = transport
+        transport.mount(self._session)
+        if isinstance(self._session.auth, AbstractOauth2Authenticator):
+            self._session.auth.transport = transport
+
     @property
     def cache_filename(self):
         """
@@ -119,6 +139,26 @@ class HttpStream(Stream, ABC):
     def availability_strategy(self) -> Optional[AvailabilityStrategy]:
         return HttpAvailabilityStrategy()
 
+    @property
+    def max_pages_in_flight(self) -> int:
+        """
+        Override to send the requests of the next pages of a slice while the current page is parsed, for APIs whose next page can be
+        predicted without reading the current one, e.g. offset or page number pagination. See predict_next_page_token.
+        :return: The maximum number of page requests in flight. Pages are requested one after the other by default.
+        """
+        return 1
+
+    def predict_next_page_token(self, next_page_token: Optional[Mapping[str, Any]]) -> Optional[Mapping[str, Any]]:
+        """
+        Override, together with max_pages_in_flight, to request pages ahead of time. Pages are still parsed in order and next_page_token
+        remains the source of truth: predicted requests are discarded when it returns a different token, e.g. after a short page.
+
+        :param next_page_token: the token of a page, None for the first page
+        :return: The token next_page_token is expected to return for the response of that page, assuming it is full. Returning None means
+          the next page cannot be predicted and is only requested once the current one is read.
+        """
+        return None
+
     @abstractmethod
     def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
         """
@@ -301,7 +341,12 @@ class HttpStream(Stream, ABC):
         self.logger.debug(
             "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
         )
-        response: requests.Response = self._session.send(request, **request_kwargs)
+        if self.rate_limiter:
+            with self.rate_limiter.limit(request):
+                response = self._send_and_measure(request, request_kwargs)
+            self.rate_limiter.update(request, response)
+        else:
+            response = self._send_and_measure(request, request_kwargs)
 
         # Evaluation of response.text can be heavy, for example, if streaming a large response
         # Do it only in debug mode
@@ -327,7 +372,56 @@ class HttpStream(Stream, ABC):
                 raise exc
         return response
 
+    # Maximum number of responses kept while checking the availability of the stream
+    MAX_PREFETCHED_RESPONSES = 10
+
+    @property
+    def _prefetched_responses(self) -> Dict[Tuple[str, str, Any], requests.Response]:
+        # Created lazily because not all streams call HttpStream.__init__
+        if "_prefetched_responses_by_request" not in self.__dict__:
+            self.__dict__["_prefetched_responses_by_request"] = {}
+        return self.__dict__["_prefetched_responses_by_request"]
+
+    def discard_prefetched_responses(self) -> None:
+        """
+        Drops the responses kept while checking the availability of the stream that the read did not replay
+        """
+        self._prefetched_responses.clear()
+
+    def _send_and_measure(self, request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
+        if not metrics_registry.enabled:
+            return self._session.send(request, **request_kwargs)
+        started_at = time.perf_counter()
+        response: requests.Response = self._session.send(request, **request_kwargs)
+        metrics_registry.stream(self.name).record_http_request(time.perf_counter() - started_at)
+        return response
+
+    def _measure_parsing(self, records: Iterable[StreamData]) -> Iterable[StreamData]:
+        if not metrics_registry.enabled:
+            return records
+        return timed(records, metrics_registry.stream(self.name).record_parse)
+
     def _send_request(self, request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
+        """
+        Sends the request, unless the exact same request was sent while checking the availability of the stream: its response is then
+        replayed, only once.
+        """
+        request_key = (request.method, request.url, request.body)
+        prefetched_response = self._prefetched_responses.pop(request_key, None)
+        if prefetched_response is not None:
+            return prefetched_response
+
+        response = self._send_request_with_backoff(request, request_kwargs)
+        # Streamed responses are partially consumed by the availability check and cannot be replayed
+        if (
+            is_prefetching_responses(self)
+            and not request_kwargs.get("stream")
+            and len(self._prefetched_responses) < self.MAX_PREFETCHED_RESPONSES
+        ):
+            self._prefetched_responses[request_key] = response
+        return response
+
+    def _send_request_with_backoff(self, request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
         """
         Creates backoff wrappers which are responsible for retry logic
         """
@@ -355,9 +449,29 @@ class HttpStream(Stream, ABC):
         if max_tries is not None:
             max_tries = max(0, max_tries) + 1
 
-        user_backoff_handler = user_defined_backoff_handler(max_tries=max_tries)(self._send)
+        if not metrics_registry.enabled:
+            user_backoff_handler = user_defined_backoff_handler(max_tries=max_tries)(self._send)
+            backoff_handler = default_backoff_handler(max_tries=max_tries, factor=self.retry_factor)
+            return backoff_handler(user_backoff_handler)(request, request_kwargs)
+
+        # Whatever time is not spent sending requests is spent backing off
+        sending_seconds = 0.0
+
+        def send(request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
+            nonlocal sending_seconds
+            started_at = time.perf_counter()
+            try:
+                return self._send(request, request_kwargs)
+            finally:
+                sending_seconds += time.perf_counter() - started_at
+
+        user_backoff_handler = user_defined_backoff_handler(max_tries=max_tries)(send)
         backoff_handler = default_backoff_handler(max_tries=max_tries, factor=self.retry_factor)
-        return backoff_handler(user_backoff_handler)(request, request_kwargs)
+        started_at = time.perf_counter()
+        try:
+            return backoff_handler(user_backoff_handler)(request, request_kwargs)
+        finally:
+            metrics_registry.stream(self.name).record_backoff(time.perf_counter() - started_at - sending_seconds)
 
     @classmethod
     def parse_response_error_message(cls, response: requests.Response) -> Optional[str]:
@@ -429,11 +543,14 @@ class HttpStream(Stream, ABC):
         stream_state: Mapping[str, Any] = None,
     ) -> Iterable[StreamData]:
         stream_state = stream_state or {}
+        if self.max_pages_in_flight > 1:
+            yield from self._read_pipelined_pages(records_generator_fn, stream_slice, stream_state)
+            return
         pagination_complete = False
         next_page_token = None
         while not pagination_complete:
             request, response = self._fetch_next_page(stream_slice, stream_state, next_page_token)
-            yield from records_generator_fn(request, response, stream_state, stream_slice)
+            yield from self._measure_parsing(records_generator_fn(request, response, stream_state, stream_slice))
 
             next_page_token = self.next_page_token(response)
             if not next_page_token:
@@ -442,9 +559,61 @@ class HttpStream(Stream, ABC):
         # Always return an empty generator just in case no records were ever yielded
         yield from []
 
-    def _fetch_next_page(
+    def _read_pipelined_pages(
+        self,
+        records_generator_fn: Callable[
+            [requests.PreparedRequest, requests.Response, Mapping[str, Any], Mapping[str, Any]], Iterable[StreamData]
+        ],
+        stream_slice: Mapping[str, Any],
+        stream_state: Mapping[str, Any],
+    ) -> Iterable[StreamData]:
+        """
+        Reads the pages like _read_pages does, while the requests of the next pages, as predicted by predict_next_page_token, are already
+        in flight. Requests are prepared on the calling thread and only sent from worker threads, and pages are parsed in order.
+        Requests sent ahead of time are discarded once the API stops paginating or paginates differently than predicted.
+        """
+        executor = ThreadPoolExecutor(max_workers=self.max_pages_in_flight, thread_name_prefix="pipelined_pages")
+        in_flight: Deque[Tuple[Optional[Mapping[str, Any]], requests.PreparedRequest, Future]] = deque()
+
+        def submit(next_page_token: Optional[Mapping[str, Any]]) -> None:
+            request, request_kwargs = self._create_next_page_request(stream_slice, stream_state, next_page_token)
+            in_flight.append((next_page_token, request, executor.submit(self._send_request, request, request_kwargs)))
+
+        def discard_in_flight() -> None:
+            while in_flight:
+                _, _, future = in_flight.pop()
+                if not future.cancel():
+                    future.add_done_callback(_close_response)
+
+        try:
+            submit(None)
+            while in_flight:
+                while len(in_flight) < self.max_pages_in_flight:
+                    predicted_page_token = self.predict_next_page_token(in_flight[-1][0])
+                    if not predicted_page_token:
+                        break
+                    submit(predicted_page_token)
+
+                _, request, future = in_flight.popleft()
+                response = future.result()
+                yield from self._measure_parsing(records_generator_fn(request, response, stream_state, stream_slice))
+
+                next_page_token = self.next_page_token(response)
+                if not next_page_token:
+                    break
+                if not in_flight or in_flight[0][0] != next_page_token:
+                    self.logger.debug(f"The next page of stream {self.name} was mispredicted, discarding the requests sent ahead of time")
+                    discard_in_flight()
+                    submit(next_page_token)
+        finally:
+            discard_in_flight()
+            executor.shutdown(wait=True)
+
+        yield from []
+
+    def _create_next_page_request(
         self, stream_slice: Mapping[str, Any] = None, stream_state: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
-    ) -> Tuple[requests.PreparedRequest, requests.Response]:
+    ) -> Tuple[requests.PreparedRequest, Mapping[str, Any]]:
         request_headers = self.request_headers(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
         request = self._create_prepared_request(
             path=self.path(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
@@ -454,11 +623,22 @@ class HttpStream(Stream, ABC):
             data=self.request_body_data(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
         )
         request_kwargs = self.request_kwargs(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+        return request, request_kwargs
 
+    def _fetch_next_page(
+        self, stream_slice: Mapping[str, Any] = None, stream_state: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> Tuple[requests.PreparedRequest, requests.Response]:
+        request, request_kwargs = self._create_next_page_request(stream_slice, stream_state, next_page_token)
         response = self._send_request(request, request_kwargs)
         return request, response
 
 
+def _close_response(future: Future) -> None:
+    # Releases the connection of a response that will never be read
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
 class HttpSubStream(HttpStream, ABC):
     def __init__(self, parent: HttpStream, **kwargs):
         """
@@ -0,0 +1,158 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+import re
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Iterator, List, Optional
+
+import requests
+
+logger = logging.getLogger("airbyte")
+
+# X-RateLimit-Reset values above this are epoch timestamps, below they are a number of seconds to wait
+_EPOCH_THRESHOLD_SECONDS = 1_000_000_000
+
+
+@dataclass
+class RateLimit:
+    """
+    Declares a rate limit enforced by an API.
+
+    Attributes:
+        requests (int): Maximum number of requests sent per period
+        period_seconds (float): Length of the period, e.g. 1 for requests per second or 60 for requests per minute
+        max_concurrent_requests (Optional[int]): Maximum number of requests in flight at the same time
+        url_pattern (Optional[str]): Regular expression searched in the URL of the requests the limit applies to. The limit applies to
+          all the requests of the source when not set
+    """
+
+    requests: int
+    period_seconds: float = 1.0
+    max_concurrent_requests: Optional[int] = None
+    url_pattern: Optional[str] = None
+
+
+class TokenBucket:
+    """
+    Lets requests through at a sustained rate of one every period_seconds / requests seconds, with bursts of up to requests requests.
+    Sending is paused altogether when the API reports its limit is exhausted.
+    """
+
+    def __init__(self, rate_limit: RateLimit):
+        self.rate_limit = rate_limit
+        self._capacity = float(rate_limit.requests)
+        self._rate = rate_limit.requests / rate_limit.period_seconds
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._url_pattern = re.compile(rate_limit.url_pattern) if rate_limit.url_pattern else None
+        self._concurrency = threading.BoundedSemaphore(rate_limit.max_concurrent_requests) if rate_limit.max_concurrent_requests else None
+
+    def matches(self, request: requests.PreparedRequest) -> bool:
+        return self._url_pattern is None or bool(self._url_pattern.search(request.url or ""))
+
+    def acquire(self) -> None:
+        """
+        Blocks until a request can be sent
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+                self._updated_at = now
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(self._paused_until - now, (1 - self._tokens) / self._rate)
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Holds every request back for the next seconds, and drains the bucket so that requests resume at the sustained rate
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+    @contextmanager
+    def concurrency_slot(self) -> Iterator[None]:
+        if self._concurrency is None:
+            yield
+            return
+        with self._concurrency:
+            yield
+
+
+class RateLimiter:
+    """
+    Schedules the requests of all the streams of a source according to its rate limits. Requests wait for a token of every bucket
+    matching their URL before being sent, and the rate limit headers of the responses pause the buckets when the API reports that
+    its limit is exhausted. This avoids hitting 429 responses and backing off, so the source runs at the API's sustained rate.
+    """
+
+    def __init__(self, rate_limits: List[RateLimit]):
+        self._buckets = [TokenBucket(rate_limit) for rate_limit in rate_limits]
+
+    @contextmanager
+    def limit(self, request: requests.PreparedRequest) -> Iterator[None]:
+        """
+        Waits until the request can be sent, then holds its concurrency slots until the context exits
+        """
+        buckets = [bucket for bucket in self._buckets if bucket.matches(request)]
+        with ExitStack() as stack:
+            for bucket in buckets:
+                stack.enter_context(bucket.concurrency_slot())
+            for bucket in buckets:
+                bucket.acquire()
+            yield
+
+    def update(self, request: requests.PreparedRequest, response: requests.Response) -> None:
+        """
+        Pauses the buckets of the request when the response says no request should be sent for a while
+        """
+        wait = self.wait_time(response)
+        if wait:
+            logger.info(f"Rate limit reached for {request.url}, holding requests back for {wait} seconds")
+            for bucket in self._buckets:
+                if bucket.matches(request):
+                    bucket.pause(wait)
+
+    @staticmethod
+    def wait_time(response: requests.Response) -> Optional[float]:
+        """
+        :return: the number of seconds to wait before sending the next request according to the Retry-After header, or to the
+          X-RateLimit-Remaining and X-RateLimit-Reset headers when no request remains, None if requests can be sent right away
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        try:
+            if remaining is None or float(remaining) > 0:
+                return None
+        except ValueError:
+            return None
+        reset = response.headers.get("X-RateLimit-Reset")
+        try:
+            reset_seconds = float(reset)
+        except (TypeError, ValueError):
+            # The API does not tell when the limit resets, wait for a second which is the shortest period limits are defined over
+            return 1.0
+        if reset_seconds > _EPOCH_THRESHOLD_SECONDS:
+            return max(0.0, reset_seconds - time.time())
+        return reset_seconds
@@ -12,6 +12,7 @@ import requests
 from requests.auth import AuthBase
 
 from ..exceptions import DefaultBackoffException
+from ..transport import HttpTransport, default_transport
 
 logger = logging.getLogger("airbyte")
 
@@ -23,6 +24,8 @@ class AbstractOauth2Authenticator(AuthBase):
     delegating that behavior to the classes implementing the interface.
     """
 
+    transport: HttpTransport = default_transport  # Connection pools the token refresh requests are sent through
+
     def __call__(self, request: requests.Request) -> requests.Request:
         """Attach the HTTP headers required to authenticate on the HTTP request"""
         request.headers.update(self.get_auth_header())
@@ -79,7 +82,9 @@ class AbstractOauth2Authenticator(AuthBase):
     )
     def _get_refresh_access_token_response(self):
         try:
-            response = requests.request(method="POST", url=self.get_token_refresh_endpoint(), data=self.build_refresh_request_body())
+            response = self.transport.session.request(
+                method="POST", url=self.get_token_refresh_endpoint(), data=self.build_refresh_request_body()
+            )
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -0,0 +1,68 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Number of hosts whose connections are kept open
+DEFAULT_POOL_CONNECTIONS = 10
+# Number of connections kept open to each host, which should be at least the number of requests sent concurrently to a host
+DEFAULT_POOL_MAXSIZE = 10
+
+
+class HttpTransport:
+    """
+    Connection pools shared by every session of a source. Streams mounting the same transport reuse each other's keep-alive
+    connections instead of opening, and negotiating TLS for, new connections to the same hosts.
+
+    The requests library only speaks HTTP/1.1: connections are reused sequentially, so pool_maxsize bounds how many requests can be
+    in flight to a single host without opening short-lived connections.
+    """
+
+    def __init__(
+        self, pool_connections: int = DEFAULT_POOL_CONNECTIONS, pool_maxsize: int = DEFAULT_POOL_MAXSIZE, pool_block: bool = False
+    ):
+        """
+        :param pool_connections: number of hosts whose connections are kept open
+        :param pool_maxsize: number of connections kept open to each host
+        :param pool_block: whether requests wait for a connection to be released when pool_maxsize connections to their host are in
+          use, rather than opening a connection that is discarded once the request is complete
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self._adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        self._session: Optional[requests.Session] = None
+        self._lock = threading.Lock()
+
+    def mount(self, session: requests.Session) -> requests.Session:
+        """
+        Sends the requests of session through the connection pools of the transport
+        :return: the session
+        """
+        session.mount("https://", self._adapter)
+        session.mount("http://", self._adapter)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Session sending requests that do not belong to a stream through the transport, e.g. to refresh access tokens
+        """
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self.mount(requests.Session())
+        return self._session
+
+    def close(self) -> None:
+        """
+        Closes the connections of the pools, which are reopened by the next requests
+        """
+        self._adapter.close()
+
+
+default_transport = HttpTransport()
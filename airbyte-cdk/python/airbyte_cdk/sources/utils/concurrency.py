@@ -0,0 +1,149 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Deque, Iterable, Iterator, Tuple, TypeVar
+
+S = TypeVar("S")
+T = TypeVar("T")
+
+# How long a blocked worker waits before re-checking whether the consumer went away
+_POLL_INTERVAL_SECONDS = 0.1
+
+
+class _IteratorDone:
+    """Sentinel put on the queue by a worker once the iterator it was draining is exhausted"""
+
+
+class _IteratorFailed:
+    """Wraps an exception raised by a worker so that it can be re-raised on the consuming thread"""
+
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+def _put(buffer: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    """
+    Puts item on the bounded buffer, waiting for free space unless the consumer asked the workers to stop.
+    :return: False if the consumer stopped before the item could be buffered
+    """
+    while not stop.is_set():
+        try:
+            buffer.put(item, timeout=_POLL_INTERVAL_SECONDS)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _drain(produce: Callable[[], Iterable[Any]], buffer: queue.Queue, stop: threading.Event) -> None:
+    if stop.is_set():
+        return
+    iterable = None
+    try:
+        iterable = produce()
+        for item in iterable:
+            if not _put(buffer, item, stop):
+                return
+    except BaseException as e:
+        _put(buffer, _IteratorFailed(e), stop)
+        return
+    finally:
+        close = getattr(iterable, "close", None)
+        if close:
+            close()
+    _put(buffer, _IteratorDone(), stop)
+
+
+def _consume(buffer: queue.Queue) -> Iterator[Any]:
+    while True:
+        item = buffer.get()
+        if isinstance(item, _IteratorDone):
+            return
+        elif isinstance(item, _IteratorFailed):
+            raise item.exception
+        yield item
+
+
+def read_concurrently(iterators: Iterable[Iterator[T]], max_workers: int, buffer_size: int = 1000) -> Iterator[T]:
+    """
+    Drains up to max_workers iterators at the same time on a pool of threads and merges what they produce into a single iterator
+    consumed from the calling thread. Items coming from the same iterator are yielded in the order that iterator produced them,
+    items coming from different iterators are interleaved in the order they became available.
+
+    The first exception raised by any of the iterators is re-raised from this generator. When the generator is closed or fails, the
+    remaining iterators are not started and the ones already running are stopped at their next item.
+
+    :param iterators: the iterators to drain. They are only started once a worker is available to consume them
+    :param max_workers: the maximum number of iterators consumed at the same time
+    :param buffer_size: the maximum number of items buffered across all workers before they block
+    """
+    iterators = list(iterators)
+    if not iterators:
+        return
+    buffer: queue.Queue = queue.Queue(maxsize=buffer_size)
+    stop = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="concurrent_read")
+    futures = [executor.submit(_drain, iterator.__iter__, buffer, stop) for iterator in iterators]
+    remaining = len(futures)
+    try:
+        while remaining:
+            item = buffer.get()
+            if isinstance(item, _IteratorDone):
+                remaining -= 1
+            elif isinstance(item, _IteratorFailed):
+                raise item.exception
+            else:
+                yield item
+    finally:
+        stop.set()
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def read_in_order(
+    inputs: Iterable[S], read: Callable[[S], Iterable[T]], max_workers: int, buffer_size: int = 1000
+) -> Iterator[Tuple[S, Iterator[T]]]:
+    """
+    Calls read on each input ahead of time on a pool of threads, while handing the results back in the order of the inputs. This
+    generator yields a (input, items) pair per input, where items iterates over what read produced for that input. The items of the
+    next max_workers - 1 inputs are prefetched while the current ones are consumed, so the consumer must be done with the items
+    of an input before moving on to the next one.
+
+    Exceptions raised by read are re-raised while iterating over the items of the input that caused them. When the generator is
+    closed, prefetching stops and the inputs that were not reached yet are never read.
+
+    :param inputs: the inputs to read, only pulled from when a worker is available to read them
+    :param read: produces the items of an input
+    :param max_workers: the maximum number of inputs read at the same time
+    :param buffer_size: the maximum number of items buffered per input before its worker blocks
+    """
+    inputs = iter(inputs)
+    stop = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ordered_read")
+    pending: Deque[Tuple[S, queue.Queue]] = deque()
+
+    def submit_next() -> bool:
+        for next_input in inputs:
+            buffer: queue.Queue = queue.Queue(maxsize=buffer_size)
+            executor.submit(_drain, partial(read, next_input), buffer, stop)
+            pending.append((next_input, buffer))
+            return True
+        return False
+
+    try:
+        while len(pending) < max_workers and submit_next():
+            pass
+        while pending:
+            current_input, buffer = pending.popleft()
+            yield current_input, _consume(buffer)
+            submit_next()
+    finally:
+        stop.set()
+        executor.shutdown(wait=True)
@@ -3,12 +3,14 @@
 #
 
 import datetime
+import time
 from typing import Any, Mapping
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, AirbyteRecordMessage, AirbyteTraceMessage
 from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources.streams.core import StreamData
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
+from airbyte_cdk.utils.stream_metrics import metrics_registry
 
 
 def stream_data_to_airbyte_message(
@@ -27,9 +29,16 @@ def stream_data_to_airbyte_message(
         # need it to normalize values against json schema. By default no action
         # taken unless configured. See
         # docs/connector-development/cdk-python/schemas.md for details.
-        transformer.transform(data, schema)  # type: ignore
-        message = AirbyteRecordMessage(stream=stream_name, data=data, emitted_at=now_millis)
-        return AirbyteMessage(type=MessageType.RECORD, record=message)
+        if metrics_registry.enabled:
+            started_at = time.perf_counter()
+            transformer.transform(data, schema)  # type: ignore
+            metrics_registry.stream(stream_name).record_transform(time.perf_counter() - started_at)
+        else:
+            transformer.transform(data, schema)  # type: ignore
+        # Records are emitted for every row read by the source so they are built without pydantic validation, all the fields are
+        # already of the expected types.
+        message = AirbyteRecordMessage.construct(stream=stream_name, data=data, emitted_at=now_millis)
+        return AirbyteMessage.construct(type=MessageType.RECORD, record=message)
     elif isinstance(data_or_message, AirbyteTraceMessage):
         return AirbyteMessage(type=MessageType.TRACE, trace=data_or_message)
     elif isinstance(data_or_message, AirbyteLogMessage):
@@ -2,12 +2,17 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import hashlib
+import json
 import logging
+import numbers
+import threading
+from collections import OrderedDict
 from distutils.util import strtobool
 from enum import Flag, auto
-from typing import Any, Callable, Dict, Mapping, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
-from jsonschema import Draft7Validator, ValidationError, validators
+from jsonschema import Draft7Validator, RefResolutionError, RefResolver, ValidationError, validators
 
 json_to_python_simple = {"string": str, "number": float, "integer": int, "boolean": bool, "null": type(None)}
 json_to_python = {**json_to_python_simple, **{"object": dict, "array": list}}
@@ -15,6 +20,26 @@ python_to_json = {v: k for k, v in json_to_python.items()}
 
 logger = logging.getLogger("airbyte")
 
+# Same semantics as the Draft7 type checker used by jsonschema
+_type_checkers: Dict[str, Callable[[Any], bool]] = {
+    "array": lambda instance: isinstance(instance, list),
+    "boolean": lambda instance: isinstance(instance, bool),
+    "integer": lambda instance: not isinstance(instance, bool)
+    and (isinstance(instance, int) or (isinstance(instance, float) and instance.is_integer())),
+    "null": lambda instance: instance is None,
+    "number": lambda instance: not isinstance(instance, bool) and isinstance(instance, numbers.Number),
+    "object": lambda instance: isinstance(instance, dict),
+    "string": lambda instance: isinstance(instance, str),
+}
+
+# A compiled schema normalizes an instance in place and appends the validation errors it finds. The path argument is the key path of
+# the instance being normalized, as a stack that is only copied when an error is found.
+CompiledSchema = Callable[[Any, List[Any], List[ValidationError]], None]
+
+
+class _UnsupportedSchema(Exception):
+    """Raised when compiling a schema that relies on jsonschema features the compiled transformation does not reproduce"""
+
 
 class TransformConfig(Flag):
     """
@@ -41,6 +66,8 @@ class TypeTransformer:
     """
 
     _custom_normalizer: Optional[Callable[[Any, Dict[str, Any]], Any]] = None
+    # Number of distinct schemas kept compiled by a transformer, a transformer is usually shared by the instances of a stream class
+    COMPILED_SCHEMAS_CACHE_SIZE = 32
 
     def __init__(self, config: TransformConfig):
         """
@@ -57,6 +84,15 @@ class TypeTransformer:
             if key in ["type", "array", "$ref", "properties", "items"]
         }
         self._normalizer = validators.create(meta_schema=Draft7Validator.META_SCHEMA, validators=all_validators)
+        # Compiled schemas by schema content, so that equal schemas loaded again for every record are only compiled once
+        self._compiled_schemas: "OrderedDict[str, Optional[CompiledSchema]]" = OrderedDict()
+        # Content keys by schema identity, along with the schema itself to make sure the identity is not reused, so that the schema
+        # objects reused between records are not serialized again
+        self._schema_keys: "OrderedDict[int, Tuple[Mapping[str, Any], str]]" = OrderedDict()
+        # Last schema looked up along with its content key, the schemas of streams loading them again for every record are equal to it
+        self._last_schema_key: Optional[Tuple[Mapping[str, Any], str]] = None
+        # A transformer is shared by the instances of a stream class, which may be read on several threads
+        self._cache_lock = threading.Lock()
 
     def registerCustomTransform(self, normalization_callback: Callable[[Any, Dict[str, Any]], Any]) -> Callable:
         """
@@ -70,6 +106,8 @@ class TypeTransformer:
         if TransformConfig.CustomSchemaNormalization not in self._config:
             raise Exception("Please set TransformConfig.CustomSchemaNormalization config before registering custom normalizer")
         self._custom_normalizer = normalization_callback
+        with self._cache_lock:
+            self._compiled_schemas.clear()
         return normalization_callback
 
     def __normalize(self, original_item: Any, subschema: Dict[str, Any]) -> Any:
@@ -180,6 +218,13 @@ class TypeTransformer:
         """
         if TransformConfig.NoTransform in self._config:
             return
+        compiled_schema = self._get_compiled_schema(schema)
+        if compiled_schema:
+            errors: List[ValidationError] = []
+            compiled_schema(record, [], errors)
+            for e in errors:
+                logger.warning(self.get_error_message(e))
+            return
         normalizer = self._normalizer(schema)
         for e in normalizer.iter_errors(record):
             """
@@ -188,9 +233,272 @@ class TypeTransformer:
             """
             logger.warning(self.get_error_message(e))
 
+    def _get_compiled_schema(self, schema: Mapping[str, Any]) -> Optional[CompiledSchema]:
+        """
+        Returns the schema compiled once into plain python closures, which transform records the same way as the jsonschema based
+        traversal without building a validator nor resolving references for every record. None is returned for the schemas using
+        features the compiled transformation does not support, these are transformed through jsonschema. Schemas are cached by
+        content since streams may load their schema again for every record, e.g: the declarative streams.
+        """
+        with self._cache_lock:
+            return self._get_compiled_schema_unlocked(schema)
+
+    def _get_compiled_schema_unlocked(self, schema: Mapping[str, Any]) -> Optional[CompiledSchema]:
+        schema_key = self._schema_keys.get(id(schema))
+        if schema_key and schema_key[0] is schema:
+            key = schema_key[1]
+        elif self._last_schema_key and self._last_schema_key[0] == schema:
+            # A copy of the last schema: comparing them is much cheaper than serializing and hashing it again for every record
+            key = self._last_schema_key[1]
+        else:
+            try:
+                key = hashlib.sha256(json.dumps(schema, sort_keys=True, default=str).encode()).hexdigest()
+            except ValueError:
+                # Self referencing schemas cannot be serialized, they are transformed through jsonschema
+                return None
+            self._schema_keys[id(schema)] = (schema, key)
+            if len(self._schema_keys) > self.COMPILED_SCHEMAS_CACHE_SIZE:
+                self._schema_keys.popitem(last=False)
+            self._last_schema_key = (schema, key)
+        if key in self._compiled_schemas:
+            return self._compiled_schemas[key]
+        try:
+            compiled_schema = _SchemaCompiler(self, schema).compile()
+        except _UnsupportedSchema:
+            compiled_schema = None
+        self._compiled_schemas[key] = compiled_schema
+        if len(self._compiled_schemas) > self.COMPILED_SCHEMAS_CACHE_SIZE:
+            self._compiled_schemas.popitem(last=False)
+        return compiled_schema
+
+    def _compile_normalizer(self, subschema: Any) -> Callable[[Any], Any]:
+        """
+        Builds the equivalent of __normalize for a single subschema, with the type dispatch of default_convert done once.
+        """
+        converters = []
+        if TransformConfig.DefaultSchemaNormalization in self._config:
+            if type(self).default_convert is TypeTransformer.default_convert:
+                converters.append(_compile_default_converter(subschema))
+            else:
+                converters.append(lambda item: self.default_convert(item, subschema))
+        custom_normalizer = self._custom_normalizer
+        if custom_normalizer:
+            converters.append(lambda item: custom_normalizer(item, subschema))
+
+        if len(converters) == 1:
+            return converters[0]
+
+        def normalize(item: Any) -> Any:
+            for converter in converters:
+                item = converter(item)
+            return item
+
+        return normalize
+
     def get_error_message(self, e: ValidationError) -> str:
         instance_json_type = python_to_json[type(e.instance)]
         key_path = "." + ".".join(map(str, e.path))
         return (
             f"Failed to transform value {repr(e.instance)} of type '{instance_json_type}' to '{e.validator_value}', key path: '{key_path}'"
         )
+
+
+def _compile_default_converter(subschema: Any) -> Callable[[Any], Any]:
+    """
+    Specializes TypeTransformer.default_convert for a subschema. Subschemas whose types cannot be interpreted up front keep calling
+    default_convert so that they behave exactly the same.
+    """
+
+    def generic(item: Any) -> Any:
+        return TypeTransformer.default_convert(item, subschema)
+
+    try:
+        target_type = subschema.get("type", [])
+    except AttributeError:
+        return generic
+    if not isinstance(target_type, (str, list)) or not all(isinstance(t, str) for t in target_type):
+        return generic
+    nullable = "null" in target_type
+    if isinstance(target_type, list):
+        target_type = [t for t in target_type if t != "null"]
+        if len(target_type) != 1:
+            return lambda item: item
+        target_type = target_type[0]
+
+    def with_fallback(cast: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        def convert(item: Any) -> Any:
+            if item is None and nullable:
+                return None
+            try:
+                return cast(item)
+            except (ValueError, TypeError):
+                return item
+
+        return convert
+
+    if target_type == "string":
+        return with_fallback(lambda item: item if type(item) is str else str(item))
+    elif target_type == "number":
+        return with_fallback(lambda item: item if type(item) is float else float(item))
+    elif target_type == "integer":
+        return with_fallback(lambda item: item if type(item) is int else int(item))
+    elif target_type == "boolean":
+        return with_fallback(lambda item: strtobool(item) == 1 if isinstance(item, str) else bool(item))
+    elif target_type == "array":
+        try:
+            item_types = set(subschema.get("items", {}).get("type", set()))
+        except (AttributeError, TypeError):
+            return generic
+        if not item_types.issubset(json_to_python_simple):
+            return lambda item: item
+        simple_types = tuple(json_to_python_simple.values())
+        return with_fallback(lambda item: [item] if type(item) in simple_types else item)
+    return lambda item: item
+
+
+class _SchemaCompiler:
+    """
+    Compiles a json schema into closures reproducing the jsonschema based traversal of TypeTransformer: the "properties", "items",
+    "$ref" and "type" keywords are applied in the order they appear in each subschema, the values of an object or array are normalized
+    before descending into them and local references are resolved once, at compilation time.
+    """
+
+    def __init__(self, transformer: TypeTransformer, schema: Mapping[str, Any]):
+        self._transformer = transformer
+        self._schema = schema
+        self._resolver = RefResolver.from_schema(schema)
+        # Compiled subschemas by identity, which makes recursive schemas compile to a cyclic graph of closures
+        self._compiled: Dict[int, CompiledSchema] = {}
+
+    def compile(self) -> CompiledSchema:
+        return self._compile(self._schema)
+
+    def _resolve(self, ref: Any) -> Any:
+        if not isinstance(ref, str) or not ref.startswith("#"):
+            raise _UnsupportedSchema(f"Only local references are supported, got {ref}")
+        _, resolved = self._resolver.resolve(ref)
+        return resolved
+
+    def _resolve_once(self, subschema: Any) -> Any:
+        """Same as the resolve function used by the jsonschema based normalizer: a single level of reference is resolved"""
+        if not isinstance(subschema, dict):
+            raise _UnsupportedSchema()
+        if "$ref" in subschema:
+            return self._resolve(subschema["$ref"])
+        return subschema
+
+    def _compile_normalizer(self, subschema: Any) -> Callable[[Any], Any]:
+        try:
+            return self._transformer._compile_normalizer(self._resolve_once(subschema))
+        except RefResolutionError as error:
+            return _raising(error)
+
+    def _compile(self, schema: Any) -> CompiledSchema:
+        if not isinstance(schema, dict) or "$id" in schema:
+            # Boolean schemas and resolution scopes are left to jsonschema
+            raise _UnsupportedSchema()
+        if id(schema) in self._compiled:
+            return self._compiled[id(schema)]
+
+        steps: List[CompiledSchema] = []
+
+        def run(instance: Any, path: List[Any], errors: List[ValidationError]) -> None:
+            for step in steps:
+                step(instance, path, errors)
+
+        self._compiled[id(schema)] = run
+
+        ref = schema.get("$ref")
+        if ref is not None:
+            # A reference replaces all the other keywords of its subschema
+            try:
+                steps.append(self._compile(self._resolve(ref)))
+            except RefResolutionError as error:
+                steps.append(_raising(error))
+            return run
+
+        for keyword, value in schema.items():
+            if keyword == "type":
+                steps.append(self._compile_type(schema, value))
+            elif keyword == "properties":
+                steps.append(self._compile_properties(value))
+            elif keyword == "items":
+                steps.append(self._compile_items(value))
+            elif keyword == "$ref":
+                raise _UnsupportedSchema()
+        return run
+
+    @staticmethod
+    def _compile_type(schema: Mapping[str, Any], types: Any) -> CompiledSchema:
+        type_names = [types] if isinstance(types, str) else types
+        if not isinstance(type_names, list) or not all(type_name in _type_checkers for type_name in type_names):
+            raise _UnsupportedSchema(f"Unsupported type {types}")
+        checkers = [_type_checkers[type_name] for type_name in type_names]
+        # Same message as the one of the jsonschema type validator
+        expected_types = ", ".join(repr(type_name) for type_name in type_names)
+
+        def check_type(instance: Any, path: List[Any], errors: List[ValidationError]) -> None:
+            for checker in checkers:
+                if checker(instance):
+                    return
+            errors.append(
+                ValidationError(
+                    f"{instance!r} is not of type {expected_types}",
+                    validator="type",
+                    validator_value=types,
+                    instance=instance,
+                    schema=schema,
+                    path=list(path),
+                )
+            )
+
+        return check_type
+
+    def _compile_properties(self, properties: Any) -> CompiledSchema:
+        if not isinstance(properties, dict):
+            raise _UnsupportedSchema()
+        compiled_properties = [
+            (name, self._compile_normalizer(subschema), self._compile(subschema)) for name, subschema in properties.items()
+        ]
+
+        def normalize_properties(instance: Any, path: List[Any], errors: List[ValidationError]) -> None:
+            if not isinstance(instance, dict):
+                return
+            for name, normalize, _ in compiled_properties:
+                if name in instance:
+                    instance[name] = normalize(instance[name])
+            for name, _, compiled_property in compiled_properties:
+                if name in instance:
+                    path.append(name)
+                    compiled_property(instance[name], path, errors)
+                    path.pop()
+
+        return normalize_properties
+
+    def _compile_items(self, items: Any) -> CompiledSchema:
+        if not isinstance(items, dict):
+            # Tuple validation and boolean schemas are left to jsonschema
+            raise _UnsupportedSchema()
+        normalize = self._compile_normalizer(items)
+        compiled_items = self._compile(items)
+
+        def normalize_items(instance: Any, path: List[Any], errors: List[ValidationError]) -> None:
+            if not isinstance(instance, list):
+                return
+            for index, item in enumerate(instance):
+                instance[index] = normalize(item)
+            for index, item in enumerate(instance):
+                path.append(index)
+                compiled_items(item, path, errors)
+                path.pop()
+
+        return normalize_items
+
+
+def _raising(error: Exception) -> Callable[..., Any]:
+    """Defers a reference resolution error to the moment the jsonschema based traversal would have raised it"""
+
+    def raise_error(*args: Any) -> Any:
+        raise error
+
+    return raise_error
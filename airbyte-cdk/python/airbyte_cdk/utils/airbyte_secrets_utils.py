@@ -2,7 +2,8 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Any, List, Mapping
+import re
+from typing import Any, List, Mapping, Optional, Pattern
 
 import dpath.util
 
@@ -54,19 +55,48 @@ def get_secrets(connection_specification: Mapping[str, Any], config: Mapping[str
 
 
 __SECRETS_FROM_CONFIG: List[str] = []
+# Matches any of the secrets, compiled once per update_secrets call. None when there is no secret to filter
+__SECRETS_PATTERN: Optional[Pattern] = None
+
+
+def _compile_secrets_pattern(secrets: List[Any]) -> Optional[Pattern]:
+    """
+    Compiles the secrets into a single alternation, longest first, inside a lookahead: the regex engine tries alternatives in order,
+    so the pattern matches at every position a secret starts at, capturing the longest secret starting there. Secrets overlapping each
+    other are all found, rather than only the leftmost one as a plain alternation would
+    """
+    values = sorted({str(secret) for secret in secrets if secret}, key=len, reverse=True)
+    if not values:
+        return None
+    return re.compile("(?=({}))".format("|".join(re.escape(value) for value in values)))
 
 
 def update_secrets(secrets: List[str]):
     """Update the list of secrets to be replaced"""
-    global __SECRETS_FROM_CONFIG
+    global __SECRETS_FROM_CONFIG, __SECRETS_PATTERN
     __SECRETS_FROM_CONFIG = secrets
+    __SECRETS_PATTERN = _compile_secrets_pattern(secrets)
 
 
 def filter_secrets(string: str) -> str:
-    """Filter secrets from a string by replacing them with ****"""
-    # TODO this should perform a maximal match for each secret. if "x" and "xk" are both secret values, and this method is called twice on
-    #  the input "xk", then depending on call order it might only obfuscate "*k". This is a bug.
-    for secret in __SECRETS_FROM_CONFIG:
-        if secret:
-            string = string.replace(str(secret), "****")
-    return string
+    """
+    Filter secrets from a string by replacing them with ****. All the secrets are found in a single pass over the string, and secrets
+    overlapping each other are masked together
+    """
+    if __SECRETS_PATTERN is None:
+        return string
+    masked_spans: List[List[int]] = []
+    for match in __SECRETS_PATTERN.finditer(string):
+        start, end = match.span(1)
+        if masked_spans and start < masked_spans[-1][1]:
+            masked_spans[-1][1] = max(masked_spans[-1][1], end)
+        else:
+            masked_spans.append([start, end])
+    if not masked_spans:
+        return string
+    parts, position = [], 0
+    for start, end in masked_spans:
+        parts.extend((string[position:start], "****"))
+        position = end
+    parts.append(string[position:])
+    return "".join(parts)
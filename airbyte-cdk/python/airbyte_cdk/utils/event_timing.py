@@ -4,6 +4,7 @@
 
 import datetime
 import logging
+import threading
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass, field
@@ -15,7 +16,7 @@ logger = logging.getLogger("airbyte")
 class EventTimer:
     """Simple nanosecond resolution event timer for debugging, initially intended to be used to record streams execution
     time for a source.
-       Event nesting follows a LIFO pattern, so finish will apply to the last started event.
+       Event nesting follows a LIFO pattern, so finish will apply to the last started event unless the event name is given.
     """
 
     def __init__(self, name):
@@ -23,25 +24,32 @@ class EventTimer:
         self.events = {}
         self.count = 0
         self.stack = []
+        self._lock = threading.Lock()
 
     def start_event(self, name):
         """
         Start a new event and push it to the stack.
         """
-        self.events[name] = Event(name=name)
-        self.count += 1
-        self.stack.insert(0, self.events[name])
+        with self._lock:
+            self.events[name] = Event(name=name)
+            self.count += 1
+            self.stack.insert(0, self.events[name])
 
-    def finish_event(self):
+    def finish_event(self, name: Optional[str] = None):
         """
         Finish the current event and pop it from the stack.
+        :param name: finish this event instead of the last started one, needed when events are started from several threads
         """
-
-        if self.stack:
-            event = self.stack.pop(0)
-            event.finish()
-        else:
-            logger.warning(f"{self.name} finish_event called without start_event")
+        with self._lock:
+            if name is not None and name in self.events and self.events[name] in self.stack:
+                event = self.events[name]
+                self.stack.remove(event)
+                event.finish()
+            elif self.stack:
+                event = self.stack.pop(0)
+                event.finish()
+            else:
+                logger.warning(f"{self.name} finish_event called without start_event")
 
     def report(self, order_by="name"):
         """
@@ -70,6 +78,9 @@ class Event:
         return float("+inf")
 
     def __str__(self):
+        if not self.end:
+            # Events of streams still being read concurrently are not finished yet when a report is generated
+            return f"{self.name} in progress"
         return f"{self.name} {datetime.timedelta(seconds=self.duration)}"
 
     def finish(self):
@@ -0,0 +1,144 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import threading
+from typing import Any, BinaryIO, Optional, Union
+
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage
+from airbyte_cdk.models import Type as MessageType
+from pydantic.json import pydantic_encoder
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup, the standard library encoder is used when it is not installed
+    orjson = None
+
+# Record fields that can be written without going through pydantic. Records setting any other field use the generic path
+_RECORD_FIELDS = {"namespace", "stream", "data", "emitted_at"}
+
+
+def _dumps(value) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=pydantic_encoder).decode("utf-8")
+        except (orjson.JSONEncodeError, TypeError):
+            # orjson is stricter than the standard library e.g: it rejects non-string keys and integers larger than 64 bits
+            pass
+    return json.dumps(value, default=pydantic_encoder)
+
+
+def airbyte_message_to_string(message: AirbyteMessage) -> str:
+    """
+    Serializes a message the same way as message.json(exclude_unset=True) does. RECORD messages, which are the overwhelming majority
+    of the messages emitted by a source, skip pydantic entirely: the protocol envelope is written directly around the record data.
+    When orjson is installed, record data is serialized with it and the output is equivalent but compact JSON.
+    """
+    record = message.record
+    if message.type != MessageType.RECORD or record is None or not message.__fields_set__ <= {"type", "record"}:
+        return message.json(exclude_unset=True)
+    record_fields = record.__fields_set__
+    if not record_fields <= _RECORD_FIELDS:
+        return message.json(exclude_unset=True)
+
+    # Follows the field order of AirbyteRecordMessage so that the output matches pydantic's
+    parts = []
+    if "namespace" in record_fields:
+        parts.append(f'"namespace": {json.dumps(record.namespace)}')
+    if "stream" in record_fields:
+        parts.append(f'"stream": {json.dumps(record.stream)}')
+    if "data" in record_fields:
+        parts.append(f'"data": {_dumps(record.data)}')
+    if "emitted_at" in record_fields:
+        parts.append(f'"emitted_at": {json.dumps(record.emitted_at)}')
+    return '{"type": "RECORD", "record": {' + ", ".join(parts) + "}}"
+
+
+def _loads(line: Union[str, bytes]) -> Any:
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def airbyte_message_from_string(line: Union[str, bytes]) -> AirbyteMessage:
+    """
+    Deserializes a message the same way as AirbyteMessage.parse_raw does. Well-formed RECORD messages skip pydantic validation: they
+    are built as lightweight models around the decoded record data, which is by far the most expensive part to validate.
+    :raises ValueError: if the line is not valid JSON or not a valid Airbyte message. pydantic's ValidationError is a ValueError.
+    """
+    message = _loads(line)
+    if isinstance(message, dict) and message.get("type") == MessageType.RECORD.value and message.keys() <= {"type", "record"}:
+        record = message.get("record")
+        if (
+            isinstance(record, dict)
+            and record.keys() <= _RECORD_FIELDS
+            and isinstance(record.get("stream"), str)
+            and isinstance(record.get("data"), dict)
+            and type(record.get("emitted_at")) is int
+            and isinstance(record.get("namespace", ""), str)
+        ):
+            return AirbyteMessage.construct(type=MessageType.RECORD, record=AirbyteRecordMessage.construct(**record))
+    return AirbyteMessage.parse_obj(message)
+
+
+class BufferedMessageWriter:
+    """
+    Writes serialized messages to a binary stream, typically sys.stdout.buffer, in large batches instead of one write per message.
+
+    Messages are written as whole lines so that they never interleave with log lines written to the same stream by another writer.
+    The buffer is flushed once it grows over buffer_size and after every message that is not a RECORD so that STATE, LOG and TRACE
+    messages are never held back. Records are never held back longer than flush_interval seconds either: a background thread flushes
+    the buffer while the source is blocked e.g: waiting for an API response, until the writer is closed.
+    """
+
+    def __init__(self, stream: BinaryIO, buffer_size: int = 64 * 1024, flush_interval: float = 1.0):
+        self._stream = stream
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+        self._lines = []
+        self._buffered_bytes = 0
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+
+    def write(self, message: str) -> None:
+        line = (message + "\n").encode("utf-8")
+        with self._lock:
+            self._lines.append(line)
+            self._buffered_bytes += len(line)
+            if self._buffered_bytes >= self._buffer_size or not message.startswith('{"type": "RECORD"'):
+                self._flush()
+            elif self._flusher is None and not self._closed.is_set():
+                self._flusher = threading.Thread(target=self._flush_periodically, name="message-writer-flush", daemon=True)
+                self._flusher.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._lines:
+            self._stream.write(b"".join(self._lines))
+            self._lines = []
+            self._buffered_bytes = 0
+        self._stream.flush()
+
+    def _flush_periodically(self) -> None:
+        while not self._closed.wait(self._flush_interval):
+            with self._lock:
+                if self._lines:
+                    self._flush()
+
+    def close(self) -> None:
+        """Flushes the buffer and stops the background flushes"""
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
+
+    def __enter__(self) -> "BufferedMessageWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,282 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, TypeVar
+
+try:
+    import resource
+except ImportError:  # resource is only available on unix platforms
+    resource = None
+
+T = TypeVar("T")
+
+# Upper bounds, in seconds, of the buckets of the HTTP request latency histogram. The last bucket counts slower requests
+LATENCY_BUCKETS_SECONDS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# Number of most recent slices reported per stream
+MAX_REPORTED_SLICES = 100
+
+
+class SliceMetrics:
+    """Records read and time spent reading a single slice of a stream"""
+
+    def __init__(self, stream_slice: Optional[Mapping[str, Any]]):
+        self.stream_slice = stream_slice
+        self.records = 0
+        self.started_at = time.monotonic()
+        self.finished_at: Optional[float] = None
+
+    @property
+    def duration(self) -> float:
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    def to_dict(self) -> Mapping[str, Any]:
+        return {
+            "slice": self.stream_slice,
+            "records": self.records,
+            "duration_seconds": round(self.duration, 6),
+            "finished": self.finished_at is not None,
+        }
+
+
+class StreamMetrics:
+    """
+    Throughput and latency counters of a single stream. Counters can be updated from several threads, e.g. when slices are prefetched.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.started_at = time.monotonic()
+        self.records = 0
+        self.bytes_emitted = 0
+        self.http_requests = 0
+        self.http_request_seconds = 0.0
+        self.latency_histogram = [0] * (len(LATENCY_BUCKETS_SECONDS) + 1)
+        self.backoff_seconds = 0.0
+        self.parse_seconds = 0.0
+        self.transform_seconds = 0.0
+        self.serialize_seconds = 0.0
+        self.slice_count = 0
+        self.slices: Deque[SliceMetrics] = deque(maxlen=MAX_REPORTED_SLICES)
+
+    def record_http_request(self, seconds: float) -> None:
+        with self._lock:
+            self.http_requests += 1
+            self.http_request_seconds += seconds
+            self.latency_histogram[bisect_left(LATENCY_BUCKETS_SECONDS, seconds)] += 1
+
+    def record_backoff(self, seconds: float) -> None:
+        with self._lock:
+            self.backoff_seconds += seconds
+
+    def record_parse(self, seconds: float) -> None:
+        with self._lock:
+            self.parse_seconds += seconds
+
+    def record_transform(self, seconds: float) -> None:
+        with self._lock:
+            self.transform_seconds += seconds
+
+    def record_emitted(self, size: int, seconds: float) -> None:
+        """
+        :param size: number of bytes of the serialized record
+        :param seconds: time spent serializing the record
+        """
+        with self._lock:
+            self.records += 1
+            self.bytes_emitted += size
+            self.serialize_seconds += seconds
+
+    def track_slice(self, stream_slice: Optional[Mapping[str, Any]], records: Iterable[T]) -> Iterator[T]:
+        """
+        Counts the records read for stream_slice and how long they took to read while they are iterated over
+        """
+        slice_metrics = SliceMetrics(stream_slice)
+        with self._lock:
+            self.slice_count += 1
+            self.slices.append(slice_metrics)
+        try:
+            for record in records:
+                if isinstance(record, Mapping):
+                    slice_metrics.records += 1
+                yield record
+        finally:
+            slice_metrics.finished_at = time.monotonic()
+
+    def to_dict(self) -> Mapping[str, Any]:
+        with self._lock:
+            elapsed = time.monotonic() - self.started_at
+            return {
+                "stream": self.name,
+                "elapsed_seconds": round(elapsed, 6),
+                "records": self.records,
+                "records_per_second": round(self.records / elapsed, 3) if elapsed else 0.0,
+                "bytes_emitted": self.bytes_emitted,
+                "http_requests": self.http_requests,
+                "http_request_seconds": round(self.http_request_seconds, 6),
+                "http_latency_histogram": {
+                    **{f"le_{bound}s": count for bound, count in zip(LATENCY_BUCKETS_SECONDS, self.latency_histogram)},
+                    f"gt_{LATENCY_BUCKETS_SECONDS[-1]}s": self.latency_histogram[-1],
+                },
+                "backoff_seconds": round(self.backoff_seconds, 6),
+                "parse_seconds": round(self.parse_seconds, 6),
+                "transform_seconds": round(self.transform_seconds, 6),
+                "serialize_seconds": round(self.serialize_seconds, 6),
+                "slices": self.slice_count,
+                "recent_slices": [slice_metrics.to_dict() for slice_metrics in self.slices],
+            }
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    :return: the peak resident set size of the process, or None when it cannot be measured on this platform
+    """
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on linux
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def timed(iterable: Iterable[T], record: Callable[[float], None]) -> Iterator[T]:
+    """
+    Iterates over iterable, reporting the time spent producing each item to record
+    """
+    iterator = iter(iterable)
+    while True:
+        started_at = time.perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            record(time.perf_counter() - started_at)
+            return
+        record(time.perf_counter() - started_at)
+        yield item
+
+
+class NoopStreamMetrics(StreamMetrics):
+    """
+    Stream metrics which collect nothing, used when no metrics are reported
+    """
+
+    def record_http_request(self, seconds: float) -> None:
+        pass
+
+    def record_backoff(self, seconds: float) -> None:
+        pass
+
+    def record_parse(self, seconds: float) -> None:
+        pass
+
+    def record_transform(self, seconds: float) -> None:
+        pass
+
+    def record_emitted(self, size: int, seconds: float) -> None:
+        pass
+
+    def track_slice(self, stream_slice: Optional[Mapping[str, Any]], records: Iterable[T]) -> Iterator[T]:
+        return iter(records)
+
+
+class MetricsRegistry:
+    """
+    Collects the metrics of the streams read by the process.
+
+    The report is emitted periodically as a log message when AIRBYTE_METRICS_INTERVAL_SECONDS is set and written as JSON to the file
+    AIRBYTE_METRICS_PATH points to, if any, once the read is over.
+    """
+
+    ENV_METRICS_INTERVAL_SECONDS = "AIRBYTE_METRICS_INTERVAL_SECONDS"
+    ENV_METRICS_PATH = "AIRBYTE_METRICS_PATH"
+    # Whether metrics are collected at all, the code measuring them on the hot path is skipped otherwise
+    enabled = True
+
+    @classmethod
+    def configured(cls) -> bool:
+        """
+        :return: True when the environment asks for metrics to be reported
+        """
+        return bool(os.environ.get(cls.ENV_METRICS_INTERVAL_SECONDS) or os.environ.get(cls.ENV_METRICS_PATH))
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._streams: Dict[str, StreamMetrics] = {}
+        self._last_report_at = time.monotonic()
+
+    def stream(self, name: str) -> StreamMetrics:
+        metrics = self._streams.get(name)
+        if metrics is None:
+            with self._lock:
+                metrics = self._streams.setdefault(name, StreamMetrics(name))
+        return metrics
+
+    def reset(self) -> None:
+        with self._lock:
+            self._streams = {}
+            self._last_report_at = time.monotonic()
+
+    def report(self) -> Mapping[str, Any]:
+        with self._lock:
+            streams: List[StreamMetrics] = list(self._streams.values())
+        return {"peak_rss_bytes": peak_rss_bytes(), "streams": [metrics.to_dict() for metrics in streams]}
+
+    @property
+    def report_interval(self) -> Optional[float]:
+        interval = os.environ.get(self.ENV_METRICS_INTERVAL_SECONDS)
+        return float(interval) if interval else None
+
+    def report_due(self) -> bool:
+        """
+        :return: True, at most once per report interval, when periodic reports are enabled
+        """
+        interval = self.report_interval
+        if not interval:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_report_at < interval:
+                return False
+            self._last_report_at = now
+            return True
+
+    def dump(self) -> None:
+        """
+        Writes the report to the file AIRBYTE_METRICS_PATH points to, if it is set
+        """
+        path = os.environ.get(self.ENV_METRICS_PATH)
+        if path:
+            with open(path, "w") as metrics_file:
+                json.dump(self.report(), metrics_file, default=str)
+
+
+class NoopMetricsRegistry(MetricsRegistry):
+    """
+    Registry which collects nothing, used when no AIRBYTE_METRICS_* setting is set so that reading records isn't slowed down
+    """
+
+    enabled = False
+
+    def __init__(self):
+        super().__init__()
+        self._noop_stream = NoopStreamMetrics("")
+
+    def stream(self, name: str) -> StreamMetrics:
+        return self._noop_stream
+
+    @property
+    def report_interval(self) -> Optional[float]:
+        return None
+
+    def dump(self) -> None:
+        pass
+
+
+metrics_registry = MetricsRegistry() if MetricsRegistry.configured() else NoopMetricsRegistry()
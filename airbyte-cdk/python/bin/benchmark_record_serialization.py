@@ -0,0 +1,70 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures how many RECORD messages per second can be built and written to stdout, comparing the generic pydantic path used before
+with the fast path used by the entrypoint. Run with: python bin/benchmark_record_serialization.py [--records N] [--columns N]
+"""
+
+import argparse
+import datetime
+import os
+import time
+
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage
+from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
+from airbyte_cdk.utils import message_serializer
+from airbyte_cdk.utils.message_serializer import BufferedMessageWriter, airbyte_message_to_string
+
+
+def build_record(index: int, columns: int) -> dict:
+    record = {"id": index, "updated_at": "2023-01-01T00:00:00Z", "active": index % 2 == 0}
+    for column in range(columns):
+        record[f"column_{column}"] = f"value {index} {column}" if column % 3 else column * 1.5
+    return record
+
+
+def pydantic_path(records, output) -> None:
+    for record in records:
+        now_millis = int(datetime.datetime.now().timestamp() * 1000)
+        message = AirbyteMessage(
+            type=MessageType.RECORD, record=AirbyteRecordMessage(stream="benchmark", data=record, emitted_at=now_millis)
+        )
+        print(message.json(exclude_unset=True), file=output)
+
+
+def fast_path(records, output) -> None:
+    with BufferedMessageWriter(output.buffer) as writer:
+        for record in records:
+            writer.write(airbyte_message_to_string(stream_data_to_airbyte_message("benchmark", record)))
+
+
+def run(name: str, path, records) -> None:
+    with open(os.devnull, "w") as output:
+        start = time.perf_counter()
+        path(records, output)
+        elapsed = time.perf_counter() - start
+    print(f"{name:<24} {len(records) / elapsed:>12,.0f} records/sec")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--columns", type=int, default=50)
+    args = parser.parse_args()
+
+    records = [build_record(index, args.columns) for index in range(args.records)]
+    print(f"{args.records} records of {args.columns + 3} columns")
+    run("pydantic", pydantic_path, records)
+    orjson = message_serializer.orjson
+    message_serializer.orjson = None
+    run("fast path (json)", fast_path, records)
+    message_serializer.orjson = orjson
+    if orjson is not None:
+        run("fast path (orjson)", fast_path, records)
+
+
+if __name__ == "__main__":
+    main()
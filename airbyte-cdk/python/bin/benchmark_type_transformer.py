@@ -0,0 +1,124 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures how many records per second TypeTransformer normalizes with DefaultSchemaNormalization, comparing the jsonschema based
+traversal with the compiled schemas, for streams sharing their schema object between records and for streams loading it again for
+every record. Records are generated from the json schemas shipped with the connectors of this repository.
+Run with: python bin/benchmark_type_transformer.py [--connectors-path PATH] [--records N]
+"""
+
+import argparse
+import copy
+import glob
+import json
+import logging
+import os
+import random
+import time
+from typing import Any, List, Mapping, Tuple
+
+import jsonref
+from airbyte_cdk.sources.utils.schema_helpers import JsonFileLoader, resolve_ref_links
+from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
+
+CONNECTORS_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "..", "airbyte-integrations", "connectors")
+# Values that need casting, are already valid or cannot be cast, so that every code path of the transformer is exercised
+SAMPLE_VALUES = {"string": [12, "value"], "integer": ["12", 12, "a"], "number": ["1.5", 1.5], "boolean": ["true", 1, True]}
+
+
+def sample_value(schema: Any, depth: int = 0) -> Any:
+    if not isinstance(schema, dict) or "$ref" in schema:
+        return None
+    types = schema.get("type", [])
+    types = [types] if isinstance(types, str) else [t for t in types if t != "null"]
+    if "object" in types and depth < 5:
+        return {name: sample_value(subschema, depth + 1) for name, subschema in schema.get("properties", {}).items()}
+    if "array" in types and depth < 5:
+        return [sample_value(schema.get("items", {}), depth + 1) for _ in range(2)]
+    for json_type in types:
+        if json_type in SAMPLE_VALUES:
+            return random.choice(SAMPLE_VALUES[json_type])
+    return None
+
+
+def load_schemas(connectors_path: str) -> List[Tuple[str, Mapping[str, Any]]]:
+    schemas = []
+    for path in sorted(glob.glob(os.path.join(connectors_path, "source-*", "source_*", "schemas", "*.json"))):
+        package_path = os.path.dirname(os.path.dirname(path)) + "/"
+        try:
+            with open(path) as schema_file:
+                raw_schema = json.load(schema_file)
+            # Resolves the references to shared schemas the same way as ResourceSchemaLoader does for the connector packages
+            schema = resolve_ref_links(
+                jsonref.JsonRef.replace_refs(raw_schema, loader=JsonFileLoader(package_path, "schemas/shared"), base_uri=package_path)
+            )
+        except Exception:
+            continue
+        if isinstance(schema, dict) and schema.get("properties"):
+            schemas.append((path, schema))
+    return schemas
+
+
+def transforms_without_error(schema: Mapping[str, Any], record: dict) -> bool:
+    """A few connector schemas are not valid json schemas e.g: "items" given as a list, they make both transformers raise"""
+    try:
+        TypeTransformer(TransformConfig.DefaultSchemaNormalization).transform(copy.deepcopy(record), schema)
+        return True
+    except Exception:
+        return False
+
+
+def run(name: str, transformer: TypeTransformer, workload: List[Tuple[Mapping[str, Any], dict]], reload_schema: bool = False) -> None:
+    """
+    :param reload_schema: whether every record is transformed with a new copy of its schema, as the streams loading their schema
+    for every record do, instead of the schema object shared by the records of a stream
+    """
+    # Schemas are compiled once per stream for the whole sync, the first record of each schema is used to measure it separately
+    warmup = {id(schema): (schema, copy.deepcopy(record)) for schema, record in workload}.values()
+    start = time.perf_counter()
+    for schema, record in warmup:
+        transformer.transform(record, copy.deepcopy(schema) if reload_schema else schema)
+    warmup_elapsed = time.perf_counter() - start
+
+    records = [(schema, copy.deepcopy(record)) for schema, record in workload]
+    elapsed = 0.0
+    for schema, record in records:
+        # Only the transformation is measured, not the loading of the schema
+        if reload_schema:
+            schema = copy.deepcopy(schema)
+        start = time.perf_counter()
+        transformer.transform(record, schema)
+        elapsed += time.perf_counter() - start
+    print(f"{name:<16} {len(records) / elapsed:>12,.0f} records/sec (first record of each schema: {warmup_elapsed:.2f}s)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--connectors-path", default=CONNECTORS_PATH)
+    parser.add_argument("--records", type=int, default=200, help="records generated per schema")
+    args = parser.parse_args()
+
+    # Casting failures are expected, their warnings would only measure the logging configuration
+    logging.disable(logging.WARNING)
+    random.seed(0)
+    schemas = load_schemas(args.connectors_path)
+    workload = [(schema, sample_value(schema)) for _, schema in schemas for _ in range(args.records)]
+    workload = [(schema, record) for schema, record in workload if transforms_without_error(schema, record)]
+    print(f"{len(workload)} records over {len(schemas)} connector schemas")
+
+    jsonschema_transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    jsonschema_transformer._get_compiled_schema = lambda schema: None
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    transformer.COMPILED_SCHEMAS_CACHE_SIZE = len(schemas)
+    reloading_transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    reloading_transformer.COMPILED_SCHEMAS_CACHE_SIZE = len(schemas)
+    run("jsonschema", jsonschema_transformer, workload)
+    run("compiled", transformer, workload)
+    # Declarative streams used to load their schema file again for every record
+    run("compiled/reload", reloading_transformer, workload, reload_schema=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -241,3 +241,32 @@ class TestRun:
     def test_run_cmd_with_incorrect_args_fails(self, args, destination: Destination):
         with pytest.raises(Exception):
             list(destination.run_cmd(parsed_args=argparse.Namespace(**args)))
+
+
+class TestWriteInBatches:
+    def test_records_are_written_in_batches_before_state(self, destination: Destination):
+        destination.batch_size = 2
+        written = []
+        input_messages = [
+            _wrapped(_record("s1", {"id": 1})),
+            _wrapped(_record("s2", {"id": 1})),
+            _wrapped(_record("s1", {"id": 2})),
+            _wrapped(_record("s1", {"id": 3})),
+            _wrapped(_state({"k": "v"})),
+            _wrapped(_record("s2", {"id": 2})),
+        ]
+
+        output = destination.write_in_batches(iter(input_messages), lambda stream, records: written.append((stream, list(records))))
+
+        assert next(output) == _wrapped(_state({"k": "v"}))
+        assert written == [
+            ("s1", [_record("s1", {"id": 1}), _record("s1", {"id": 2})]),
+            ("s1", [_record("s1", {"id": 3})]),
+            ("s2", [_record("s2", {"id": 1})]),
+        ]
+        assert list(output) == []
+        assert written[-1] == ("s2", [_record("s2", {"id": 2})])
+
+    def test_batch_writer_is_required(self, destination: Destination):
+        with pytest.raises(TypeError):
+            destination.write_in_batches([_wrapped(_record("s1", {"id": 1}))])
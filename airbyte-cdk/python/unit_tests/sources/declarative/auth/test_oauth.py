@@ -84,7 +84,7 @@ class TestOauth2Authenticator:
 
         resp.status_code = 200
         mocker.patch.object(resp, "json", return_value={"access_token": "access_token", "expires_in": 1000})
-        mocker.patch.object(requests, "request", side_effect=mock_request, autospec=True)
+        mocker.patch.object(requests.Session, "request", side_effect=mock_request, autospec=True)
         token = oauth.refresh_access_token()
 
         assert ("access_token", 1000) == token
@@ -122,13 +122,13 @@ class TestOauth2Authenticator:
 
         resp.status_code = 200
         mocker.patch.object(resp, "json", return_value={"access_token": "access_token", "expires_in": expires_in_response})
-        mocker.patch.object(requests, "request", side_effect=mock_request, autospec=True)
+        mocker.patch.object(requests.Session, "request", side_effect=mock_request, autospec=True)
         token = oauth.get_access_token()
         assert "access_token" == token
         assert oauth.get_token_expiry_date() == pendulum.parse(next_day)
 
 
-def mock_request(method, url, data):
+def mock_request(session, method, url, data):
     if url == "refresh_end":
         return resp
     raise Exception(f"Error while refreshing access token with request: {method}, {url}, {data}")
@@ -7,12 +7,14 @@ import json
 import pytest
 import requests
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors.dpath_extractor import DpathExtractor
 
 config = {"field": "record_array"}
 parameters = {"parameters_field": "record_array"}
 
 decoder = JsonDecoder(parameters={})
+streaming_decoder = StreamingJsonDecoder(parameters={}, chunk_size=3)
 
 
 @pytest.mark.parametrize(
@@ -32,19 +34,83 @@ decoder = JsonDecoder(parameters={})
         ),
         ("test_field_does_not_exist", ["record"], {"id": 1}, []),
         ("test_nested_list", ["list", "*", "item"], {"list": [{"item": {"id": "1"}}]}, [{"id": "1"}]),
-        ("test_complex_nested_list", ['data', '*', 'list', 'data2', '*'], {"data": [{"list": {"data2": [{"id": 1}, {"id": 2}]}},{"list": {"data2": [{"id": 3}, {"id": 4}]}}]}, [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}])
+        ("test_complex_nested_list", ['data', '*', 'list', 'data2', '*'], {"data": [{"list": {"data2": [{"id": 1}, {"id": 2}]}},{"list": {"data2": [{"id": 3}, {"id": 4}]}}]}, [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}]),
+        ("test_wildcard_matches_empty_values", ["data", "*"], {"data": [{}, {"id": 1}]}, [{}, {"id": 1}]),
+        ("test_extract_from_list_index", ["data", "1"], {"data": [{"id": 1}, {"id": 2}]}, [{"id": 2}]),
+        ("test_extract_empty_object", ["data"], {"data": {}}, []),
+        (
+            "test_escapes_in_strings",
+            ["data"],
+            {"data": [{"id": 'a "quoted" }] \\ "]', "list": ["[", "{"]}]},
+            [{"id": 'a "quoted" }] \\ "]', "list": ["[", "{"]}],
+        ),
+        ("test_skip_nested_siblings", ["data"], {"meta": {"a": [1, {"b": "]}"}]}, "data": [{"id": "\u00e9"}]}, [{"id": "\u00e9"}]),
     ],
 )
-def test_dpath_extractor(test_name, field_path, body, expected_records):
-    extractor = DpathExtractor(field_path=field_path, config=config, decoder=decoder, parameters=parameters)
+@pytest.mark.parametrize("record_decoder", [decoder, streaming_decoder])
+def test_dpath_extractor(test_name, field_path, body, expected_records, record_decoder):
+    extractor = DpathExtractor(field_path=field_path, config=config, decoder=record_decoder, parameters=parameters)
 
     response = create_response(body)
     actual_records = extractor.extract_records(response)
 
-    assert actual_records == expected_records
+    assert list(actual_records) == expected_records
+
+
+@pytest.mark.parametrize(
+    "body, expected_records", [(b"", []), (b"not json", []), (b'{"data": [{"id": 1}, {"id": 2}]} ', [{"id": 1}, {"id": 2}])]
+)
+def test_streaming_extractor_on_raw_body(body, expected_records):
+    extractor = DpathExtractor(field_path=["data"], config=config, decoder=streaming_decoder, parameters=parameters)
+
+    response = requests.Response()
+    response._content = body
+    response._content_consumed = True
+
+    assert list(extractor.extract_records(response)) == expected_records
+
+
+def test_streaming_extractor_fails_on_truncated_response():
+    extractor = DpathExtractor(field_path=["data"], config=config, decoder=streaming_decoder, parameters=parameters)
+    response = create_response({"data": [{"id": 1}, {"id": 2}]})
+    response._content = response._content[:-6]
+
+    records = iter(extractor.extract_records(response))
+    assert next(records) == {"id": 1}
+    with pytest.raises(json.JSONDecodeError):
+        next(records)
+
+
+def test_streaming_extractor_buffer_is_bounded():
+    extractor = DpathExtractor(
+        field_path=["data"],
+        config=config,
+        decoder=StreamingJsonDecoder(parameters={}, chunk_size=4, max_buffer_size=16),
+        parameters=parameters,
+    )
+    response = create_response({"data": [{"id": 1}, {"id": "x" * 32}]})
+
+    records = iter(extractor.extract_records(response))
+    assert next(records) == {"id": 1}
+    with pytest.raises(ValueError):
+        next(records)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5])
+def test_streaming_extractor_decodes_large_values_once(mocker, chunk_size):
+    records = [{"id": 1, "text": 'line\n "quoted" \\ ' * 50, "nested": [{"a": [1, 2, {"b": "}"}]}]}, {"id": 2}]
+    extractor = DpathExtractor(
+        field_path=["data"], config=config, decoder=StreamingJsonDecoder(parameters={}, chunk_size=chunk_size), parameters=parameters
+    )
+    raw_decode = mocker.spy(json.JSONDecoder, "raw_decode")
+
+    assert list(extractor.extract_records(create_response({"data": records}))) == records
+    # a value spanning many chunks is not decoded again every time a chunk is received
+    assert raw_decode.call_count < 10
 
 
 def create_response(body):
     response = requests.Response()
     response._content = json.dumps(body).encode("utf-8")
+    response._content_consumed = True
     return response
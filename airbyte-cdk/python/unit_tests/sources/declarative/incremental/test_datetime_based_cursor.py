@@ -452,6 +452,36 @@ def test_update_cursor(test_name, previous_cursor, stream_slice, last_record, ex
     assert expected_state == updated_state
 
 
+def test_observed_records_only_update_cursor_when_slice_is_closed():
+    slicer = DatetimeBasedCursor(
+        start_datetime=MinMaxDatetime(datetime="2021-01-01T00:00:00.000000+0000", parameters={}),
+        end_datetime=MinMaxDatetime(datetime="2021-01-10T00:00:00.000000+0000", parameters={}),
+        step="P1D",
+        cursor_field=InterpolatedString(string=cursor_field, parameters={}),
+        datetime_format=datetime_format,
+        cursor_granularity=cursor_granularity,
+        config=config,
+        parameters={},
+    )
+    first_slice = {"start_time": "2021-01-01T00:00:00.000000+0000", "end_time": "2021-01-01T23:59:59.999999+0000"}
+    second_slice = {"start_time": "2021-01-02T00:00:00.000000+0000", "end_time": "2021-01-02T23:59:59.999999+0000"}
+    third_slice = {"start_time": "2021-01-03T00:00:00.000000+0000", "end_time": "2021-01-03T23:59:59.999999+0000"}
+
+    slicer.observe(second_slice, {cursor_field: "2021-01-02T12:00:00.000000+0000"})
+    slicer.observe(first_slice, {cursor_field: "2021-01-01T18:00:00.000000+0000"})
+    slicer.observe(first_slice, {cursor_field: "2021-01-01T06:00:00.000000+0000"})
+    assert slicer.get_stream_state() == {}
+
+    slicer.close_slice(first_slice)
+    assert slicer.get_stream_state() == {cursor_field: "2021-01-01T18:00:00.000000+0000"}
+
+    slicer.close_slice(second_slice)
+    assert slicer.get_stream_state() == {cursor_field: "2021-01-02T12:00:00.000000+0000"}
+
+    slicer.close_slice(third_slice)
+    assert slicer.get_stream_state() == {cursor_field: "2021-01-02T12:00:00.000000+0000"}
+
+
 @pytest.mark.parametrize(
     "test_name, inject_into, field_name, expected_req_params, expected_headers, expected_body_json, expected_body_data",
     [
@@ -78,3 +78,38 @@ def test_macros(test_name, s, expected_value):
     config = {}
     val = interpolation.eval(s, config)
     assert val == expected_value
+
+
+@pytest.mark.parametrize(
+    "test_name, s, expected_value",
+    [
+        ("test_plain_string", "hello world", "hello world"),
+        ("test_plain_integer", "1", 1),
+        ("test_plain_boolean", "True", True),
+        ("test_plain_list", "[1, 2]", [1, 2]),
+        ("test_single_brace", "{not a template}", "{not a template}"),
+        ("test_trailing_newline_is_stripped", "line\n", "line"),
+        ("test_comment", "a{# comment #}b", "ab"),
+        ("test_statement", "{% if true %}yes{% endif %}", "yes"),
+    ],
+)
+def test_literal_fast_path_matches_jinja(test_name, s, expected_value):
+    interpolation = JinjaInterpolation()
+    assert interpolation.eval(s, {}) == expected_value
+    assert interpolation.eval(s, {}) == expected_value
+    expected_compilations = 1 if any(delimiter in s for delimiter in ("{{", "{%", "{#")) or s.endswith("\n") else 0
+    assert interpolation._compile.cache_info().misses == expected_compilations
+
+
+def test_templates_are_compiled_once():
+    interpolation = JinjaInterpolation()
+    assert [interpolation.eval("{{ record['id'] }}", {}, record={"id": i}) for i in range(3)] == [0, 1, 2]
+    assert interpolation._compile.cache_info().misses == 1
+    assert interpolation._compile.cache_info().hits == 2
+
+
+def test_cached_literals_are_not_shared():
+    interpolation = JinjaInterpolation()
+    first = interpolation.eval("[1, 2]", {})
+    first.append(3)
+    assert interpolation.eval("[1, 2]", {}) == [1, 2]
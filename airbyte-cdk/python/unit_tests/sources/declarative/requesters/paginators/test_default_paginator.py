@@ -16,6 +16,7 @@ from airbyte_cdk.sources.declarative.requesters.paginators.default_paginator imp
     RequestOptionType,
 )
 from airbyte_cdk.sources.declarative.requesters.paginators.strategies.cursor_pagination_strategy import CursorPaginationStrategy
+from airbyte_cdk.sources.declarative.requesters.paginators.strategies.offset_increment import OffsetIncrement
 from airbyte_cdk.sources.declarative.requesters.request_path import RequestPath
 
 
@@ -210,3 +211,34 @@ def test_limit_page_fetched():
         assert last_token
 
     assert not paginator.next_page_token(MagicMock(), MagicMock())
+
+
+def test_predicted_pages_have_their_own_request_options():
+    paginator = DefaultPaginator(
+        pagination_strategy=OffsetIncrement(page_size=2, parameters={}, config={}),
+        config={},
+        url_base="https://airbyte.io",
+        parameters={},
+        page_size_option=RequestOption(inject_into=RequestOptionType.request_parameter, field_name="limit", parameters={}),
+        page_token_option=RequestOption(inject_into=RequestOptionType.request_parameter, field_name="offset", parameters={}),
+    )
+
+    first_prediction = paginator.predict_next_page_token(None)
+    second_prediction = paginator.predict_next_page_token(first_prediction)
+
+    assert first_prediction == {"next_page_token": 2}
+    assert second_prediction == {"next_page_token": 4}
+    assert paginator.get_request_params(next_page_token=second_prediction) == {"limit": 2, "offset": 4}
+    # The paginator itself is still on the first page
+    assert paginator.get_request_params() == {"limit": 2}
+
+
+def test_pages_are_not_predicted_from_the_response():
+    paginator = DefaultPaginator(
+        pagination_strategy=CursorPaginationStrategy(cursor_value="{{ response.next }}", config={}, parameters={}),
+        config={},
+        url_base="https://airbyte.io",
+        parameters={},
+        page_token_option=RequestPath(parameters={}),
+    )
+    assert paginator.predict_next_page_token(None) is None
@@ -41,3 +41,9 @@ def test_offset_increment_paginator_strategy_rises():
     with pytest.raises(Exception) as exc:
         paginator_strategy.get_page_size()
     assert str(exc.value) == "invalid value is of type <class 'str'>. Expected <class 'int'>"
+
+
+@pytest.mark.parametrize("token, expected_prediction", [(None, 2), (2, 4), (10, 12)])
+def test_offset_increment_predicts_the_next_offset(token, expected_prediction):
+    paginator_strategy = OffsetIncrement(page_size=2, parameters={}, config={})
+    assert paginator_strategy.predict_next_page_token(token) == expected_prediction
@@ -35,3 +35,9 @@ def test_page_increment_paginator_strategy(test_name, page_size, start_from, exp
 
     paginator_strategy.reset()
     assert start_from == paginator_strategy._page
+
+
+@pytest.mark.parametrize("start_from, token, expected_prediction", [(0, None, 1), (1, None, 2), (1, 2, 3)])
+def test_page_increment_predicts_the_next_page(start_from, token, expected_prediction):
+    paginator_strategy = PageIncrement(2, parameters={}, start_from_page=start_from)
+    assert paginator_strategy.predict_next_page_token(token) == expected_prediction
@@ -2,17 +2,21 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import airbyte_cdk.sources.declarative.requesters.error_handlers.response_status as response_status
 import pytest
 import requests
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level, SyncMode, Type
+from airbyte_cdk.sources.declarative.decoders import StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.exceptions import ReadException
+from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordSelector
 from airbyte_cdk.sources.declarative.incremental import DatetimeBasedCursor
 from airbyte_cdk.sources.declarative.requesters.error_handlers.response_action import ResponseAction
 from airbyte_cdk.sources.declarative.requesters.error_handlers.response_status import ResponseStatus
-from airbyte_cdk.sources.declarative.requesters.request_option import RequestOptionType
+from airbyte_cdk.sources.declarative.requesters.paginators import DefaultPaginator
+from airbyte_cdk.sources.declarative.requesters.paginators.strategies import CursorPaginationStrategy, OffsetIncrement
+from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
 from airbyte_cdk.sources.declarative.requesters.requester import HttpMethod
 from airbyte_cdk.sources.declarative.retrievers.simple_retriever import (
     SimpleRetriever,
@@ -22,6 +26,7 @@ from airbyte_cdk.sources.declarative.retrievers.simple_retriever import (
 )
 from airbyte_cdk.sources.streams.http.auth import NoAuth
 from airbyte_cdk.sources.streams.http.http import HttpStream
+from airbyte_cdk.sources.utils.concurrency import read_in_order
 
 primary_key = "pk"
 records = [{"id": 1}, {"id": 2}]
@@ -669,3 +674,138 @@ def test_limit_stream_slices():
 
 def _generate_slices(number_of_slices):
     return [{"date": f"2022-01-0{day + 1}"} for day in range(number_of_slices)]
+
+
+@pytest.mark.parametrize("total_records, max_pages_in_flight", [(5, 1), (5, 3), (6, 4)])
+def test_pages_requested_ahead_of_time(requests_mock, total_records, max_pages_in_flight):
+    def paginated_records(request, context):
+        offset = int(request.qs.get("offset", [0])[0])
+        return [{"id": i} for i in range(offset, min(offset + 2, total_records))]
+
+    requests_mock.get("https://airbyte.io/v1", json=paginated_records)
+    requester = MagicMock()
+    requester.get_authenticator.return_value = NoAuth()
+    requester.get_url_base.return_value = "https://airbyte.io"
+    requester.get_path.return_value = "/v1"
+    requester.get_method.return_value = HttpMethod.GET
+    requester.interpret_response_status.return_value = response_status.SUCCESS
+    for method in ("get_request_params", "get_request_headers", "get_request_body_data", "get_request_body_json", "request_kwargs"):
+        getattr(requester, method).return_value = {}
+    requester.use_cache = False
+    record_selector = MagicMock()
+    record_selector.select_records.side_effect = lambda response, **kwargs: response.json()
+    paginator = DefaultPaginator(
+        pagination_strategy=OffsetIncrement(page_size=2, parameters={}, config={}),
+        config={},
+        url_base="https://airbyte.io",
+        parameters={},
+        page_token_option=RequestOption(inject_into=RequestOptionType.request_parameter, field_name="offset", parameters={}),
+    )
+
+    retriever = SimpleRetriever(
+        name="stream_name",
+        primary_key=primary_key,
+        requester=requester,
+        paginator=paginator,
+        record_selector=record_selector,
+        parameters={},
+        config={},
+        max_pages_in_flight=max_pages_in_flight,
+    )
+
+    assert list(retriever.read_records(SyncMode.full_refresh)) == [{"id": i} for i in range(total_records)]
+    assert requests_mock.request_history[0].qs == {}
+
+
+@pytest.mark.parametrize(
+    "pagination_strategy, reads_response_body",
+    [
+        (OffsetIncrement(page_size=2, parameters={}, config={}), False),
+        (CursorPaginationStrategy(cursor_value="{{ response.next }}", parameters={}, config={}), True),
+    ],
+)
+def test_streamed_responses_refused_when_paginator_reads_response_body(pagination_strategy, reads_response_body):
+    requester = MagicMock()
+    requester.get_authenticator.return_value = NoAuth()
+    paginator = DefaultPaginator(pagination_strategy=pagination_strategy, config={}, url_base="https://airbyte.io", parameters={})
+    record_selector = RecordSelector(
+        extractor=DpathExtractor(field_path=["data"], config={}, decoder=StreamingJsonDecoder(parameters={}), parameters={}),
+        parameters={},
+    )
+
+    def create_retriever():
+        return SimpleRetriever(
+            name="stream_name",
+            primary_key=primary_key,
+            requester=requester,
+            paginator=paginator,
+            record_selector=record_selector,
+            parameters={},
+            config={},
+        )
+
+    assert paginator.reads_response_body() == reads_response_body
+    if reads_response_body:
+        with pytest.raises(ValueError):
+            create_retriever()
+    else:
+        assert create_retriever().request_kwargs(None, None, None)["stream"]
+
+
+def test_slices_read_concurrently_are_paginated_separately_and_only_observed(requests_mock):
+    total_records = 5
+
+    def paginated_records(request, context):
+        offset = int(request.qs.get("offset", [0])[0])
+        return [{"date": request.qs["date"][0], "id": i} for i in range(offset, min(offset + 2, total_records))]
+
+    requests_mock.get("https://airbyte.io/v1", json=paginated_records)
+    requester = MagicMock()
+    requester.get_authenticator.return_value = NoAuth()
+    requester.get_url_base.return_value = "https://airbyte.io"
+    requester.get_path.return_value = "/v1"
+    requester.get_method.return_value = HttpMethod.GET
+    requester.interpret_response_status.return_value = response_status.SUCCESS
+    for method in ("get_request_params", "get_request_headers", "get_request_body_data", "get_request_body_json", "request_kwargs"):
+        getattr(requester, method).return_value = {}
+    requester.use_cache = False
+    record_selector = MagicMock()
+    record_selector.select_records.side_effect = lambda response, **kwargs: response.json()
+    paginator = DefaultPaginator(
+        pagination_strategy=OffsetIncrement(page_size=2, parameters={}, config={}),
+        config={},
+        url_base="https://airbyte.io",
+        parameters={},
+        page_token_option=RequestOption(inject_into=RequestOptionType.request_parameter, field_name="offset", parameters={}),
+    )
+    stream_slicer = MagicMock()
+    stream_slicer.get_request_params.side_effect = lambda stream_slice: {"date": stream_slice["date"]}
+    for method in ("get_request_headers", "get_request_body_data", "get_request_body_json"):
+        getattr(stream_slicer, method).return_value = {}
+
+    retriever = SimpleRetriever(
+        name="stream_name",
+        primary_key=primary_key,
+        requester=requester,
+        paginator=paginator,
+        record_selector=record_selector,
+        stream_slicer=stream_slicer,
+        parameters={},
+        config={},
+        max_concurrent_slices=3,
+    )
+    slices = _generate_slices(3)
+
+    slices_and_records = read_in_order(
+        slices,
+        lambda _slice: retriever.read_records(SyncMode.incremental, stream_slice=_slice),
+        max_workers=retriever.max_concurrent_slices,
+    )
+
+    for _slice, slice_records in slices_and_records:
+        assert list(slice_records) == [{"date": _slice["date"], "id": i} for i in range(total_records)]
+        retriever.close_slice(_slice)
+    stream_slicer.update_cursor.assert_not_called()
+    observed = {(_slice["date"], record["id"]) for (_slice, record), _ in stream_slicer.observe.call_args_list}
+    assert observed == {(_slice["date"], i) for _slice in slices for i in range(total_records)}
+    assert stream_slicer.close_slice.call_args_list == [call(_slice) for _slice in slices]
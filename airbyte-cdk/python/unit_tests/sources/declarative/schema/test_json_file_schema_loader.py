@@ -2,6 +2,8 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+from unittest.mock import patch
+
 import pytest
 from airbyte_cdk.sources.declarative.schema import JsonFileSchemaLoader
 
@@ -24,3 +26,16 @@ def test_extract_resource_and_schema_path(test_name, input_path, expected_resour
 
     assert actual_resource == expected_resource
     assert actual_path == expected_path
+
+
+def test_schema_file_is_loaded_once():
+    schema_loader = JsonFileSchemaLoader({}, {}, "./source_example/schemas/lists.json")
+    with patch("pkgutil.get_data", return_value=b'{"type": "object", "properties": {}}') as get_data, patch.object(
+        JsonFileSchemaLoader, "_resolve_schema_references", side_effect=lambda schema: schema
+    ):
+        first_schema = schema_loader.get_json_schema()
+        second_schema = schema_loader.get_json_schema()
+
+    assert first_schema == {"type": "object", "properties": {}}
+    assert second_schema is first_schema
+    get_data.assert_called_once_with("source_example", "schemas/lists.json")
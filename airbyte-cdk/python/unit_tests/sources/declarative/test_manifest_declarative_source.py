@@ -9,8 +9,10 @@ from unittest.mock import patch
 
 import pytest
 import yaml
+from airbyte_cdk.models import AirbyteStream, ConfiguredAirbyteCatalog, ConfiguredAirbyteStream, DestinationSyncMode, SyncMode
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
 from airbyte_cdk.sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
+from airbyte_cdk.sources.streams.http import HttpTransport, RateLimit, RateLimiter
 from jsonschema.exceptions import ValidationError
 
 logger = logging.getLogger("airbyte")
@@ -625,6 +627,176 @@ class TestManifestDeclarativeSource:
         source = ManifestDeclarativeSource(source_config=any_valid_manifest, debug=True)
 
         debug_logger = logging.getLogger("logger.debug")
-        list(source.read(debug_logger, {}, {}, {}))
+        list(source.read(debug_logger, {}, ConfiguredAirbyteCatalog(streams=[]), {}))
 
         assert debug_logger.isEnabledFor(logging.DEBUG)
+
+
+def _manifest(stream_names):
+    return {
+        "version": "version",
+        "definitions": {},
+        "streams": [
+            {
+                "type": "DeclarativeStream",
+                "$parameters": {"name": stream_name, "primary_key": "id", "url_base": "https://api.sendgrid.com"},
+                "schema_loader": {
+                    "name": "{{ parameters.stream_name }}",
+                    "file_path": "./source_sendgrid/schemas/{{ parameters.name }}.yaml",
+                },
+                "retriever": {
+                    "requester": {"path": f"/v3/marketing/{stream_name}"},
+                    "record_selector": {"extractor": {"field_path": ["result"]}},
+                },
+            }
+            for stream_name in stream_names
+        ],
+        "check": {"type": "CheckStream", "stream_names": [stream_names[0]]},
+    }
+
+
+def _configured_catalog(stream_names):
+    return ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name=stream_name, json_schema={}, supported_sync_modes=[SyncMode.full_refresh]),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.overwrite,
+            )
+            for stream_name in stream_names
+        ]
+    )
+
+
+def test_resolved_manifest_is_cached_by_content(tmp_path):
+    source = ManifestDeclarativeSource(source_config=_manifest(["lists"]), manifest_cache_dir=str(tmp_path))
+    assert len(list(tmp_path.iterdir())) == 1
+
+    with patch("airbyte_cdk.sources.declarative.manifest_declarative_source.ManifestReferenceResolver") as resolver, patch(
+        "airbyte_cdk.sources.declarative.manifest_declarative_source.validate"
+    ) as validate:
+        cached_source = ManifestDeclarativeSource(source_config=_manifest(["lists"]), manifest_cache_dir=str(tmp_path))
+        resolver.assert_not_called()
+        validate.assert_not_called()
+    assert cached_source.resolved_manifest == source.resolved_manifest
+    assert [stream.name for stream in cached_source.streams({})] == ["lists"]
+
+    ManifestDeclarativeSource(source_config=_manifest(["lists", "segments"]), manifest_cache_dir=str(tmp_path))
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_corrupted_manifest_cache_is_ignored(tmp_path):
+    ManifestDeclarativeSource(source_config=_manifest(["lists"]), manifest_cache_dir=str(tmp_path))
+    (cache_file,) = tmp_path.iterdir()
+    cache_file.write_text("{not json")
+
+    source = ManifestDeclarativeSource(source_config=_manifest(["lists"]), manifest_cache_dir=str(tmp_path))
+
+    assert [stream.name for stream in source.streams({})] == ["lists"]
+
+
+def test_invalid_manifest_is_not_cached(tmp_path):
+    manifest = _manifest(["lists"])
+    del manifest["version"]
+    with pytest.raises(ValidationError):
+        ManifestDeclarativeSource(source_config=manifest, manifest_cache_dir=str(tmp_path))
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    "catalog_stream_names, expected_created_streams",
+    [
+        (["segments"], ["segments"]),
+        (["lists", "segments"], ["lists", "segments"]),
+        (["unknown"], ["lists", "segments", "contacts"]),
+    ],
+)
+def test_read_only_creates_streams_of_the_catalog(mocker, catalog_stream_names, expected_created_streams):
+    source = ManifestDeclarativeSource(source_config=_manifest(["lists", "segments", "contacts"]))
+    created_streams = []
+
+    def read(logger, config, catalog, state):
+        created_streams.extend(stream.name for stream in source.streams(config))
+        yield from []
+
+    mocker.patch("airbyte_cdk.sources.declarative.declarative_source.DeclarativeSource.read", side_effect=read)
+
+    list(source.read(logging.getLogger(""), {}, _configured_catalog(catalog_stream_names), {}))
+
+    assert created_streams == expected_created_streams
+    assert len(source.streams({})) == 3
+
+
+def _substream_manifest():
+    manifest = _manifest(["lists"])
+    manifest["streams"].append(
+        {
+            "type": "DeclarativeStream",
+            "$parameters": {"name": "list_members", "primary_key": "id", "url_base": "https://api.sendgrid.com"},
+            "schema_loader": {"file_path": "./source_sendgrid/schemas/{{ parameters.name }}.yaml"},
+            "retriever": {
+                "requester": {"path": "/v3/marketing/lists/{{ stream_slice.list_id }}/members"},
+                "record_selector": {"extractor": {"field_path": ["result"]}},
+                "partition_router": {
+                    "type": "SubstreamPartitionRouter",
+                    "parent_stream_configs": [
+                        {"parent_key": "id", "partition_field": "list_id", "stream": manifest["streams"][0]},
+                    ],
+                },
+            },
+        }
+    )
+    return manifest
+
+
+def test_rate_limits_are_applied_to_retrievers_and_parent_streams(mocker):
+    manifest = _substream_manifest()
+    manifest["rate_limits"] = [{"requests": 10, "period_seconds": 60, "url_pattern": "/lists"}, {"requests": 100}]
+    source = ManifestDeclarativeSource(source_config=manifest)
+    streams = source.streams({})
+    mocker.patch.object(source, "streams", return_value=streams)
+
+    list(source.read(logger, {}, ConfiguredAirbyteCatalog(streams=[]), {}))
+
+    assert source.rate_limits == [
+        RateLimit(requests=10, period_seconds=60, url_pattern="/lists"),
+        RateLimit(requests=100, period_seconds=1),
+    ]
+    lists, list_members = streams
+    (parent_config,) = list_members.retriever.stream_slicer.parent_stream_configs
+    assert isinstance(lists.retriever.rate_limiter, RateLimiter)
+    assert list_members.retriever.rate_limiter is lists.retriever.rate_limiter
+    assert parent_config.stream.retriever.rate_limiter is lists.retriever.rate_limiter
+
+
+def test_no_rate_limiter_without_rate_limits():
+    source = ManifestDeclarativeSource(source_config=_substream_manifest())
+
+    assert source.rate_limits == []
+
+
+def test_transport_is_applied_to_retrievers_parent_streams_and_oauth_authenticators(mocker):
+    manifest = _substream_manifest()
+    for stream in manifest["streams"]:
+        stream["retriever"]["requester"]["authenticator"] = {
+            "type": "OAuthAuthenticator",
+            "client_id": "client_id",
+            "client_secret": "client_secret",
+            "refresh_token": "refresh_token",
+            "token_refresh_endpoint": "https://api.sendgrid.com/oauth/token",
+        }
+    transport = HttpTransport(pool_maxsize=20)
+    mocker.patch.object(ManifestDeclarativeSource, "http_transport", new_callable=mocker.PropertyMock, return_value=transport)
+    source = ManifestDeclarativeSource(source_config=manifest)
+    streams = source.streams({})
+    mocker.patch.object(source, "streams", return_value=streams)
+
+    list(source.read(logger, {}, ConfiguredAirbyteCatalog(streams=[]), {}))
+
+    lists, list_members = streams
+    (parent_config,) = list_members.retriever.stream_slicer.parent_stream_configs
+    retrievers = [lists.retriever, list_members.retriever, parent_config.stream.retriever]
+    for retriever in retrievers:
+        assert retriever.transport is transport
+        assert retriever._session.auth.transport is transport
+    assert len({id(retriever._session.get_adapter("https://api.sendgrid.com")) for retriever in retrievers}) == 1
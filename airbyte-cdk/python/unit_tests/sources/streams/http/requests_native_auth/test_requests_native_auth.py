@@ -158,7 +158,7 @@ class TestOauth2Authenticator:
 
         resp.status_code = 200
         mocker.patch.object(resp, "json", return_value={"access_token": "access_token", "expires_in": 1000})
-        mocker.patch.object(requests, "request", side_effect=mock_request, autospec=True)
+        mocker.patch.object(requests.Session, "request", side_effect=mock_request, autospec=True)
         token, expires_in = oauth.refresh_access_token()
 
         assert isinstance(expires_in, int)
@@ -290,7 +290,7 @@ class TestSingleUseRefreshTokenOauth2Authenticator:
         assert authenticator.refresh_access_token() == ("new_access_token", 1000, "new_refresh_token")
 
 
-def mock_request(method, url, data):
+def mock_request(session, method, url, data):
     if url == "refresh_end":
         return resp
     raise Exception(f"Error while refreshing access token with request: {method}, {url}, {data}")
@@ -7,6 +7,7 @@ from typing import Any, Iterable, List, Mapping, Optional, Tuple
 
 import pytest
 import requests
+from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources import AbstractSource
 from airbyte_cdk.sources.streams import Stream
 from airbyte_cdk.sources.streams.http.availability_strategy import HttpAvailabilityStrategy
@@ -151,3 +152,85 @@ def test_http_availability_strategy_on_empty_stream(mocker):
 
     assert stream_is_available
     assert empty_stream.read_records.called
+
+
+def test_first_response_of_availability_check_is_replayed_when_reading(mocker):
+    http_stream = MockHttpStream()
+    response = requests.Response()
+    response.status_code = 200
+    mock_send = mocker.patch.object(requests.Session, "send", return_value=response)
+
+    stream_is_available, _ = http_stream.check_availability(logger)
+    assert stream_is_available
+    assert mock_send.call_count == 1
+
+    assert list(http_stream.read_records(SyncMode.full_refresh)) == [{"data": 2}]
+    assert mock_send.call_count == 1
+
+    # The prefetched response is only replayed once
+    list(http_stream.read_records(SyncMode.full_refresh))
+    assert mock_send.call_count == 2
+
+
+def test_responses_are_not_kept_outside_of_availability_checks(mocker):
+    http_stream = MockHttpStream()
+    response = requests.Response()
+    response.status_code = 200
+    mock_send = mocker.patch.object(requests.Session, "send", return_value=response)
+
+    list(http_stream.read_records(SyncMode.full_refresh))
+    list(http_stream.read_records(SyncMode.full_refresh))
+
+    assert mock_send.call_count == 2
+
+
+def test_response_of_a_different_request_is_not_replayed(mocker):
+    class PagedHttpStream(MockHttpStream):
+        def request_params(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> Mapping[str, Any]:
+            return {"page": stream_slice["page"]} if stream_slice else {}
+
+    http_stream = PagedHttpStream()
+    response = requests.Response()
+    response.status_code = 200
+    mock_send = mocker.patch.object(requests.Session, "send", return_value=response)
+
+    http_stream.check_availability(logger)
+    list(http_stream.read_records(SyncMode.full_refresh, stream_slice={"page": 2}))
+
+    assert mock_send.call_count == 2
+
+
+def test_responses_of_other_streams_are_not_kept(mocker):
+    class MockHttpSubStream(MockHttpStream):
+        def __init__(self, parent: HttpStream, **kwargs):
+            super().__init__(**kwargs)
+            self.parent = parent
+
+        def stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
+            for record in self.parent.read_records(SyncMode.full_refresh):
+                yield {"parent": record}
+
+    parent = MockHttpStream()
+    child = MockHttpSubStream(parent=parent)
+    response = requests.Response()
+    response.status_code = 200
+    mocker.patch.object(requests.Session, "send", return_value=response)
+
+    stream_is_available, _ = child.check_availability(logger)
+
+    assert stream_is_available
+    assert len(child._prefetched_responses) == 1
+    assert parent._prefetched_responses == {}
+
+
+def test_discarded_responses_are_not_replayed(mocker):
+    http_stream = MockHttpStream()
+    response = requests.Response()
+    response.status_code = 200
+    mock_send = mocker.patch.object(requests.Session, "send", return_value=response)
+
+    http_stream.check_availability(logger)
+    http_stream.discard_prefetched_responses()
+    list(http_stream.read_records(SyncMode.full_refresh))
+
+    assert mock_send.call_count == 2
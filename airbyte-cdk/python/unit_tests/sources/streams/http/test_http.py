@@ -2,8 +2,8 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-
 import json
+import time
 from http import HTTPStatus
 from typing import Any, Iterable, Mapping, Optional
 from unittest.mock import ANY, MagicMock, patch
@@ -16,6 +16,7 @@ from airbyte_cdk.sources.streams.http.auth import NoAuth
 from airbyte_cdk.sources.streams.http.auth import TokenAuthenticator as HttpTokenAuthenticator
 from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
 from airbyte_cdk.sources.streams.http.requests_native_auth import TokenAuthenticator
+from airbyte_cdk.utils.stream_metrics import MetricsRegistry
 
 
 class StubBasicReadHttpStream(HttpStream):
@@ -153,6 +154,28 @@ def test_stub_custom_backoff_http_stream(mocker):
     # TODO(davin): Figure out how to assert calls.
 
 
+def test_requests_and_backoff_are_measured(mocker):
+    sleeps = []
+    real_sleep = time.sleep
+    mocker.patch("time.sleep", lambda seconds: sleeps.append(seconds) or real_sleep(0.01))
+    registry = MetricsRegistry()
+    mocker.patch("airbyte_cdk.sources.streams.http.http.metrics_registry", registry)
+    stream = StubCustomBackoffHttpStream()
+    rate_limited = requests.Response()
+    rate_limited.status_code = 429
+    ok = requests.Response()
+    ok.status_code = 200
+    ok._content = b'{"data": []}'
+    mocker.patch.object(requests.Session, "send", side_effect=[rate_limited, ok])
+
+    list(stream.read_records(SyncMode.full_refresh))
+
+    metrics = registry.stream(stream.name).to_dict()
+    assert 1.5 in sleeps
+    assert metrics["http_requests"] == 2
+    assert metrics["backoff_seconds"] >= 0.01
+
+
 @pytest.mark.parametrize("retries", [-20, -1, 0, 1, 2, 10])
 def test_stub_custom_backoff_http_stream_retries(mocker, retries):
     mocker.patch("time.sleep", lambda x: None)
@@ -509,3 +532,71 @@ def test_default_get_error_display_message_handles_http_error(mocker):
 
     http_err_msg = stream.get_error_display_message(requests.HTTPError())
     assert http_err_msg == "my custom message"
+
+
+class PipelinedHttpStream(StubBasicReadHttpStream):
+    page_size = 2
+
+    def __init__(self, records: int, max_pages_in_flight: int = 3):
+        super().__init__()
+        self._records = records
+        self._max_pages_in_flight = max_pages_in_flight
+
+    @property
+    def max_pages_in_flight(self) -> int:
+        return self._max_pages_in_flight
+
+    def request_params(self, next_page_token: Optional[Mapping[str, Any]] = None, **kwargs) -> Mapping[str, Any]:
+        return {"offset": next_page_token["offset"] if next_page_token else 0}
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        records = response.json()
+        if len(records) < self.page_size:
+            return None
+        return {"offset": int(response.request.qs["offset"][0]) + len(records)}
+
+    def predict_next_page_token(self, next_page_token: Optional[Mapping[str, Any]]) -> Optional[Mapping[str, Any]]:
+        return {"offset": (next_page_token["offset"] if next_page_token else 0) + self.page_size}
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        yield from response.json()
+
+
+def _paginated_response(records: int):
+    def callback(request, context):
+        offset = int(request.qs["offset"][0])
+        return [{"id": i} for i in range(offset, min(offset + PipelinedHttpStream.page_size, records))]
+
+    return callback
+
+
+@pytest.mark.parametrize("records, max_pages_in_flight", [(0, 3), (5, 3), (6, 3), (7, 1), (9, 10)])
+def test_pipelined_pages_are_read_in_order(requests_mock, records, max_pages_in_flight):
+    requests_mock.get("https://test_base_url.com", json=_paginated_response(records))
+    stream = PipelinedHttpStream(records, max_pages_in_flight=max_pages_in_flight)
+
+    assert list(stream.read_records(SyncMode.full_refresh)) == [{"id": i} for i in range(records)]
+
+    pages_read = records // PipelinedHttpStream.page_size + 1
+    assert pages_read <= requests_mock.call_count < pages_read + max_pages_in_flight
+
+
+def test_pipelined_pages_follow_the_actual_next_page_token(requests_mock):
+    requests_mock.get("https://test_base_url.com", json=_paginated_response(7))
+    stream = PipelinedHttpStream(7)
+    # Every prediction skips a record
+    predict_next_page_token = stream.predict_next_page_token
+    stream.predict_next_page_token = lambda token: {"offset": predict_next_page_token(token)["offset"] + 1}
+
+    assert list(stream.read_records(SyncMode.full_refresh)) == [{"id": i} for i in range(7)]
+
+
+def test_pipelined_read_stops_sending_requests_when_closed(requests_mock):
+    requests_mock.get("https://test_base_url.com", json=_paginated_response(100))
+    stream = PipelinedHttpStream(100, max_pages_in_flight=4)
+
+    records = stream.read_records(SyncMode.full_refresh)
+    assert next(records) == {"id": 0}
+    records.close()
+
+    assert requests_mock.call_count <= 4
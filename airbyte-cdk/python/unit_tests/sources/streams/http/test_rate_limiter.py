@@ -0,0 +1,116 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import email.utils
+import time
+
+import pytest
+import requests
+from airbyte_cdk.sources.streams.http.rate_limiter import RateLimit, RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(mocker):
+    fake_clock = FakeClock()
+    mocker.patch("airbyte_cdk.sources.streams.http.rate_limiter.time.monotonic", fake_clock.monotonic)
+    mocker.patch("airbyte_cdk.sources.streams.http.rate_limiter.time.sleep", fake_clock.sleep)
+    return fake_clock
+
+
+def _request(url="https://api.test/v1/users"):
+    return requests.Request("GET", url).prepare()
+
+
+def _response(headers):
+    response = requests.Response()
+    response.status_code = 200
+    response.headers.update(headers)
+    return response
+
+
+def test_token_bucket_allows_bursts_then_sustained_rate(clock):
+    bucket = TokenBucket(RateLimit(requests=2, period_seconds=1))
+
+    for _ in range(4):
+        bucket.acquire()
+
+    assert clock.sleeps == [pytest.approx(0.5), pytest.approx(0.5)]
+
+
+def test_token_bucket_pause(clock):
+    bucket = TokenBucket(RateLimit(requests=10, period_seconds=1))
+    bucket.pause(5)
+
+    bucket.acquire()
+
+    assert sum(clock.sleeps) == pytest.approx(5)
+
+
+def test_only_matching_buckets_limit_requests(clock):
+    limiter = RateLimiter([RateLimit(requests=1, period_seconds=60, url_pattern="/orders")])
+
+    for _ in range(3):
+        with limiter.limit(_request()):
+            pass
+    assert clock.sleeps == []
+
+    for _ in range(2):
+        with limiter.limit(_request("https://api.test/v1/orders")):
+            pass
+    assert clock.sleeps == [pytest.approx(60)]
+
+
+def test_update_pauses_matching_buckets(clock):
+    limiter = RateLimiter([RateLimit(requests=100, period_seconds=1)])
+
+    limiter.update(_request(), _response({"Retry-After": "30"}))
+    with limiter.limit(_request()):
+        pass
+
+    assert sum(clock.sleeps) == pytest.approx(30)
+
+
+@pytest.mark.parametrize(
+    "headers, expected_wait",
+    [
+        ({}, None),
+        ({"Retry-After": "12"}, 12),
+        ({"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "20"}, None),
+        ({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "20"}, 20),
+        ({"X-RateLimit-Remaining": "0"}, 1),
+        ({"X-RateLimit-Remaining": "not a number"}, None),
+    ],
+)
+def test_wait_time(headers, expected_wait):
+    assert RateLimiter.wait_time(_response(headers)) == expected_wait
+
+
+def test_wait_time_from_dates():
+    in_a_minute = time.time() + 60
+    assert RateLimiter.wait_time(_response({"Retry-After": email.utils.formatdate(in_a_minute, usegmt=True)})) == pytest.approx(60, abs=2)
+    assert RateLimiter.wait_time(_response({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(in_a_minute)})) == pytest.approx(
+        60, abs=2
+    )
+
+
+def test_max_concurrent_requests():
+    limiter = RateLimiter([RateLimit(requests=100, max_concurrent_requests=1)])
+    bucket = limiter._buckets[0]
+
+    with limiter.limit(_request()):
+        assert not bucket._concurrency.acquire(blocking=False)
+    assert bucket._concurrency.acquire(blocking=False)
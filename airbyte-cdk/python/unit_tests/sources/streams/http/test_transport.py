@@ -0,0 +1,74 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import requests
+from airbyte_cdk.sources.streams.http import HttpStream
+from airbyte_cdk.sources.streams.http.requests_native_auth import Oauth2Authenticator
+from airbyte_cdk.sources.streams.http.transport import HttpTransport, default_transport
+
+
+class StubStream(HttpStream):
+    url_base = "https://test_base_url.com"
+    primary_key = ""
+
+    def path(self, **kwargs) -> str:
+        return ""
+
+    def next_page_token(self, response):
+        return None
+
+    def parse_response(self, response, **kwargs):
+        yield from []
+
+
+def test_mount_shares_connection_pools():
+    transport = HttpTransport(pool_connections=2, pool_maxsize=5)
+    first, second = transport.mount(requests.Session()), transport.mount(requests.Session())
+
+    adapter = first.get_adapter("https://example.com")
+    assert adapter is second.get_adapter("https://example.com")
+    assert adapter is first.get_adapter("http://example.com")
+    assert adapter._pool_maxsize == 5
+
+
+def test_session_is_created_once():
+    transport = HttpTransport()
+    assert transport.session is transport.session
+    assert transport.session.get_adapter("https://example.com") is transport.mount(requests.Session()).get_adapter("https://example.com")
+
+
+def test_streams_share_the_default_transport():
+    first, second = StubStream(), StubStream()
+    assert first.transport is default_transport
+    assert first._session.get_adapter("https://test_base_url.com") is second._session.get_adapter("https://test_base_url.com")
+
+
+def test_use_transport_applies_to_oauth_refresh():
+    authenticator = Oauth2Authenticator(
+        token_refresh_endpoint="https://test_base_url.com/token",
+        client_id="client_id",
+        client_secret="client_secret",
+        refresh_token="refresh_token",
+    )
+    stream = StubStream(authenticator=authenticator)
+    transport = HttpTransport()
+
+    stream.use_transport(transport)
+
+    assert stream.transport is transport
+    assert authenticator.transport is transport
+    assert stream._session.get_adapter("https://test_base_url.com") is transport.session.get_adapter("https://test_base_url.com")
+
+
+def test_oauth_refresh_is_sent_through_the_transport(requests_mock):
+    requests_mock.post("https://test_base_url.com/token", json={"access_token": "token", "expires_in": 60})
+    authenticator = Oauth2Authenticator(
+        token_refresh_endpoint="https://test_base_url.com/token",
+        client_id="client_id",
+        client_secret="client_secret",
+        refresh_token="refresh_token",
+    )
+
+    assert authenticator.refresh_access_token() == ("token", 60)
+    assert requests_mock.call_count == 1
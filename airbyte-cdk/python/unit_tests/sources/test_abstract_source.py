@@ -31,8 +31,10 @@ from airbyte_cdk.models import (
     Type,
 )
 from airbyte_cdk.sources import AbstractSource
+from airbyte_cdk.sources.utils.concurrency import read_in_order
 from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
 from airbyte_cdk.sources.streams import IncrementalMixin, Stream
+from airbyte_cdk.sources.streams.http import HttpStream, HttpTransport, RateLimit, RateLimiter
 from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
@@ -235,6 +237,22 @@ def test_read_stream_with_error_gets_display_message(mocker):
     assert exc.value.message == "my message"
 
 
+def test_read_stream_with_error_concurrently_gets_display_message(mocker):
+    stream = MockStream(name="my_stream")
+
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(MockStream, "read_records", side_effect=RuntimeError("oh no!"))
+    mocker.patch.object(MockStream, "get_error_display_message", return_value="my message")
+    mocker.patch.object(MockSource, "max_concurrent_streams", new_callable=mocker.PropertyMock, return_value=2)
+
+    source = MockSource(streams=[stream])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.full_refresh)])
+
+    with pytest.raises(AirbyteTracedException, match="oh no!") as exc:
+        list(source.read(logger, {}, catalog))
+    assert exc.value.message == "my message"
+
+
 GLOBAL_EMITTED_AT = 1
 
 
@@ -332,6 +350,126 @@ def test_valid_full_refresh_read_with_slices(mocker):
     assert expected == messages
 
 
+def test_valid_full_refresh_read_concurrently(mocker):
+    """Tests that reading several streams concurrently keeps the order of the messages of each stream"""
+    s1_output = [{"k": i} for i in range(100)]
+    s2_output = [{"k": i} for i in range(50)]
+    s1 = MockStream([({"sync_mode": SyncMode.full_refresh}, s1_output)], name="s1")
+    s2 = MockStream([({"sync_mode": SyncMode.full_refresh}, s2_output)], name="s2")
+
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(MockSource, "max_concurrent_streams", new_callable=mocker.PropertyMock, return_value=2)
+
+    src = MockSource(streams=[s1, s2])
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            _configured_stream(s1, SyncMode.full_refresh),
+            _configured_stream(s2, SyncMode.full_refresh),
+        ]
+    )
+
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog)))
+
+    assert [m for m in messages if m.record.stream == "s1"] == _as_records("s1", s1_output)
+    assert [m for m in messages if m.record.stream == "s2"] == _as_records("s2", s2_output)
+
+
+class MockHttpStream(HttpStream):
+    url_base = "https://test_base_url.com"
+    primary_key = ""
+
+    def __init__(self, name: str, parent: Optional[HttpStream] = None):
+        super().__init__()
+        self._name = name
+        self.parent = parent
+
+    @property
+    def name(self):
+        return self._name
+
+    def path(self, **kwargs) -> str:
+        return ""
+
+    def next_page_token(self, response):
+        return None
+
+    def parse_response(self, response, **kwargs):
+        yield from []
+
+
+def test_rate_limiter_is_shared_by_http_streams(mocker):
+    parent = MockHttpStream("parent")
+    child = MockHttpStream("child", parent=parent)
+    own_rate_limiter = RateLimiter([])
+    with_own_rate_limiter = MockHttpStream("with_own_rate_limiter")
+    with_own_rate_limiter.rate_limiter = own_rate_limiter
+    mocker.patch.object(MockSource, "rate_limits", new_callable=mocker.PropertyMock, return_value=[RateLimit(requests=10)])
+
+    src = MockSource(streams=[child, with_own_rate_limiter, MockStream(name="not_http")])
+    list(src.read(logger, {}, ConfiguredAirbyteCatalog(streams=[])))
+
+    assert isinstance(child.rate_limiter, RateLimiter)
+    assert parent.rate_limiter is child.rate_limiter
+    assert with_own_rate_limiter.rate_limiter is own_rate_limiter
+
+
+def test_transport_is_shared_by_http_streams(mocker):
+    parent = MockHttpStream("parent")
+    child = MockHttpStream("child", parent=parent)
+    transport = HttpTransport(pool_maxsize=20)
+    mocker.patch.object(MockSource, "http_transport", new_callable=mocker.PropertyMock, return_value=transport)
+
+    src = MockSource(streams=[child, MockStream(name="not_http")])
+    list(src.read(logger, {}, ConfiguredAirbyteCatalog(streams=[])))
+
+    assert child.transport is transport
+    assert parent.transport is transport
+    assert child._session.get_adapter("https://test_base_url.com") is parent._session.get_adapter("https://test_base_url.com")
+
+
+@pytest.mark.parametrize("stream_is_available", [True, False])
+def test_responses_of_availability_check_discarded_after_read(mocker, stream_is_available):
+    stream = MockHttpStream("s1")
+    mocker.patch.object(MockHttpStream, "get_json_schema", return_value={})
+    unreplayed_response = mocker.Mock()
+
+    def check_availability(logger, source):
+        stream._prefetched_responses[("GET", "https://test_base_url.com/next_page", None)] = unreplayed_response
+        return stream_is_available, None
+
+    mocker.patch.object(MockHttpStream, "check_availability", side_effect=check_availability)
+    mocker.patch.object(MockHttpStream, "read_records", return_value=[])
+    src = MockSource(streams=[stream])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.full_refresh)])
+
+    list(src.read(logger, {}, catalog))
+
+    assert stream._prefetched_responses == {}
+
+
+def test_read_concurrently_with_limit(mocker):
+    """Tests that the internal record limit still applies to each stream when reading concurrently"""
+    stream_output = [{"k": i} for i in range(10)]
+    s1 = MockStream([({"sync_mode": SyncMode.full_refresh}, stream_output)], name="s1")
+    s2 = MockStream([({"sync_mode": SyncMode.full_refresh}, stream_output)], name="s2")
+
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(MockSource, "max_concurrent_streams", new_callable=mocker.PropertyMock, return_value=2)
+
+    src = MockSource(streams=[s1, s2])
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            _configured_stream(s1, SyncMode.full_refresh),
+            _configured_stream(s2, SyncMode.full_refresh),
+        ]
+    )
+
+    messages = _fix_emitted_at(list(src.read(logger, {"_limit": 3}, catalog)))
+
+    assert [m for m in messages if m.record.stream == "s1"] == _as_records("s1", stream_output[:3])
+    assert [m for m in messages if m.record.stream == "s2"] == _as_records("s2", stream_output[:3])
+
+
 @pytest.mark.parametrize(
     "slices",
     [
@@ -979,6 +1117,120 @@ class TestIncrementalRead:
 
         assert expected == messages
 
+    def test_concurrent_read_emits_state_after_stream_records(self, mocker):
+        """Tests that when streams are read concurrently, each stream's state is emitted after all of its records"""
+        stream_output = [{"k": i} for i in range(20)]
+        state = {"cursor": "value"}
+        streams = [
+            MockStreamWithState([({"sync_mode": SyncMode.incremental, "stream_state": {}}, stream_output)], name=f"s{i}") for i in range(4)
+        ]
+        mocker.patch.object(MockStreamWithState, "get_updated_state", return_value=state)
+        mocker.patch.object(MockStreamWithState, "state", new_callable=mocker.PropertyMock, return_value=state)
+        mocker.patch.object(MockStreamWithState, "get_json_schema", return_value={})
+        mocker.patch.object(MockSource, "max_concurrent_streams", new_callable=mocker.PropertyMock, return_value=3)
+        src = MockSource(streams=streams)
+        catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.incremental) for stream in streams])
+
+        messages = _fix_emitted_at(list(src.read(logger, {}, catalog)))
+
+        for stream in streams:
+            stream_messages = [
+                m
+                for m in messages
+                if (m.type == Type.RECORD and m.record.stream == stream.name)
+                or (m.type == Type.STATE and m.state.stream.stream_descriptor.name == stream.name)
+            ]
+            assert [m.record for m in stream_messages[:-1]] == [r.record for r in _as_records(stream.name, stream_output)]
+            assert stream_messages[-1].type == Type.STATE
+            assert stream_messages[-1].state.stream.stream_state == AirbyteStateBlob.parse_obj(state)
+
+    def test_concurrent_slices_are_emitted_and_checkpointed_in_order(self, mocker):
+        """Tests that slices prefetched concurrently are still emitted in order, with a checkpoint after each of them"""
+        slices = [{"date": f"2023-01-{day:02d}"} for day in range(1, 11)]
+
+        def read_records(**kwargs):
+            _slice = kwargs["stream_slice"]
+            return [{"date": _slice["date"], "id": i} for i in range(5)]
+
+        stream = MockStream(name="s1")
+        mocker.patch.object(MockStream, "cursor_field", new_callable=mocker.PropertyMock, return_value="date")
+        mocker.patch.object(MockStream, "read_records", side_effect=read_records)
+        mocker.patch.object(MockStream, "stream_slices", return_value=slices)
+        mocker.patch.object(MockStream, "supports_incremental", new_callable=mocker.PropertyMock, return_value=True)
+        mocker.patch.object(MockStream, "max_concurrent_slices", new_callable=mocker.PropertyMock, return_value=4)
+        mocker.patch.object(MockStream, "get_updated_state", side_effect=lambda state, record: {"date": record["date"]})
+        mocker.patch.object(MockStream, "get_json_schema", return_value={})
+        src = MockSource(streams=[stream])
+        catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.incremental)])
+
+        messages = _fix_emitted_at(list(src.read(logger, {}, catalog)))
+
+        expected = []
+        for _slice in slices:
+            expected.extend(_as_records("s1", read_records(stream_slice=_slice)))
+            expected.append(_as_state({"s1": _slice}, "s1", _slice))
+        assert messages == expected
+
+    def test_slices_read_with_state_updated_by_previous_slices(self, mocker):
+        """Tests that when slices are read one at a time, each slice is read with the state updated by the records of the previous ones"""
+        slices = [{"date": "2023-01-01"}, {"date": "2023-01-02"}]
+        read_states = []
+
+        def read_records(**kwargs):
+            read_states.append(kwargs["stream_state"])
+            return [{"date": kwargs["stream_slice"]["date"]}]
+
+        stream = MockStream(name="s1")
+        mocker.patch.object(MockStream, "cursor_field", new_callable=mocker.PropertyMock, return_value="date")
+        mocker.patch.object(MockStream, "read_records", side_effect=read_records)
+        mocker.patch.object(MockStream, "stream_slices", return_value=slices)
+        mocker.patch.object(MockStream, "supports_incremental", new_callable=mocker.PropertyMock, return_value=True)
+        mocker.patch.object(MockStream, "get_updated_state", side_effect=lambda state, record: {"date": record["date"]})
+        mocker.patch.object(MockStream, "get_json_schema", return_value={})
+        src = MockSource(streams=[stream])
+        catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.incremental)])
+
+        list(src.read(logger, {}, catalog))
+
+        assert read_states == [{}, {"date": "2023-01-01"}]
+
+    def test_slices_of_streams_with_state_property_read_concurrently_and_closed_in_order(self, mocker):
+        """Tests that slices of streams updating their state while reading records are prefetched, and that each slice is closed
+        right before its checkpoint so that the state never covers slices whose records were not emitted yet"""
+        slices = [{"date": f"2023-01-{day:02d}"} for day in range(1, 7)]
+
+        class StreamClosingSlices(MockStreamWithState):
+            def __init__(self):
+                super().__init__([], name="s1")
+                self._state = {}
+                self.pending = {}
+
+            def read_records(self, stream_slice=None, **kwargs):
+                # progress is only kept per slice while reading, it is folded into the state when the slice is closed
+                self.pending[stream_slice["date"]] = stream_slice["date"]
+                return [{"date": stream_slice["date"], "id": i} for i in range(3)]
+
+            def close_slice(self, stream_slice):
+                self._state = {"date": self.pending.pop(stream_slice["date"])}
+
+        stream = StreamClosingSlices()
+        mocker.patch.object(StreamClosingSlices, "max_concurrent_slices", new_callable=mocker.PropertyMock, return_value=4)
+        mocker.patch.object(StreamClosingSlices, "stream_slices", return_value=slices)
+        mocker.patch.object(StreamClosingSlices, "supports_incremental", new_callable=mocker.PropertyMock, return_value=True)
+        mocker.patch.object(StreamClosingSlices, "get_json_schema", return_value={})
+        read_in_order_spy = mocker.patch("airbyte_cdk.sources.abstract_source.read_in_order", side_effect=read_in_order)
+        src = MockSource(streams=[stream])
+        catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.incremental)])
+
+        messages = _fix_emitted_at(list(src.read(logger, {}, catalog)))
+
+        expected = []
+        for _slice in slices:
+            expected.extend(_as_records("s1", [{"date": _slice["date"], "id": i} for i in range(3)]))
+            expected.append(_as_state({"s1": _slice}, "s1", _slice))
+        assert messages == expected
+        assert read_in_order_spy.call_args.kwargs["max_workers"] == 4
+
 
 def test_checkpoint_state_from_stream_instance():
     teams_stream = MockStreamOverridesStateMethod()
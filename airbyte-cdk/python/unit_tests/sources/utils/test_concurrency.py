@@ -0,0 +1,102 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+import time
+
+import pytest
+from airbyte_cdk.sources.utils.concurrency import read_concurrently, read_in_order
+
+
+def test_read_concurrently_preserves_order_per_iterator():
+    iterators = [iter([(i, j) for j in range(200)]) for i in range(5)]
+
+    items = list(read_concurrently(iterators, max_workers=3, buffer_size=10))
+
+    assert len(items) == 1000
+    for i in range(5):
+        assert [j for source, j in items if source == i] == list(range(200))
+
+
+def test_read_concurrently_uses_several_threads():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def waiting_iterator(value):
+        # Both iterators need to be running at the same time to get past the barrier
+        barrier.wait()
+        yield value
+
+    assert sorted(read_concurrently([waiting_iterator(1), waiting_iterator(2)], max_workers=2)) == [1, 2]
+
+
+def test_read_concurrently_reraises_first_exception():
+    def failing_iterator():
+        yield 1
+        raise ValueError("failure")
+
+    with pytest.raises(ValueError, match="failure"):
+        list(read_concurrently([failing_iterator(), iter(range(10))], max_workers=2))
+
+
+def test_read_concurrently_closes_iterators_when_consumer_stops():
+    closed = threading.Event()
+
+    def endless_iterator():
+        try:
+            while True:
+                yield 1
+        finally:
+            closed.set()
+
+    reader = read_concurrently([endless_iterator()], max_workers=1, buffer_size=1)
+    assert next(reader) == 1
+    reader.close()
+
+    assert closed.wait(timeout=5)
+
+
+def test_read_concurrently_without_iterators():
+    assert list(read_concurrently([], max_workers=2)) == []
+
+
+def test_read_in_order_yields_inputs_in_order():
+    def read(value):
+        # Later inputs are produced faster so that they finish first
+        time.sleep(0.01 * (5 - value))
+        return [(value, i) for i in range(3)]
+
+    results = [(value, list(items)) for value, items in read_in_order(range(5), read, max_workers=3)]
+
+    assert results == [(value, [(value, i) for i in range(3)]) for value in range(5)]
+
+
+def test_read_in_order_prefetches_at_most_max_workers_inputs():
+    read_inputs = []
+
+    def read(value):
+        read_inputs.append(value)
+        return [value]
+
+    reader = read_in_order(range(10), read, max_workers=3)
+    value, items = next(reader)
+    assert list(items) == [0]
+    time.sleep(0.1)
+
+    assert sorted(read_inputs) == [0, 1, 2]
+    reader.close()
+
+
+def test_read_in_order_reraises_exception_with_the_failing_input():
+    def read(value):
+        if value == 1:
+            raise ValueError("failure")
+        return [value]
+
+    reader = read_in_order(range(3), read, max_workers=2)
+    _, items = next(reader)
+    assert list(items) == [0]
+    _, items = next(reader)
+    with pytest.raises(ValueError, match="failure"):
+        list(items)
+    reader.close()
@@ -2,8 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import copy
 import json
+from concurrent.futures import ThreadPoolExecutor
 
+import airbyte_cdk.sources.utils.transform as transform_module
 import pytest
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 
@@ -264,3 +267,105 @@ def test_custom_transform_with_default_normalization():
     obj = {"value": 12}
     s.transformer.transform(obj, SIMPLE_SCHEMA)
     assert obj == {"value": "transformed"}
+
+
+RECURSIVE_SCHEMA = {
+    "type": "object",
+    "properties": {"name": {"type": "string"}, "children": {"type": "array", "items": {"$ref": "#/definitions/node"}}},
+    "definitions": {
+        "node": {
+            "type": ["null", "object"],
+            "properties": {"name": {"type": "string"}, "children": {"type": "array", "items": {"$ref": "#/definitions/node"}}},
+        }
+    },
+}
+
+
+@pytest.mark.parametrize(
+    "schema, record",
+    [
+        (COMPLEX_SCHEMA, {"value": "false", "prop": 12, "number_prop": "aa12", "int_prop": "1", "array": [12, None], "nested": {"a": 1}}),
+        (COMPLEX_SCHEMA, {"too_many_types": 1212, "list_of_lists": [[1], "a", [{"b": 1}]], "nested": "not an object"}),
+        (VERY_NESTED_SCHEMA, {"very_nested_value": {"very_nested_value": {"very_nested_value": "1"}}}),
+        (RECURSIVE_SCHEMA, {"name": 1, "children": [{"name": 2, "children": [{"name": 3.5, "children": None}, "leaf"]}, None]}),
+        (
+            {"type": "object", "properties": {"value": {"type": ["integer", "null"]}, "other": {"type": "number"}}},
+            {"value": 1.0, "other": True},
+        ),
+        ({"type": "object", "properties": {"value": {"type": "array", "items": {"type": ["string"]}}}}, {"value": 10}),
+        ({"type": "integer"}, {"value": "12"}),
+    ],
+)
+def test_compiled_transform_matches_jsonschema_transform(schema, record, caplog, mocker):
+    compiled_record = json.loads(json.dumps(record))
+    TypeTransformer(TransformConfig.DefaultSchemaNormalization).transform(compiled_record, schema)
+    compiled_warnings = [r.message for r in caplog.records]
+    caplog.clear()
+
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    mocker.patch.object(transformer, "_get_compiled_schema", return_value=None)
+    transformer.transform(record, schema)
+
+    assert compiled_record == record
+    assert compiled_warnings == [r.message for r in caplog.records]
+
+
+def test_schema_is_compiled_once(mocker):
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    compile_spy = mocker.spy(transformer, "_compile_normalizer")
+
+    for _ in range(3):
+        transformer.transform({"value": 12}, SIMPLE_SCHEMA)
+
+    assert compile_spy.call_count == 1
+
+
+def test_equal_schemas_are_compiled_once(mocker):
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    compile_spy = mocker.spy(transformer, "_compile_normalizer")
+
+    for _ in range(3):
+        record = {"value": 12}
+        transformer.transform(record, json.loads(json.dumps(SIMPLE_SCHEMA)))
+        assert record == {"value": "12"}
+
+    assert compile_spy.call_count == 1
+
+
+def test_copies_of_last_schema_are_not_serialized_again(mocker):
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    dumps_spy = mocker.spy(transform_module.json, "dumps")
+
+    for _ in range(3):
+        transformer.transform({"value": 12}, copy.deepcopy(SIMPLE_SCHEMA))
+
+    assert dumps_spy.call_count == 1
+
+
+def test_transform_on_several_threads():
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    schemas = [
+        {"type": "object", "properties": {f"value_{i}": {"type": "string"}}} for i in range(TypeTransformer.COMPILED_SCHEMAS_CACHE_SIZE * 2)
+    ]
+
+    def transform(schema_index):
+        schema = copy.deepcopy(schemas[schema_index % len(schemas)])
+        record = {f"value_{schema_index % len(schemas)}": 12}
+        transformer.transform(record, schema)
+        return record
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        records = list(executor.map(transform, range(2000)))
+
+    assert records == [{f"value_{i % len(schemas)}": "12"} for i in range(2000)]
+
+
+def test_unsupported_schema_falls_back_to_jsonschema():
+    schema = {"type": "object", "properties": {"value": {"type": "array", "items": [{"type": "string"}]}, "other": {"type": "string"}}}
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    record = {"other": 12}
+
+    transformer.transform(record, schema)
+
+    assert transformer._get_compiled_schema(schema) is None
+    assert record == {"other": "12"}
@@ -2,7 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-
+import json
 from argparse import Namespace
 from copy import deepcopy
 from typing import Any, List, Mapping, MutableMapping, Union
@@ -11,6 +11,7 @@ from unittest.mock import MagicMock
 import pytest
 from airbyte_cdk import AirbyteEntrypoint
 from airbyte_cdk import entrypoint as entrypoint_module
+from airbyte_cdk.entrypoint import METRICS_LOG_PREFIX
 from airbyte_cdk.models import (
     AirbyteCatalog,
     AirbyteConnectionStatus,
@@ -23,6 +24,7 @@ from airbyte_cdk.models import (
     Type,
 )
 from airbyte_cdk.sources import Source
+from airbyte_cdk.utils.stream_metrics import MetricsRegistry
 
 
 class MockSource(Source):
@@ -193,6 +195,29 @@ def test_run_read(entrypoint: AirbyteEntrypoint, mocker, spec_mock, config_mock)
     assert spec_mock.called
 
 
+def test_run_read_reports_metrics(entrypoint: AirbyteEntrypoint, mocker, spec_mock, config_mock, monkeypatch, tmp_path):
+    metrics_path = tmp_path / "metrics.json"
+    monkeypatch.setenv("AIRBYTE_METRICS_INTERVAL_SECONDS", "3600")
+    monkeypatch.setenv("AIRBYTE_METRICS_PATH", str(metrics_path))
+    mocker.patch("airbyte_cdk.entrypoint.metrics_registry", MetricsRegistry())
+    parsed_args = Namespace(command="read", config="config_path", state="statepath", catalog="catalogpath")
+    expected = AirbyteRecordMessage(stream="stream", data={"data": "stuff"}, emitted_at=1)
+    mocker.patch.object(MockSource, "read_state", return_value={})
+    mocker.patch.object(MockSource, "read_catalog", return_value={})
+    mocker.patch.object(MockSource, "read", return_value=[AirbyteMessage(record=expected, type=Type.RECORD)] * 2)
+
+    messages = list(entrypoint.run(parsed_args))
+
+    assert messages[:2] == [_wrap_message(expected)] * 2
+    metrics_message = AirbyteMessage.parse_raw(messages[2])
+    assert metrics_message.type == Type.LOG and metrics_message.log.message.startswith(METRICS_LOG_PREFIX)
+    (stream_metrics,) = json.loads(metrics_message.log.message[len(METRICS_LOG_PREFIX) :])["streams"]
+    assert stream_metrics["stream"] == "stream"
+    assert stream_metrics["records"] == 2
+    assert stream_metrics["bytes_emitted"] == 2 * len(_wrap_message(expected))
+    assert json.loads(metrics_path.read_text())["streams"][0]["records"] == 2
+
+
 def test_invalid_command(entrypoint: AirbyteEntrypoint, mocker, config_mock):
     with pytest.raises(Exception):
         list(entrypoint.run(Namespace(command="invalid", config="conf")))
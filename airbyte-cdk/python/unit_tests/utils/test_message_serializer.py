@@ -0,0 +1,147 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import datetime
+import io
+import time
+from decimal import Decimal
+
+import pytest
+from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, AirbyteRecordMessage, AirbyteStateMessage, Level
+from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
+from airbyte_cdk.utils import message_serializer
+from airbyte_cdk.utils.message_serializer import BufferedMessageWriter, airbyte_message_to_string
+
+
+@pytest.fixture(autouse=True)
+def without_orjson(mocker):
+    # Output is only byte for byte identical to pydantic's with the standard library encoder
+    mocker.patch.object(message_serializer, "orjson", None)
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        pytest.param(
+            AirbyteMessage(type=MessageType.RECORD, record=AirbyteRecordMessage(stream="users", data={"id": 1}, emitted_at=1)),
+            id="test_record",
+        ),
+        pytest.param(
+            AirbyteMessage(
+                type=MessageType.RECORD,
+                record=AirbyteRecordMessage(namespace="public", stream="users", data={"id": 1, "name": "é"}, emitted_at=1),
+            ),
+            id="test_record_with_namespace_and_unicode",
+        ),
+        pytest.param(
+            AirbyteMessage(
+                type=MessageType.RECORD,
+                record=AirbyteRecordMessage(
+                    stream="users",
+                    data={
+                        "created": datetime.datetime(2023, 1, 1, 12),
+                        "amount": Decimal("1.5"),
+                        "tags": ["a", None],
+                        "nested": {"k": 1.0},
+                    },
+                    emitted_at=1,
+                ),
+            ),
+            id="test_record_with_non_json_types",
+        ),
+        pytest.param(stream_data_to_airbyte_message("users", {"id": 1, "name": "octavia"}), id="test_record_from_stream_data"),
+        pytest.param(AirbyteMessage(type=MessageType.LOG, log=AirbyteLogMessage(level=Level.INFO, message="hello")), id="test_log"),
+        pytest.param(AirbyteMessage(type=MessageType.STATE, state=AirbyteStateMessage(data={"users": {"id": 1}})), id="test_state"),
+    ],
+)
+def test_airbyte_message_to_string_matches_pydantic(message):
+    assert airbyte_message_to_string(message) == message.json(exclude_unset=True)
+
+
+def test_writer_buffers_records_until_buffer_is_full():
+    stream = io.BytesIO()
+    record = '{"type": "RECORD", "record": {"stream": "users", "data": {"id": 1}, "emitted_at": 1}}'
+    with BufferedMessageWriter(stream, buffer_size=100, flush_interval=60) as writer:
+        writer.write(record)
+        assert stream.getvalue() == b""
+
+        writer.write(record)
+        assert stream.getvalue() == f"{record}\n{record}\n".encode()
+
+
+def test_writer_flushes_non_record_messages_immediately():
+    stream = io.BytesIO()
+    record = '{"type": "RECORD", "record": {"stream": "users", "data": {"id": 1}, "emitted_at": 1}}'
+    state = '{"type": "STATE", "state": {"data": {"users": {"id": 1}}}}'
+    with BufferedMessageWriter(stream, flush_interval=60) as writer:
+        writer.write(record)
+        writer.write(state)
+
+        assert stream.getvalue() == f"{record}\n{state}\n".encode()
+
+
+def test_writer_flushes_on_exit():
+    stream = io.BytesIO()
+    with BufferedMessageWriter(stream, flush_interval=60) as writer:
+        writer.write('{"type": "RECORD", "record": {"stream": "users", "data": {"id": 1}, "emitted_at": 1}}')
+        assert stream.getvalue() == b""
+
+    assert stream.getvalue() == b'{"type": "RECORD", "record": {"stream": "users", "data": {"id": 1}, "emitted_at": 1}}\n'
+
+
+def test_writer_flushes_records_while_source_is_blocked():
+    stream = io.BytesIO()
+    record = '{"type": "RECORD", "record": {"stream": "users", "data": {"id": 1}, "emitted_at": 1}}'
+    with BufferedMessageWriter(stream, flush_interval=0.05) as writer:
+        writer.write(record)
+
+        deadline = time.monotonic() + 5
+        while not stream.getvalue() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert stream.getvalue() == f"{record}\n".encode()
+
+
+def test_writer_stops_flushing_once_closed():
+    stream = io.BytesIO()
+    writer = BufferedMessageWriter(stream, flush_interval=0.05)
+    writer.write('{"type": "RECORD", "record": {"stream": "users", "data": {"id": 1}, "emitted_at": 1}}')
+    flusher = writer._flusher
+
+    writer.close()
+
+    assert not flusher.is_alive()
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        pytest.param('{"type": "RECORD", "record": {"stream": "users", "data": {"id": 1}, "emitted_at": 1}}', id="test_record"),
+        pytest.param(
+            b'{"type": "RECORD", "record": {"namespace": "public", "stream": "users", "data": {"name": "\\u00e9"}, "emitted_at": 1}}',
+            id="test_record_as_bytes",
+        ),
+        pytest.param('{"type": "RECORD", "record": {"stream": "users", "data": {"id": 1}, "emitted_at": 1.0}}', id="test_record_coerced"),
+        pytest.param('{"type": "STATE", "state": {"data": {"users": {"id": 1}}}}', id="test_state"),
+    ],
+)
+def test_airbyte_message_from_string_matches_pydantic(line):
+    message = message_serializer.airbyte_message_from_string(line)
+
+    assert message == AirbyteMessage.parse_raw(line)
+    assert airbyte_message_to_string(message) == AirbyteMessage.parse_raw(line).json(exclude_unset=True)
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        pytest.param("not json", id="test_invalid_json"),
+        pytest.param(
+            '{"type": "RECORD", "record": {"stream": "users", "data": "not an object", "emitted_at": 1}}', id="test_invalid_record"
+        ),
+    ],
+)
+def test_airbyte_message_from_string_raises_value_error(line):
+    with pytest.raises(ValueError):
+        message_serializer.airbyte_message_from_string(line)
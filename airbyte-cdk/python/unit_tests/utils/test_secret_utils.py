@@ -121,3 +121,23 @@ def test_secret_filtering():
     update_secrets([SECRET_STRING_VALUE, SECRET_STRING_2_VALUE])
     filtered = filter_secrets(sensitive_str)
     assert filtered == f"**** {NOT_SECRET_VALUE} **** ****"
+
+
+@pytest.mark.parametrize(
+    "secrets, string, expected",
+    [
+        (["x", "xk"], "xk", "****"),
+        (["xk", "x"], "xk x", "**** ****"),
+        (["ab", "bc"], "abc", "****"),
+        (["ab", "bcdef"], "abcdef", "****"),
+        (["bcdef", "ab"], "xabcdefx ab", "x****x ****"),
+        (["abc", "b"], "abcb", "********"),
+        (["a.b"], "a.b axb", "**** axb"),
+        ([12345], "id 12345", "id ****"),
+        (["secret"], "secretsecret", "********"),
+    ],
+)
+def test_secret_filtering_masks_longest_match(secrets, string, expected):
+    update_secrets(secrets)
+    assert filter_secrets(string) == expected
+    update_secrets([])
@@ -0,0 +1,118 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import pytest
+from airbyte_cdk.utils.stream_metrics import MetricsRegistry, NoopMetricsRegistry, StreamMetrics, timed
+
+
+def test_http_latency_histogram():
+    metrics = StreamMetrics("stream")
+    for seconds in [0.01, 0.05, 0.3, 120]:
+        metrics.record_http_request(seconds)
+
+    report = metrics.to_dict()
+
+    assert report["http_requests"] == 4
+    assert report["http_request_seconds"] == pytest.approx(120.36)
+    assert report["http_latency_histogram"]["le_0.05s"] == 2
+    assert report["http_latency_histogram"]["le_0.5s"] == 1
+    assert report["http_latency_histogram"]["gt_60.0s"] == 1
+
+
+def test_track_slice_counts_records_only():
+    metrics = StreamMetrics("stream")
+    items = [{"id": 1}, "not a record", {"id": 2}]
+
+    assert list(metrics.track_slice({"partition": 1}, items)) == items
+
+    (slice_report,) = metrics.to_dict()["recent_slices"]
+    assert slice_report["slice"] == {"partition": 1}
+    assert slice_report["records"] == 2
+    assert slice_report["finished"]
+
+
+def test_record_emitted():
+    metrics = StreamMetrics("stream")
+    metrics.record_emitted(10, 0.5)
+    metrics.record_emitted(20, 0.25)
+
+    report = metrics.to_dict()
+
+    assert report["records"] == 2
+    assert report["bytes_emitted"] == 30
+    assert report["serialize_seconds"] == 0.75
+
+
+def test_timed_reports_time_spent_producing_items():
+    durations = []
+    assert list(timed(iter([1, 2]), durations.append)) == [1, 2]
+    # One duration per item and one for the final StopIteration
+    assert len(durations) == 3
+
+
+def test_registry_returns_the_same_metrics_per_stream():
+    registry = MetricsRegistry()
+    registry.stream("a").record_parse(1.0)
+    registry.stream("a").record_parse(2.0)
+    registry.stream("b")
+
+    report = registry.report()
+
+    assert [stream["stream"] for stream in report["streams"]] == ["a", "b"]
+    assert report["streams"][0]["parse_seconds"] == 3.0
+    registry.reset()
+    assert registry.report()["streams"] == []
+
+
+def test_report_due_only_when_interval_is_set(monkeypatch):
+    registry = MetricsRegistry()
+    assert not registry.report_due()
+
+    monkeypatch.setenv(MetricsRegistry.ENV_METRICS_INTERVAL_SECONDS, "0.000001")
+    assert registry.report_due()
+
+
+def test_dump(monkeypatch, tmp_path):
+    registry = MetricsRegistry()
+    registry.stream("a")
+    registry.dump()
+    assert list(tmp_path.iterdir()) == []
+
+    monkeypatch.setenv(MetricsRegistry.ENV_METRICS_PATH, str(tmp_path / "metrics.json"))
+    registry.dump()
+    assert (tmp_path / "metrics.json").exists()
+
+
+@pytest.mark.parametrize(
+    "env, configured",
+    [
+        ({}, False),
+        ({"AIRBYTE_METRICS_INTERVAL_SECONDS": "60"}, True),
+        ({"AIRBYTE_METRICS_PATH": "/tmp/metrics.json"}, True),
+    ],
+)
+def test_registry_configured_from_env(monkeypatch, env, configured):
+    monkeypatch.delenv("AIRBYTE_METRICS_INTERVAL_SECONDS", raising=False)
+    monkeypatch.delenv("AIRBYTE_METRICS_PATH", raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+
+    assert MetricsRegistry.configured() == configured
+
+
+def test_noop_registry_collects_nothing(monkeypatch, tmp_path):
+    monkeypatch.setenv("AIRBYTE_METRICS_INTERVAL_SECONDS", "0.000001")
+    monkeypatch.setenv("AIRBYTE_METRICS_PATH", str(tmp_path / "metrics.json"))
+    registry = NoopMetricsRegistry()
+    metrics = registry.stream("stream")
+    metrics.record_http_request(1.0)
+    metrics.record_emitted(10, 1.0)
+    items = [{"id": 1}, {"id": 2}]
+
+    assert list(metrics.track_slice(None, items)) == items
+    assert not registry.enabled
+    assert registry.report() == {"peak_rss_bytes": registry.report()["peak_rss_bytes"], "streams": []}
+    assert not registry.report_due()
+    registry.dump()
+    assert not (tmp_path / "metrics.json").exists()
@@ -164,6 +164,11 @@ class API:
         self.api = MyFacebookAdsApi.init(access_token=access_token, crash_log=False)
         FacebookAdsApi.set_default_api(self.api)
 
+    @property
+    def account_id(self) -> str:
+        """ID of current account as set in config"""
+        return self._account_id
+
     @cached_property
     def account(self) -> AdAccount:
         """Find current account"""
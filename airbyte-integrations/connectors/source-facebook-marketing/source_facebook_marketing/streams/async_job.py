@@ -4,9 +4,12 @@
 
 import copy
 import logging
+import queue
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
 from enum import Enum
-from typing import Any, Iterator, List, Mapping, Optional, Type, Union
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, Optional, Type, Union
 
 import backoff
 import pendulum
@@ -54,6 +57,72 @@ def update_in_batch(api: FacebookAdsApi, jobs: List["AsyncJob"]):
         batch = batch.execute()
 
 
+class PrefetchedResult:
+    """Result of a finished job paged through by a background thread into a bounded buffer,
+    so that the results of several jobs are downloaded at the same time while each of them is still read in order.
+    """
+
+    _END = object()
+
+    def __init__(self, get_result: Callable[[], Iterable[Any]], executor: Executor, buffer_size: int):
+        """Start fetching the result
+
+        :param get_result: callable returning the result of the job
+        :param executor: executor to page through the result with
+        :param buffer_size: maximum number of records fetched ahead of the reader
+        """
+        self._buffer = queue.Queue(maxsize=buffer_size)
+        self._cancelled = threading.Event()
+        self._started = False
+        self._future = executor.submit(self._fetch, get_result)
+
+    @property
+    def started(self) -> bool:
+        """Tell if the reader started reading the records"""
+        return self._started
+
+    def _put(self, item: Any) -> bool:
+        """Wait for room in the buffer unless the result is cancelled in the meantime"""
+        while not self._cancelled.is_set():
+            try:
+                self._buffer.put(item, timeout=1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _fetch(self, get_result: Callable[[], Iterable[Any]]):
+        try:
+            for record in get_result():
+                if not self._put(record):
+                    return
+        finally:
+            self._put(self._END)
+
+    def cancel(self):
+        """Stop fetching the result, records that were not read yet are dropped"""
+        self._cancelled.set()
+        self._future.cancel()
+
+    def __iter__(self) -> Iterator[Any]:
+        """Read the records in order, errors raised while fetching them are raised here"""
+        self._started = True
+        try:
+            while True:
+                try:
+                    record = self._buffer.get(timeout=1)
+                except queue.Empty:
+                    if self._cancelled.is_set():
+                        raise RuntimeError("The result was cancelled before it was fetched")
+                    continue
+                if record is self._END:
+                    break
+                yield record
+            self._future.result()
+        finally:
+            self.cancel()
+
+
 class Status(str, Enum):
     """Async job statuses"""
 
@@ -77,6 +146,7 @@ class AsyncJob(ABC):
         self._api = api
         self._interval = interval
         self._attempt_number = 0
+        self._prefetched_result: Optional[PrefetchedResult] = None
 
     @property
     def interval(self) -> pendulum.Period:
@@ -113,9 +183,26 @@ class AsyncJob(ABC):
         :param batch: FB batch executor
         """
 
-    @abstractmethod
     def get_result(self) -> Iterator[Any]:
-        """Retrieve result of the finished job."""
+        """Retrieve result of the finished job, from the background download if prefetch_result was called."""
+        if self._prefetched_result:
+            result, self._prefetched_result = self._prefetched_result, None
+            return iter(result)
+        return self._get_result()
+
+    def prefetch_result(self, executor: Executor, buffer_size: int) -> PrefetchedResult:
+        """Start downloading result of the finished job in the background
+
+        :param executor: executor to page through the result with
+        :param buffer_size: maximum number of records fetched ahead of get_result
+        :return: the result being fetched, so that it can be cancelled
+        """
+        self._prefetched_result = PrefetchedResult(self._get_result, executor=executor, buffer_size=buffer_size)
+        return self._prefetched_result
+
+    @abstractmethod
+    def _get_result(self) -> Iterator[Any]:
+        """Retrieve result of the finished job from the API."""
 
     @abstractmethod
     def split_job(self) -> List["AsyncJob"]:
@@ -158,7 +245,7 @@ class ParentAsyncJob(AsyncJob):
         """Checks jobs status in advance."""
         update_in_batch(api=self._api, jobs=self._jobs)
 
-    def get_result(self) -> Iterator[Any]:
+    def _get_result(self) -> Iterator[Any]:
         """Retrieve result of the finished job."""
         for job in self._jobs:
             yield from job.get_result()
@@ -211,6 +298,11 @@ class InsightAsyncJob(AsyncJob):
         self._finish_time = None
         self._failed = False
 
+    @property
+    def edge_object(self) -> Union[AdAccount, Campaign, AdSet, Ad]:
+        """Object the job fetches insights of"""
+        return self._edge_object
+
     def split_job(self) -> List["AsyncJob"]:
         """Split existing job in few smaller ones grouped by ParentAsyncJob class."""
         if isinstance(self._edge_object, AdAccount):
@@ -352,7 +444,7 @@ class InsightAsyncJob(AsyncJob):
         return False
 
     @backoff_policy
-    def get_result(self) -> Any:
+    def _get_result(self) -> Any:
         """Retrieve result of the finished job."""
         if not self._job or self.failed:
             raise RuntimeError(f"{self}: Incorrect usage of get_result - the job is not started or failed")
@@ -4,11 +4,14 @@
 
 import logging
 import time
-from typing import TYPE_CHECKING, Iterator, List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Iterator, List, Mapping, MutableMapping, Optional, Set
 
+import pendulum
 from source_facebook_marketing.streams.common import JobException
 
-from .async_job import AsyncJob, ParentAsyncJob, update_in_batch
+from .async_job import AsyncJob, InsightAsyncJob, ParentAsyncJob, update_in_batch
 
 if TYPE_CHECKING:  # pragma: no cover
     from source_facebook_marketing.api import API
@@ -16,11 +19,113 @@ if TYPE_CHECKING:  # pragma: no cover
 logger = logging.getLogger("airbyte")
 
 
+class JobDurationModel:
+    """
+    Expected duration of insight jobs of an account with the given breakdowns, by the type of object the jobs fetch insights of.
+    It is learnt from finished jobs and kept in stream state, so that jobs expected to run too long are split into jobs
+    of smaller objects before they start rather than after they failed.
+    """
+
+    # Types of objects jobs are split to in advance, from the biggest one.
+    # Splitting to ads is left for jobs that failed, because accounts can have too many of them.
+    EDGE_TYPES = ["AdAccount", "Campaign", "AdSet"]
+    # Jobs expected to run longer than this are split in advance.
+    MAX_EXPECTED_DURATION = pendulum.duration(minutes=20)
+    # Weight of the latest duration in the expected one, previous durations weigh the rest.
+    SMOOTHING = 0.3
+    # Factor the expected duration of a type of object is multiplied by once per sync in which jobs of that type are split in advance.
+    # Durations of such jobs are not learnt anymore since they don't run, so they are tried again unsplit once it fell under the limit.
+    DECAY = 0.9
+
+    def __init__(self, account_id: str, breakdowns: List[str], action_breakdowns: List[str]):
+        """Init
+
+        :param account_id: account jobs run for
+        :param breakdowns: breakdowns of the jobs
+        :param action_breakdowns: action breakdowns of the jobs
+        """
+        self._key = {"account_id": account_id, "breakdowns": list(breakdowns), "action_breakdowns": list(action_breakdowns)}
+        self._seconds_per_day: MutableMapping[str, float] = {}
+        # types of objects whose expected duration already decayed, the model lives as long as the sync
+        self._decayed_edge_types: Set[str] = set()
+
+    @property
+    def state(self) -> Mapping[str, Any]:
+        """Model as it is saved in stream state, empty until a job finished"""
+        if not self._seconds_per_day:
+            return {}
+        return {**self._key, "seconds_per_day": dict(self._seconds_per_day)}
+
+    @state.setter
+    def state(self, value: Mapping[str, Any]):
+        """Load the model from stream state, ignore it if it was learnt for another account or breakdowns"""
+        if any(value.get(key) != key_value for key, key_value in self._key.items()):
+            logger.info("Ignoring saved insight job durations because of different account or breakdowns.")
+            return
+        self._seconds_per_day = dict(value.get("seconds_per_day", {}))
+
+    @staticmethod
+    def _days(interval: pendulum.Period) -> int:
+        return interval.in_days() + 1
+
+    def observe(self, job: InsightAsyncJob):
+        """Learn from a finished job, a failed job counts as one that ran into the timeout.
+
+        :param job: completed or failed job
+        """
+        edge_type = type(job.edge_object).__name__
+        seconds = job.elapsed_time.total_seconds()
+        if job.failed:
+            seconds = max(seconds, job.job_timeout.total_seconds())
+        seconds_per_day = seconds / self._days(job.interval)
+        if edge_type in self._seconds_per_day:
+            seconds_per_day = self.SMOOTHING * seconds_per_day + (1 - self.SMOOTHING) * self._seconds_per_day[edge_type]
+        self._seconds_per_day[edge_type] = seconds_per_day
+
+    def expected_duration(self, edge_type: str, interval: pendulum.Period) -> Optional[pendulum.Duration]:
+        """Expected duration of a job for the given type of object and interval, None if no such job finished before."""
+        if edge_type not in self._seconds_per_day:
+            return None
+        return pendulum.duration(seconds=self._seconds_per_day[edge_type] * self._days(interval))
+
+    def splits_needed(self, job: InsightAsyncJob) -> int:
+        """Number of times the job should be split before it starts, so that it is expected to finish in time.
+
+        :param job: job that is about to start
+        :return: 0 if the job doesn't need to be split
+        """
+        edge_type = type(job.edge_object).__name__
+        if edge_type not in self.EDGE_TYPES:
+            return 0
+        splits = 0
+        for edge_type in self.EDGE_TYPES[self.EDGE_TYPES.index(edge_type) : -1]:
+            expected_duration = self.expected_duration(edge_type, job.interval)
+            if expected_duration is None or expected_duration <= self.MAX_EXPECTED_DURATION:
+                break
+            splits += 1
+        return splits
+
+    def decay(self, job: InsightAsyncJob, splits: int):
+        """Lower the expected duration of the types of objects the job is split from in advance, at most once per sync,
+        so that it does not depend on how many jobs are split in the sync.
+
+        :param job: job that is split in advance
+        :param splits: number of times the job is split
+        """
+        first_edge_type = self.EDGE_TYPES.index(type(job.edge_object).__name__)
+        for edge_type in self.EDGE_TYPES[first_edge_type : first_edge_type + splits]:
+            if edge_type not in self._decayed_edge_types:
+                self._seconds_per_day[edge_type] *= self.DECAY
+                self._decayed_edge_types.add(edge_type)
+
+
 class InsightAsyncJobManager:
     """
     Class for managing Ads Insights async jobs. Before running next job it
     checks current insight throttle value and if it greater than THROTTLE_LIMIT variable, no new jobs added.
     To consume completed jobs use completed_job generator, jobs will be returned in the order they finished.
+    Results of the next completed jobs are downloaded in the background while the current one is consumed.
+    When a model of job durations is given, jobs expected to run too long are split before they start.
     """
 
     # When current insights throttle hit this value no new jobs added.
@@ -31,16 +136,23 @@ class InsightAsyncJobManager:
     # Maximum of concurrent jobs that could be scheduled. Since throttling
     # limit is not reliable indicator of async workload capability we still have to use this parameter.
     MAX_JOBS_IN_QUEUE = 100
+    # Maximum of completed jobs whose results are downloaded at the same time,
+    # fewer results are downloaded ahead as current insights throttle gets closer to THROTTLE_LIMIT.
+    MAX_RESULTS_IN_PROGRESS = 8
+    # Maximum of records of each job downloaded ahead of consumption.
+    RESULT_BUFFER_SIZE = 1000
 
-    def __init__(self, api: "API", jobs: Iterator[AsyncJob]):
+    def __init__(self, api: "API", jobs: Iterator[AsyncJob], job_durations: Optional[JobDurationModel] = None):
         """Init
 
         :param api:
         :param jobs:
+        :param job_durations: model of job durations to split jobs in advance with, updated with durations of finished jobs
         """
         self._api = api
         self._jobs = iter(jobs)
         self._running_jobs = []
+        self._job_durations = job_durations
 
     def _start_jobs(self):
         """Enqueue new jobs."""
@@ -53,6 +165,7 @@ class InsightAsyncJobManager:
             if not job:
                 self._empty = True
                 break
+            job = self._split_job_in_advance(job)
             job.start()
             self._running_jobs.append(job)
 
@@ -72,14 +185,57 @@ class InsightAsyncJobManager:
         if not self._running_jobs:
             self._start_jobs()
 
-        while self._running_jobs:
-            completed_jobs = self._check_jobs_status_and_restart()
-            while not completed_jobs:
-                logger.info(f"No jobs ready to be consumed, wait for {self.JOB_STATUS_UPDATE_SLEEP_SECONDS} seconds")
-                time.sleep(self.JOB_STATUS_UPDATE_SLEEP_SECONDS)
+        executor = ThreadPoolExecutor(max_workers=self.MAX_RESULTS_IN_PROGRESS)
+        try:
+            while self._running_jobs:
                 completed_jobs = self._check_jobs_status_and_restart()
-            yield from completed_jobs
-            self._start_jobs()
+                while not completed_jobs:
+                    logger.info(f"No jobs ready to be consumed, wait for {self.JOB_STATUS_UPDATE_SLEEP_SECONDS} seconds")
+                    time.sleep(self.JOB_STATUS_UPDATE_SLEEP_SECONDS)
+                    completed_jobs = self._check_jobs_status_and_restart()
+                yield from self._prefetch_results(completed_jobs, executor=executor)
+                self._start_jobs()
+        finally:
+            # a result the consumer already started reading is still downloaded, so that it can be read to the end
+            executor.shutdown(wait=False)
+
+    def _prefetch_results(self, jobs: List[AsyncJob], executor: ThreadPoolExecutor) -> Iterator[AsyncJob]:
+        """Yield jobs in the given order while results of the next ones are downloaded in the background.
+        Every job is consumed after the previous one, so state is advanced in the same order as without prefetching.
+
+        :param jobs: completed jobs
+        :param executor: executor to download results with
+        :yield: the same jobs
+        """
+        pending_jobs = deque(jobs)
+        prefetched_jobs = deque()
+        yielded_result = None
+        try:
+            while pending_jobs or prefetched_jobs:
+                results_in_progress = self._get_results_in_progress_limit()
+                while pending_jobs and len(prefetched_jobs) < results_in_progress:
+                    job = pending_jobs.popleft()
+                    prefetched_jobs.append((job, job.prefetch_result(executor=executor, buffer_size=self.RESULT_BUFFER_SIZE)))
+                if prefetched_jobs:
+                    job, yielded_result = prefetched_jobs.popleft()
+                    yield job
+                    # the consumer moved past the job, a result it did not read to the end would block a worker forever
+                    yielded_result.cancel()
+                    yielded_result = None
+                else:
+                    # when throttle leaves no room for downloads in the background the result is read by the consumer itself
+                    yield pending_jobs.popleft()
+        finally:
+            # stop downloads that nobody is going to consume
+            if yielded_result and not yielded_result.started:
+                yielded_result.cancel()
+            for _, result in prefetched_jobs:
+                result.cancel()
+
+    def _get_results_in_progress_limit(self) -> int:
+        """Number of results that can be downloaded at the same time within current insights throttle."""
+        throttle_budget = max(self.THROTTLE_LIMIT - self._get_current_throttle_value(), 0) / self.THROTTLE_LIMIT
+        return int(self.MAX_RESULTS_IN_PROGRESS * throttle_budget)
 
     def _check_jobs_status_and_restart(self) -> List[AsyncJob]:
         """Checks jobs status in advance and restart if some failed.
@@ -93,6 +249,7 @@ class InsightAsyncJobManager:
         update_in_batch(api=self._api.api, jobs=self._running_jobs)
         self._wait_throttle_limit_down()
         for job in self._running_jobs:
+            self._observe_job_durations(job)
             if job.failed:
                 if isinstance(job, ParentAsyncJob):
                     # if this job is a ParentAsyncJob, it holds X number of jobs
@@ -123,6 +280,46 @@ class InsightAsyncJobManager:
 
         return completed_jobs
 
+    def _split_job_in_advance(self, job: AsyncJob) -> AsyncJob:
+        """Split job into jobs of smaller objects if it is expected to run too long.
+
+        :param job: job that is about to start
+        :return: the same job or jobs it was split into grouped by ParentAsyncJob
+        """
+        if not self._job_durations or not isinstance(job, InsightAsyncJob):
+            return job
+        splits = self._job_durations.splits_needed(job)
+        if not splits:
+            return job
+
+        smaller_jobs = [job]
+        for _ in range(splits):
+            smaller_jobs = [smaller_job for bigger_job in smaller_jobs for smaller_job in bigger_job.split_job()]
+        if not smaller_jobs:
+            return job
+        self._job_durations.decay(job, splits)
+        logger.info(f"{job}: expected to run too long, split into {len(smaller_jobs)} smaller jobs in advance.")
+        return ParentAsyncJob(api=self._api.api, jobs=smaller_jobs, interval=job.interval)
+
+    def _observe_job_durations(self, job: AsyncJob):
+        """Update model of job durations with the job if it just finished, or with its nested jobs that failed."""
+        if not self._job_durations:
+            return
+        if isinstance(job, ParentAsyncJob):
+            # completed nested jobs are observed once all of them completed, failed ones every time they fail,
+            # so that the nested jobs completed while others are still running are not observed on every status check
+            if job.failed:
+                finished_jobs = [nested_job for nested_job in job._jobs if nested_job.failed]
+            elif job.completed:
+                finished_jobs = job._jobs
+            else:
+                finished_jobs = []
+        else:
+            finished_jobs = [job]
+        for finished_job in finished_jobs:
+            if finished_job.completed and isinstance(finished_job, InsightAsyncJob):
+                self._job_durations.observe(finished_job)
+
     def _wait_throttle_limit_down(self):
         while self._get_current_throttle_value() > self.THROTTLE_LIMIT:
             logger.info(f"Current throttle is {self._api.api.ads_insights_throttle}, wait {self.JOB_STATUS_UPDATE_SLEEP_SECONDS} seconds")
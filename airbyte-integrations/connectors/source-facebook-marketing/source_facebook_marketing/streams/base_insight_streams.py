@@ -14,7 +14,7 @@ from airbyte_cdk.utils import AirbyteTracedException
 from cached_property import cached_property
 from facebook_business.exceptions import FacebookBadObjectError
 from source_facebook_marketing.streams.async_job import AsyncJob, InsightAsyncJob
-from source_facebook_marketing.streams.async_job_manager import InsightAsyncJobManager
+from source_facebook_marketing.streams.async_job_manager import InsightAsyncJobManager, JobDurationModel
 
 from .base_streams import FBMarketingIncrementalStream
 
@@ -97,6 +97,11 @@ class AdsInsights(FBMarketingIncrementalStream):
         """Build complex PK based on slices and breakdowns"""
         return ["date_start", "account_id", "ad_id"] + self.breakdowns
 
+    @cached_property
+    def _job_durations(self) -> JobDurationModel:
+        """Durations of previous jobs of this stream, used to split jobs expected to run too long before they start"""
+        return JobDurationModel(account_id=self._api.account_id, breakdowns=self.breakdowns, action_breakdowns=self.action_breakdowns)
+
     @property
     def insights_lookback_period(self):
         """
@@ -137,19 +142,22 @@ class AdsInsights(FBMarketingIncrementalStream):
     def state(self) -> MutableMapping[str, Any]:
         """State getter, the result can be stored by the source"""
         if self._cursor_value:
-            return {
+            state = {
                 self.cursor_field: self._cursor_value.isoformat(),
                 "slices": [d.isoformat() for d in self._completed_slices],
                 "time_increment": self.time_increment,
             }
-
-        if self._completed_slices:
-            return {
+        elif self._completed_slices:
+            state = {
                 "slices": [d.isoformat() for d in self._completed_slices],
                 "time_increment": self.time_increment,
             }
+        else:
+            state = {}
 
-        return {}
+        if self._job_durations.state:
+            state["job_durations"] = self._job_durations.state
+        return state
 
     @state.setter
     def state(self, value: Mapping[str, Any]):
@@ -164,6 +172,8 @@ class AdsInsights(FBMarketingIncrementalStream):
         self._cursor_value = pendulum.parse(value[self.cursor_field]).date() if value.get(self.cursor_field) else None
         self._completed_slices = set(pendulum.parse(v).date() for v in value.get("slices", []))
         self._next_cursor_value = self._get_start_date()
+        if value.get("job_durations"):
+            self._job_durations.state = value["job_durations"]
 
     def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]):
         """Update stream state from latest record
@@ -235,7 +245,9 @@ class AdsInsights(FBMarketingIncrementalStream):
         if stream_state:
             self.state = stream_state
 
-        manager = InsightAsyncJobManager(api=self._api, jobs=self._generate_async_jobs(params=self.request_params()))
+        manager = InsightAsyncJobManager(
+            api=self._api, jobs=self._generate_async_jobs(params=self.request_params()), job_durations=self._job_durations
+        )
         for job in manager.completed_jobs():
             yield {"insight_job": job}
 
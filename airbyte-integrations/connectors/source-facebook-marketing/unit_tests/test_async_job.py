@@ -4,6 +4,7 @@
 
 import copy
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterator
 
 import pendulum
@@ -16,7 +17,7 @@ from facebook_business.adobjects.adsinsights import AdsInsights
 from facebook_business.adobjects.campaign import Campaign
 from facebook_business.api import FacebookAdsApiBatch, FacebookBadObjectError
 from source_facebook_marketing.api import MyFacebookAdsApi
-from source_facebook_marketing.streams.async_job import InsightAsyncJob, ParentAsyncJob, Status, update_in_batch
+from source_facebook_marketing.streams.async_job import InsightAsyncJob, ParentAsyncJob, PrefetchedResult, Status, update_in_batch
 
 
 @pytest.fixture(name="adreport")
@@ -361,6 +362,65 @@ class TestInsightAsyncJob:
             job.split_job()
 
 
+class TestPrefetchedResult:
+    def test_records_read_in_order(self):
+        """Records should be read in the order they were fetched even when the buffer is smaller than the result"""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            result = PrefetchedResult(lambda: iter(range(100)), executor=executor, buffer_size=3)
+
+            assert list(result) == list(range(100))
+
+    def test_fetch_error_raised_to_reader(self):
+        """Errors raised while fetching should be raised after the records fetched before them"""
+
+        def get_result():
+            yield 1
+            raise FacebookBadObjectError("Bad data to set object data")
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            records = []
+            with pytest.raises(FacebookBadObjectError):
+                for record in PrefetchedResult(get_result, executor=executor, buffer_size=3):
+                    records.append(record)
+
+        assert records == [1]
+
+    def test_cancel(self):
+        """Cancelled result should stop fetching even if nobody reads it"""
+        fetched = []
+
+        def get_result():
+            for record in range(100):
+                fetched.append(record)
+                yield record
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            result = PrefetchedResult(get_result, executor=executor, buffer_size=3)
+            while result._buffer.qsize() < 3:
+                time.sleep(0.01)
+            result.cancel()
+
+            result._future.result(timeout=5)
+            assert result._future.done()
+            assert len(fetched) <= 4, "the buffer should not be refilled once the result is cancelled"
+            with pytest.raises(RuntimeError):
+                list(result)
+
+    def test_job_get_result_prefetched(self, completed_job, adreport, api):
+        """Job result should be read from the prefetched result once"""
+        api.call().json.return_value = {"data": [{"some_data": 123}, {"some_data": 77}]}
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            completed_job.prefetch_result(executor=executor, buffer_size=1)
+            result = completed_job.get_result()
+
+            assert [row.export_all_data() for row in result] == [{"some_data": 123}, {"some_data": 77}]
+            adreport.get_result.assert_called_once()
+
+        completed_job.get_result()
+        assert adreport.get_result.call_count == 2, "next calls should not use the prefetched result"
+
+
 class TestParentAsyncJob:
     def test_start(self, parent_job, grouped_jobs):
         parent_job.start()
@@ -2,11 +2,15 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import pendulum
 import pytest
+from facebook_business.adobjects.adaccount import AdAccount
+from facebook_business.adobjects.adset import AdSet
+from facebook_business.adobjects.campaign import Campaign
 from facebook_business.api import FacebookAdsApiBatch
 from source_facebook_marketing.api import MyFacebookAdsApi
 from source_facebook_marketing.streams.async_job import InsightAsyncJob, ParentAsyncJob
-from source_facebook_marketing.streams.async_job_manager import InsightAsyncJobManager
+from source_facebook_marketing.streams.async_job_manager import InsightAsyncJobManager, JobDurationModel
 from source_facebook_marketing.streams.common import JobException
 
 
@@ -28,6 +32,107 @@ def update_job_mock_fixture(mocker):
     return mocker.patch("source_facebook_marketing.streams.async_job_manager.update_in_batch")
 
 
+@pytest.fixture(name="job_durations")
+def job_durations_fixture():
+    return JobDurationModel(account_id="unknown_account", breakdowns=["country"], action_breakdowns=["action_type"])
+
+
+def finished_job(mocker, edge_object, days=1, minutes=1, failed=False):
+    interval = pendulum.Period(pendulum.Date(2022, 1, 1), pendulum.Date(2022, 1, days))
+    return mocker.Mock(
+        spec=InsightAsyncJob,
+        edge_object=edge_object,
+        interval=interval,
+        elapsed_time=pendulum.duration(minutes=minutes),
+        job_timeout=InsightAsyncJob.job_timeout,
+        completed=True,
+        failed=failed,
+        attempt_number=1,
+    )
+
+
+class TestJobDurationModel:
+    def test_observe(self, mocker, job_durations):
+        """Expected duration should be learnt per day of interval and object type"""
+        interval = pendulum.Period(pendulum.Date(2022, 2, 1), pendulum.Date(2022, 2, 2))
+        assert job_durations.expected_duration("AdAccount", interval) is None
+
+        job_durations.observe(finished_job(mocker, AdAccount(1), days=5, minutes=10))
+        assert job_durations.expected_duration("AdAccount", interval) == pendulum.duration(minutes=4)
+        assert job_durations.expected_duration("Campaign", interval) is None
+
+        job_durations.observe(finished_job(mocker, AdAccount(1), days=5, minutes=20))
+        assert job_durations.expected_duration("AdAccount", interval) == pendulum.duration(minutes=4 * 0.7 + 8 * 0.3)
+
+    def test_observe_failed(self, mocker, job_durations):
+        """Failed job should count as one that ran into the timeout"""
+        job = finished_job(mocker, AdAccount(1), minutes=1, failed=True)
+
+        job_durations.observe(job)
+
+        assert job_durations.expected_duration("AdAccount", job.interval) == InsightAsyncJob.job_timeout
+
+    @pytest.mark.parametrize(
+        "durations, edge_object, splits",
+        [
+            ({}, AdAccount(1), 0),
+            ({AdAccount: 10}, AdAccount(1), 0),
+            ({AdAccount: 50}, AdAccount(1), 1),
+            ({AdAccount: 50, Campaign: 10}, AdAccount(1), 1),
+            ({AdAccount: 50, Campaign: 30}, AdAccount(1), 2),
+            ({Campaign: 30}, Campaign(1), 1),
+            ({AdSet: 30}, AdSet(1), 0),
+        ],
+    )
+    def test_splits_needed(self, mocker, job_durations, durations, edge_object, splits):
+        """Jobs should be split until they are expected to finish in time, but not further than to ad sets"""
+        for edge_class, minutes in durations.items():
+            job_durations.observe(finished_job(mocker, edge_class(1), minutes=minutes))
+        job = finished_job(mocker, edge_object)
+
+        assert job_durations.splits_needed(job) == splits
+
+    def test_decay(self, mocker, job_durations):
+        """Expected duration of the objects a job is split from should decay once per sync, so that they are tried unsplit again"""
+        job_durations.observe(finished_job(mocker, AdAccount(1), minutes=50))
+        job_durations.observe(finished_job(mocker, Campaign(1), minutes=30))
+        job = finished_job(mocker, AdAccount(1))
+
+        job_durations.decay(job, splits=1)
+        job_durations.decay(job, splits=1)
+
+        assert job_durations.expected_duration("AdAccount", job.interval) == pendulum.duration(minutes=45)
+        assert job_durations.expected_duration("Campaign", job.interval) == pendulum.duration(minutes=30)
+        syncs = 1
+        while job_durations.splits_needed(job):
+            state = job_durations.state
+            job_durations = JobDurationModel(account_id="unknown_account", breakdowns=["country"], action_breakdowns=["action_type"])
+            job_durations.state = state
+            job_durations.decay(job, splits=job_durations.splits_needed(job))
+            syncs += 1
+        assert syncs == 9
+
+    def test_state(self, mocker, job_durations):
+        """Model should be restored from state unless it was learnt for another account or breakdowns"""
+        assert job_durations.state == {}
+        job_durations.observe(finished_job(mocker, AdAccount(1), minutes=1))
+        state = job_durations.state
+        assert state == {
+            "account_id": "unknown_account",
+            "breakdowns": ["country"],
+            "action_breakdowns": ["action_type"],
+            "seconds_per_day": {"AdAccount": 60},
+        }
+
+        restored = JobDurationModel(account_id="unknown_account", breakdowns=["country"], action_breakdowns=["action_type"])
+        restored.state = state
+        assert restored.state == state
+
+        other = JobDurationModel(account_id="unknown_account", breakdowns=[], action_breakdowns=["action_type"])
+        other.state = state
+        assert other.state == {}
+
+
 class TestInsightAsyncManager:
     def test_jobs_empty(self, api):
         """Should work event without jobs"""
@@ -174,3 +279,130 @@ class TestInsightAsyncManager:
 
         with pytest.raises(JobException):
             next(manager.completed_jobs(), None)
+
+    def test_results_prefetched(self, api, mocker, time_mock):
+        """Manager should download results of completed jobs ahead of consumption"""
+        jobs = [mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True) for _ in range(3)]
+        manager = InsightAsyncJobManager(api=api, jobs=jobs)
+
+        completed_jobs = manager.completed_jobs()
+        assert next(completed_jobs) == jobs[0]
+        for job in jobs:
+            job.prefetch_result.assert_called_once()
+        assert list(completed_jobs) == jobs[1:]
+
+    @pytest.mark.parametrize("throttle, prefetched_count", [(0, 8), (35, 4), (69, 0), (100, 0)])
+    def test_results_prefetched_within_throttle(self, api, mocker, throttle, prefetched_count):
+        """Manager should download fewer results at the same time as throttle goes up, jobs should keep their order"""
+        api.api.ads_insights_throttle = MyFacebookAdsApi.Throttle(throttle, throttle)
+        jobs = [mocker.Mock(spec=InsightAsyncJob) for _ in range(10)]
+        manager = InsightAsyncJobManager(api=api, jobs=[])
+
+        prefetched_jobs = manager._prefetch_results(jobs, executor=mocker.Mock())
+
+        assert next(prefetched_jobs) == jobs[0]
+        assert [job.prefetch_result.called for job in jobs] == [True] * prefetched_count + [False] * (10 - prefetched_count)
+        assert list(prefetched_jobs) == jobs[1:]
+
+    def test_unconsumed_results_cancelled(self, api, mocker, time_mock):
+        """Manager should stop downloading results of jobs that were not yielded"""
+        jobs = [mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True) for _ in range(3)]
+        manager = InsightAsyncJobManager(api=api, jobs=jobs)
+
+        completed_jobs = manager.completed_jobs()
+        assert next(completed_jobs) == jobs[0]
+        completed_jobs.close()
+
+        jobs[0].prefetch_result.return_value.cancel.assert_not_called()
+        jobs[1].prefetch_result.return_value.cancel.assert_called_once()
+        jobs[2].prefetch_result.return_value.cancel.assert_called_once()
+
+    @pytest.mark.parametrize("started", [True, False])
+    def test_yielded_result_cancelled_once_consumer_moves_past(self, api, mocker, time_mock, started):
+        """Manager should stop downloading the result of a yielded job once the next job is requested or if it was never read"""
+        jobs = [mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True) for _ in range(3)]
+        for job in jobs:
+            job.prefetch_result.return_value.started = started
+        manager = InsightAsyncJobManager(api=api, jobs=jobs)
+
+        completed_jobs = manager.completed_jobs()
+        assert next(completed_jobs) == jobs[0]
+        jobs[0].prefetch_result.return_value.cancel.assert_not_called()
+        assert next(completed_jobs) == jobs[1]
+        jobs[0].prefetch_result.return_value.cancel.assert_called_once()
+        completed_jobs.close()
+
+        assert jobs[1].prefetch_result.return_value.cancel.called != started
+        jobs[2].prefetch_result.return_value.cancel.assert_called_once()
+
+    def test_job_split_in_advance(self, api, mocker, time_mock, update_job_mock, job_durations):
+        """Manager should split jobs expected to run too long before they start"""
+        job_durations.observe(finished_job(mocker, AdAccount(1), minutes=60))
+        job = finished_job(mocker, AdAccount(1))
+        job.__str__ = mocker.Mock(return_value="InsightAsyncJob")
+        sub_jobs = [finished_job(mocker, Campaign(1)), finished_job(mocker, Campaign(2))]
+        for sub_job in sub_jobs:
+            sub_job.elapsed_time = None
+            sub_job.start.side_effect = lambda sub_job=sub_job: setattr(sub_job, "elapsed_time", pendulum.duration(minutes=1))
+        job.split_job.return_value = sub_jobs
+        manager = InsightAsyncJobManager(api=api, jobs=[job], job_durations=job_durations)
+
+        completed_jobs = list(manager.completed_jobs())
+
+        job.start.assert_not_called()
+        assert len(completed_jobs) == 1
+        assert isinstance(completed_jobs[0], ParentAsyncJob)
+        assert completed_jobs[0]._jobs == sub_jobs
+        for sub_job in sub_jobs:
+            sub_job.start.assert_called_once()
+        assert job_durations.expected_duration("Campaign", job.interval) == pendulum.duration(minutes=1)
+
+    def test_job_durations_observed(self, api, mocker, time_mock, update_job_mock, job_durations):
+        """Manager should learn durations of completed and failed jobs"""
+        jobs = [finished_job(mocker, AdAccount(1), minutes=10), finished_job(mocker, Campaign(1), minutes=1, failed=True)]
+        jobs[1].attempt_number = InsightAsyncJobManager.MAX_NUMBER_OF_ATTEMPTS
+        manager = InsightAsyncJobManager(api=api, jobs=jobs, job_durations=job_durations)
+
+        with pytest.raises(JobException):
+            list(manager.completed_jobs())
+
+        assert job_durations.expected_duration("AdAccount", jobs[0].interval) == pendulum.duration(minutes=10)
+        assert job_durations.expected_duration("Campaign", jobs[1].interval) == InsightAsyncJob.job_timeout
+
+    def test_all_jobs_of_a_sync_split_in_advance(self, api, mocker, time_mock, update_job_mock, job_durations):
+        """Manager should split every job expected to run too long, however many of them start in the sync"""
+        job_durations.observe(finished_job(mocker, AdAccount(1), minutes=60))
+        jobs = [finished_job(mocker, AdAccount(1)) for _ in range(30)]
+        for job in jobs:
+            job.split_job.return_value = [finished_job(mocker, Campaign(1))]
+        manager = InsightAsyncJobManager(api=api, jobs=jobs, job_durations=job_durations)
+
+        completed_jobs = list(manager.completed_jobs())
+
+        assert len(completed_jobs) == len(jobs)
+        assert all(isinstance(job, ParentAsyncJob) for job in completed_jobs)
+        for job in jobs:
+            job.start.assert_not_called()
+        assert job_durations.expected_duration("AdAccount", jobs[0].interval) == pendulum.duration(minutes=54)
+
+    def test_nested_job_durations_observed_once(self, api, mocker, time_mock, update_job_mock, job_durations):
+        """Manager should observe nested jobs once their parent completed, not on every status check while it runs"""
+        sub_jobs = [finished_job(mocker, Campaign(1)), finished_job(mocker, Campaign(2))]
+        sub_jobs[1].completed = False
+        status_checks = []
+
+        def update_jobs(api, jobs):
+            status_checks.append(jobs)
+            if len(status_checks) == 3:
+                sub_jobs[1].completed = True
+
+        update_job_mock.side_effect = update_jobs
+        parent_job = ParentAsyncJob(api=api.api, jobs=sub_jobs, interval=sub_jobs[0].interval)
+        observe = mocker.spy(job_durations, "observe")
+        manager = InsightAsyncJobManager(api=api, jobs=[parent_job], job_durations=job_durations)
+
+        completed_jobs = list(manager.completed_jobs())
+
+        assert completed_jobs == [parent_job]
+        assert len(status_checks) == 3
+        assert [call.args[0] for call in observe.call_args_list] == sub_jobs
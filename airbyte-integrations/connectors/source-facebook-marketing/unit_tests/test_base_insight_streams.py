@@ -151,6 +151,25 @@ class TestBaseInsightsStream:
 
         assert actual_state == state
 
+    def test_state_job_durations(self, api, async_manager_mock):
+        """Job durations should be saved in state, restored from it and given to the job manager"""
+        api.account_id = "unknown_account"
+        job_durations = {
+            "account_id": "unknown_account",
+            "breakdowns": [],
+            "action_breakdowns": AdsInsights.action_breakdowns,
+            "seconds_per_day": {"AdAccount": 600.0},
+        }
+        state = {AdsInsights.cursor_field: "2010-10-03", "slices": [], "time_increment": 1, "job_durations": job_durations}
+        stream = AdsInsights(api=api, start_date=datetime(2010, 1, 1), end_date=datetime(2011, 1, 1), insights_lookback_window=28)
+        async_manager_mock.completed_jobs.return_value = []
+
+        list(stream.stream_slices(stream_state=state, sync_mode=SyncMode.incremental))
+
+        assert stream.state == state
+        args, kwargs = async_manager_mock.call_args
+        assert kwargs["job_durations"].state == job_durations
+
     def test_stream_slices_no_state(self, api, async_manager_mock, start_date):
         """Stream will use start_date when there is not state"""
         end_date = start_date + duration(weeks=2)
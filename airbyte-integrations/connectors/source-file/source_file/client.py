@@ -4,9 +4,11 @@
 
 
 import json
+import shutil
 import tempfile
 import traceback
 import urllib
+from itertools import islice
 from os import environ
 from typing import Iterable
 from urllib.parse import urlparse
@@ -17,6 +19,7 @@ import botocore
 import google
 import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 import smart_open
 from airbyte_cdk.entrypoint import logger
 from airbyte_cdk.models import AirbyteStream, SyncMode
@@ -236,6 +239,10 @@ class Client:
     """Class that manages reading and parsing data from streams"""
 
     CSV_CHUNK_SIZE = 10_000
+    # number of rows or records the schema is inferred from on discover, rather than reading the whole file
+    DISCOVER_SAMPLE_SIZE = 10_000
+    # size of the chunks binary sources are copied to a temporary file by
+    CACHE_CHUNK_SIZE = 1024**2
     reader_class = URLFile
     binary_formats = {"excel", "excel_binary", "feather", "parquet", "orc", "pickle"}
 
@@ -258,7 +265,7 @@ class Client:
         # Use Genson Library to take JSON objects and generate schemas that describe them,
         builder = SchemaBuilder()
         if self._reader_format == "jsonl":
-            for o in self.read():
+            for o in islice(self.load_nested_json(fp), self.DISCOVER_SAMPLE_SIZE):
                 builder.add_object(o)
         else:
             builder.add_object(json.load(fp))
@@ -271,28 +278,28 @@ class Client:
         result["$schema"] = "http://json-schema.org/draft-07/schema#"
         return result
 
-    def load_nested_json(self, fp) -> list:
+    def load_nested_json(self, fp) -> Iterable[dict]:
         if self._reader_format == "jsonl":
-            result = []
-            line = fp.readline()
-            while line:
-                result.append(json.loads(line))
-                line = fp.readline()
+            # records are parsed one line at a time so that the file is never loaded in memory as a whole
+            for line in fp:
+                if line.strip():
+                    yield json.loads(line)
         else:
             result = json.load(fp)
             if not isinstance(result, list):
                 result = [result]
-        return result
+            yield from result
 
     def load_yaml(self, fp):
         if self._reader_format == "yaml":
             return pd.DataFrame(safe_load(fp))
 
-    def load_dataframes(self, fp, skip_data=False) -> Iterable:
+    def load_dataframes(self, fp, skip_data=False, sample=False) -> Iterable:
         """load and return the appropriate pandas dataframe.
 
         :param fp: file-like object to read from
         :param skip_data: limit reading data
+        :param sample: only read the first DISCOVER_SAMPLE_SIZE rows of csv files, or the schema of parquet files
         :return: a list of dataframe loaded from files described in the configuration
         """
         readers = {
@@ -325,7 +332,14 @@ class Client:
                 if skip_data:
                     reader_options["nrows"] = 0
                     reader_options["index_col"] = 0
+                elif sample:
+                    reader_options["nrows"] = min(reader_options.get("nrows") or self.DISCOVER_SAMPLE_SIZE, self.DISCOVER_SAMPLE_SIZE)
                 yield from reader(fp, **reader_options)
+            elif self._reader_format == "parquet" and sample:
+                # the dtypes of the columns are known from the schema stored in the file's metadata
+                table = pq.read_schema(fp).empty_table()
+                columns = reader_options.get("columns")
+                yield (table.select(columns) if columns else table).to_pandas()
             elif self._reader_options == "excel_binary":
                 reader_options["engine"] = "pyxlsb"
                 yield from reader(fp, **reader_options)
@@ -386,9 +400,9 @@ class Client:
                 raise ConnectionResetError
 
     def _cache_stream(self, fp):
-        """cache stream to file"""
+        """cache stream to file, chunk by chunk so that it is never loaded in memory as a whole"""
         fp_tmp = tempfile.TemporaryFile(mode="w+b")
-        fp_tmp.write(fp.read())
+        shutil.copyfileobj(fp, fp_tmp, self.CACHE_CHUNK_SIZE)
         fp_tmp.seek(0)
         fp.close()
         return fp_tmp
@@ -399,7 +413,7 @@ class Client:
         else:
             if self.binary_source:
                 fp = self._cache_stream(fp)
-            df_list = self.load_dataframes(fp, skip_data=False)
+            df_list = self.load_dataframes(fp, skip_data=False, sample=True)
         fields = {}
         for df in df_list:
             for col in df.columns:
@@ -3,10 +3,11 @@
 #
 
 
+import io
 from unittest.mock import patch
 
 import pytest
-from pandas import read_csv, read_excel
+from pandas import DataFrame, read_csv, read_excel
 from source_file.client import Client, ConfigurationError, URLFile
 
 
@@ -103,6 +104,56 @@ def test_cache_stream(client, absolute_path, test_files):
         assert client._cache_stream(file)
 
 
+def test_cache_stream_by_chunks(client):
+    client.CACHE_CHUNK_SIZE = 4
+    fp = io.BytesIO(b"0123456789")
+    with patch.object(fp, "read", wraps=fp.read) as read:
+        assert client._cache_stream(fp).read() == b"0123456789"
+    assert all(call.args == (4,) for call in read.call_args_list)
+
+
+def test_load_nested_jsonl_line_by_line(config):
+    config["format"] = "jsonl"
+    client = Client(**config)
+    records = client.load_nested_json(io.StringIO('{"id": 1}\n\n{"id": 2}\nnot json\n'))
+    # records are parsed as they are read, so the invalid last line isn't reached yet
+    assert next(records) == {"id": 1}
+    assert next(records) == {"id": 2}
+    with pytest.raises(ValueError):
+        next(records)
+
+
+def test_jsonl_schema_is_inferred_from_a_sample(config):
+    config["format"] = "jsonl"
+    client = Client(**config)
+    client.DISCOVER_SAMPLE_SIZE = 2
+    schema = client.load_nested_json_schema(io.StringIO('{"id": 1}\n{"id": 2}\n{"id": 3, "name": "a"}\n'))
+    assert set(schema["properties"]) == {"id"}
+
+
+def test_csv_dtypes_are_inferred_from_a_sample(config):
+    config["format"] = "csv"
+    client = Client(**config)
+    client.DISCOVER_SAMPLE_SIZE = 2
+    properties = client._stream_properties(io.StringIO("id,name\n1,a\n2,b\nthree,c\n"))
+    assert properties == {"id": {"type": ["number", "null"]}, "name": {"type": ["string", "null"]}}
+
+
+def test_parquet_dtypes_are_read_from_the_schema(config, tmp_path):
+    config["format"] = "parquet"
+    client = Client(**config)
+    f = tmp_path / "test.parquet"
+    DataFrame({"id": [1, 2], "name": ["a", "b"], "flag": [True, False]}).to_parquet(f)
+    with open(f, mode="rb") as file, patch("source_file.client.pd.read_parquet") as read_parquet:
+        properties = client._stream_properties(file)
+    read_parquet.assert_not_called()
+    assert properties == {
+        "id": {"type": ["number", "null"]},
+        "name": {"type": ["string", "null"]},
+        "flag": {"type": ["boolean", "null"]},
+    }
+
+
 def test_open_aws_url():
     url = "s3://my_bucket/my_key"
     provider = {"storage": "S3"}
@@ -0,0 +1,79 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures the read throughput of the CSV and Parquet parsers on generated files of several gigabytes.
+This is not collected by pytest, run it from the connector folder:
+
+    python -m integration_tests.benchmark_parsers --size 2 --columns 20
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Mapping
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from source_s3.source_files_abstract.file_info import FileInfo
+from source_s3.source_files_abstract.formats.abstract_file_parser import AbstractFileParser
+from source_s3.source_files_abstract.formats.csv_parser import CsvParser
+from source_s3.source_files_abstract.formats.parquet_parser import ParquetParser
+from unit_tests.test_csv_parser import generate_big_file
+
+CSV_FORMAT = {
+    "filetype": "csv",
+    "delimiter": ",",
+    "quote_char": '"',
+    "encoding": "utf8",
+    "double_quote": True,
+    "newlines_in_values": False,
+    "block_size": 10000,
+}
+
+
+def benchmark(parser: AbstractFileParser, filepath: str) -> Mapping[str, Any]:
+    file_info = FileInfo(key=filepath, size=os.stat(filepath).st_size, last_modified=datetime.now())
+    extra_columns = {"_ab_source_file_last_modified": file_info.last_modified.isoformat(), "_ab_source_file_url": filepath}
+    started_at = time.perf_counter()
+    records = 0
+    with open(filepath, "rb") as f:
+        for _ in parser.stream_records(f, file_info, extra_columns):
+            records += 1
+    elapsed = time.perf_counter() - started_at
+    return {"records": records, "seconds": round(elapsed, 2), "records_per_second": round(records / elapsed)}
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--size", type=float, default=2.0, help="size of the generated CSV file in gigabytes")
+    arg_parser.add_argument("--columns", type=int, default=20, help="number of columns of the generated files")
+    arg_parser.add_argument("--folder", default=tempfile.gettempdir(), help="folder where the files are generated")
+    args = arg_parser.parse_args()
+
+    csv_filepath = os.path.join(args.folder, "benchmark_source_s3.csv")
+    parquet_filepath = os.path.join(args.folder, "benchmark_source_s3.parquet")
+    try:
+        schema, file_size = generate_big_file(csv_filepath, args.size, args.columns)
+        print(f"generated {csv_filepath}: {file_size:.2f} GB")
+        writer = None
+        for batch in pa_csv.open_csv(csv_filepath):
+            writer = writer or pq.ParquetWriter(parquet_filepath, batch.schema)
+            writer.write_table(pa.Table.from_batches([batch]))
+        writer.close()
+        print(f"generated {parquet_filepath}: {os.stat(parquet_filepath).st_size / 1024 ** 3:.2f} GB")
+
+        print("csv:", benchmark(CsvParser(format=CSV_FORMAT, master_schema=schema), csv_filepath))
+        print("parquet:", benchmark(ParquetParser(format={"filetype": "parquet"}, master_schema=schema), parquet_filepath))
+    finally:
+        for filepath in (csv_filepath, parquet_filepath):
+            if os.path.exists(filepath):
+                os.remove(filepath)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,39 +3,68 @@
 #
 
 
+import io
+import json
+import os
+import tempfile
+import threading
 from contextlib import contextmanager
-from typing import Any, BinaryIO, Iterator, Mapping, TextIO, Union
+from typing import Any, BinaryIO, Dict, Iterator, Mapping, Optional, TextIO, Union
 
 import smart_open
 from boto3 import session as boto3session
+from boto3.s3.transfer import TransferConfig
 from botocore import UNSIGNED
-from botocore.client import Config as ClientConfig
+from botocore.client import BaseClient
 from botocore.config import Config
-from source_s3.s3_utils import make_s3_client, make_s3_resource
+from smart_open import compression as so_compression
+from source_s3.s3_utils import make_s3_client
 
 from .source_files_abstract.storagefile import StorageFile
+from .source_files_abstract.stream import FileStream
+
+# Number of byte ranges of an object downloaded at the same time by prefetch()
+PREFETCH_CONCURRENCY = 4
+# Number of connections kept open by the client shared by the files of a provider: enough for the files prefetched at the same time
+# and the one streamed by open()
+MAX_POOL_CONNECTIONS = FileStream.max_prefetched_files * PREFETCH_CONCURRENCY + 1
+PREFETCH_TRANSFER_CONFIG = TransferConfig(max_concurrency=PREFETCH_CONCURRENCY)
+# Prefetched objects up to this size are held in memory, bigger ones are spilled to a temporary file
+MAX_IN_MEMORY_SIZE = 16 * 1024**2  # in bytes
 
 
 class S3File(StorageFile):
+    _clients: Dict[str, BaseClient] = {}
+    _clients_lock = threading.Lock()
+
     def __init__(self, *args: Any, **kwargs: Any):
         super().__init__(*args, **kwargs)
-        self._setup_boto_session()
+        self._buffer: Optional[BinaryIO] = None
 
-    def _setup_boto_session(self) -> None:
+    @classmethod
+    def get_client(cls, provider: Mapping[str, Any]) -> BaseClient:
         """
-        Making a new Session at file level rather than stream level as boto3 sessions are NOT thread-safe.
-        Currently grabbing last_modified across multiple files asynchronously and may implement more multi-threading in future.
-        See https://boto3.amazonaws.com/v1/documentation/api/latest/guide/resources.html (anchor link broken, scroll to bottom)
+        boto3 sessions are NOT thread-safe but their clients are, so the files of a provider share a single client
+        and its pool of connections rather than making a new session and client per file.
+        See https://boto3.amazonaws.com/v1/documentation/api/latest/guide/clients.html#multithreading-or-multiprocessing-with-clients
+
+        :param provider: provider specific mapping as described in spec.json
+        :return: boto3 S3 client
         """
-        if self.use_aws_account(self._provider):
-            self._boto_session = boto3session.Session(
-                aws_access_key_id=self._provider.get("aws_access_key_id"),
-                aws_secret_access_key=self._provider.get("aws_secret_access_key"),
-            )
-            self._boto_s3_resource = make_s3_resource(self._provider, session=self._boto_session)
-        else:
-            self._boto_session = boto3session.Session()
-            self._boto_s3_resource = make_s3_resource(self._provider, config=Config(signature_version=UNSIGNED), session=self._boto_session)
+        key = json.dumps(provider, sort_keys=True, default=str)
+        with cls._clients_lock:
+            if key not in cls._clients:
+                if cls.use_aws_account(provider):
+                    session = boto3session.Session(
+                        aws_access_key_id=provider.get("aws_access_key_id"),
+                        aws_secret_access_key=provider.get("aws_secret_access_key"),
+                    )
+                    config = Config(max_pool_connections=MAX_POOL_CONNECTIONS)
+                else:
+                    session = boto3session.Session()
+                    config = Config(signature_version=UNSIGNED, max_pool_connections=MAX_POOL_CONNECTIONS)
+                cls._clients[key] = make_s3_client(provider, session=session, config=config)
+            return cls._clients[key]
 
     @staticmethod
     def use_aws_account(provider: Mapping[str, str]) -> bool:
@@ -43,33 +72,54 @@ class S3File(StorageFile):
         aws_secret_access_key = provider.get("aws_secret_access_key")
         return True if (aws_access_key_id is not None and aws_secret_access_key is not None) else False
 
+    def prefetch(self) -> None:
+        """
+        Downloads the whole object ahead of open(). boto3 fetches objects above its multipart threshold as PREFETCH_CONCURRENCY
+        parallel byte ranges. Failures are left to open(), which streams the object instead and reports unreachable keys.
+        """
+        buffer = io.BytesIO() if (self.file_size or 0) <= MAX_IN_MEMORY_SIZE else tempfile.TemporaryFile()
+        try:
+            self.get_client(self._provider).download_fileobj(
+                self._provider.get("bucket"), self.url, buffer, Config=PREFETCH_TRANSFER_CONFIG
+            )
+        except Exception as e:
+            self.logger.debug(f"failed to prefetch {self.file_info}: {e}")
+            buffer.close()
+            return
+        buffer.seek(0)
+        self._buffer = buffer
+
     @contextmanager
     def open(self, binary: bool) -> Iterator[Union[TextIO, BinaryIO]]:
         """
         Utilising smart_open to handle this (https://github.com/RaRe-Technologies/smart_open)
+        The object is read from the buffer filled by prefetch() if any, else it is streamed from S3.
 
         :param binary: whether or not to open file as binary
         :return: file-like object
         """
         mode = "rb" if binary else "r"
         bucket = self._provider.get("bucket")
-        if self.use_aws_account(self._provider):
-            params = {"client": make_s3_client(self._provider, session=self._boto_session)}
+        if self._buffer is not None:
+            buffer, self._buffer = self._buffer, None
+            # the buffer has no name to infer the compression from, so it is inferred from the key here
+            extension = os.path.splitext(self.url)[1]
+            compression = extension if extension in so_compression.get_supported_extensions() else so_compression.NO_COMPRESSION
+            result = smart_open.open(buffer, mode=mode, compression=compression)
         else:
-            config = ClientConfig(signature_version=UNSIGNED)
-            params = {"client": make_s3_client(self._provider, config=config)}
-        self.logger.debug(f"try to open {self.file_info}")
-        # There are rare cases when some keys become unreachable during sync
-        # and we don't know about it, because catalog has been initially formed only once at the beginning
-        # This is happen for example if a file was deleted/moved (or anything else) while we proceed with another file
-        try:
-            result = smart_open.open(f"s3://{bucket}/{self.url}", transport_params=params, mode=mode)
-        except OSError as e:
-            self.logger.warn(
-                f"We don't have access to {self.url}. "
-                f"Check whether key {self.url} exists in `{bucket}` bucket and/or has proper ACL permissions"
-            )
-            raise e
+            params = {"client": self.get_client(self._provider)}
+            self.logger.debug(f"try to open {self.file_info}")
+            # There are rare cases when some keys become unreachable during sync
+            # and we don't know about it, because catalog has been initially formed only once at the beginning
+            # This is happen for example if a file was deleted/moved (or anything else) while we proceed with another file
+            try:
+                result = smart_open.open(f"s3://{bucket}/{self.url}", transport_params=params, mode=mode)
+            except OSError as e:
+                self.logger.warn(
+                    f"We don't have access to {self.url}. "
+                    f"Check whether key {self.url} exists in `{bucket}` bucket and/or has proper ACL permissions"
+                )
+                raise e
         # see https://docs.python.org/3/library/contextlib.html#contextlib.contextmanager for why we do this
         try:
             yield result
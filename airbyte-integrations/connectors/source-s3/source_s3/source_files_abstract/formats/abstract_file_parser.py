@@ -3,7 +3,7 @@
 #
 
 from abc import ABC, abstractmethod
-from typing import Any, BinaryIO, Iterator, Mapping, TextIO, Union
+from typing import Any, BinaryIO, Dict, Iterator, List, Mapping, Optional, TextIO, Union
 
 import pyarrow as pa
 from airbyte_cdk.logger import AirbyteLogger
@@ -56,16 +56,40 @@ class AbstractFileParser(ABC):
         """
 
     @abstractmethod
-    def stream_records(self, file: Union[TextIO, BinaryIO], file_info: FileInfo) -> Iterator[Mapping[str, Any]]:
+    def stream_records(
+        self, file: Union[TextIO, BinaryIO], file_info: FileInfo, extra_columns: Optional[Mapping[str, Any]] = None
+    ) -> Iterator[Mapping[str, Any]]:
         """
         Override this with format-specifc logic to stream each data row from the file as a mapping of {columns:values}
         Note: avoid loading the whole file into memory to avoid OOM breakages
 
         :param file: file-like object (opened via StorageFile)
         :param file_info: file metadata
+        :param extra_columns: mapping of {columns:values} added to every record of the file, e.g. the file's metadata, defaults to None
         :yield: data record as a mapping of {columns:values}
         """
 
+    @staticmethod
+    def columns_to_records(
+        names: List[str], columns: List[Union[pa.Array, pa.ChunkedArray]], num_rows: int, extra_columns: Optional[Mapping[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Zips columns of values into records at the Arrow level rather than row by row in Python.
+        extra_columns are appended as constant columns so that they don't need to be set on each record afterwards.
+
+        :param names: column names
+        :param columns: one array of values per column
+        :param num_rows: number of values of each column
+        :param extra_columns: mapping of {columns:values} added to every record, defaults to None
+        :return: list of records as mappings of {columns:values}
+        """
+        if extra_columns:
+            names = list(names) + list(extra_columns.keys())
+            columns = list(columns) + [pa.repeat(pa.scalar(value), num_rows) for value in extra_columns.values()]
+        if not columns:
+            return []
+        return pa.Table.from_arrays(columns, names=names).to_pylist()  # type: ignore[no-any-return]
+
     @classmethod
     def json_type_to_pyarrow_type(cls, typ: str, reverse: bool = False, logger: AirbyteLogger = AirbyteLogger()) -> str:
         """
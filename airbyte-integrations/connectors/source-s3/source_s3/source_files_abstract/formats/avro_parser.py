@@ -2,7 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Any, BinaryIO, Iterator, Mapping, TextIO, Union
+from typing import Any, BinaryIO, Iterator, Mapping, Optional, TextIO, Union
 
 import fastavro
 from fastavro import reader
@@ -82,12 +82,17 @@ class AvroParser(AbstractFileParser):
         schema_dict = self._parse_data_type(data_type_mapping, avro_schema)
         return schema_dict
 
-    def stream_records(self, file: Union[TextIO, BinaryIO], file_info: FileInfo) -> Iterator[Mapping[str, Any]]:
+    def stream_records(
+        self, file: Union[TextIO, BinaryIO], file_info: FileInfo, extra_columns: Optional[Mapping[str, Any]] = None
+    ) -> Iterator[Mapping[str, Any]]:
         """Stream the data using a generator
         :param file: file-like object (opened via StorageFile)
         :param file_info: file metadata
+        :param extra_columns: mapping of {columns:values} added to every record, defaults to None
         :yield: data record as a mapping of {columns:values}
         """
         avro_reader = reader(file)
         for record in avro_reader:
+            if extra_columns:
+                record.update(extra_columns)
             yield record
@@ -27,9 +27,9 @@ TMP_FOLDER = tempfile.mkdtemp()
 
 def wrap_exception(exceptions: Tuple[type, ...]):
     def wrapper(fn: callable):
-        def inner(self, file: Union[TextIO, BinaryIO], file_info: FileInfo):
+        def inner(self, file: Union[TextIO, BinaryIO], file_info: FileInfo, *args: Any, **kwargs: Any):
             try:
-                return fn(self, file, file_info)
+                return fn(self, file, file_info, *args, **kwargs)
             except exceptions as e:
                 raise S3Exception(file_info, str(e), str(e), exception=e)
 
@@ -215,10 +215,12 @@ class CsvParser(AbstractFileParser):
         return {field_name.strip(): pyarrow.string() for field_name in field_names}
 
     @wrap_exception((ValueError,))
-    def stream_records(self, file: Union[TextIO, BinaryIO], file_info: FileInfo) -> Iterator[Mapping[str, Any]]:
+    def stream_records(
+        self, file: Union[TextIO, BinaryIO], file_info: FileInfo, extra_columns: Optional[Mapping[str, Any]] = None
+    ) -> Iterator[Mapping[str, Any]]:
         """
         https://arrow.apache.org/docs/python/generated/pyarrow.csv.open_csv.html
-        PyArrow returns lists of values for each column so we zip() these up into records which we then yield
+        PyArrow converts values to the types of the master schema per batch, and each batch of columns is zipped into records
         """
         streaming_reader = pa_csv.open_csv(
             file,
@@ -226,19 +228,5 @@ class CsvParser(AbstractFileParser):
             pa.csv.ParseOptions(**self._parse_options()),
             pa.csv.ConvertOptions(**self._convert_options(self._master_schema)),
         )
-        still_reading = True
-        while still_reading:
-            try:
-                batch = streaming_reader.read_next_batch()
-            except StopIteration:
-                still_reading = False
-            else:
-                batch_dict = batch.to_pydict()
-                batch_columns = [col_info.name for col_info in batch.schema]
-                # this gives us a list of lists where each nested list holds ordered values for a single column
-                # e.g. [ [1,2,3], ["a", "b", "c"], [True, True, False] ]
-                columnwise_record_values = [batch_dict[column] for column in batch_columns]
-                # we zip this to get row-by-row, e.g. [ [1, "a", True], [2, "b", True], [3, "c", False] ]
-                for record_values in zip(*columnwise_record_values):
-                    # create our record of {col: value, col: value} by dict comprehension, iterating through all cols in batch_columns
-                    yield {batch_columns[i]: record_values[i] for i in range(len(batch_columns))}
+        for batch in streaming_reader:
+            yield from self.columns_to_records(batch.schema.names, batch.columns, batch.num_rows, extra_columns)
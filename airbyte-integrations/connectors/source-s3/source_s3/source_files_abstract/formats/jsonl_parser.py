@@ -3,7 +3,7 @@
 #
 
 import logging
-from typing import Any, BinaryIO, Iterator, Mapping, TextIO, Union
+from typing import Any, BinaryIO, Iterator, Mapping, Optional, TextIO, Union
 
 import pyarrow as pa
 from pyarrow import ArrowNotImplementedError
@@ -103,10 +103,12 @@ class JsonlParser(AbstractFileParser):
         schema_dict = {field.name: field_type_to_str(field.type) for field in table.schema}
         return self.json_schema_to_pyarrow_schema(schema_dict, reverse=True)
 
-    def stream_records(self, file: Union[TextIO, BinaryIO], file_info: FileInfo) -> Iterator[Mapping[str, Any]]:
+    def stream_records(
+        self, file: Union[TextIO, BinaryIO], file_info: FileInfo, extra_columns: Optional[Mapping[str, Any]] = None
+    ) -> Iterator[Mapping[str, Any]]:
         """
         https://arrow.apache.org/docs/python/generated/pyarrow.json.read_json.html
 
         """
         table = self._read_table(file, self._master_schema)
-        yield from table.to_pylist()
+        yield from self.columns_to_records(table.column_names, table.columns, table.num_rows, extra_columns)
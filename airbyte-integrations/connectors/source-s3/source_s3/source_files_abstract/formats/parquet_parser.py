@@ -2,8 +2,10 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Any, BinaryIO, Iterator, List, Mapping, TextIO, Tuple, Union
+from typing import Any, BinaryIO, Iterator, List, Mapping, Optional, TextIO, Tuple, Union
 
+import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 from airbyte_cdk.models import FailureType
 from pyarrow.parquet import ParquetFile
@@ -103,20 +105,51 @@ class ParquetParser(AbstractFileParser):
             raise S3Exception(file_info, "empty Parquet file", "The .parquet file is empty!", FailureType.config_error)
         return schema_dict
 
-    def stream_records(self, file: Union[TextIO, BinaryIO], file_info: FileInfo) -> Iterator[Mapping[str, Any]]:
+    @staticmethod
+    def convert_column_data(column: pa.Array) -> pa.Array:
+        """Converts not JSON values of a column to JSON ones at once, with the same result as convert_field_data"""
+        if pa.types.is_date(column.type):
+            return column.cast(pa.string())
+        if pa.types.is_time(column.type):
+            # isoformat() only prints the fraction of seconds when there is one
+            column = column.cast(pa.time64("us"), safe=False).cast(pa.string())
+            return pc.replace_substring(column, ".000000", "")
+        if pa.types.is_timestamp(column.type):
+            try:
+                return ParquetParser.convert_timestamp_column_data(column)
+            except pa.ArrowInvalid:
+                # Arrow can only cast the timezones of its timezone database, not fixed offsets like "+05:30"
+                return pa.array([ParquetParser.convert_field_data("timestamp", value) for value in column.to_pylist()], pa.string())
+        return column
+
+    @staticmethod
+    def convert_timestamp_column_data(column: pa.Array) -> pa.Array:
+        """
+        Casts print e.g. "2022-01-01 10:00:00.000000-0500" instead of "2022-01-01T10:00:00-05:00". Like isoformat(), the fraction of
+        seconds is printed in microseconds, or in nanoseconds for the nanosecond timestamps having some, and not at all if there is none
+        """
+        unit = "ns" if column.type.unit == "ns" else "us"
+        column = column.cast(pa.timestamp(unit, column.type.tz), safe=False).cast(pa.string())
+        column = pc.replace_substring(column, " ", "T", max_replacements=1)
+        column = pc.replace_substring_regex(column, r"\.0+(\D|$)", r"\1")
+        column = pc.replace_substring_regex(column, r"(\.\d{6})000(\D|$)", r"\1\2")
+        column = pc.replace_substring(column, "Z", "+00:00")
+        return pc.replace_substring_regex(column, r"([+-]\d\d)(\d\d)$", r"\1:\2")
+
+    def stream_records(
+        self, file: Union[TextIO, BinaryIO], file_info: FileInfo, extra_columns: Optional[Mapping[str, Any]] = None
+    ) -> Iterator[Mapping[str, Any]]:
         """
         https://arrow.apache.org/docs/python/generated/pyarrow.parquet.ParquetFile.html
-        PyArrow reads streaming batches from a Parquet file
+        PyArrow reads streaming batches from a Parquet file, their values are converted to JSON ones per column
         """
 
         reader = self._init_reader(file)
         self.logger.info(f"found {reader.num_row_groups} row groups")
-        # parsing logical_types with respect to master_schema column names.
-        logical_types = {
-            field.name: self.parse_field_type(field.logical_type.type.lower(), field.physical_type)[1]
-            for field in reader.schema
-            if field.name in self._master_schema
-        }
+        # checks the types of the columns of the master_schema are supported
+        for field in reader.schema:
+            if field.name in self._master_schema:
+                self.parse_field_type(field.logical_type.type.lower(), field.physical_type)
         if not reader.schema:
             # pyarrow can parse empty parquet files but a connector can't generate dynamic schema
             raise S3Exception(file_info, "empty Parquet file", "The .parquet file is empty!", FailureType.config_error)
@@ -128,18 +161,10 @@ class ParquetParser(AbstractFileParser):
         for num_row_group in range(reader.num_row_groups):
             args["row_groups"] = [num_row_group]
             for batch in reader.iter_batches(**args):
-                # this gives us a dist of lists where each nested list holds ordered values for a single column
-                # {'number': [1.0, 2.0, 3.0], 'name': ['foo', None, 'bar'], 'flag': [True, False, True], 'delta': [-1.0, 2.5, 0.1]}
-                batch_dict = batch.to_pydict()
                 # sometimes the batch file has more columns than master_schema declares, like:
                 # master schema: ['number', 'name', 'flag', 'delta'],
                 # batch_file_schema: ['number', 'name', 'flag', 'delta', 'EXTRA_COL_NAME'].
-                # we need to check wether batch_file_schema == master_schema and reject extra columns, otherwise "KeyError" raises.
-                batch_columns = [column for column in batch_dict.keys() if column in self._master_schema]
-                columnwise_record_values = [batch_dict[column] for column in batch_columns if column in self._master_schema]
-                # we zip this to get row-by-row
-                for record_values in zip(*columnwise_record_values):
-                    yield {
-                        batch_columns[i]: self.convert_field_data(logical_types[batch_columns[i]], record_values[i])
-                        for i in range(len(batch_columns))
-                    }
+                # we need to check wether batch_file_schema == master_schema and reject extra columns.
+                batch_columns = [column for column in batch.schema.names if column in self._master_schema]
+                columns = [self.convert_column_data(batch.column(column)) for column in batch_columns]
+                yield from self.columns_to_records(batch_columns, columns, batch.num_rows, extra_columns)
@@ -0,0 +1,86 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Dict, Mapping, Optional
+
+from airbyte_cdk.logger import AirbyteLogger
+
+from .file_info import FileInfo
+
+LOGGER = AirbyteLogger()
+
+
+class SchemaCache:
+    """
+    Inferred schemas of files, persisted in a JSON file between runs so that the schema of a file is only inferred again
+    when the file or the format options change. Without a path, schemas are only cached for the lifetime of this object.
+    """
+
+    max_entries = 100000  # the oldest schemas are dropped beyond this number of files
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        :param path: JSON file the schemas are loaded from and saved to, defaults to None
+        """
+        self._path = path
+        self._lock = threading.Lock()
+        self._schemas: Dict[str, Dict[str, Any]] = self._load()
+        self._changed = False
+
+    @staticmethod
+    def key(file_info: FileInfo, format: Mapping[str, Any]) -> str:
+        """
+        :param file_info: file metadata, the ETag identifies the version of the file if known, else the last_modified and size do
+        :param format: file format specific mapping as described in spec.json
+        :return: cache key of the schema of this version of the file read with these format options
+        """
+        version = file_info.etag or [file_info.last_modified.isoformat(), file_info.size]
+        return hashlib.sha256(json.dumps([file_info.key, version, format], sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self._path or not os.path.exists(self._path):
+            return {}
+        try:
+            with open(self._path, "r") as f:
+                schemas: Dict[str, Dict[str, Any]] = json.load(f)
+            return schemas
+        except (OSError, ValueError) as e:
+            LOGGER.warn(f"Ignoring unreadable schema cache {self._path}: {e}")
+            return {}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._schemas.get(key)
+
+    def set(self, key: str, schema: Dict[str, Any]) -> None:
+        with self._lock:
+            self._schemas.pop(key, None)
+            self._schemas[key] = schema
+            while len(self._schemas) > self.max_entries:
+                del self._schemas[next(iter(self._schemas))]
+            self._changed = True
+
+    def save(self) -> None:
+        """
+        Writes the cache to its path if it changed, replacing the previous file atomically so that concurrent runs never read
+        a partially written cache.
+        """
+        with self._lock:
+            if not self._path or not self._changed:
+                return
+            directory = os.path.dirname(os.path.abspath(self._path))
+            try:
+                os.makedirs(directory, exist_ok=True)
+                with tempfile.NamedTemporaryFile("w", dir=directory, delete=False) as f:
+                    json.dump(self._schemas, f)
+                os.replace(f.name, self._path)
+            except OSError as e:
+                LOGGER.warn(f"Failed to save schema cache {self._path}: {e}")
+                return
+            self._changed = False
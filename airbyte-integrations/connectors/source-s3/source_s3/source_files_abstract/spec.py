@@ -77,6 +77,25 @@ class SourceFilesAbstractSpec(BaseModel):
         order=30,
     )
 
+    schema_inference_sampling: str = Field(
+        title="Files to infer the schema from",
+        default="all",
+        enum=["all", "newest", "one_per_prefix"],
+        description="Which of the files matching the pattern are opened to infer the schema: <strong>all</strong> of them, the "
+        "<strong>newest</strong> ones or the newest file of each folder (<strong>one_per_prefix</strong>). Sampling speeds up "
+        "discovery on buckets holding many files. Columns only found in files that were not sampled are read into "
+        "_ab_additional_properties.",
+        order=40,
+    )
+
+    schema_inference_sample_size: int = Field(
+        title="Number of files to infer the schema from",
+        default=10,
+        minimum=1,
+        description="Number of files the schema is inferred from when sampling the newest files.",
+        order=41,
+    )
+
     @staticmethod
     def change_format_to_oneOf(schema: dict) -> dict:
         props_to_change = ["format"]
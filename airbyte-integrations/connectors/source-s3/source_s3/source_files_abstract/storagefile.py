@@ -45,6 +45,12 @@ class StorageFile(ABC):
         """
         return self.file_info.key
 
+    def prefetch(self) -> None:
+        """
+        Override this to download the file ahead of open(), e.g. into a buffer that open() reads from.
+        This is called from a pool of threads while previous files are being read, so it must not raise for files open() can skip.
+        """
+
     @contextmanager
     @abstractmethod
     def open(self, binary: bool) -> Iterator[Union[TextIO, BinaryIO]]:
@@ -4,19 +4,24 @@
 
 
 import concurrent.futures
+import hashlib
 import json
+import os
+import posixpath
 import threading
 from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections import deque
 from copy import deepcopy
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from functools import lru_cache
 from traceback import format_exc
-from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Union
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 from airbyte_cdk.logger import AirbyteLogger
 from airbyte_cdk.models import FailureType
 from airbyte_cdk.models.airbyte_protocol import SyncMode
-from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.streams import IncrementalMixin, Stream
 from wcmatch.glob import GLOBSTAR, SPLIT, globmatch
 
 from ..exceptions import S3Exception
@@ -26,9 +31,11 @@ from .formats.avro_parser import AvroParser
 from .formats.csv_parser import CsvParser
 from .formats.jsonl_parser import JsonlParser
 from .formats.parquet_parser import ParquetParser
+from .schema_cache import SchemaCache
 from .storagefile import StorageFile
 
 JSON_TYPES = ["string", "number", "integer", "object", "array", "boolean", "null"]
+SCHEMA_INFERENCE_SAMPLINGS = ["all", "newest", "one_per_prefix"]
 
 LOGGER = AirbyteLogger()
 LOCK = threading.Lock()
@@ -38,6 +45,37 @@ class ConfigurationError(Exception):
     """Client mis-configured"""
 
 
+class ProjectionPlan:
+    """
+    Describes how records with a given set of columns are mutated into the target columns of a stream:
+    missing columns are added with a value of None (null) and additional columns are packed into the additional properties column.
+    This is computed once for the columns of a file so that each record is only mutated with a few dict operations.
+    """
+
+    def __init__(self, target_columns: Iterable[str], record_columns: Iterable[str], additional_col: str):
+        """
+        :param target_columns: list of column names to mutate the records into
+        :param record_columns: columns of the records this plan is applied to
+        :param additional_col: name of the object column holding additional columns
+        """
+        target_columns, record_columns = list(target_columns), list(record_columns)
+        target_set, record_set = set(target_columns), set(record_columns)
+        self.additional_col = additional_col
+        # template updating records with the missing columns, in the order of target columns
+        self.missing_columns = {c: None for c in target_columns if c not in record_set and c != additional_col}
+        self.extra_columns = [c for c in record_columns if c not in target_set]
+
+    def apply(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        :param record: json-like representation of a data row {column:value} with the columns of this plan
+        :return: mutated record with columns lining up to the target columns
+        """
+        if self.missing_columns:
+            record.update(self.missing_columns)
+        record[self.additional_col] = {c: record.pop(c) for c in self.extra_columns}
+        return record
+
+
 class FileStream(Stream, ABC):
     @property
     def fileformatparser_map(self) -> Mapping[str, type]:
@@ -56,14 +94,27 @@ class FileStream(Stream, ABC):
     airbyte_columns = [ab_additional_col, ab_last_mod_col, ab_file_name_col]
     datetime_format_string = "%Y-%m-%dT%H:%M:%S%z"
     parallel_tasks_size = 256
+    max_prefetched_files = 8  # number of files downloaded ahead, counting the one being read, 0 to read files one at a time
+    max_prefetched_bytes = 256 * 1024**2  # size of the files downloaded ahead, counting the one being read, whether in memory or on disk
 
-    def __init__(self, dataset: str, provider: dict, format: dict, path_pattern: str, schema: str = None):
+    def __init__(
+        self,
+        dataset: str,
+        provider: dict,
+        format: dict,
+        path_pattern: str,
+        schema: str = None,
+        schema_inference_sampling: str = "all",
+        schema_inference_sample_size: int = 10,
+    ):
         """
         :param dataset: table name for this stream
         :param provider: provider specific mapping as described in spec.json
         :param format: file format specific mapping as described in spec.json
         :param path_pattern: glob-style pattern for file-matching (https://facelessuser.github.io/wcmatch/glob/)
         :param schema: JSON-syntax user provided schema, defaults to None
+        :param schema_inference_sampling: which files the schema is inferred from, one of SCHEMA_INFERENCE_SAMPLINGS, defaults to "all"
+        :param schema_inference_sample_size: number of files the schema is inferred from when sampling the newest files, defaults to 10
         """
         self.dataset = dataset
         self._path_pattern = path_pattern
@@ -72,6 +123,10 @@ class FileStream(Stream, ABC):
         self._schema: Dict[str, Any] = {}
         if schema:
             self._schema = self._parse_user_input_schema(schema)
+        if schema_inference_sampling not in SCHEMA_INFERENCE_SAMPLINGS:
+            raise ConfigurationError(f"Invalid schema inference sampling, must be one of {SCHEMA_INFERENCE_SAMPLINGS}")
+        self._schema_inference_sampling = schema_inference_sampling
+        self._schema_inference_sample_size = schema_inference_sample_size
         self.master_schema: Dict[str, Any] = None
         LOGGER.info(f"initialised stream with format: {format}")
 
@@ -154,6 +209,32 @@ class FileStream(Stream, ABC):
             if globmatch(file_info.key, self._path_pattern, flags=GLOBSTAR | SPLIT):
                 yield file_info
 
+    @property
+    def schema_cache_path(self) -> Optional[str]:
+        """
+        JSON file caching the inferred schemas of files between runs, set with the AIRBYTE_SCHEMA_CACHE_PATH environment variable.
+        If not set, schemas are inferred again on every run.
+        """
+        return os.environ.get("AIRBYTE_SCHEMA_CACHE_PATH")
+
+    def _sample_file_infos(self, file_infos: List[FileInfo]) -> List[FileInfo]:
+        """
+        Picks the files to infer the master schema from, according to schema_inference_sampling:
+            - all: every file
+            - newest: the schema_inference_sample_size most recently modified files
+            - one_per_prefix: the most recently modified file of each folder
+        Columns of the files that aren't sampled are read into the additional properties column.
+
+        :param file_infos: files in time-ascending order
+        :return: sampled files in time-ascending order
+        """
+        if self._schema_inference_sampling == "newest":
+            return file_infos[-self._schema_inference_sample_size :]
+        if self._schema_inference_sampling == "one_per_prefix":
+            newest_per_prefix = {posixpath.dirname(file_info.key): file_info for file_info in file_infos}
+            return sorted(newest_per_prefix.values(), key=lambda file_info: file_info.last_modified)
+        return file_infos
+
     @lru_cache(maxsize=None)
     def get_time_ordered_file_infos(self) -> List[FileInfo]:
         """
@@ -244,9 +325,20 @@ class FileStream(Stream, ABC):
             file_infos = list(self.get_time_ordered_file_infos())
             if min_datetime is not None:
                 file_infos = [info for info in file_infos if info.last_modified >= min_datetime]
+            file_infos = self._sample_file_infos(file_infos)
+
+            # only the files whose schema isn't cached yet for this version of the file and format options are opened
+            schema_cache = SchemaCache(self.schema_cache_path)
+            cache_keys = {file_info: schema_cache.key(file_info, self._format) for file_info in file_infos}
+            for file_info, cache_key in cache_keys.items():
+                cached_schema = schema_cache.get(cache_key)
+                if cached_schema is not None:
+                    schemas[file_info] = cached_schema
+                    processed_files.append(file_info)
+            uncached_infos = [file_info for file_info in file_infos if file_info not in schemas]
 
-            for i in range(0, len(file_infos), self.parallel_tasks_size):
-                chunk_infos = file_infos[i : i + self.parallel_tasks_size]
+            for i in range(0, len(uncached_infos), self.parallel_tasks_size):
+                chunk_infos = uncached_infos[i : i + self.parallel_tasks_size]
                 with concurrent.futures.ThreadPoolExecutor() as executor:
                     list(
                         executor.map(
@@ -257,6 +349,10 @@ class FileStream(Stream, ABC):
                             ],
                         )
                     )
+            for file_info in uncached_infos:
+                if file_info in schemas:
+                    schema_cache.set(cache_keys[file_info], schemas[file_info])
+            schema_cache.save()
 
             for file_info in file_infos:
                 this_schema = schemas[file_info]
@@ -312,54 +408,70 @@ class FileStream(Stream, ABC):
         This builds full-refresh stream_slices regardless of sync_mode param.
         For full refresh, 1 file == 1 stream_slice.
         The structure of a stream slice is [ {file}, ... ].
-        In incremental mode, a stream slice may have more than one file so we mirror that format here.
         Incremental stream_slices are implemented in the IncrementalFileStream child class.
+        The files of the next stream_slices are prefetched while a stream_slice is read, see _prefetch_files().
+        """
+        yield from self._prefetch_files(
+            {"files": [{"storage_file": self.storagefile_class(file_info, self._provider)}]}
+            for file_info in self.get_time_ordered_file_infos()
+        )
+
+    def _prefetch_files(self, stream_slices: Iterable[Optional[Dict[str, Any]]]) -> Iterator[Optional[Dict[str, Any]]]:
+        """
+        Yields stream_slices in their original order, while the files of the next ones are prefetched on a pool of threads.
+        Up to max_prefetched_files files and max_prefetched_bytes bytes are downloaded ahead, counting the files of the slice being read,
+        and a slice is only yielded once its files have been prefetched, so files are still handed to the parser one at a time in
+        last_modified order. Files bigger than max_prefetched_bytes are not prefetched, open() streams them.
         """
+        if self.max_prefetched_files < 1:
+            yield from stream_slices
+            return
 
-        # TODO: this could be optimised via concurrent reads, however we'd lose chronology and need to deal with knock-ons of that
-        # we could do this concurrently both full and incremental by running batches in parallel
-        # and then incrementing the cursor per each complete batch
-        for file_info in self.get_time_ordered_file_infos():
-            yield {"files": [{"storage_file": self.storagefile_class(file_info, self._provider)}]}
+        pending: Deque[Tuple[Optional[Dict[str, Any]], List[concurrent.futures.Future], int]] = deque()
+        prefetched_files = 0
+        prefetched_bytes = 0
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_prefetched_files, thread_name_prefix="prefetch")
+        try:
+            for stream_slice in stream_slices:
+                storage_files = [
+                    file_item["storage_file"]
+                    for file_item in (stream_slice or {}).get("files", [])
+                    if file_item["storage_file"].file_size <= self.max_prefetched_bytes
+                ]
+                slice_bytes = sum(storage_file.file_size for storage_file in storage_files)
+                # the files of a yielded slice are released once the next slice is requested, since they were read by then
+                while pending and (
+                    prefetched_files + len(storage_files) > self.max_prefetched_files
+                    or prefetched_bytes + slice_bytes > self.max_prefetched_bytes
+                ):
+                    prefetched_slice, futures, futures_bytes = pending.popleft()
+                    prefetched_files -= len(futures)
+                    prefetched_bytes -= futures_bytes
+                    concurrent.futures.wait(futures)
+                    yield prefetched_slice
+                futures = [executor.submit(storage_file.prefetch) for storage_file in storage_files]
+                pending.append((stream_slice, futures, slice_bytes))
+                prefetched_files += len(storage_files)
+                prefetched_bytes += slice_bytes
+            while pending:
+                prefetched_slice, futures, _ = pending.popleft()
+                concurrent.futures.wait(futures)
+                yield prefetched_slice
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def _match_target_schema(self, record: Dict[str, Any], target_columns: List) -> Dict[str, Any]:
         """
         This method handles missing or additional fields in each record, according to the provided target_columns.
         All missing fields are added, with a value of None (null)
         All additional fields are packed into the _ab_additional_properties object column
-        We start off with a check to see if we're already lined up to target in order to avoid unnecessary iterations (useful if many columns)
+        When many records share the same columns, build a ProjectionPlan once and apply it to each record instead.
 
         :param record: json-like representation of a data row {column:value}
         :param target_columns: list of column names to mutate this record into (obtained via self._get_schema_map().keys() as of now)
         :return: mutated record with columns lining up to target_columns
         """
-        compare_columns = [c for c in target_columns if c not in [self.ab_last_mod_col, self.ab_file_name_col]]
-        # check if we're already matching to avoid unnecessary iteration
-        if set(list(record.keys()) + [self.ab_additional_col]) == set(compare_columns):
-            record[self.ab_additional_col] = {}
-            return record
-        # missing columns
-        for c in [col for col in compare_columns if col != self.ab_additional_col]:
-            if c not in record.keys():
-                record[c] = None
-        # additional columns
-        record[self.ab_additional_col] = {c: deepcopy(record[c]) for c in record.keys() if c not in compare_columns}
-        for c in record[self.ab_additional_col]:
-            del record[c]
-
-        return record
-
-    def _add_extra_fields_from_map(self, record: Dict[str, Any], extra_map: Mapping[str, Any]) -> Mapping[str, Any]:
-        """
-        Simple method to take a mapping of columns:values and add them to the provided record
-
-        :param record: json-like representation of a data row {column:value}
-        :param extra_map: map of additional columns and values to add
-        :return: mutated record with additional fields
-        """
-        for key, value in extra_map.items():
-            record[key] = value
-        return record
+        return ProjectionPlan(target_columns, list(record.keys()), self.ab_additional_col).apply(record)
 
     def _read_from_slice(
         self,
@@ -369,28 +481,37 @@ class FileStream(Stream, ABC):
     ) -> Iterable[Mapping[str, Any]]:
         """
         Uses provider-relevant StorageFile to open file and then iterates through stream_records() using format-relevant AbstractFileParser.
-        Records are mutated on the fly using _match_target_schema() and _add_extra_fields_from_map() to achieve desired final schema.
+        The file's metadata columns are added to the records by the parser, records are then mutated on the fly using
+        a ProjectionPlan to achieve desired final schema. The plan is built once per set of columns found in the file,
+        which is usually the file's header or schema, so records only pay for a lookup and a few dict operations.
         Since this is called per stream_slice, this method works for both full_refresh and incremental.
         """
+        target_columns = list(self._get_schema_map().keys())
         for file_item in stream_slice["files"]:
             storage_file: StorageFile = file_item["storage_file"]
+            extra_columns = {
+                self.ab_last_mod_col: datetime.strftime(storage_file.last_modified, self.datetime_format_string),
+                self.ab_file_name_col: storage_file.url,
+            }
+            plans: Dict[Tuple[str, ...], ProjectionPlan] = {}
             try:
                 with storage_file.open(file_reader.is_binary) as f:
-                    # TODO: make this more efficient than mutating every record one-by-one as they stream
-                    for record in file_reader.stream_records(f, storage_file.file_info):
-                        schema_matched_record = self._match_target_schema(record, list(self._get_schema_map().keys()))
-                        complete_record = self._add_extra_fields_from_map(
-                            schema_matched_record,
-                            {
-                                self.ab_last_mod_col: datetime.strftime(storage_file.last_modified, self.datetime_format_string),
-                                self.ab_file_name_col: storage_file.url,
-                            },
-                        )
-                        yield complete_record
+                    for record in file_reader.stream_records(f, storage_file.file_info, extra_columns):
+                        columns = tuple(record)
+                        plan = plans.get(columns)
+                        if plan is None:
+                            plan = plans[columns] = ProjectionPlan(target_columns, columns, self.ab_additional_col)
+                        yield plan.apply(record)
             except OSError:
                 continue
+            self._on_file_read(storage_file.file_info)
         LOGGER.info("finished reading a stream slice")
 
+    def _on_file_read(self, file_info: FileInfo) -> None:
+        """
+        Called once all the records of a file have been read, override this to act on the completion of files, e.g. to update state
+        """
+
     def read_records(
         self,
         sync_mode: SyncMode,
@@ -406,12 +527,16 @@ class FileStream(Stream, ABC):
             yield from self._read_from_slice(file_reader, stream_slice)
 
 
-class IncrementalFileStream(FileStream, ABC):
-    # TODO: ideally want to checkpoint after every file or stream slice rather than N records
+class IncrementalFileStream(FileStream, IncrementalMixin, ABC):
     state_checkpoint_interval = None
     buffer_days = 3  # keeping track of all files synced in the last N days
     sync_all_files_always = False
-    max_history_size = 1000000000
+    max_history_files = 1000000  # history is dropped beyond this number of files, all files of the last N days are synced then
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._cursor: datetime = self._get_datetime_from_stream_state()
+        self._history: Dict[str, List[int]] = {}
 
     @property
     def cursor_field(self) -> str:
@@ -420,11 +545,51 @@ class IncrementalFileStream(FileStream, ABC):
         """
         return self.ab_last_mod_col
 
+    @property
+    def state(self) -> MutableMapping[str, Any]:
+        """
+        The state is advanced once all the records of a file have been read, see _on_file_read().
+        We also save the schema into the state here so that we can use it on future incremental batches, allowing for additional/missing columns.
+        """
+        state: Dict[str, Any] = {
+            self.cursor_field: datetime.strftime(self._cursor, self.datetime_format_string),
+            "schema": self._get_schema_map(),
+        }
+        if not self.sync_all_files_always:
+            state["history"] = {date: list(key_hashes) for date, key_hashes in self._history.items()}
+        return state
+
+    @state.setter
+    def state(self, value: MutableMapping[str, Any]) -> None:
+        """
+        Loads the cursor and history of a previous sync. Histories holding the keys of the files rather than their hashes are
+        converted on the fly.
+        """
+        self._cursor = self._get_datetime_from_stream_state(value)
+        self._history = {
+            date: sorted({key if isinstance(key, int) else self._hash_key(key) for key in keys})
+            for date, keys in (value or {}).get("history", {}).items()
+        }
+
     @staticmethod
-    def file_in_history(file_info: FileInfo, history: dict) -> bool:
-        for slot in history.values():
-            if file_info.key in slot:
-                return file_info.key in slot
+    def _hash_key(key: str) -> int:
+        """
+        History holds 53-bit hashes of the file keys rather than the keys themselves to keep the state compact.
+        53 bits is the largest integer JSON consumers are guaranteed to read without loss of precision.
+        """
+        return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big") >> 11
+
+    @classmethod
+    def file_in_history(cls, file_info: FileInfo, history: Mapping[str, List[int]]) -> bool:
+        """
+        :param file_info: file to look for
+        :param history: mapping of {date: sorted list of the hashes of the keys of the files modified on that date}
+        """
+        key_hash = cls._hash_key(file_info.key)
+        for key_hashes in history.values():
+            index = bisect_left(key_hashes, key_hash)
+            if index < len(key_hashes) and key_hashes[index] == key_hash:
+                return True
         return False
 
     def _get_datetime_from_stream_state(self, stream_state: Mapping[str, Any] = None) -> datetime:
@@ -434,136 +599,80 @@ class IncrementalFileStream(FileStream, ABC):
         else:
             return datetime.strptime("1970-01-01T00:00:00+0000", self.datetime_format_string)
 
-    def get_updated_history(self, current_stream_state, latest_record_datetime, latest_record, current_parsed_datetime, state_date):
-        """
-        History is dict which basically groups files by their modified_at date.
-        After reading each record we add its file to the history set if it wasn't already there.
-        Then we drop from the history set any entries whose key is less than now - buffer_days
-        """
-
-        history = current_stream_state.get("history", {})
-
-        file_modification_date = latest_record_datetime.strftime("%Y-%m-%d")
-
-        # add record to history if record modified date in range delta start from state
-        if latest_record_datetime.date() + timedelta(days=self.buffer_days) >= state_date:
-            history_item = set(history.setdefault(file_modification_date, set()))
-            history_item.add(latest_record[self.ab_file_name_col])
-            history[file_modification_date] = history_item
+    def _on_file_read(self, file_info: FileInfo) -> None:
+        """
+        History is dict which basically groups the hashes of the file keys by their modified_at date.
+        After reading each file we move the cursor to its last_modified and add it to the history, unless it's older than
+        cursor - buffer_days. Then we drop from the history any entries whose date is less than cursor - buffer_days.
+        History is dropped altogether when it grows beyond max_history_files.
+        """
+        last_modified = file_info.last_modified
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        previous_date = self._cursor.date()
+        self._cursor = max(self._cursor, last_modified)
+        if self.sync_all_files_always:
+            return
+
+        state_date = self._cursor.date()
+        if last_modified.date() + timedelta(days=self.buffer_days) >= state_date:
+            key_hashes = self._history.setdefault(last_modified.strftime("%Y-%m-%d"), [])
+            key_hash = self._hash_key(file_info.key)
+            index = bisect_left(key_hashes, key_hash)
+            if index == len(key_hashes) or key_hashes[index] != key_hash:
+                key_hashes.insert(index, key_hash)
 
         # reset history to new date state
-        if current_parsed_datetime.date() != state_date:
-            history = {
-                date: history[date]
-                for date in history
+        if previous_date != state_date:
+            self._history = {
+                date: key_hashes
+                for date, key_hashes in self._history.items()
                 if datetime.strptime(date, "%Y-%m-%d").date() + timedelta(days=self.buffer_days) >= state_date
             }
 
-        return history
-
-    def size_history_balancer(self, state_dict):
-        """
-        Delete history if state size limit reached
-        """
-        history = state_dict["history"]
-
-        if history.__sizeof__() > self.max_history_size:
+        if sum(len(key_hashes) for key_hashes in self._history.values()) > self.max_history_files:
             self.sync_all_files_always = True
-            state_dict.pop("history")
+            self._history = {}
 
-        return state_dict
-
-    def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]) -> Mapping[str, Any]:
-        """
-        Inspects the latest record extracted from the data source and the current state object and return an updated state object.
-        In the case where current_stream_state is null, we default to 1970-01-01 in order to pick up all files present.
-        We also save the schema into the state here so that we can use it on future incremental batches, allowing for additional/missing columns.
-
-        :param current_stream_state: The stream's current state object
-        :param latest_record: The latest record extracted from the stream
-        :return: An updated state object
-        """
-        state_dict: Dict[str, Any] = {}
-        current_parsed_datetime = self._get_datetime_from_stream_state(current_stream_state)
-        latest_record_datetime = datetime.strptime(
-            latest_record.get(self.cursor_field, "1970-01-01T00:00:00+0000"), self.datetime_format_string
-        )
-        state_dict[self.cursor_field] = datetime.strftime(max(current_parsed_datetime, latest_record_datetime), self.datetime_format_string)
-
-        state_dict["schema"] = self._get_schema_map()
-
-        state_date = self._get_datetime_from_stream_state(state_dict).date()
-
-        if not self.sync_all_files_always:
-            state_dict["history"] = self.get_updated_history(
-                current_stream_state, latest_record_datetime, latest_record, current_parsed_datetime, state_date
-            )
-
-        return self.size_history_balancer(state_dict)
-
-    def need_to_skip_file(self, stream_state, file_info):
+    def need_to_skip_file(self, file_info: FileInfo) -> bool:
         """
         Skip this file if last_mod is earlier than our cursor value from state and already in history
         or skip this file if last_mod plus delta is earlier than our cursor value
         """
-        file_in_history_and_last_modified_is_earlier_than_cursor_value = (
-            stream_state is not None
-            and self.cursor_field in stream_state.keys()
-            and file_info.last_modified <= self._get_datetime_from_stream_state(stream_state)
-            and self.file_in_history(file_info, stream_state.get("history", {}))
-        )
-
-        file_is_not_in_history_and_last_modified_plus_buffer_days_is_earlier_than_cursor_value = file_info.last_modified + timedelta(
-            days=self.buffer_days
-        ) < self._get_datetime_from_stream_state(stream_state) and not self.file_in_history(file_info, stream_state.get("history", {}))
-
-        return (
-            file_in_history_and_last_modified_is_earlier_than_cursor_value
-            or file_is_not_in_history_and_last_modified_plus_buffer_days_is_earlier_than_cursor_value
-        )
+        if self.file_in_history(file_info, self._history):
+            return file_info.last_modified <= self._cursor
+        return file_info.last_modified + timedelta(days=self.buffer_days) < self._cursor
 
     def stream_slices(
         self, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
     ) -> Iterable[Optional[Dict[str, Any]]]:
         """
         Builds either full_refresh or incremental stream_slices based on sync_mode.
-        An incremental stream_slice is a group of all files with the exact same last_modified timestamp.
-        This ensures we only update the cursor state to a given timestamp after ALL files with that timestamp have been successfully read.
-
-        Slight nuance: as we iterate through get_time_ordered_file_infos(),
-        we yield the stream_slice containing file(s) up to and Excluding the file on the current iteration.
-        The stream_slice is then cleared (if we yielded it) and this iteration's file appended to the (next) stream_slice
+        An incremental stream_slice holds a single file so that the state is checkpointed after each file.
+        This is safe for files sharing the same last_modified timestamp: the ones already read are in the history,
+        the others are not skipped on the next sync even though the cursor has reached their timestamp.
         """
         if sync_mode == SyncMode.full_refresh:
             yield from super().stream_slices(sync_mode=sync_mode, cursor_field=cursor_field, stream_state=stream_state)
 
         else:
+            if stream_state:
+                self.state = stream_state
             # if necessary and present, let's update this object's schema attribute to the schema stored in state
             # TODO: ideally we could do this on __init__ but I'm not sure that's possible without breaking from cdk style implementation
             if self._schema == {} and stream_state is not None and "schema" in stream_state.keys():
                 self._schema = stream_state["schema"]
 
-            # logic here is to bundle all files with exact same last modified timestamp together in each slice
-            prev_file_last_mod: datetime = None  # init variable to hold previous iterations last modified
-            grouped_files_by_time: List[Dict[str, Any]] = []
-            for file_info in self.get_time_ordered_file_infos():
-                if self.need_to_skip_file(stream_state, file_info):
-                    continue
-
-                # check if this file belongs in the next slice, if so yield the current slice before this file
-                if (prev_file_last_mod is not None) and (file_info.last_modified != prev_file_last_mod):
-                    yield {"files": grouped_files_by_time}
-                    grouped_files_by_time.clear()
-
-                # now we either have an empty stream_slice or a stream_slice that this file shares a last modified with, so append it
-                grouped_files_by_time.append({"storage_file": self.storagefile_class(file_info, self._provider)})
-                # update our prev_file_last_mod to the current one for next iteration
-                prev_file_last_mod = file_info.last_modified
-
-            # now yield the final stream_slice. This is required because our loop only yields the slice previous to its current iteration.
-            if len(grouped_files_by_time) > 0:
-                yield {"files": grouped_files_by_time}
-            else:
+            has_files = False
+            for stream_slice in self._prefetch_files(
+                {"files": [{"storage_file": self.storagefile_class(file_info, self._provider)}]}
+                for file_info in self.get_time_ordered_file_infos()
+                if not self.need_to_skip_file(file_info)
+            ):
+                has_files = True
+                yield stream_slice
+
+            if not has_files:
                 # in case we have no files
                 yield None
 
@@ -2,7 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Any, Mapping, Tuple
+from typing import Any, List, Mapping, Tuple
 
 import pyarrow as pa
 import pytest
@@ -111,3 +111,23 @@ class TestAbstractFileParserStatics:
             with pytest.raises(Exception) as e_info:
                 AbstractFileParser.json_schema_to_pyarrow_schema(pyarrow_schema, reverse=True)
                 LOGGER.debug(str(e_info))
+
+    @pytest.mark.parametrize(
+        "names, columns, num_rows, extra_columns, expected_records",
+        [
+            (["a", "b"], [pa.array([1, 2]), pa.array(["x", None])], 2, None, [{"a": 1, "b": "x"}, {"a": 2, "b": None}]),
+            (
+                ["a"],
+                [pa.array([1, 2])],
+                2,
+                {"_ab_source_file_url": "file.csv"},
+                [{"a": 1, "_ab_source_file_url": "file.csv"}, {"a": 2, "_ab_source_file_url": "file.csv"}],
+            ),
+            (["a"], [pa.array([], type=pa.int64())], 0, {"_ab_source_file_url": "file.csv"}, []),
+            ([], [], 0, None, []),
+        ],
+    )
+    def test_columns_to_records(
+        self, names: List[str], columns: List[pa.Array], num_rows: int, extra_columns: Mapping[str, Any], expected_records: List[Any]
+    ) -> None:
+        assert AbstractFileParser.columns_to_records(names, columns, num_rows, extra_columns) == expected_records
@@ -4,6 +4,7 @@
 
 import bz2
 import copy
+import datetime
 import gzip
 import os
 import shutil
@@ -251,3 +252,37 @@ class TestParquetParser(AbstractTestParser):
     def test_convert_field_data(self):
         with pytest.raises(TypeError):
             ParquetParser.convert_field_data(logical_type="", field_value="")
+
+    @pytest.mark.parametrize(
+        "logical_type, values",
+        [
+            ("date", [datetime.date(2022, 1, 1), None]),
+            ("time", [datetime.time(10, 0), datetime.time(10, 0, 1, 500), None]),
+            (
+                "timestamp",
+                [datetime.datetime(2022, 1, 1, 10), datetime.datetime(2022, 1, 1, 10, 0, 0, 123456), None],
+            ),
+            (
+                "timestamp",
+                [
+                    datetime.datetime(2022, 1, 1, 10, tzinfo=datetime.timezone.utc),
+                    datetime.datetime(2022, 1, 1, 10, 0, 0, 1, tzinfo=datetime.timezone(datetime.timedelta(hours=-5))),
+                ],
+            ),
+            ("integer", [1, None]),
+            ("string", ["a", None]),
+        ],
+    )
+    def test_convert_column_data(self, logical_type: str, values: List[Any]):
+        column = pa.array(values)
+        expected_values = [ParquetParser.convert_field_data(logical_type, value) for value in column.to_pylist()]
+        assert ParquetParser.convert_column_data(column).to_pylist() == expected_values
+
+    @pytest.mark.parametrize("unit", ["s", "ms", "us", "ns"])
+    @pytest.mark.parametrize("tz", [None, "UTC", "America/New_York", "+05:30"])
+    def test_convert_timestamp_column_data(self, unit: str, tz: str):
+        nanoseconds = [1640995200000000000, 1640995200123000000, 1640995200123456000, 1640995200123456789, None]
+        unit_nanoseconds = {"s": 10**9, "ms": 10**6, "us": 10**3, "ns": 1}[unit]
+        column = pa.array([value // unit_nanoseconds if value else None for value in nanoseconds], pa.timestamp(unit, tz))
+        expected_values = [ParquetParser.convert_field_data("timestamp", value) for value in column.to_pylist()]
+        assert ParquetParser.convert_column_data(column).to_pylist() == expected_values
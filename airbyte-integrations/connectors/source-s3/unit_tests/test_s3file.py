@@ -3,13 +3,18 @@
 #
 
 
+import gzip
+from datetime import datetime
 from typing import Mapping
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 import smart_open
 from airbyte_cdk import AirbyteLogger
-from source_s3.s3file import S3File
+from smart_open import open as smart_open_open
+from source_s3.s3file import MAX_POOL_CONNECTIONS, S3File
+from source_s3.source_files_abstract.file_info import FileInfo
+from source_s3.source_files_abstract.stream import FileStream
 
 LOGGER = AirbyteLogger()
 
@@ -44,3 +49,39 @@ class TestS3File:
         smart_open.open = MagicMock()
         with S3File(file_info=MagicMock(), provider=provider).open("rb") as s3_file:
             assert s3_file
+
+    def test_client_is_shared_by_files(self) -> None:
+        provider = {"storage": "S3", "bucket": "dummy", "aws_access_key_id": "id", "aws_secret_access_key": "key", "path_prefix": "dummy"}
+        assert S3File.get_client(provider) is S3File.get_client(dict(provider))
+        assert S3File.get_client(provider) is not S3File.get_client({**provider, "bucket": "other"})
+
+    @pytest.mark.parametrize(
+        "key, content",
+        [
+            ("file.csv", b"id,name\n1,Frodo\n"),
+            ("file.csv.gz", gzip.compress(b"id,name\n1,Frodo\n")),
+        ],
+    )
+    def test_prefetched_file_is_read_from_buffer(self, key: str, content: bytes) -> None:
+        client = MagicMock()
+        client.download_fileobj.side_effect = lambda bucket, key, buffer, Config: buffer.write(content)
+        s3_file = S3File(file_info=FileInfo(key=key, size=len(content), last_modified=datetime.now()), provider={"bucket": "dummy"})
+        with patch.object(S3File, "get_client", return_value=client), patch.object(smart_open, "open", smart_open_open):
+            s3_file.prefetch()
+            with s3_file.open(binary=False) as f:
+                assert f.read() == "id,name\n1,Frodo\n"
+        client.download_fileobj.assert_called_once()
+        assert s3_file._buffer is None
+        # the files prefetched at the same time do not need more connections than the pool of the client holds
+        transfer_config = client.download_fileobj.call_args.kwargs["Config"]
+        assert transfer_config.max_concurrency * FileStream.max_prefetched_files < MAX_POOL_CONNECTIONS
+
+    def test_failed_prefetch_falls_back_to_streaming(self) -> None:
+        client = MagicMock()
+        client.download_fileobj.side_effect = Exception("Access Denied")
+        s3_file = S3File(file_info=FileInfo(key="file.csv", size=1, last_modified=datetime.now()), provider={"bucket": "dummy"})
+        with patch.object(S3File, "get_client", return_value=client), patch.object(smart_open, "open") as open_mock:
+            s3_file.prefetch()
+            with s3_file.open(binary=True):
+                pass
+        assert open_mock.call_args[0][0] == "s3://dummy/file.csv"
@@ -0,0 +1,54 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from datetime import datetime
+
+from source_s3.source_files_abstract.file_info import FileInfo
+from source_s3.source_files_abstract.schema_cache import SchemaCache
+
+FILE_INFO = FileInfo(key="folder/file.csv", size=128, last_modified=datetime(2022, 1, 1))
+FORMAT = {"filetype": "csv", "delimiter": ","}
+
+
+def test_schemas_are_persisted_between_runs(tmp_path):
+    path = str(tmp_path / "cache" / "schemas.json")
+    cache = SchemaCache(path)
+    cache.set(SchemaCache.key(FILE_INFO, FORMAT), {"id": "integer"})
+    cache.save()
+
+    assert SchemaCache(path).get(SchemaCache.key(FILE_INFO, FORMAT)) == {"id": "integer"}
+
+
+def test_key_changes_with_file_version_and_format():
+    key = SchemaCache.key(FILE_INFO, FORMAT)
+    assert key == SchemaCache.key(FileInfo(key="folder/file.csv", size=128, last_modified=datetime(2022, 1, 1)), dict(FORMAT))
+    assert key != SchemaCache.key(FileInfo(key="folder/file.csv", size=128, last_modified=datetime(2022, 1, 2)), FORMAT)
+    assert key != SchemaCache.key(FileInfo(key="folder/file.csv", size=256, last_modified=datetime(2022, 1, 1)), FORMAT)
+    assert key != SchemaCache.key(FILE_INFO, {**FORMAT, "delimiter": ";"})
+    # the ETag identifies the version of the file on its own
+    assert SchemaCache.key(
+        FileInfo(key="folder/file.csv", size=128, last_modified=datetime(2022, 1, 1), etag='"abc"'), FORMAT
+    ) == SchemaCache.key(FileInfo(key="folder/file.csv", size=128, last_modified=datetime(2022, 1, 2), etag='"abc"'), FORMAT)
+
+
+def test_oldest_schemas_are_dropped(tmp_path):
+    cache = SchemaCache()
+    cache.max_entries = 2
+    for key in ("a", "b", "c"):
+        cache.set(key, {key: "string"})
+
+    assert cache.get("a") is None
+    assert cache.get("b") == {"b": "string"}
+    assert cache.get("c") == {"c": "string"}
+
+
+def test_unreadable_cache_is_ignored(tmp_path):
+    path = tmp_path / "schemas.json"
+    path.write_text("not json")
+
+    cache = SchemaCache(str(path))
+    assert cache.get(SchemaCache.key(FILE_INFO, FORMAT)) is None
+    cache.set(SchemaCache.key(FILE_INFO, FORMAT), {"id": "integer"})
+    cache.save()
+    assert SchemaCache(str(path)).get(SchemaCache.key(FILE_INFO, FORMAT)) == {"id": "integer"}
@@ -2,7 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Mapping
 from unittest.mock import MagicMock, patch
 
@@ -12,7 +12,7 @@ from airbyte_cdk.models import SyncMode
 from source_s3.exceptions import S3Exception
 from source_s3.source_files_abstract.file_info import FileInfo
 from source_s3.source_files_abstract.storagefile import StorageFile
-from source_s3.source_files_abstract.stream import IncrementalFileStream
+from source_s3.source_files_abstract.stream import IncrementalFileStream, ProjectionPlan
 from source_s3.stream import IncrementalFileStreamS3
 
 from .abstract_test_parser import create_by_local_file, memory_limit
@@ -20,12 +20,6 @@ from .abstract_test_parser import create_by_local_file, memory_limit
 LOGGER = AirbyteLogger()
 
 
-def mock_big_size_object():
-    mock = MagicMock()
-    mock.__sizeof__.return_value = 1000000001
-    return mock
-
-
 class TestIncrementalFileStream:
     @pytest.mark.parametrize(  # set return_schema to None for an expected fail
         "schema_string, return_schema",
@@ -121,41 +115,68 @@ class TestIncrementalFileStream:
                 fs._match_target_schema(record, target_columns)
                 LOGGER.debug(str(e_info))
 
-    @pytest.mark.parametrize(  # set expected_return_record to None for an expected fail
-        "extra_map, record, expected_return_record",
-        [
-            (  # one extra field
-                {"friend": "Frodo"},
-                {"id": "1", "first_name": "Samwise", "last_name": "Gamgee"},
-                {"id": "1", "first_name": "Samwise", "last_name": "Gamgee", "friend": "Frodo"},
-            ),
-            (  # multiple extra fields
-                {"friend": "Frodo", "enemy": "Gollum", "loves": "PO-TAY-TOES"},
-                {"id": "1", "first_name": "Samwise", "last_name": "Gamgee"},
-                {"id": "1", "first_name": "Samwise", "last_name": "Gamgee", "friend": "Frodo", "enemy": "Gollum", "loves": "PO-TAY-TOES"},
-            ),
-            (  # empty extra_map
-                {},
-                {"id": "1", "first_name": "Samwise", "last_name": "Gamgee"},
-                {"id": "1", "first_name": "Samwise", "last_name": "Gamgee"},
-            ),
-        ],
-        ids=["one_extra_field", "multiple_extra_fields", "empty_extra_map"],
-    )
+    def test_projection_plan_is_reused_across_records(self) -> None:
+        plan = ProjectionPlan(["id", "name", "_ab_additional_properties"], ["id", "location"], "_ab_additional_properties")
+        records = [plan.apply({"id": str(i), "location": "The Shire"}) for i in range(2)]
+        assert records == [
+            {"id": "0", "name": None, "_ab_additional_properties": {"location": "The Shire"}},
+            {"id": "1", "name": None, "_ab_additional_properties": {"location": "The Shire"}},
+        ]
+        assert records[0]["_ab_additional_properties"] is not records[1]["_ab_additional_properties"]
+
+    def test_read_from_slice_builds_a_plan_per_columns(self) -> None:
+        stream_instance = IncrementalFileStreamS3(dataset="dummy", provider={}, format={}, path_pattern="", schema='{"id": "string"}')
+        file_reader = MagicMock()
+        file_reader.stream_records.return_value = iter([{"id": "1"}, {"id": "2", "extra": "x"}, {"id": "3"}])
+        storage_file = MagicMock(url="s3://bucket/file.csv", last_modified=datetime(2022, 1, 1))
+        storage_file.file_info = FileInfo(key="file.csv", size=1, last_modified=datetime(2022, 1, 1))
+        with patch("source_s3.source_files_abstract.stream.ProjectionPlan", wraps=ProjectionPlan) as plan_class:
+            records = list(stream_instance._read_from_slice(file_reader, {"files": [{"storage_file": storage_file}]}))
+
+        assert [record["_ab_additional_properties"] for record in records] == [{}, {"extra": "x"}, {}]
+        assert plan_class.call_count == 2
+        assert file_reader.stream_records.call_args[0][2] == {
+            "_ab_source_file_last_modified": "2022-01-01T00:00:00",
+            "_ab_source_file_url": "s3://bucket/file.csv",
+        }
+
     @patch(
         "source_s3.source_files_abstract.stream.IncrementalFileStream.__abstractmethods__", set()
     )  # patching abstractmethods to empty set so we can instantiate ABC to test
-    @memory_limit(512)
-    def test_add_extra_fields_from_map(
-        self, extra_map: Mapping[str, Any], record: Dict[str, Any], expected_return_record: Mapping[str, Any]
-    ) -> None:
+    def test_files_are_prefetched_in_order(self) -> None:
         fs = IncrementalFileStream(dataset="dummy", provider={}, format={}, path_pattern="")
-        if expected_return_record is not None:
-            assert fs._add_extra_fields_from_map(record, extra_map) == expected_return_record
-        else:
-            with pytest.raises(Exception) as e_info:
-                fs._add_extra_fields_from_map(record, extra_map)
-                LOGGER.debug(str(e_info))
+        fs.max_prefetched_files = 2
+        prefetched = []
+        storage_files = [MagicMock(file_size=1, prefetch=MagicMock(side_effect=lambda i=i: prefetched.append(i))) for i in range(5)]
+        stream_slices = ({"files": [{"storage_file": storage_file}]} for storage_file in storage_files)
+
+        for i, stream_slice in enumerate(fs._prefetch_files(stream_slices)):
+            assert stream_slice["files"][0]["storage_file"] is storage_files[i]
+            # the files of this slice are downloaded before it is read, no more than 2 files counting it
+            assert i in prefetched
+            assert max(prefetched) <= i + 1
+        assert sorted(prefetched) == list(range(5))
+
+    @patch(
+        "source_s3.source_files_abstract.stream.IncrementalFileStream.__abstractmethods__", set()
+    )  # patching abstractmethods to empty set so we can instantiate ABC to test
+    def test_prefetched_files_are_limited_in_size(self) -> None:
+        fs = IncrementalFileStream(dataset="dummy", provider={}, format={}, path_pattern="")
+        fs.max_prefetched_bytes = 100
+        prefetched = []
+        file_sizes = [40, 40, 40, 200, 10, 90]
+        storage_files = [
+            MagicMock(file_size=file_size, prefetch=MagicMock(side_effect=lambda i=i: prefetched.append(i)))
+            for i, file_size in enumerate(file_sizes)
+        ]
+        stream_slices = ({"files": [{"storage_file": storage_file}]} for storage_file in storage_files)
+
+        for i, stream_slice in enumerate(fs._prefetch_files(stream_slices)):
+            assert stream_slice["files"][0]["storage_file"] is storage_files[i]
+            # the files downloaded ahead, counting the one being read, never take more than 100 bytes
+            assert sum(file_sizes[j] for j in prefetched if j >= i) <= 100
+        # files bigger than the limit are streamed when read
+        assert sorted(prefetched) == [0, 1, 2, 4, 5]
 
     @pytest.mark.parametrize(
         "patterns, filepaths, expected_filepaths",
@@ -338,41 +359,74 @@ class TestIncrementalFileStream:
         assert set([p.key for p in fs.pattern_matched_filepath_iterator(file_infos)]) == set(expected_filepaths)
 
     @pytest.mark.parametrize(
-        "latest_record, current_stream_state, expected",
+        "read_file_info, current_stream_state, expected",
         [
             (  # overwrite history file
-                {"id": 1, "_ab_source_file_last_modified": "2022-05-11T11:54:11+0000", "_ab_source_file_url": "new_test_file.csv"},
-                {"_ab_source_file_last_modified": "2021-07-25T15:33:04+0000", "history": {"2021-07-25": {"old_test_file.csv"}}},
+                FileInfo(key="new_test_file.csv", size=1, last_modified=datetime(2022, 5, 11, 11, 54, 11, tzinfo=timezone.utc)),
+                {"_ab_source_file_last_modified": "2021-07-25T15:33:04+0000", "history": {"2021-07-25": ["old_test_file.csv"]}},
                 {"2022-05-11": {"new_test_file.csv"}},
             ),
             (  # add file to same day
-                {"id": 1, "_ab_source_file_last_modified": "2022-07-25T11:54:11+0000", "_ab_source_file_url": "new_test_file.csv"},
-                {"_ab_source_file_last_modified": "2022-07-25T00:00:00+0000", "history": {"2022-07-25": {"old_test_file.csv"}}},
+                FileInfo(key="new_test_file.csv", size=1, last_modified=datetime(2022, 7, 25, 11, 54, 11, tzinfo=timezone.utc)),
+                {"_ab_source_file_last_modified": "2022-07-25T00:00:00+0000", "history": {"2022-07-25": ["old_test_file.csv"]}},
                 {"2022-07-25": {"new_test_file.csv", "old_test_file.csv"}},
             ),
             (  # add new day to history
-                {"id": 1, "_ab_source_file_last_modified": "2022-07-03T11:54:11+0000", "_ab_source_file_url": "new_test_file.csv"},
-                {"_ab_source_file_last_modified": "2022-07-01T00:00:00+0000", "history": {"2022-07-01": {"old_test_file.csv"}}},
+                FileInfo(key="new_test_file.csv", size=1, last_modified=datetime(2022, 7, 3, 11, 54, 11, tzinfo=timezone.utc)),
+                {"_ab_source_file_last_modified": "2022-07-01T00:00:00+0000", "history": {"2022-07-01": ["old_test_file.csv"]}},
                 {"2022-07-01": {"old_test_file.csv"}, "2022-07-03": {"new_test_file.csv"}},
             ),
+            (  # file older than the buffer days
+                FileInfo(key="new_test_file.csv", size=1, last_modified=datetime(2022, 6, 1, tzinfo=timezone.utc)),
+                {"_ab_source_file_last_modified": "2022-07-01T00:00:00+0000", "history": {"2022-07-01": ["old_test_file.csv"]}},
+                {"2022-07-01": {"old_test_file.csv"}},
+            ),
             (  # history size limit reached
-                {"_ab_source_file_url": "test.csv"},
-                {"_ab_source_file_last_modified": "2022-07-01T00:00:00+0000", "history": mock_big_size_object()},
+                FileInfo(key="test.csv", size=1, last_modified=datetime(2022, 7, 1, tzinfo=timezone.utc)),
+                {"_ab_source_file_last_modified": "2022-07-01T00:00:00+0000", "history": {"2022-07-01": list(range(1000000))}},
                 None,
             ),
         ],
-        ids=["overwrite_history_file", "add_file_to_same_day ", "add_new_day_to_history", "history_size_limit_reached"],
+        ids=[
+            "overwrite_history_file",
+            "add_file_to_same_day ",
+            "add_new_day_to_history",
+            "older_than_buffer_days",
+            "history_size_limit_reached",
+        ],
     )
     @patch(
         "source_s3.source_files_abstract.stream.IncrementalFileStream.__abstractmethods__", set()
     )  # patching abstractmethods to empty set so we can instantiate ABC to test
-    def test_get_updated_history(self, latest_record, current_stream_state, expected, request) -> None:
+    def test_history_is_updated_per_file(self, read_file_info, current_stream_state, expected, request) -> None:
         fs = IncrementalFileStream(dataset="dummy", provider={}, format={"filetype": "csv"}, path_pattern="**/prefix*.csv")
         fs._get_schema_map = MagicMock(return_value={})
-        assert fs.get_updated_state(current_stream_state, latest_record).get("history") == expected
-
-        if request.node.callspec.id == "history_size_limit_reached":
+        fs.state = current_stream_state
+        fs._on_file_read(read_file_info)
+        history = fs.state.get("history")
+        if expected is None:
+            assert history is None
             assert fs.sync_all_files_always
+        else:
+            assert history == {date: sorted(fs._hash_key(key) for key in keys) for date, keys in expected.items()}
+            assert fs.state["_ab_source_file_last_modified"] == datetime.strftime(
+                max(read_file_info.last_modified, fs._get_datetime_from_stream_state(current_stream_state)), fs.datetime_format_string
+            )
+
+    @patch(
+        "source_s3.source_files_abstract.stream.IncrementalFileStream.__abstractmethods__", set()
+    )  # patching abstractmethods to empty set so we can instantiate ABC to test
+    def test_files_are_skipped_from_history(self) -> None:
+        fs = IncrementalFileStream(dataset="dummy", provider={}, format={"filetype": "csv"}, path_pattern="**/prefix*.csv")
+        fs._get_schema_map = MagicMock(return_value={})
+        fs.state = {"_ab_source_file_last_modified": "2022-07-01T00:00:00+0000", "history": {"2022-07-01": ["read.csv"]}}
+        last_modified = datetime(2022, 7, 1, tzinfo=timezone.utc)
+
+        assert fs.need_to_skip_file(FileInfo(key="read.csv", size=1, last_modified=last_modified))
+        assert not fs.need_to_skip_file(FileInfo(key="not_read_yet.csv", size=1, last_modified=last_modified))
+        assert fs.need_to_skip_file(FileInfo(key="old.csv", size=1, last_modified=datetime(2022, 6, 1, tzinfo=timezone.utc)))
+        # a legacy history of keys is read back as hashes
+        assert fs.state["history"] == {"2022-07-01": [fs._hash_key("read.csv")]}
 
     @pytest.mark.parametrize(  # set expected_return_record to None for an expected fail
         "stream_state, expected_error",
@@ -651,6 +705,54 @@ class TestIncrementalFileStream:
                         captured = capsys.readouterr()
                         assert "Detected mismatched datatype" in captured.out
 
+    @pytest.mark.parametrize(
+        ("sampling", "expected_keys"),
+        (
+            ("all", ["a/first", "b/second", "a/third", "b/fourth"]),
+            ("newest", ["a/third", "b/fourth"]),
+            ("one_per_prefix", ["a/third", "b/fourth"]),
+        ),
+    )
+    def test_sample_file_infos(self, sampling, expected_keys):
+        file_infos = [
+            FileInfo(last_modified=datetime(2022, 1, 1), key="a/first", size=128),
+            FileInfo(last_modified=datetime(2022, 1, 2), key="b/second", size=128),
+            FileInfo(last_modified=datetime(2022, 1, 3), key="a/third", size=128),
+            FileInfo(last_modified=datetime(2022, 1, 4), key="b/fourth", size=128),
+        ]
+        stream_instance = IncrementalFileStreamS3(
+            dataset="dummy",
+            provider={},
+            format={"filetype": "csv"},
+            path_pattern="**",
+            schema_inference_sampling=sampling,
+            schema_inference_sample_size=2,
+        )
+        assert [file_info.key for file_info in stream_instance._sample_file_infos(file_infos)] == expected_keys
+
+    @patch("source_s3.stream.IncrementalFileStreamS3.storagefile_class", MagicMock())
+    def test_master_schema_is_read_from_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("AIRBYTE_SCHEMA_CACHE_PATH", str(tmp_path / "schemas.json"))
+        file_infos = [
+            FileInfo(last_modified=datetime(2022, 1, 1), key="first", size=128),
+            FileInfo(last_modified=datetime(2022, 1, 2), key="second", size=128),
+        ]
+        get_inferred_schema = MagicMock(side_effect=[{"id": "integer"}, {"name": "string"}, {"name": "string", "pets": "array"}])
+        with patch.object(
+            IncrementalFileStreamS3, "fileformatparser_class", MagicMock(return_value=MagicMock(get_inferred_schema=get_inferred_schema))
+        ):
+            with patch.object(IncrementalFileStreamS3, "get_time_ordered_file_infos", MagicMock(return_value=file_infos)):
+                stream_kwargs = dict(dataset="dummy", provider={}, format={"filetype": "csv"}, path_pattern="**")
+                assert IncrementalFileStreamS3(**stream_kwargs)._get_master_schema() == {"id": "integer", "name": "string"}
+                assert get_inferred_schema.call_count == 2
+                assert IncrementalFileStreamS3(**stream_kwargs)._get_master_schema() == {"id": "integer", "name": "string"}
+                assert get_inferred_schema.call_count == 2
+
+                # only the modified file is opened again
+                file_infos[1] = FileInfo(last_modified=datetime(2022, 1, 3), key="second", size=128)
+                assert IncrementalFileStreamS3(**stream_kwargs)._get_master_schema() == {"id": "integer", "name": "string", "pets": "array"}
+                assert get_inferred_schema.call_count == 3
+
     @patch.object(
         IncrementalFileStreamS3,
         "_get_master_schema",
@@ -4,6 +4,8 @@
 
 import concurrent.futures
 import logging
+import os
+from email.utils import formatdate
 from typing import Any, List, Mapping, Optional, Tuple
 
 import requests  # type: ignore[import]
@@ -11,6 +13,7 @@ from airbyte_cdk.models import ConfiguredAirbyteCatalog
 from requests import adapters as request_adapters
 from requests.exceptions import HTTPError, RequestException  # type: ignore[import]
 
+from .describe_cache import DescribeCache
 from .exceptions import TypeSalesforceException
 from .rate_limiting import default_backoff_handler
 from .utils import filter_streams_by_criteria
@@ -211,6 +214,10 @@ class Salesforce:
     # https://developer.salesforce.com/docs/atlas.en-us.salesforce_app_limits_cheatsheet.meta/salesforce_app_limits_cheatsheet/salesforce_app_limits_platform_api.htm
     # Request Size Limits
     REQUEST_SIZE_LIMITS = 16_384
+    # https://developer.salesforce.com/docs/atlas.en-us.api_rest.meta/api_rest/resources_composite_batch.htm
+    # A batch request runs up to 25 subrequests
+    describe_batch_size = 25
+    parallel_describe_batches = 10
 
     def __init__(
         self,
@@ -228,6 +235,7 @@ class Salesforce:
         self.client_secret = client_secret
         self.access_token = None
         self.instance_url = ""
+        self.org_id = None
         self.session = requests.Session()
         # Change the connection pool size. Default value is not enough for parallel tasks
         adapter = request_adapters.HTTPAdapter(pool_connections=self.parallel_tasks_size, pool_maxsize=self.parallel_tasks_size)
@@ -238,6 +246,14 @@ class Salesforce:
             self.logger.info("using SANDBOX of Salesforce")
         self.start_date = start_date
 
+    @property
+    def describe_cache_dir(self) -> Optional[str]:
+        """
+        Directory caching the describes of sObjects between runs, a file per org, set with the SALESFORCE_DESCRIBE_CACHE_DIR
+        environment variable.
+        """
+        return os.environ.get("SALESFORCE_DESCRIBE_CACHE_DIR")
+
     def _get_standard_headers(self) -> Mapping[str, str]:
         return {"Authorization": "Bearer {}".format(self.access_token)}
 
@@ -287,13 +303,20 @@ class Salesforce:
 
     @default_backoff_handler(max_tries=5, factor=5)
     def _make_request(
-        self, http_method: str, url: str, headers: dict = None, body: dict = None, stream: bool = False, params: dict = None
+        self,
+        http_method: str,
+        url: str,
+        headers: dict = None,
+        body: dict = None,
+        stream: bool = False,
+        params: dict = None,
+        json: dict = None,
     ) -> requests.models.Response:
         try:
             if http_method == "GET":
                 resp = self.session.get(url, headers=headers, stream=stream, params=params)
             elif http_method == "POST":
-                resp = self.session.post(url, headers=headers, data=body)
+                resp = self.session.post(url, headers=headers, data=body, json=json)
             resp.raise_for_status()
         except HTTPError as err:
             self.logger.warn(f"http error body: {err.response.text}")
@@ -314,6 +337,9 @@ class Salesforce:
         auth = resp.json()
         self.access_token = auth["access_token"]
         self.instance_url = auth["instance_url"]
+        # the identity URL ends with the ids of the organization and the user: https://login.salesforce.com/id/<org id>/<user id>
+        if auth.get("id"):
+            self.org_id = auth["id"].rstrip("/").split("/")[-2]
 
     def describe(self, sobject: str = None, sobject_options: Mapping[str, Any] = None) -> Mapping[str, Any]:
         """Describes all objects or a specific object"""
@@ -328,35 +354,67 @@ class Salesforce:
         resp_json: Mapping[str, Any] = resp.json()
         return resp_json
 
+    def describe_sobjects(self, sobjects: List[str]) -> Mapping[str, Mapping[str, Any]]:
+        """
+        Describes sObjects by batches of subrequests, sent in parallel. sObjects described before are only described again
+        if their metadata was modified since, otherwise their cached describe is used.
+        Only the fields of describes are kept, as their names and types are all schemas are generated from.
+        """
+        describe_cache = DescribeCache(self.describe_cache_dir, org_id=self.org_id or self.instance_url, version=self.version)
+        url = f"{self.instance_url}/services/data/{self.version}/composite/batch"
+
+        def describe_batch(batch: List[str]) -> Mapping[str, Mapping[str, Any]]:
+            subrequests = []
+            for sobject in batch:
+                subrequest = {"method": "GET", "url": f"{self.version}/sobjects/{sobject}/describe"}
+                if_modified_since = describe_cache.if_modified_since(sobject)
+                if if_modified_since:
+                    subrequest["httpHeaders"] = {"If-Modified-Since": if_modified_since}
+                subrequests.append(subrequest)
+            try:
+                resp = self._make_request("POST", url, headers=self._get_standard_headers(), json={"batchRequests": subrequests})
+            except RequestException as e:
+                for sobject in batch:
+                    self.logger.error(f"Loading error of the {sobject} schema: {e}")
+                return {}
+            described_at = resp.headers.get("Date") or formatdate(usegmt=True)
+
+            describes = {}
+            for sobject, result in zip(batch, resp.json()["results"]):
+                cached_describe = describe_cache.get(sobject)
+                if result["statusCode"] == requests.codes.not_modified and cached_describe:
+                    describes[sobject] = cached_describe
+                elif result["statusCode"] == requests.codes.ok:
+                    describes[sobject] = {
+                        "fields": [{"name": field["name"], "type": field["type"]} for field in result["result"]["fields"]]
+                    }
+                    describe_cache.set(sobject, described_at, describes[sobject])
+                else:
+                    self.logger.error(f"Loading error of the {sobject} schema: {result['statusCode']} {result['result']}")
+            return describes
+
+        batches = [sobjects[i : i + self.describe_batch_size] for i in range(0, len(sobjects), self.describe_batch_size)]
+        sobject_describes = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.parallel_describe_batches) as executor:
+            for describes in executor.map(describe_batch, batches):
+                sobject_describes.update(describes)
+        describe_cache.save()
+        return sobject_describes
+
     def generate_schema(self, stream_name: str = None, stream_options: Mapping[str, Any] = None) -> Mapping[str, Any]:
-        response = self.describe(stream_name, stream_options)
-        schema = {"$schema": "http://json-schema.org/draft-07/schema#", "type": "object", "additionalProperties": True, "properties": {}}
-        for field in response["fields"]:
-            schema["properties"][field["name"]] = self.field_to_property_schema(field)  # type: ignore[index]
-        return schema
+        return self.schema_from_describe(self.describe(stream_name, stream_options))
 
     def generate_schemas(self, stream_objects: Mapping[str, Any]) -> Mapping[str, Any]:
-        def load_schema(name: str, stream_options: Mapping[str, Any]) -> Tuple[str, Optional[Mapping[str, Any]], Optional[str]]:
-            try:
-                result = self.generate_schema(stream_name=name, stream_options=stream_options)
-            except RequestException as e:
-                return name, None, str(e)
-            return name, result, None
+        describes = self.describe_sobjects(list(stream_objects.keys()))
+        return {
+            stream_name: self.schema_from_describe(describes[stream_name]) for stream_name in stream_objects if stream_name in describes
+        }
 
-        stream_names = list(stream_objects.keys())
-        # try to split all requests by chunks
-        stream_schemas = {}
-        for i in range(0, len(stream_names), self.parallel_tasks_size):
-            chunk_stream_names = stream_names[i : i + self.parallel_tasks_size]
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                for stream_name, schema, err in executor.map(
-                    lambda args: load_schema(*args), [(stream_name, stream_objects[stream_name]) for stream_name in chunk_stream_names]
-                ):
-                    if err:
-                        self.logger.error(f"Loading error of the {stream_name} schema: {err}")
-                        continue
-                    stream_schemas[stream_name] = schema
-        return stream_schemas
+    def schema_from_describe(self, describe: Mapping[str, Any]) -> Mapping[str, Any]:
+        schema = {"$schema": "http://json-schema.org/draft-07/schema#", "type": "object", "additionalProperties": True, "properties": {}}
+        for field in describe["fields"]:
+            schema["properties"][field["name"]] = self.field_to_property_schema(field)  # type: ignore[index]
+        return schema
 
     @staticmethod
     def get_pk_and_replication_key(json_schema: Mapping[str, Any]) -> Tuple[Optional[str], Optional[str]]:
@@ -0,0 +1,96 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import logging
+import os
+import re
+import threading
+from typing import Any, Dict, Mapping, Optional
+
+logger = logging.getLogger("airbyte")
+
+
+class DescribeCache:
+    """
+    Describes of the sObjects of a Salesforce org for an API version, each with the Date of the response it was received in.
+    That date is sent back as If-Modified-Since, so that Salesforce only describes again the sObjects whose metadata changed.
+
+    Each org is cached in its own file of the cache directory, which only holds the describes of the API version the connector
+    last used: the describes of another version may list other fields. Without a directory, nothing is cached.
+    """
+
+    def __init__(self, directory: Optional[str], org_id: str, version: str):
+        """
+        :param directory: directory holding a cache file per org, defaults to None
+        :param org_id: id of the Salesforce org the sObjects belong to
+        :param version: version of the API the sObjects are described with, e.g. v52.0
+        """
+        self._path = os.path.join(directory, re.sub(r"[^\w-]", "_", org_id) + ".json") if directory else None
+        self._version = version
+        self._lock = threading.Lock()
+        self._sobjects: Dict[str, Dict[str, Any]] = self._load()
+        self._changed = False
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self._path or not os.path.exists(self._path):
+            return {}
+        try:
+            with open(self._path, "r") as f:
+                cache = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable describe cache {self._path}: {e}")
+            return {}
+        if cache.get("version") != self._version:
+            logger.info(
+                f"Ignoring the describes cached for API version {cache.get('version')}, sObjects are described with {self._version}"
+            )
+            return {}
+        sobjects: Dict[str, Dict[str, Any]] = cache.get("sobjects", {})
+        return sobjects
+
+    def if_modified_since(self, sobject: str) -> Optional[str]:
+        """
+        :return: value of the If-Modified-Since header to describe the sObject with, None if it is not cached
+        """
+        with self._lock:
+            cached = self._sobjects.get(sobject)
+            return cached["described_at"] if cached else None
+
+    def get(self, sobject: str) -> Optional[Mapping[str, Any]]:
+        """
+        :return: the cached describe of the sObject, to use when Salesforce answers that it was not modified since
+        """
+        with self._lock:
+            cached = self._sobjects.get(sobject)
+            return cached["describe"] if cached else None
+
+    def set(self, sobject: str, described_at: str, describe: Mapping[str, Any]) -> None:
+        """
+        :param sobject: name of the sObject
+        :param described_at: HTTP date of the response the sObject was described in
+        :param describe: describe of the sObject
+        """
+        with self._lock:
+            self._sobjects[sobject] = {"described_at": described_at, "describe": describe}
+            self._changed = True
+
+    def save(self) -> None:
+        """
+        Writes the describes of the org if any changed. The file is renamed over the previous one once written, so that a sync
+        of the same org running at the same time never reads it half written.
+        """
+        with self._lock:
+            if not self._path or not self._changed:
+                return
+            partial_path = f"{self._path}.{os.getpid()}"
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self._path)), exist_ok=True)
+                with open(partial_path, "w") as f:
+                    json.dump({"version": self._version, "sobjects": self._sobjects}, f)
+                os.replace(partial_path, self._path)
+            except OSError as e:
+                logger.warning(f"Failed to save describe cache {self._path}: {e}")
+                return
+            self._changed = False
@@ -4,15 +4,20 @@
 
 import csv
 import ctypes
+import io
+import itertools
+import json
 import math
 import os
+import sqlite3
+import threading
 import time
 import urllib.parse
 from abc import ABC
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from contextlib import closing
-from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Type, Union
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Set, Tuple, Type, Union
 
-import pandas as pd
 import pendulum
 import requests  # type: ignore[import]
 from airbyte_cdk.models import ConfiguredAirbyteCatalog, SyncMode
@@ -20,7 +25,6 @@ from airbyte_cdk.sources.streams.availability_strategy import AvailabilityStrate
 from airbyte_cdk.sources.streams.core import Stream, StreamData
 from airbyte_cdk.sources.streams.http import HttpStream
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
-from numpy import nan
 from pendulum import DateTime  # type: ignore[attr-defined]
 from requests import codes, exceptions
 
@@ -34,6 +38,7 @@ CSV_FIELD_SIZE_LIMIT = int(ctypes.c_ulong(-1).value // 2)
 csv.field_size_limit(CSV_FIELD_SIZE_LIMIT)
 
 DEFAULT_ENCODING = "utf-8"
+DOWNLOAD_CHUNK_SIZE = 1024**2  # in bytes
 
 
 class SalesforceStream(HttpStream, ABC):
@@ -108,7 +113,90 @@ class PropertyChunk:
         self.next_page = None
 
 
+class PartialRecords:
+    """
+    Parts of records read by property chunks, kept by primary key until every chunk has read its part of the record.
+    Beyond `max_in_memory` records, the oldest ones are spilled to a temporary sqlite database, so that chunks drifting apart
+    don't keep the whole object in memory.
+    """
+
+    def __init__(self, chunk_ids: Iterable[int], max_in_memory: int):
+        self.chunk_ids = frozenset(chunk_ids)
+        self.max_in_memory = max_in_memory
+        self._records: Dict[str, Tuple[MutableMapping[str, Any], Set[int]]] = {}
+        self._spilled: Optional[sqlite3.Connection] = None
+
+    def __len__(self) -> int:
+        spilled_count = self._spilled.execute("SELECT COUNT(*) FROM records").fetchone()[0] if self._spilled else 0
+        return len(self._records) + spilled_count
+
+    def add(self, record_id: str, chunk_id: int, record: Mapping[str, Any]) -> Optional[MutableMapping[str, Any]]:
+        """
+        Adds the part of a record read by a chunk. Returns the whole record once all the chunks have read it.
+        """
+        partial_record, chunk_ids = self._records.pop(record_id, None) or self._pop_spilled(record_id) or ({}, set())
+        partial_record.update(record)
+        chunk_ids.add(chunk_id)
+        if chunk_ids >= self.chunk_ids:
+            return partial_record
+        self._records[record_id] = (partial_record, chunk_ids)
+        if len(self._records) > self.max_in_memory:
+            self._spill()
+        return None
+
+    def incomplete(self) -> Iterable[Tuple[str, Set[int]]]:
+        """
+        Yields the primary keys of the records which some chunks have not read yet, along with the chunks which have read them.
+        """
+        for record_id, (_, chunk_ids) in self._records.items():
+            yield record_id, chunk_ids
+        if self._spilled:
+            for record_id, chunk_ids in self._spilled.execute("SELECT id, chunk_ids FROM records"):
+                yield record_id, set(json.loads(chunk_ids))
+
+    def close(self):
+        self._records.clear()
+        if self._spilled:
+            # the temporary database is deleted once closed
+            self._spilled.close()
+            self._spilled = None
+
+    def _spill(self):
+        if not self._spilled:
+            # an empty name opens a private temporary database on disk
+            self._spilled = sqlite3.connect("")
+            self._spilled.execute("CREATE TABLE records (id TEXT PRIMARY KEY, record TEXT, chunk_ids TEXT)")
+        # the oldest records are the ones which chunks drifted apart on, the most recent ones are likely to be completed soon
+        spilled_ids = list(itertools.islice(self._records, len(self._records) // 2))
+        with self._spilled:
+            self._spilled.executemany(
+                "INSERT OR REPLACE INTO records VALUES (?, ?, ?)",
+                [
+                    (record_id, json.dumps(partial_record), json.dumps(sorted(chunk_ids)))
+                    for record_id, (partial_record, chunk_ids) in ((record_id, self._records.pop(record_id)) for record_id in spilled_ids)
+                ],
+            )
+
+    def _pop_spilled(self, record_id: str) -> Optional[Tuple[MutableMapping[str, Any], Set[int]]]:
+        if not self._spilled:
+            return None
+        row = self._spilled.execute("SELECT record, chunk_ids FROM records WHERE id = ?", (record_id,)).fetchone()
+        if not row:
+            return None
+        with self._spilled:
+            self._spilled.execute("DELETE FROM records WHERE id = ?", (record_id,))
+        return json.loads(row[0]), set(json.loads(row[1]))
+
+
 class RestSalesforceStream(SalesforceStream):
+    # Number of partial records of property chunks kept in memory, the next ones are spilled to disk
+    MAX_PARTIAL_RECORDS_IN_MEMORY = 10000
+    # Number of records queried by their primary key at a time, as many as fit into the request beside the chunk's properties
+    MAX_RECORD_IDS_PER_QUERY = 50
+    # Number of records a property chunk may be read ahead of the chunk read the least, so that a chunk returning smaller pages
+    # doesn't make the records of the others wait for their missing parts. Salesforce returns pages of up to 2000 records.
+    MAX_CHUNK_RECORDS_AHEAD = 2000
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         assert self.primary_key or not self.too_many_properties
@@ -197,10 +285,16 @@ class RestSalesforceStream(SalesforceStream):
         stream_state: Mapping[str, Any] = None,
     ) -> Iterable[StreamData]:
         stream_state = stream_state or {}
-        records_by_primary_key = {}
         property_chunks: Mapping[int, PropertyChunk] = {
             index: PropertyChunk(properties=properties) for index, properties in enumerate(self.chunk_properties())
         }
+        if self.too_many_properties:
+            yield from self._read_chunked_pages(property_chunks, records_generator_fn, stream_slice, stream_state)
+            return
+
+        # this is the case when a stream has no primary key
+        # (it is allowed when properties length does not exceed the maximum value)
+        # so there would be a single chunk, therefore we may and should yield records immediately
         while True:
             chunk_id = self._next_chunk_id(property_chunks)
             if chunk_id is None:
@@ -216,74 +310,219 @@ class RestSalesforceStream(SalesforceStream):
             if property_chunk.first_time:
                 property_chunk.first_time = False
             property_chunk.next_page = self.next_page_token(response)
-            chunk_page_records = records_generator_fn(request, response, stream_state, stream_slice)
-            if not self.too_many_properties:
-                # this is the case when a stream has no primary key
-                # (it is allowed when properties length does not exceed the maximum value)
-                # so there would be a single chunk, therefore we may and should yield records immediately
-                for record in chunk_page_records:
-                    property_chunk.record_counter += 1
-                    yield record
-                continue
-
-            # stick together different parts of records by their primary key and emit if a record is complete
-            for record in chunk_page_records:
+            for record in records_generator_fn(request, response, stream_state, stream_slice):
                 property_chunk.record_counter += 1
-                record_id = record[self.primary_key]
-                if record_id not in records_by_primary_key:
-                    records_by_primary_key[record_id] = (record, 1)
-                    continue
-                partial_record, counter = records_by_primary_key[record_id]
-                partial_record.update(record)
-                counter += 1
-                if counter == len(property_chunks):
-                    yield partial_record  # now it's complete
-                    records_by_primary_key.pop(record_id)
-                else:
-                    records_by_primary_key[record_id] = (partial_record, counter)
-
-        # Process what's left.
-        # Because we make multiple calls to query N records (each call to fetch X properties of all the N records),
-        # there's a chance that the number of records corresponding to the query may change between the calls.
-        # Select 'a', 'b' from table order by pk -> returns records with ids `1`, `2`
-        #   <insert smth.>
-        # Select 'c', 'd' from table order by pk -> returns records with ids `1`, `3`
-        # Then records `2` and `3` would be incomplete.
-        # This may result in data inconsistency. We skip such records for now and log a warning message.
-        incomplete_record_ids = ",".join([str(key) for key in records_by_primary_key])
-        if incomplete_record_ids:
-            self.logger.warning(f"Inconsistent record(s) with primary keys {incomplete_record_ids} found. Skipping them.")
+                yield record
 
         # Always return an empty generator just in case no records were ever yielded
         yield from []
 
-    def _fetch_next_page_for_chunk(
+    def _read_chunked_pages(
+        self,
+        property_chunks: Mapping[int, PropertyChunk],
+        records_generator_fn: Callable[
+            [requests.PreparedRequest, requests.Response, Mapping[str, Any], Mapping[str, Any]], Iterable[StreamData]
+        ],
+        stream_slice: Mapping[str, Any],
+        stream_state: Mapping[str, Any],
+    ) -> Iterable[StreamData]:
+        """
+        Reads the pages of the property chunks in parallel, then sticks together the parts of records by their primary key
+        and emits the records once complete. As the chunks are sorted the same way, the next page of a chunk is only requested
+        while it is not ahead of the chunk read the least by more than MAX_CHUNK_RECORDS_AHEAD records, so that only the records
+        of the pages in flight are usually partial. Partial records beyond MAX_PARTIAL_RECORDS_IN_MEMORY are spilled to disk.
+        """
+        partial_records = PartialRecords(property_chunks, max_in_memory=self.MAX_PARTIAL_RECORDS_IN_MEMORY)
+        executor = ThreadPoolExecutor(max_workers=len(property_chunks))
+        # pages in flight by the chunk they are read for, a chunk only has one page in flight at a time
+        pages: Dict[int, Tuple[requests.PreparedRequest, Future]] = {}
+        try:
+            while True:
+                non_exhausted_chunks = {
+                    chunk_id: chunk.record_counter for chunk_id, chunk in property_chunks.items() if chunk.first_time or chunk.next_page
+                }
+                if not non_exhausted_chunks:
+                    # pagination complete
+                    break
+                least_read = min(non_exhausted_chunks.values())
+                for chunk_id, record_counter in non_exhausted_chunks.items():
+                    if chunk_id in pages or record_counter > least_read + self.MAX_CHUNK_RECORDS_AHEAD:
+                        continue
+                    # requests are prepared here and only sent from worker threads
+                    property_chunk = property_chunks[chunk_id]
+                    request, request_kwargs = self._create_chunk_request(
+                        stream_slice, stream_state, property_chunk.next_page, property_chunk.properties
+                    )
+                    pages[chunk_id] = request, executor.submit(self._send_request, request, request_kwargs)
+
+                wait([response_future for _, response_future in pages.values()], return_when=FIRST_COMPLETED)
+                for chunk_id, (request, response_future) in list(pages.items()):
+                    if not response_future.done():
+                        continue
+                    del pages[chunk_id]
+                    property_chunk = property_chunks[chunk_id]
+                    response = response_future.result()
+                    property_chunk.first_time = False
+                    property_chunk.next_page = self.next_page_token(response)
+                    for record in records_generator_fn(request, response, stream_state, stream_slice):
+                        property_chunk.record_counter += 1
+                        complete_record = partial_records.add(record[self.primary_key], chunk_id, record)
+                        if complete_record:
+                            yield complete_record
+
+            yield from self._read_missing_parts(partial_records, property_chunks, records_generator_fn, stream_slice, stream_state)
+        finally:
+            for _, response_future in pages.values():
+                response_future.cancel()
+            executor.shutdown(wait=True)
+            partial_records.close()
+
+    def _read_missing_parts(
+        self,
+        partial_records: PartialRecords,
+        property_chunks: Mapping[int, PropertyChunk],
+        records_generator_fn: Callable[
+            [requests.PreparedRequest, requests.Response, Mapping[str, Any], Mapping[str, Any]], Iterable[StreamData]
+        ],
+        stream_slice: Mapping[str, Any],
+        stream_state: Mapping[str, Any],
+    ) -> Iterable[StreamData]:
+        """
+        Because we make multiple calls to query N records (each call to fetch X properties of all the N records),
+        there's a chance that the number of records corresponding to the query may change between the calls.
+        Select 'a', 'b' from table order by pk -> returns records with ids `1`, `2`
+          <insert smth.>
+        Select 'c', 'd' from table order by pk -> returns records with ids `1`, `3`
+        Then records `2` and `3` would be incomplete, so their missing properties are queried by their primary key.
+        """
+        missing_record_ids: Dict[int, List[str]] = {chunk_id: [] for chunk_id in property_chunks}
+        for record_id, chunk_ids in partial_records.incomplete():
+            for chunk_id in property_chunks.keys() - chunk_ids:
+                missing_record_ids[chunk_id].append(record_id)
+
+        for chunk_id, record_ids in missing_record_ids.items():
+            properties = property_chunks[chunk_id].properties
+            for start in range(0, len(record_ids), self.MAX_RECORD_IDS_PER_QUERY):
+                quoted_ids = ",".join(
+                    "'{}'".format(str(record_id).replace("'", "\\'"))
+                    for record_id in record_ids[start : start + self.MAX_RECORD_IDS_PER_QUERY]
+                )
+                params = {"q": f"SELECT {','.join(properties)} FROM {self.name} WHERE {self.primary_key} IN ({quoted_ids})"}
+                next_page = None
+                while True:
+                    request, request_kwargs = self._create_chunk_request(
+                        stream_slice, stream_state, next_page, properties, params=None if next_page else params
+                    )
+                    response = self._send_request(request, request_kwargs)
+                    for record in records_generator_fn(request, response, stream_state, stream_slice):
+                        complete_record = partial_records.add(record[self.primary_key], chunk_id, record)
+                        if complete_record:
+                            yield complete_record
+                    next_page = self.next_page_token(response)
+                    if not next_page:
+                        break
+
+        # Records deleted in between the calls can't be completed. We skip such records for now and log a warning message.
+        incomplete_record_ids = ",".join([str(record_id) for record_id, _ in partial_records.incomplete()])
+        if incomplete_record_ids:
+            self.logger.warning(f"Inconsistent record(s) with primary keys {incomplete_record_ids} found. Skipping them.")
+
+    def _create_chunk_request(
         self,
         stream_slice: Mapping[str, Any] = None,
         stream_state: Mapping[str, Any] = None,
         next_page_token: Mapping[str, Any] = None,
         property_chunk: Mapping[str, Any] = None,
-    ) -> Tuple[requests.PreparedRequest, requests.Response]:
+        params: Mapping[str, Any] = None,
+    ) -> Tuple[requests.PreparedRequest, Mapping[str, Any]]:
         request_headers = self.request_headers(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+        if params is None:
+            params = self.request_params(
+                stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token, property_chunk=property_chunk
+            )
         request = self._create_prepared_request(
             path=self.path(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
             headers=dict(request_headers, **self.authenticator.get_auth_header()),
-            params=self.request_params(
-                stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token, property_chunk=property_chunk
-            ),
+            params=params,
             json=self.request_body_json(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
             data=self.request_body_data(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
         )
         request_kwargs = self.request_kwargs(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+        return request, request_kwargs
+
+    def _fetch_next_page_for_chunk(
+        self,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+        next_page_token: Mapping[str, Any] = None,
+        property_chunk: Mapping[str, Any] = None,
+    ) -> Tuple[requests.PreparedRequest, requests.Response]:
+        request, request_kwargs = self._create_chunk_request(stream_slice, stream_state, next_page_token, property_chunk)
         response = self._send_request(request, request_kwargs)
         return request, response
 
 
+class WrittenChunks(io.RawIOBase):
+    """
+    Readable stream of the chunks of a download, which are written to a file as they are read.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], data_file: BinaryIO):
+        self._chunks = iter(chunks)
+        self._data_file = data_file
+        self._chunk = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._chunk:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._data_file.write(chunk)
+            self._chunk = memoryview(chunk)
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+
+class BulkJobResult:
+    """
+    Downloaded result of a bulk job, along with what is needed to query the next page before its records are read.
+    """
+
+    def __init__(
+        self,
+        job_full_url: Optional[str],
+        job_status: Optional[str],
+        path: Optional[str] = None,
+        encoding: Optional[str] = None,
+        record_count: int = 0,
+        last_record: Optional[Mapping[str, Any]] = None,
+    ):
+        self.job_full_url = job_full_url
+        self.job_status = job_status
+        self.path = path
+        self.encoding = encoding
+        self.record_count = record_count
+        self.last_record = last_record
+
+
 class BulkSalesforceStream(SalesforceStream):
     page_size = 15000
     DEFAULT_WAIT_TIMEOUT_SECONDS = 86400  # 24-hour bulk job running time
     MAX_CHECK_INTERVAL_SECONDS = 2.0
     MAX_RETRY_NUMBER = 3
+    # Number of bulk jobs run ahead of the one which records are read: the next page and the first pages of the next slices
+    MAX_JOBS_AHEAD = 3
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._job_executor = ThreadPoolExecutor(max_workers=self.MAX_JOBS_AHEAD + 1)
+        # jobs started by stream_slices ahead of reading their slice, by their query
+        self._jobs_ahead: Dict[str, Future] = {}
 
     def path(self, next_page_token: Mapping[str, Any] = None, **kwargs: Any) -> str:
         return f"/services/data/{self.sf_api.version}/jobs/query"
@@ -362,7 +601,8 @@ class BulkSalesforceStream(SalesforceStream):
         # minimal starting delay is 0.5 seconds.
         # this value was received empirically
         time.sleep(0.5)
-        while pendulum.now() < expiration_time:
+        # jobs run ahead are not waited for anymore once the sync is over
+        while pendulum.now() < expiration_time and threading.main_thread().is_alive():
             job_info = self._send_http_request("GET", url=url).json()
             job_status = job_info["state"]
             if job_status in ["JobComplete", "Aborted", "Failed"]:
@@ -417,48 +657,118 @@ class BulkSalesforceStream(SalesforceStream):
             self.logger.warning("Filter 'null' bytes from string, size reduced %d -> %d chars", len(b), len(res))
         return res
 
-    def download_data(self, url: str, chunk_size: int = 1024) -> tuple[str, str]:
+    def download_data(self, url: str, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> tuple[str, str]:
         """
         Retrieves binary data result from successfully `executed_job`, using chunks, to avoid local memory limitations.
         @ url: string - the url of the `executed_job`
-        @ chunk_size: int - the buffer size for each chunk to fetch from stream, in bytes, default: 1024 bytes
+        @ chunk_size: int - the buffer size for each chunk to fetch from stream, in bytes, default: 1 MB
         Return the tuple containing string with file path of downloaded binary data (Saved temporarily) and file encoding.
         """
+        path, encoding, _, _ = self._download_and_count(url, chunk_size)
+        return path, encoding
+
+    def _download_and_count(self, url: str, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> Tuple[str, str, int, Optional[Mapping[str, Any]]]:
+        """
+        Downloads the result of the job like download_data, and parses it while it is written to count its records and get
+        the last one, so that the result is not read once more to know whether there is a next page.
+        Return the tuple of the file path, the file encoding, the number of records and the last record.
+        """
         # set filepath for binary data from response
         tmp_file = os.path.realpath(os.path.basename(url))
+        record_count, last_record = 0, None
         with closing(self._send_http_request("GET", f"{url}/results", stream=True)) as response, open(tmp_file, "wb") as data_file:
-            response_encoding = response.apparent_encoding or response.encoding or self.encoding
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                data_file.write(self.filter_null_bytes(chunk))
+            if "charset" in response.headers.get("Content-Type", ""):
+                response_encoding = response.encoding
+            else:
+                # the encoding is detected from the whole content only if the response doesn't declare it
+                response_encoding = response.apparent_encoding or response.encoding or self.encoding
+            chunks = (self.filter_null_bytes(chunk) for chunk in response.iter_content(chunk_size=chunk_size))
+            with io.TextIOWrapper(io.BufferedReader(WrittenChunks(chunks, data_file)), encoding=response_encoding, newline="") as data:
+                for last_record in self._csv_records(data):
+                    record_count += 1
         # check the file exists
         if os.path.isfile(tmp_file):
-            return tmp_file, response_encoding
+            return tmp_file, response_encoding, record_count, last_record
         else:
             raise TmpFileIOError(f"The IO/Error occured while verifying binary data. Stream: {self.name}, file {tmp_file} doesn't exist.")
 
-    def read_with_chunks(self, path: str, file_encoding: str, chunk_size: int = 100) -> Iterable[Tuple[int, Mapping[str, Any]]]:
+    @staticmethod
+    def _csv_records(lines: Iterable[str]) -> Iterable[Mapping[str, Any]]:
+        """
+        Parses the records of CSV data. Values are kept as strings and converted according to the schema by the transformer,
+        empty values are read as None. Rows with more values than the header have their first values dropped, as they used to be
+        read as the index by pandas.
+        """
+        rows = csv.reader(lines, dialect="unix")
+        header = next(rows, None)
+        if not header:
+            return
+        for row in rows:
+            if not row:
+                continue
+            if len(row) > len(header):
+                row = row[len(row) - len(header) :]
+            yield {key: value if value != "" else None for key, value in itertools.zip_longest(header, row)}
+
+    @classmethod
+    def _read_csv(cls, path: str, file_encoding: str) -> Iterable[Mapping[str, Any]]:
         """
-        Reads the downloaded binary data, using lines chunks, set by `chunk_size`.
+        Streams the records of the downloaded CSV data.
+        """
+        with open(path, "r", encoding=file_encoding, newline="") as data:
+            yield from cls._csv_records(data)
+
+    def read_with_chunks(self, path: str, file_encoding: str) -> Iterable[Mapping[str, Any]]:
+        """
+        Reads the downloaded binary data record by record.
         @ path: string - the path to the downloaded temporarily binary data.
         @ file_encoding: string - encoding for binary data file according to Standard Encodings from codecs module
-        @ chunk_size: int - the number of lines to read at a time, default: 100 lines / time.
         """
         try:
-            with open(path, "r", encoding=file_encoding) as data:
-                chunks = pd.read_csv(data, chunksize=chunk_size, iterator=True, dialect="unix")
-                for chunk in chunks:
-                    chunk = chunk.replace({nan: None}).to_dict(orient="records")
-                    for row in chunk:
-                        yield row
-        except pd.errors.EmptyDataError as e:
-            self.logger.info(f"Empty data received. {e}")
-            yield from []
+            yield from self._read_csv(path, file_encoding)
         except IOError as ioe:
             raise TmpFileIOError(f"The IO/Error occured while reading tmp data. Called: {path}. Stream: {self.name}", ioe)
         finally:
             # remove binary tmp file, after data is read
             os.remove(path)
 
+    def run_job(self, query: str, url: str) -> BulkJobResult:
+        """
+        Executes a bulk job and downloads its result. Jobs of the next pages run in the background while records of
+        the previous ones are read, so the result is counted while it is downloaded to know whether there is a next page to query.
+        """
+        job_full_url, job_status = self.execute_job(query=query, url=url)
+        if not job_full_url:
+            return BulkJobResult(job_full_url, job_status)
+        path, encoding, record_count, last_record = self._download_and_count(url=job_full_url)
+        return BulkJobResult(job_full_url, job_status, path=path, encoding=encoding, record_count=record_count, last_record=last_record)
+
+    def start_job(self, query: str, url: str) -> Future:
+        """
+        Starts a bulk job for the query in the background, unless it has already been started ahead by stream_slices.
+        """
+        job = self._jobs_ahead.pop(query, None)
+        if job is None:
+            job = self._job_executor.submit(self.run_job, query=query, url=url)
+        return job
+
+    def discard_job(self, job: Future):
+        """
+        Deletes a job started ahead and its downloaded data once it is done, because its records are not going to be read.
+        """
+
+        def clean_up(done_job: Future):
+            if done_job.cancelled() or done_job.exception():
+                return
+            result: BulkJobResult = done_job.result()
+            if result.path and os.path.exists(result.path):
+                os.remove(result.path)
+            if result.job_full_url:
+                self.delete_job(url=result.job_full_url)
+
+        if not job.cancel():
+            job.add_done_callback(clean_up)
+
     def abort_job(self, url: str):
         data = {"state": "Aborted"}
         self._send_http_request("PATCH", url=url, json=data)
@@ -501,46 +811,58 @@ class BulkSalesforceStream(SalesforceStream):
     ) -> Iterable[Mapping[str, Any]]:
         stream_state = stream_state or {}
         next_page_token = None
+        params = self.request_params(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+        path = self.path(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+        job: Optional[Future] = self.start_job(query=params["q"], url=f"{self.url_base}{path}")
 
-        while True:
-            params = self.request_params(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
-            path = self.path(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
-            job_full_url, job_status = self.execute_job(query=params["q"], url=f"{self.url_base}{path}")
-            if not job_full_url:
-                if job_status == "Failed":
-                    # As rule as BULK logic returns unhandled error. For instance:
-                    # error message: 'Unexpected exception encountered in query processing.
-                    #                 Please contact support with the following id: 326566388-63578 (-436445966)'"
-                    # Thus we can try to switch to GET sync request because its response returns obvious error message
-                    standard_instance = self.get_standard_instance()
-                    self.logger.warning("switch to STANDARD(non-BULK) sync. Because the SalesForce BULK job has returned a failed status")
-                    stream_is_available, error = standard_instance.check_availability(self.logger, None)
-                    if not stream_is_available:
-                        self.logger.warning(f"Skipped syncing stream '{standard_instance.name}' because it was unavailable. Error: {error}")
-                        return
-                    yield from standard_instance.read_records(
-                        sync_mode=sync_mode, cursor_field=cursor_field, stream_slice=stream_slice, stream_state=stream_state
-                    )
+        try:
+            while job:
+                result: BulkJobResult = job.result()
+                job = None
+                if not result.job_full_url:
+                    yield from self._read_records_on_failed_job(result.job_status, sync_mode, cursor_field, stream_slice, stream_state)
                     return
-                raise SalesforceException(f"Job for {self.name} stream using BULK API was failed.")
 
-            count = 0
-            record: Mapping[str, Any] = {}
-            for record in self.read_with_chunks(*self.download_data(url=job_full_url)):
-                count += 1
-                yield record
-            self.delete_job(url=job_full_url)
-
-            if count < self.page_size:
                 # Salesforce doesn't give a next token or something to know the request was
                 # the last page. The connectors will sync batches in `page_size` and
                 # considers that batch is smaller than the `page_size` it must be the last page.
-                break
+                next_page_token = self.next_page_token(result.last_record) if result.record_count >= self.page_size else None
+                if next_page_token:
+                    # the job of the next page runs while records of this one are read
+                    params = self.request_params(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+                    path = self.path(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+                    job = self.start_job(query=params["q"], url=f"{self.url_base}{path}")
+
+                yield from self.read_with_chunks(result.path, result.encoding)
+                self.delete_job(url=result.job_full_url)
+        finally:
+            if job:
+                self.discard_job(job)
 
-            next_page_token = self.next_page_token(record)
-            if not next_page_token:
-                # not found a next page data.
-                break
+    def _read_records_on_failed_job(
+        self,
+        job_status: Optional[str],
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable[Mapping[str, Any]]:
+        if job_status == "Failed":
+            # As rule as BULK logic returns unhandled error. For instance:
+            # error message: 'Unexpected exception encountered in query processing.
+            #                 Please contact support with the following id: 326566388-63578 (-436445966)'"
+            # Thus we can try to switch to GET sync request because its response returns obvious error message
+            standard_instance = self.get_standard_instance()
+            self.logger.warning("switch to STANDARD(non-BULK) sync. Because the SalesForce BULK job has returned a failed status")
+            stream_is_available, error = standard_instance.check_availability(self.logger, None)
+            if not stream_is_available:
+                self.logger.warning(f"Skipped syncing stream '{standard_instance.name}' because it was unavailable. Error: {error}")
+                return
+            yield from standard_instance.read_records(
+                sync_mode=sync_mode, cursor_field=cursor_field, stream_slice=stream_slice, stream_state=stream_state
+            )
+            return
+        raise SalesforceException(f"Job for {self.name} stream using BULK API was failed.")
 
     def get_standard_instance(self) -> SalesforceStream:
         """Returns a instance of standard logic(non-BULK) with same settings"""
@@ -603,11 +925,13 @@ class IncrementalRestSalesforceStream(RestSalesforceStream, ABC):
         property_chunk = property_chunk or {}
 
         stream_date = stream_state.get(self.cursor_field)
-        start_date = stream_date or self.start_date
+        start_date = (stream_slice or {}).get("start_date") or stream_date or self.start_date
+        end_date = (stream_slice or {}).get("end_date")
 
         query = f"SELECT {','.join(property_chunk.keys())} FROM {self.name} "
         if start_date:
-            query += f"WHERE {self.cursor_field} >= {start_date} "
+            condition = f"{self.cursor_field} >= {start_date}"
+            query += f"WHERE ({condition}) AND {self.cursor_field} < {end_date} " if end_date else f"WHERE {condition} "
         if self.name not in UNSUPPORTED_FILTERING_STREAMS:
             query += f"ORDER BY {self.cursor_field} ASC"
         return {"q": query}
@@ -628,6 +952,84 @@ class IncrementalRestSalesforceStream(RestSalesforceStream, ABC):
 
 
 class BulkIncrementalSalesforceStream(BulkSalesforceStream, IncrementalRestSalesforceStream):
+    # Length of the date windows the stream is read by, so that jobs of the next windows run while one is read.
+    # Consecutive windows are read together when their records fit in a single page.
+    slice_step = pendulum.duration(days=30)
+
+    def _date_windows(self, stream_state: Mapping[str, Any]) -> List[Optional[Mapping[str, Any]]]:
+        start_date = stream_state.get(self.cursor_field) or self.start_date
+        if not start_date or self.name in UNSUPPORTED_FILTERING_STREAMS:
+            return [None]
+        windows: List[Optional[Mapping[str, Any]]] = []
+        start, now = pendulum.parse(start_date), pendulum.now(tz="UTC")
+        while start + self.slice_step < now:
+            end = start + self.slice_step
+            windows.append({"start_date": start.strftime("%Y-%m-%dT%H:%M:%SZ"), "end_date": end.strftime("%Y-%m-%dT%H:%M:%SZ")})
+            start = end
+        # the last window is left open to get the records updated while syncing, as a single query would
+        windows.append({"start_date": start.strftime("%Y-%m-%dT%H:%M:%SZ"), "end_date": None})
+        return windows
+
+    def _count_records(self, window: Mapping[str, Any]) -> Optional[int]:
+        """
+        Counts the records of a date window with a REST query, which is much cheaper than a bulk job.
+        Return None if the records could not be counted.
+        """
+        condition = f"{self.cursor_field} >= {window['start_date']}"
+        if window["end_date"]:
+            condition += f" AND {self.cursor_field} < {window['end_date']}"
+        query = urllib.parse.urlencode({"q": f"SELECT COUNT() FROM {self.name} WHERE {condition}"})
+        try:
+            response = self._send_http_request("GET", f"{self.url_base}/services/data/{self.sf_api.version}/queryAll?{query}")
+            record_count: int = response.json()["totalSize"]
+            return record_count
+        except (exceptions.RequestException, KeyError, ValueError) as error:
+            self.logger.warning(f"Failed to count the records of {self.name} from {window['start_date']}: {error}")
+            return None
+
+    def _date_slices(self, stream_state: Mapping[str, Any]) -> List[Optional[Mapping[str, Any]]]:
+        """
+        Date windows merged with the next ones as long as their records fit in a single page, so that no bulk job is run for
+        the windows without records. The windows are kept as is if their records can't be counted.
+        """
+        windows = self._date_windows(stream_state)
+        if len(windows) < 2:
+            return windows
+        record_counts = list(self._job_executor.map(self._count_records, windows))
+        if None in record_counts:
+            return windows
+        slices: List[Optional[Mapping[str, Any]]] = []
+        slice_record_count = 0
+        for window, record_count in zip(windows, record_counts):
+            if slices and slice_record_count + record_count <= self.page_size:
+                slices[-1] = {"start_date": slices[-1]["start_date"], "end_date": window["end_date"]}
+                slice_record_count += record_count
+            else:
+                slices.append(window)
+                slice_record_count = record_count
+        return slices
+
+    def stream_slices(
+        self, *, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
+    ) -> Iterable[Optional[Mapping[str, Any]]]:
+        """
+        Splits the stream into date windows and starts the jobs of the first pages of the next windows before a window is read.
+        """
+        stream_state = stream_state or {}
+        slices = self._date_slices(stream_state)
+        try:
+            for index, stream_slice in enumerate(slices):
+                for next_slice in slices[index : index + self.MAX_JOBS_AHEAD]:
+                    params = self.request_params(stream_state=stream_state, stream_slice=next_slice)
+                    if params["q"] not in self._jobs_ahead:
+                        path = self.path(stream_state=stream_state, stream_slice=next_slice)
+                        self._jobs_ahead[params["q"]] = self.start_job(query=params["q"], url=f"{self.url_base}{path}")
+                yield stream_slice
+        finally:
+            for job in self._jobs_ahead.values():
+                self.discard_job(job)
+            self._jobs_ahead.clear()
+
     def next_page_token(self, last_record: Mapping[str, Any]) -> Optional[Mapping[str, Any]]:
         if self.name not in UNSUPPORTED_FILTERING_STREAMS:
             page_token: str = last_record[self.cursor_field]
@@ -646,15 +1048,19 @@ class BulkIncrementalSalesforceStream(BulkSalesforceStream, IncrementalRestSales
         stream_date = stream_state.get(self.cursor_field)
         next_token = (next_page_token or {}).get("next_token")
         primary_key = (next_page_token or {}).get("primary_key")
-        start_date = next_token or stream_date or self.start_date
+        start_date = next_token or (stream_slice or {}).get("start_date") or stream_date or self.start_date
+        end_date = (stream_slice or {}).get("end_date")
         self.prev_start_date = start_date
 
         query = f"SELECT {','.join(selected_properties.keys())} FROM {self.name} "
         if start_date:
             if primary_key and self.name not in UNSUPPORTED_FILTERING_STREAMS:
-                query += f"WHERE ({self.cursor_field} = {start_date} AND {self.primary_key} > '{primary_key}') OR ({self.cursor_field} > {start_date}) "
+                condition = (
+                    f"({self.cursor_field} = {start_date} AND {self.primary_key} > '{primary_key}') OR ({self.cursor_field} > {start_date})"
+                )
             else:
-                query += f"WHERE {self.cursor_field} >= {start_date} "
+                condition = f"{self.cursor_field} >= {start_date}"
+            query += f"WHERE ({condition}) AND {self.cursor_field} < {end_date} " if end_date else f"WHERE {condition} "
         if self.name not in UNSUPPORTED_FILTERING_STREAMS:
             order_by_fields = [self.cursor_field, self.primary_key] if self.primary_key else [self.cursor_field]
             query += f"ORDER BY {','.join(order_by_fields)} ASC LIMIT {self.page_size}"
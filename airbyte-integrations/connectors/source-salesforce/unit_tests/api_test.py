@@ -8,19 +8,24 @@ import io
 import logging
 import re
 from unittest.mock import Mock
+from urllib.parse import parse_qs, urlparse
 
+import pendulum
 import pytest
 import requests_mock
 from airbyte_cdk.models import AirbyteStream, ConfiguredAirbyteCatalog, ConfiguredAirbyteStream, DestinationSyncMode, SyncMode, Type
 from conftest import encoding_symbols_parameters, generate_stream
 from requests.exceptions import HTTPError
 from source_salesforce.api import Salesforce
+from source_salesforce.describe_cache import DescribeCache
 from source_salesforce.source import SourceSalesforce
 from source_salesforce.streams import (
     CSV_FIELD_SIZE_LIMIT,
     BulkIncrementalSalesforceStream,
+    BulkJobResult,
     BulkSalesforceStream,
     IncrementalRestSalesforceStream,
+    PartialRecords,
     RestSalesforceStream,
 )
 
@@ -214,7 +219,7 @@ def test_download_data_filter_null_bytes(stream_config, stream_api):
 
         m.register_uri("GET", f"{job_full_url}/results", content=b'"Id","IsDeleted"\n\x00"0014W000027f6UwQAI","false"\n\x00\x00')
         res = list(stream.read_with_chunks(*stream.download_data(url=job_full_url)))
-        assert res == [{"Id": "0014W000027f6UwQAI", "IsDeleted": False}]
+        assert res == [{"Id": "0014W000027f6UwQAI", "IsDeleted": "false"}]
 
 
 @pytest.mark.parametrize(
@@ -311,6 +316,8 @@ def test_rate_limit_bulk(stream_config, stream_api, bulk_catalog, state):
                 m.register_uri("DELETE", stream.path() + f"/{job_id}")
 
             m.register_uri("POST", stream.path(), creation_responses)
+        # records of the date windows are counted to merge them
+        m.register_uri("GET", re.compile("/queryAll\\?q=SELECT"), json={"totalSize": 0, "records": []})
 
         result = [i for i in source.read(logger=logger, config=stream_config, catalog=bulk_catalog, state=state)]
         assert stream_1.request_params.called
@@ -441,9 +448,9 @@ def test_csv_reader_dialect_unix():
     url = "https://fake-account.salesforce.com/services/data/v52.0/jobs/query/7504W00000bkgnpQAA"
 
     data = [
-        {"Id": 1, "Name": '"first_name" "last_name"'},
-        {"Id": 2, "Name": "'" + 'first_name"\n' + "'" + 'last_name\n"'},
-        {"Id": 3, "Name": "first_name last_name"},
+        {"Id": "1", "Name": '"first_name" "last_name"'},
+        {"Id": "2", "Name": "'" + 'first_name"\n' + "'" + 'last_name\n"'},
+        {"Id": "3", "Name": "first_name last_name"},
     ]
 
     with io.StringIO("", newline="") as csvfile:
@@ -479,7 +486,7 @@ def test_csv_reader_dialect_unix():
 def test_forwarding_sobject_options(stream_config, stream_names, catalog_stream_names) -> None:
     sobjects_matcher = re.compile("/sobjects$")
     token_matcher = re.compile("/token$")
-    describe_matcher = re.compile("/describe$")
+    describe_matcher = re.compile("/composite/batch$")
     catalog = None
     if catalog_stream_names:
         catalog = ConfiguredAirbyteCatalog(
@@ -494,19 +501,13 @@ def test_forwarding_sobject_options(stream_config, stream_names, catalog_stream_
                 for catalog_stream_name in catalog_stream_names
             ]
         )
+    describe_result = {"statusCode": 200, "result": {"fields": [{"name": "field", "type": "string"}]}}
     with requests_mock.Mocker() as m:
         m.register_uri("POST", token_matcher, json={"instance_url": "https://fake-url.com", "access_token": "fake-token"})
         m.register_uri(
-            "GET",
+            "POST",
             describe_matcher,
-            json={
-                "fields": [
-                    {
-                        "name": "field",
-                        "type": "string",
-                    }
-                ]
-            },
+            json=lambda request, context: {"hasErrors": False, "results": [describe_result for _ in request.json()["batchRequests"]]},
         )
         m.register_uri(
             "GET",
@@ -535,6 +536,67 @@ def test_forwarding_sobject_options(stream_config, stream_names, catalog_stream_
     return
 
 
+def test_describe_sobjects_cached(stream_config, tmp_path, monkeypatch):
+    monkeypatch.setenv("SALESFORCE_DESCRIBE_CACHE_DIR", str(tmp_path))
+    described_at = "Wed, 21 Oct 2015 07:28:00 GMT"
+    fields = {"Account": "Name", "Asset": "Price", "Contact": "Email"}
+
+    def describe_batch(request, context):
+        context.headers["Date"] = described_at
+        results = []
+        for subrequest in request.json()["batchRequests"]:
+            sobject = subrequest["url"].split("/")[-2]
+            if sobject not in fields:
+                results.append({"statusCode": 404, "result": [{"errorCode": "NOT_FOUND"}]})
+            elif subrequest.get("httpHeaders", {}).get("If-Modified-Since") == described_at and sobject != "Asset":
+                results.append({"statusCode": 304, "result": None})
+            else:
+                results.append({"statusCode": 200, "result": {"name": sobject, "fields": [{"name": fields[sobject], "type": "string"}]}})
+        return {"hasErrors": False, "results": results}
+
+    def describe_sobjects():
+        sf_object = Salesforce(**stream_config)
+        sf_object.access_token = "fake-token"
+        sf_object.instance_url = "https://fake-url.com"
+        sf_object.org_id = "00D000000000001"
+        sf_object.describe_batch_size = 2
+        return sf_object.describe_sobjects(["Account", "Asset", "Contact", "Missing"])
+
+    with requests_mock.Mocker() as m:
+        m.register_uri("POST", "https://fake-url.com/services/data/v52.0/composite/batch", json=describe_batch)
+        assert describe_sobjects() == {sobject: {"fields": [{"name": field, "type": "string"}]} for sobject, field in fields.items()}
+        assert m.call_count == 2
+
+        # Asset was modified since, the other sObjects were not
+        fields["Asset"] = "Cost"
+        assert describe_sobjects() == {sobject: {"fields": [{"name": field, "type": "string"}]} for sobject, field in fields.items()}
+        # batches are sent in parallel, in any order
+        subrequests = [subrequest for request in m.request_history[2:] for subrequest in request.json()["batchRequests"]]
+        assert {subrequest["url"].split("/")[-2]: subrequest.get("httpHeaders") for subrequest in subrequests} == {
+            "Account": {"If-Modified-Since": described_at},
+            "Asset": {"If-Modified-Since": described_at},
+            "Contact": {"If-Modified-Since": described_at},
+            "Missing": None,
+        }
+
+
+def test_describe_cache_by_org_and_version(tmp_path):
+    described_at = "Wed, 21 Oct 2015 07:28:00 GMT"
+    describe = {"fields": [{"name": "Name", "type": "string"}]}
+    describe_cache = DescribeCache(str(tmp_path), org_id="00D000000000001", version="v52.0")
+    describe_cache.set("Account", described_at, describe)
+    describe_cache.save()
+
+    describe_cache = DescribeCache(str(tmp_path), org_id="00D000000000001", version="v52.0")
+    assert describe_cache.if_modified_since("Account") == described_at
+    assert describe_cache.get("Account") == describe
+    assert describe_cache.if_modified_since("Contact") is None
+
+    # other orgs have their own describes, the describes of another API version are described again
+    assert DescribeCache(str(tmp_path), org_id="00D000000000002", version="v52.0").get("Account") is None
+    assert DescribeCache(str(tmp_path), org_id="00D000000000001", version="v57.0").get("Account") is None
+
+
 def test_csv_field_size_limit():
     DEFAULT_CSV_FIELD_SIZE_LIMIT = 1024 * 128
 
@@ -589,17 +651,18 @@ def test_bulk_stream_paging(stream_config, stream_api_pk):
         records = list(stream.read_records(sync_mode=SyncMode.full_refresh))
 
         assert records == [
-            {"Field1": "test", "Id": 1, "LastModifiedDate": last_modified_date1},
-            {"Field1": "test", "Id": 3, "LastModifiedDate": last_modified_date1},
-            {"Field1": "test", "Id": 5, "LastModifiedDate": last_modified_date1},
-            {"Field1": "test", "Id": 2, "LastModifiedDate": last_modified_date2},
-            {"Field1": "test", "Id": 2, "LastModifiedDate": last_modified_date2},  # duplicate record
-            {"Field1": "test", "Id": 4, "LastModifiedDate": last_modified_date2},
-            {"Field1": "test", "Id": 6, "LastModifiedDate": last_modified_date2},
+            {"Field1": "test", "Id": "1", "LastModifiedDate": last_modified_date1},
+            {"Field1": "test", "Id": "3", "LastModifiedDate": last_modified_date1},
+            {"Field1": "test", "Id": "5", "LastModifiedDate": last_modified_date1},
+            {"Field1": "test", "Id": "2", "LastModifiedDate": last_modified_date2},
+            {"Field1": "test", "Id": "2", "LastModifiedDate": last_modified_date2},  # duplicate record
+            {"Field1": "test", "Id": "4", "LastModifiedDate": last_modified_date2},
+            {"Field1": "test", "Id": "6", "LastModifiedDate": last_modified_date2},
         ]
 
-        def get_query(request_index):
-            return mocked_requests.request_history[request_index].json()["query"]
+        def get_query(job_index):
+            # jobs of the next pages run while the records of the previous ones are read, so only job creations are in order
+            return [request.json()["query"] for request in mocked_requests.request_history if request.method == "POST"][job_index]
 
         SELECT = "SELECT LastModifiedDate,Id FROM Account"
         ORDER_BY = "ORDER BY LastModifiedDate,Id ASC LIMIT 2"
@@ -607,12 +670,123 @@ def test_bulk_stream_paging(stream_config, stream_api_pk):
         assert get_query(0) == f"{SELECT} WHERE LastModifiedDate >= {last_modified_date1} {ORDER_BY}"
 
         q = f"{SELECT} WHERE (LastModifiedDate = {last_modified_date1} AND Id > '3') OR (LastModifiedDate > {last_modified_date1}) {ORDER_BY}"
-        assert get_query(4) == q
+        assert get_query(1) == q
 
-        assert get_query(8) == f"{SELECT} WHERE LastModifiedDate >= {last_modified_date2} {ORDER_BY}"
+        assert get_query(2) == f"{SELECT} WHERE LastModifiedDate >= {last_modified_date2} {ORDER_BY}"
 
         q = f"{SELECT} WHERE (LastModifiedDate = {last_modified_date2} AND Id > '4') OR (LastModifiedDate > {last_modified_date2}) {ORDER_BY}"
-        assert get_query(12) == q
+        assert get_query(3) == q
+
+
+def test_bulk_stream_next_page_job_started_before_reading(stream_config, stream_api, mocker, tmp_path):
+    stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
+    stream.page_size = 2
+    paths = [tmp_path / "page_1.csv", tmp_path / "page_2.csv"]
+    paths[0].write_text("Id,LastModifiedDate\n1,2021-11-01\n2,2021-11-02\n")
+    paths[1].write_text("Id,LastModifiedDate\n3,2021-11-03\n")
+    last_records = [{"Id": "2", "LastModifiedDate": "2021-11-02"}, {"Id": "3", "LastModifiedDate": "2021-11-03"}]
+    run_job = mocker.patch.object(
+        BulkSalesforceStream,
+        "run_job",
+        side_effect=[
+            BulkJobResult("job_1", "JobComplete", path=str(paths[0]), encoding="utf-8", record_count=2, last_record=last_records[0]),
+            BulkJobResult("job_2", "JobComplete", path=str(paths[1]), encoding="utf-8", record_count=1, last_record=last_records[1]),
+        ],
+    )
+    mocker.patch.object(BulkSalesforceStream, "delete_job")
+
+    records = stream.read_records(sync_mode=SyncMode.full_refresh)
+    assert next(records) == {"Id": "1", "LastModifiedDate": "2021-11-01"}
+    stream._job_executor.shutdown(wait=True)
+    assert run_job.call_count == 2
+    assert [record["Id"] for record in records] == ["2", "3"]
+    assert not any(path.exists() for path in paths)
+
+
+def test_bulk_stream_result_counted_while_downloaded(stream_config, stream_api, mocker):
+    job_full_url: str = "https://fase-account.salesforce.com/services/data/v52.0/jobs/query/7504W00000bkgnpQAA"
+    stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
+    mocker.patch.object(BulkSalesforceStream, "execute_job", return_value=(job_full_url, "JobComplete"))
+    read_csv = mocker.spy(BulkSalesforceStream, "_read_csv")
+
+    with requests_mock.Mocker() as m:
+        content = b'Id,Name\n1,"first\nline"\n2,\n'
+        m.register_uri("GET", f"{job_full_url}/results", headers={"Content-Type": "text/csv; charset=utf-8"}, content=content)
+        result = stream.run_job(query="SELECT Id,Name FROM Account", url=job_full_url)
+
+    assert read_csv.call_count == 0
+    assert result.record_count == 2
+    assert result.last_record == {"Id": "2", "Name": None}
+    assert list(stream.read_with_chunks(result.path, result.encoding)) == [{"Id": "1", "Name": "first\nline"}, {"Id": "2", "Name": None}]
+
+
+def test_bulk_stream_slices(stream_config, stream_api):
+    stream_config["start_date"] = pendulum.now(tz="UTC").subtract(days=45).strftime("%Y-%m-%dT%H:%M:%SZ")
+    stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
+    window_end = pendulum.parse(stream.start_date).add(days=30).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    assert stream._date_windows({}) == [
+        {"start_date": stream.start_date, "end_date": window_end},
+        {"start_date": window_end, "end_date": None},
+    ]
+    assert stream._date_windows({"LastModifiedDate": window_end}) == [{"start_date": window_end, "end_date": None}]
+
+    query = stream.request_params(stream_state={}, stream_slice={"start_date": stream.start_date, "end_date": window_end})["q"]
+    assert f"WHERE (LastModifiedDate >= {stream.start_date}) AND LastModifiedDate < {window_end} ORDER BY" in query
+    query = stream.request_params(stream_state={}, stream_slice={"start_date": window_end, "end_date": None})["q"]
+    assert f"WHERE LastModifiedDate >= {window_end} ORDER BY" in query
+
+
+@pytest.mark.parametrize(
+    "record_counts, expected_windows",
+    [
+        ([3, 0, 4, 1], [(0, 1), (2, 3)]),
+        ([0, 0, 0, 0], [(0, 3)]),
+        ([6, 1, None, 1], [(0, 0), (1, 1), (2, 2), (3, 3)]),
+    ],
+)
+def test_bulk_stream_slices_merged_by_record_count(stream_config, stream_api, mocker, record_counts, expected_windows):
+    stream_config["start_date"] = pendulum.now(tz="UTC").subtract(days=100).strftime("%Y-%m-%dT%H:%M:%SZ")
+    stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
+    stream.page_size = 5
+    windows = stream._date_windows({})
+    mocker.patch.object(stream, "_count_records", side_effect=lambda window: record_counts[windows.index(window)])
+
+    assert stream._date_slices({}) == [
+        {"start_date": windows[first]["start_date"], "end_date": windows[last]["end_date"]} for first, last in expected_windows
+    ]
+
+
+def test_bulk_stream_count_records(stream_config, stream_api):
+    stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
+    window = {"start_date": "2021-01-01T00:00:00Z", "end_date": "2021-01-31T00:00:00Z"}
+
+    with requests_mock.Mocker() as m:
+        m.register_uri("GET", "https://fase-account.salesforce.com/services/data/v52.0/queryAll", json={"totalSize": 12, "records": []})
+        assert stream._count_records(window) == 12
+        assert m.last_request.qs["q"] == [
+            "select count() from account where lastmodifieddate >= 2021-01-01t00:00:00z and lastmodifieddate < 2021-01-31t00:00:00z"
+        ]
+
+        m.register_uri("GET", "https://fase-account.salesforce.com/services/data/v52.0/queryAll", status_code=400, json=[])
+        assert stream._count_records(window) is None
+
+
+def test_bulk_stream_slice_jobs_started_ahead(stream_config, stream_api, mocker):
+    stream_config["start_date"] = pendulum.now(tz="UTC").subtract(days=200).strftime("%Y-%m-%dT%H:%M:%SZ")
+    stream: BulkIncrementalSalesforceStream = generate_stream("Account", stream_config, stream_api)
+    mocker.patch.object(stream, "_count_records", return_value=stream.page_size)
+    run_job = mocker.patch.object(BulkSalesforceStream, "run_job", return_value=BulkJobResult(None, None))
+
+    stream_slices = stream.stream_slices(sync_mode=SyncMode.incremental)
+    first_slice = next(stream_slices)
+    stream._job_executor.shutdown(wait=True)
+
+    assert run_job.call_count == stream.MAX_JOBS_AHEAD
+    assert run_job.call_args_list[0].kwargs["query"] == stream.request_params(stream_state={}, stream_slice=first_slice)["q"]
+    assert len(stream._jobs_ahead) == stream.MAX_JOBS_AHEAD
+    stream_slices.close()
+    assert not stream._jobs_ahead
 
 
 def test_rest_stream_init_with_too_many_properties(stream_config, stream_api_v2_too_many_properties):
@@ -631,28 +805,26 @@ def test_too_many_properties(stream_config, stream_api_v2_pk_too_many_properties
     assert stream.too_many_properties
     assert stream.primary_key
     assert type(stream) == RestSalesforceStream
-    url = next_page_url = "https://fase-account.salesforce.com/services/data/v52.0/queryAll"
-    requests_mock.get(
-        url,
-        [
-            {
-                "json": {
-                    "records": [
-                        {"Id": 1, "propertyA": "A"},
-                        {"Id": 2, "propertyA": "A"},
-                        {"Id": 3, "propertyA": "A"},
-                        {"Id": 4, "propertyA": "A"},
-                    ]
-                }
-            },
-            {"json": {"nextRecordsUrl": next_page_url, "records": [{"Id": 1, "propertyB": "B"}, {"Id": 2, "propertyB": "B"}]}},
-            # 2 for 2 chunks above
-            *[{"json": {"records": [{"Id": 1}, {"Id": 2}], "nextRecordsUrl": next_page_url}} for _ in range(chunks_len - 2)],
-            {"json": {"records": [{"Id": 3, "propertyB": "B"}, {"Id": 4, "propertyB": "B"}]}},
-            # 2 for 1 chunk above and 1 chunk had no next page
-            *[{"json": {"records": [{"Id": 3}, {"Id": 4}]}} for _ in range(chunks_len - 2)],
-        ],
-    )
+    url = "https://fase-account.salesforce.com/services/data/v52.0/queryAll"
+    chunk_ids = {",".join(chunk.keys()): chunk_id for chunk_id, chunk in enumerate(chunks)}
+    chunk_properties = {0: {"propertyA": "A"}, 1: {"propertyB": "B"}}
+
+    def next_page_url(chunk_id):
+        return f"https://fase-account.salesforce.com/services/data/v52.0/query/{chunk_id}-2"
+
+    def first_page(request, context):
+        # chunks are read in parallel, so their pages are told apart by their query rather than by the order of the requests
+        chunk_id = chunk_ids[re.search("SELECT (.*) FROM", parse_qs(urlparse(request.url).query)["q"][0]).group(1)]
+        if chunk_id == 0:
+            return {"records": [{"Id": record_id, **chunk_properties[0]} for record_id in [1, 2, 3, 4]]}
+        records = [{"Id": record_id, **chunk_properties.get(chunk_id, {})} for record_id in [1, 2]]
+        return {"records": records, "nextRecordsUrl": next_page_url(chunk_id)}
+
+    requests_mock.get(url, json=first_page)
+    for chunk_id in range(1, chunks_len):
+        requests_mock.get(
+            next_page_url(chunk_id), json={"records": [{"Id": record_id, **chunk_properties.get(chunk_id, {})} for record_id in [3, 4]]}
+        )
     records = list(stream.read_records(sync_mode=SyncMode.full_refresh))
     assert records == [
         {"Id": 1, "propertyA": "A", "propertyB": "B"},
@@ -664,6 +836,77 @@ def test_too_many_properties(stream_config, stream_api_v2_pk_too_many_properties
         assert len(call.url) < Salesforce.REQUEST_SIZE_LIMITS
 
 
+def test_too_many_properties_inconsistent_records(stream_config, stream_api_v2_pk_too_many_properties, requests_mock, caplog):
+    stream = generate_stream("Account", stream_config, stream_api_v2_pk_too_many_properties)
+    chunks = list(stream.chunk_properties())
+    chunk_ids = {",".join(chunk.keys()): chunk_id for chunk_id, chunk in enumerate(chunks)}
+    # a record was inserted and another one was deleted after the first chunk was read
+    chunk_record_ids = [["1", "2", "3", "5"]] + [["1", "3", "4"]] * (len(chunks) - 1)
+
+    def records(request, context):
+        query = parse_qs(urlparse(request.url).query)["q"][0]
+        chunk_id = chunk_ids[re.search("SELECT (.*) FROM", query).group(1)]
+        record_ids = chunk_record_ids[chunk_id]
+        if " IN (" in query:
+            record_ids = [record_id for record_id in ["2", "4"] if f"'{record_id}'" in query]
+        return {"records": [{"Id": record_id, f"Property{chunk_id}": chunk_id} for record_id in record_ids]}
+
+    requests_mock.get("https://fase-account.salesforce.com/services/data/v52.0/queryAll", json=records)
+    records = list(stream.read_records(sync_mode=SyncMode.full_refresh))
+
+    assert sorted(record["Id"] for record in records) == ["1", "2", "3", "4"]
+    for record in records:
+        assert record == {"Id": record["Id"], **{f"Property{chunk_id}": chunk_id for chunk_id in range(len(chunks))}}
+    assert "Inconsistent record(s) with primary keys 5 found. Skipping them." in caplog.text
+
+
+def test_too_many_properties_chunks_read_at_the_same_pace(stream_config, stream_api_v2_pk_too_many_properties, requests_mock):
+    stream = generate_stream("Account", stream_config, stream_api_v2_pk_too_many_properties)
+    stream.MAX_CHUNK_RECORDS_AHEAD = 1
+    chunks = list(stream.chunk_properties())
+    chunk_ids = {",".join(chunk.keys()): chunk_id for chunk_id, chunk in enumerate(chunks)}
+    # the first chunk returns bigger pages than the others
+    chunk_pages = [[["1", "2", "3", "4"], ["5", "6"]]] + [[["1", "2"], ["3", "4"], ["5", "6"]]] * (len(chunks) - 1)
+    url = "https://fase-account.salesforce.com/services/data/v52.0/queryAll"
+
+    def page_url(chunk_id, page):
+        return f"https://fase-account.salesforce.com/services/data/v52.0/query/{chunk_id}-{page}"
+
+    def page_json(chunk_id, page):
+        page_json = {"records": [{"Id": record_id, f"Property{chunk_id}": chunk_id} for record_id in chunk_pages[chunk_id][page]]}
+        if page + 1 < len(chunk_pages[chunk_id]):
+            page_json["nextRecordsUrl"] = page_url(chunk_id, page + 1)
+        return page_json
+
+    def first_page(request, context):
+        return page_json(chunk_ids[re.search("SELECT (.*) FROM", parse_qs(urlparse(request.url).query)["q"][0]).group(1)], 0)
+
+    requests_mock.get(url, json=first_page)
+    for chunk_id, pages in enumerate(chunk_pages):
+        for page in range(1, len(pages)):
+            requests_mock.get(page_url(chunk_id, page), json=page_json(chunk_id, page))
+    records = list(stream.read_records(sync_mode=SyncMode.full_refresh))
+
+    assert sorted(record["Id"] for record in records) == ["1", "2", "3", "4", "5", "6"]
+    requested_urls = [call.url for call in requests_mock.request_history]
+    # the first chunk is only read further once the other chunks caught up with it
+    assert requested_urls.index(page_url(0, 1)) > max(requested_urls.index(page_url(chunk_id, 1)) for chunk_id in range(1, len(chunks)))
+
+
+def test_partial_records_spilled():
+    partial_records = PartialRecords(chunk_ids=[0, 1], max_in_memory=2)
+    for record_id in ["1", "2", "3", "4", "5"]:
+        assert partial_records.add(record_id, 0, {"Id": record_id, "A": "a"}) is None
+    assert len(partial_records) == 5
+    assert sorted(partial_records.incomplete()) == [(record_id, {0}) for record_id in ["1", "2", "3", "4", "5"]]
+
+    for record_id in ["5", "4", "3", "2"]:
+        assert partial_records.add(record_id, 1, {"Id": record_id, "B": "b"}) == {"Id": record_id, "A": "a", "B": "b"}
+    assert list(partial_records.incomplete()) == [("1", {0})]
+    partial_records.close()
+    assert len(partial_records) == 0
+
+
 def test_stream_with_no_records_in_response(stream_config, stream_api_v2_pk_too_many_properties, requests_mock):
     stream = generate_stream("Account", stream_config, stream_api_v2_pk_too_many_properties)
     chunks = list(stream.chunk_properties())
@@ -85,6 +85,7 @@ def _stream_api(stream_config, describe_response_data=None):
     if describe_response_data:
         response_data = describe_response_data
     sf_object.describe = Mock(return_value=response_data)
+    sf_object.describe_sobjects = Mock(side_effect=lambda sobjects: {sobject: response_data for sobject in sobjects})
     return sf_object
 
 